@@ -40,6 +40,12 @@ def main():
         is_mandatory=False,
         print_value=True,
     )
+    expiration_seconds = siemplify.extract_action_param(
+        param_name="Expiration Seconds",
+        input_type=int,
+        is_mandatory=False,
+        print_value=True,
+    )
 
     output_message = ""
     result_value = True
@@ -47,11 +53,10 @@ def main():
     siemplify.LOGGER.info("----------------- Main - Started -----------------")
     try:
         # Lock the file from other actions that may use it. if file
-        with EntityFileManager(filepath, timeout) as efm:
+        with EntityFileManager(filepath, timeout, expiration_seconds) as efm:
             for entity in siemplify.target_entities:
-                if entity.identifier not in efm.entities:
-                    siemplify.LOGGER.info(f"Adding entity: {entity.identifier}")
-                    efm.addEntity(entity.identifier)
+                if efm.addEntity(entity.identifier):
+                    siemplify.LOGGER.info(f"Added entity: {entity.identifier}")
                     output_message += f"Added Entity: {entity.identifier}\n"
                 else:
                     siemplify.LOGGER.info(
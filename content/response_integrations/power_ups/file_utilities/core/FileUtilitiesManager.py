@@ -13,85 +13,227 @@
 # limitations under the License.
 from __future__ import annotations
 
+import os
+import sqlite3
+import time
+from collections.abc import Iterator
+
 import requests
-from filelock import FileLock
 
 from .exceptions import EntityFileManagerException, FileUtilitiesHTTPException
 
+DEFAULT_TIMEOUT: float = 200
+STORE_SUFFIX: str = ".sqlite"
+
 
 class EntityFileManager:
-    def __init__(self, filepath, timeout=None):
-        """Initiate the manager. This will create a file.lock in the same folder as the filepath.
-        :param filepath:
-        :param timeout:
+    """Store of entity identifiers, mirrored to a plain text file.
+
+    The identifiers are kept in an indexed SQLite database next to the file,
+    so membership checks and changes don't read or rewrite the whole file.
+    Entering the manager starts a write transaction, which blocks other
+    processes using the same file until the manager exits, like a file lock.
+    On exit, the changes are committed and mirrored to the plain text file:
+    added identifiers are appended, and the file is rewritten only if
+    identifiers were removed or expired.
+
+    A plain text file from before the store existed is imported the first time
+    it is used, so existing files keep their entities. After that the store is
+    the source of truth, and edits made directly to the plain text file are
+    ignored and overwritten.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        timeout: float | None = None,
+        expiration_seconds: float | None = None,
+    ) -> None:
+        """Initiate the manager.
+
+        Args:
+            filepath: The path of the plain text file of the entities.
+            timeout: The number of seconds to wait for other processes using
+                the file.
+            expiration_seconds: If set, entities added by this manager expire
+                after this number of seconds.
+
         """
-        self.filepath = filepath
-        self.timeout = timeout
-
-        self.lockpath = self.filepath + ".lock"
-        if self.timeout:
-            self.lock = FileLock(self.lockpath, timeout=self.timeout)
-        else:
-            self.lock = FileLock(self.lockpath)
-        self.entities = []
-
-    def __enter__(self):
-        """This function is executed with a "with" statement. It will acquire the lock,
-        and block other processes from using this file (only if it's using py-filelock
-        or check the .lock file). Once locked, it will fetch the rows
-        from the file to self.entities to make changes.
-        :return:
+        self.filepath: str = filepath
+        self.timeout: float | None = timeout
+        self.expiration_seconds: float | None = expiration_seconds
+        self.store_path: str = filepath + STORE_SUFFIX
+        self.entities: StoredEntities | None = None
+        self._connection: sqlite3.Connection | None = None
+        self._added: list[str] = []
+        self._rewrite: bool = False
+
+    def __enter__(self) -> EntityFileManager:
+        """Open the store, import the legacy file and remove expired entities.
+
+        Returns:
+            The manager.
+
         """
-        self.lock.acquire()
-        self.entities = self.readFile()
+        self._connection = sqlite3.connect(
+            self.store_path,
+            timeout=self.timeout or DEFAULT_TIMEOUT,
+            isolation_level=None,
+        )
+        try:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entities "
+                "(identifier TEXT PRIMARY KEY, added_at REAL NOT NULL, expires_at REAL)"
+            )
+            self._connection.execute("CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)")
+            self._connection.execute("BEGIN IMMEDIATE")
+            self._added = []
+            self._rewrite = False
+            self._import_legacy_file()
+            self._remove_expired_entities()
+
+        except BaseException:
+            self._connection.close()
+            self._connection = None
+            raise
+
+        self.entities = StoredEntities(self._connection)
         return self
 
-    def __exit__(self, typ, value, traceback):
-        """This function is executed in the end of the "with" statement.
-        It will write the changed to the file and release the lock. All parameters are
-        built-ins of python and are not required.
-        :param typ: Ignore.
-        :param value: Ignore.
-        :param traceback: Ignore.
-        """
-        self.writeFile()
-        self.lock.release()
+    def __exit__(self, typ, value, traceback) -> None:
+        """Commit the changes, mirror them to the plain text file and unlock."""
+        try:
+            self.writeFile()
+            self._connection.execute("COMMIT")
+
+        finally:
+            self._connection.close()
+            self._connection = None
+
+    def readFile(self) -> list[str]:
+        """Helper function to read all entities from the plain text file.
+
+        Returns:
+            List with file contents (Entity Identifiers)
 
-    def readFile(self):
-        """Helper function to read all entities from the file.
-        :return: List with file contents (Entity Identifiers)
         """
         try:
             with open(self.filepath) as f:
                 data = f.readlines()
-            return [x.strip() for x in data]
+            return [x.strip() for x in data if x.strip()]
         except FileNotFoundError:
             return []
 
-    def writeFile(self):
-        """Helper function to write the entities list to the file"""
-        with open(self.filepath, "w") as f:
-            f.write("\n".join(self.entities))
+    def writeFile(self) -> None:
+        """Helper function to mirror the changes to the plain text file."""
+        if self._rewrite or not os.path.exists(self.filepath):
+            temp_path: str = f"{self.filepath}.{os.getpid()}.tmp"
+            with open(temp_path, "w") as f:
+                f.write("\n".join(self.entities))
+            os.replace(temp_path, self.filepath)
+
+        elif self._added:
+            with open(self.filepath, "a") as f:
+                separator: str = "\n" if f.tell() else ""
+                f.write(separator + "\n".join(self._added))
+
+        self._added = []
+        self._rewrite = False
+
+    def addEntity(self, entity: str) -> bool:
+        """Add an entity to the store.
+
+        Args:
+            entity: Entity identifier
+
+        Returns:
+            True if the entity was added, False if it is already stored
 
-    def addEntity(self, entity):
-        """Add elements to self.entities list
-        :param entity: Entity identifier
-        :return: True
         """
-        self.entities.append(entity)
+        now: float = time.time()
+        expires_at: float | None = now + self.expiration_seconds if self.expiration_seconds else None
+        cursor: sqlite3.Cursor = self._connection.execute(
+            "INSERT OR IGNORE INTO entities (identifier, added_at, expires_at) VALUES (?, ?, ?)",
+            (entity, now, expires_at),
+        )
+        if not cursor.rowcount:
+            return False
+
+        self._added.append(entity)
         return True
 
-    def removeEntity(self, entity):
-        """Remove elements from self.entities list
-        :param entity: Entity identifier
-        :return: True
+    def removeEntity(self, entity: str) -> bool:
+        """Remove an entity from the store.
+
+        Args:
+            entity: Entity identifier
+
+        Returns:
+            True
+
+        Raises:
+            EntityFileManagerException: If the entity is not stored
+
         """
-        try:
-            self.entities.remove(entity)
-            return True
-        except KeyError:
+        cursor: sqlite3.Cursor = self._connection.execute(
+            "DELETE FROM entities WHERE identifier = ?",
+            (entity,),
+        )
+        if not cursor.rowcount:
             raise EntityFileManagerException("Entity not found in file")
 
+        self._rewrite = True
+        return True
+
+    def _import_legacy_file(self) -> None:
+        imported: tuple[str] | None = self._connection.execute(
+            "SELECT value FROM metadata WHERE key = 'imported'"
+        ).fetchone()
+        if imported is not None:
+            return
+
+        now: float = time.time()
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO entities (identifier, added_at) VALUES (?, ?)",
+            ((entity, now) for entity in self.readFile()),
+        )
+        self._connection.execute(
+            "INSERT INTO metadata (key, value) VALUES ('imported', ?)",
+            (str(now),),
+        )
+
+    def _remove_expired_entities(self) -> None:
+        cursor: sqlite3.Cursor = self._connection.execute(
+            "DELETE FROM entities WHERE expires_at <= ?",
+            (time.time(),),
+        )
+        if cursor.rowcount:
+            self._rewrite = True
+
+
+class StoredEntities:
+    """The entity identifiers of an open store, in the order they were added."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._connection: sqlite3.Connection = connection
+
+    def __contains__(self, entity: object) -> bool:
+        return (
+            self._connection.execute(
+                "SELECT 1 FROM entities WHERE identifier = ?",
+                (entity,),
+            ).fetchone()
+            is not None
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        for (entity,) in self._connection.execute("SELECT identifier FROM entities ORDER BY added_at, rowid"):
+            yield entity
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM entities").fetchone()[0]
+
 
 def validate_response(
     response: requests.Response,
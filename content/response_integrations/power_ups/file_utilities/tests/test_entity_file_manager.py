@@ -0,0 +1,118 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import concurrent.futures
+import sqlite3
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from file_utilities.core.exceptions import EntityFileManagerException
+from file_utilities.core.FileUtilitiesManager import EntityFileManager
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+def test_legacy_file_is_imported_and_additions_are_appended(tmp_path: pathlib.Path) -> None:
+    """Verify existing plain text files keep their entities in the store.
+
+    Args:
+        tmp_path: Temporary directory of the entity file.
+    """
+    filepath: pathlib.Path = tmp_path / "entities.out"
+    filepath.write_text("1.1.1.1\nHOST-A")
+
+    with EntityFileManager(str(filepath)) as efm:
+        assert "HOST-A" in efm.entities
+        assert efm.addEntity("HOST-B") is True
+        assert efm.addEntity("1.1.1.1") is False
+
+    assert filepath.read_text() == "1.1.1.1\nHOST-A\nHOST-B"
+    with EntityFileManager(str(filepath)) as efm:
+        assert list(efm.entities) == ["1.1.1.1", "HOST-A", "HOST-B"]
+
+
+def test_removed_and_expired_entities_are_removed_from_the_file(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify removal and expiration rewrite the plain text file.
+
+    Args:
+        tmp_path: Temporary directory of the entity file.
+        monkeypatch: Pytest fixture to move the clock forward.
+    """
+    filepath: pathlib.Path = tmp_path / "entities.out"
+    with EntityFileManager(str(filepath), expiration_seconds=60) as efm:
+        efm.addEntity("HOST-A")
+
+    with EntityFileManager(str(filepath)) as efm:
+        efm.addEntity("HOST-B")
+        efm.addEntity("HOST-C")
+        efm.removeEntity("HOST-B")
+        with pytest.raises(EntityFileManagerException):
+            efm.removeEntity("HOST-D")
+
+    assert filepath.read_text() == "HOST-A\nHOST-C"
+
+    now: float = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    with EntityFileManager(str(filepath)) as efm:
+        assert "HOST-A" not in efm.entities
+        assert len(efm.entities) == 1
+
+    assert filepath.read_text() == "HOST-C"
+
+
+def test_concurrent_managers_add_each_entity_once(tmp_path: pathlib.Path) -> None:
+    """Verify concurrent executions don't add the same entity twice.
+
+    Args:
+        tmp_path: Temporary directory of the entity file.
+    """
+    filepath: pathlib.Path = tmp_path / "entities.out"
+
+    def add_entities(execution: int) -> int:
+        with EntityFileManager(str(filepath), timeout=30) as efm:
+            return sum(efm.addEntity(f"HOST-{i}") for i in range(execution, execution + 50))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        added: int = sum(executor.map(add_entities, range(0, 200, 10)))
+
+    assert added == 240
+    assert sorted(filepath.read_text().split("\n")) == sorted(f"HOST-{i}" for i in range(240))
+
+
+def test_connection_is_closed_when_the_file_stays_locked(tmp_path: pathlib.Path) -> None:
+    """Verify a manager that times out waiting for the lock closes its connection.
+
+    Args:
+        tmp_path: Temporary directory of the entity file.
+    """
+    filepath: pathlib.Path = tmp_path / "entities.out"
+    locked: EntityFileManager = EntityFileManager(str(filepath), timeout=0.01)
+
+    with EntityFileManager(str(filepath)) as efm:
+        efm.addEntity("HOST-A")
+        with pytest.raises(sqlite3.OperationalError), locked:
+            pass
+
+        assert locked._connection is None
+
+    with locked:
+        assert list(locked.entities) == ["HOST-A"]
@@ -0,0 +1,436 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import dataclasses
+import ipaddress
+import json
+import os
+import re
+import socket
+import tempfile
+import time
+import urllib.parse
+from html import unescape
+from typing import Protocol
+
+import uritools
+from tld import get_fld
+from urlextract import URLExtract
+
+IPV4_REGEX: re.Pattern[str] = re.compile(r"""(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})""")
+IPV6_REGEX: re.Pattern[str] = re.compile(
+    r"""((?:[0-9A-Fa-f]{1,4}:){6}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|::(?:[0-9A-Fa-f]{1,4}:){5}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){4}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){3}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,2}[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:){2}(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,3}[0-9A-Fa-f]{1,4})?::[0-9A-Fa-f]{1,4}:(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,4}[0-9A-Fa-f]{1,4})?::(?:[0-9A-Fa-f]{1,4}:[0-9A-Fa-f]{1,4}|(?:(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}(?:[0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5]))|(?:(?:[0-9A-Fa-f]{1,4}:){,5}[0-9A-Fa-f]{1,4})?::[0-9A-Fa-f]{1,4}|(?:(?:[0-9A-Fa-f]{1,4}:){,6}[0-9A-Fa-f]{1,4})?::)""",
+)
+EMAIL_REGEXP: re.Pattern[str] = re.compile(
+    r"(?i)"  # Case-insensitive matching
+    r"(?:[A-Z0-9!#$%&'*+/=?^_`{|}~-]+"  # Unquoted local part
+    r"(?:\.[A-Z0-9!#$%&'*+/=?^_`{|}~-]+)*"  # Dot-separated atoms in local part
+    r"|\"(?:[\x01-\x08\x0b\x0c\x0e-\x1f\x21\x23-\x5b\x5d-\x7f]"  # Quoted strings
+    r"|\\[\x01-\x09\x0b\x0c\x0e-\x7f])*\")"  # Escaped characters in local part
+    r"@"  # Separator
+    r"[A-Z0-9](?:[A-Z0-9-]*[A-Z0-9])?"  # Domain name
+    r"\.(?:[A-Z0-9](?:[A-Z0-9-]*[A-Z0-9])?)+",  # Top-level domain and subdomains
+)
+
+# URLs and IPs never contain whitespace, and emails only contain escaped spaces
+# and tabs, vertical tabs and form feeds, so each of them is within one token
+TOKEN_REGEX: re.Pattern[str] = re.compile(r"(?:\\[\t ]|[^\t\n\r ])+")
+TLD_CANDIDATE_REGEX: re.Pattern[str] = re.compile(r"\.([\w-]+)")
+IPV4_TOKEN_REGEX: re.Pattern[str] = re.compile(r"\d{1,3}(?:\.\d{1,3}){3}")
+# Characters URLExtract looks behind a URL for, to remove its enclosure
+ENCLOSURE_PREFIX_CHARS: frozenset[str] = frozenset(" ({[\"\\'`")
+NON_DOMAIN_TLDS: frozenset[str] = frozenset({
+    "aspx",
+    "css",
+    "gif",
+    "htm",
+    "html",
+    "js",
+    "jpg",
+    "jpeg",
+    "php",
+    "png",
+})
+DNS_CACHE_TTL_SECONDS: float = 600
+DNS_CACHE_DIRECTORY: str = os.path.join(tempfile.gettempdir(), f"functions_dns_cache_{os.getuid()}")
+DNS_CACHE_PATH: str = os.path.join(DNS_CACHE_DIRECTORY, "dns.json")
+
+
+class Resolver(Protocol):
+    """Checks whether host names exist."""
+
+    def resolves(self, host: str) -> bool:
+        """Check whether a host name resolves to an address."""
+
+
+class SocketResolver:
+    """Resolver that looks host names up with the system resolver."""
+
+    def resolves(self, host: str) -> bool:
+        try:
+            socket.gethostbyname(host)
+
+        except Exception:
+            return False
+
+        return True
+
+
+class CachingResolver:
+    """Resolver that caches the results of another resolver in a local file.
+
+    Results are kept for `ttl_seconds`, and shared by the executions of the
+    same user on the runner once `save` is called. The cache file is only used
+    when its directory is owned by the user and not accessible to anyone else.
+    """
+
+    def __init__(
+        self,
+        resolver: Resolver,
+        ttl_seconds: float = DNS_CACHE_TTL_SECONDS,
+        path: str | None = DNS_CACHE_PATH,
+    ) -> None:
+        """Initiate the resolver and load the cached results.
+
+        Args:
+            resolver: The resolver of the host names that aren't cached.
+            ttl_seconds: The number of seconds a result is cached for.
+            path: The path of the cache file, or None to cache in memory only.
+                The file's directory is created with user-only permissions.
+        """
+        self.resolver: Resolver = resolver
+        self.ttl_seconds: float = ttl_seconds
+        self.path: str | None = path
+        self._results: dict[str, tuple[bool, float]] = self._load()
+        self._changed: bool = False
+
+    def resolves(self, host: str) -> bool:
+        cached: tuple[bool, float] | None = self._results.get(host)
+        if cached is not None and cached[1] > time.time():
+            return cached[0]
+
+        result: bool = self.resolver.resolves(host)
+        self._results[host] = result, time.time() + self.ttl_seconds
+        self._changed = True
+        return result
+
+    def save(self) -> None:
+        """Write the results that haven't expired to the cache file."""
+        if self.path is None or not self._changed:
+            return
+
+        now: float = time.time()
+        results: dict[str, tuple[bool, float]] = {
+            host: result for host, result in self._results.items() if result[1] > now
+        }
+        directory: str = os.path.dirname(self.path)
+        temp_path: str = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            if not _is_private_directory(directory):
+                return
+
+            with open(temp_path, "w") as f:
+                json.dump(results, f)
+
+            os.replace(temp_path, self.path)
+
+        except OSError:
+            return
+
+        self._changed = False
+
+    def _load(self) -> dict[str, tuple[bool, float]]:
+        if self.path is None or not _is_private_directory(os.path.dirname(self.path)):
+            return {}
+
+        try:
+            with open(self.path) as f:
+                return {host: tuple(result) for host, result in json.load(f).items()}
+
+        except (OSError, ValueError, AttributeError, TypeError):
+            return {}
+
+
+@dataclasses.dataclass(slots=True)
+class Iocs:
+    """The IOCs found in a text, in the order they were found."""
+
+    urls: list[str]
+    domains: list[str]
+    ips: list[str]
+    emails: list[str]
+
+    def to_json(self) -> dict[str, list[str]]:
+        return {
+            "domains": self.domains,
+            "ips": self.ips,
+            "urls": self.urls,
+            "emails": self.emails,
+        }
+
+
+class IocExtractor:
+    """Extracts URLs, domains, IPs and emails from a text in a single pass.
+
+    The text is split once into whitespace separated tokens, and each token
+    only goes through the searches its characters allow: IPv4 addresses need a
+    dot, IPv6 addresses a colon and emails an at sign. URLs are completed and
+    validated by URLExtract, only in tokens with a known TLD after a dot, and
+    their host names are checked with the resolver. The TLDs are loaded once
+    per process.
+    """
+
+    def __init__(self, resolver: Resolver | None = None) -> None:
+        """Initiate the extractor.
+
+        Args:
+            resolver: The resolver URL host names must resolve with, or None to
+                keep URLs without checking their host names.
+        """
+        self._url_extractor: _ResolvingURLExtract = _ResolvingURLExtract(resolver)
+
+    def extract(self, text: str) -> Iocs:
+        """Extract the IOCs of a text.
+
+        Args:
+            text: The text to extract the IOCs from.
+
+        Returns:
+            The IOCs.
+        """
+        urls: dict[str, None] = {}
+        ipv4s: dict[str, None] = {}
+        ipv6s: dict[str, None] = {}
+        emails: dict[str, None] = {}
+        for token_match in TOKEN_REGEX.finditer(text):
+            token: str = token_match.group()
+            if "." in token:
+                _add_ips(ipv4s, IPV4_REGEX.findall(token))
+
+            if ":" in token:
+                _add_ips(ipv6s, IPV6_REGEX.findall(token))
+
+            if "@" in token:
+                emails.update(dict.fromkeys(email.lower() for email in EMAIL_REGEXP.findall(token)))
+
+            if self._url_extractor.may_contain_url(token):
+                start: int = token_match.start()
+                while start and text[start - 1] in ENCLOSURE_PREFIX_CHARS:
+                    start -= 1
+
+                self._add_urls(urls, text[start : token_match.end()])
+
+        return Iocs(
+            urls=list(urls),
+            domains=extract_domains_from_urls(urls),
+            ips=list(ipv4s | ipv6s),
+            emails=list(emails),
+        )
+
+    def _add_urls(self, urls: dict[str, None], text: str) -> None:
+        for found_url in self._url_extractor.find_urls(text, check_dns=True):
+            if "." not in found_url:
+                # If we found a URL like http://afafasasfasfas that makes no
+                # sense, thus skip it
+                continue
+
+            try:
+                _ = ipaddress.ip_address(found_url)
+                # IP addresses are extracted as IPs, not URLs
+                continue
+
+            except ValueError:
+                pass
+
+            clean_uri: str | None = clean_found_url(found_url)
+            if clean_uri is not None:
+                urls[clean_uri] = None
+
+
+class _ResolvingURLExtract(URLExtract):
+    """URLExtract that checks host names with a resolver.
+
+    The TLDs and their regex are loaded by the first instance, and shared by
+    the later ones.
+    """
+
+    _shared_tlds: tuple[re.Pattern[str], frozenset[str]] | None = None
+
+    def __init__(self, resolver: Resolver | None) -> None:
+        self.resolver: Resolver | None = resolver
+        super().__init__(cache_dns=False, limit=None)
+
+    def _reload_tlds_from_file(self) -> None:
+        if _ResolvingURLExtract._shared_tlds is None:
+            tlds: list[str] = [*self._load_cached_tlds(), *self._ipv4_tld]
+            if self._extract_localhost:
+                tlds.append("localhost")
+
+            _ResolvingURLExtract._shared_tlds = (
+                re.compile(_get_trie_pattern(tlds), flags=re.IGNORECASE),
+                frozenset(tld.lstrip(".").lower() for tld in tlds),
+            )
+
+        self._tlds_re, self._tld_names = _ResolvingURLExtract._shared_tlds
+
+    def may_contain_url(self, token: str) -> bool:
+        """Check whether a token has a TLD URLExtract can find a URL by.
+
+        Tokens that are IPv4 addresses are skipped, as URLs that are IP
+        addresses are dropped.
+        """
+        if IPV4_TOKEN_REGEX.fullmatch(token):
+            return False
+
+        lower_token: str = token.lower()
+        if "localhost" in lower_token:
+            return True
+
+        return "." in token and any(tld in self._tld_names for tld in TLD_CANDIDATE_REGEX.findall(lower_token))
+
+    def _is_domain_valid(self, url: str, tld: str, check_dns: bool = False, with_schema_only: bool = False) -> bool:
+        if not super()._is_domain_valid(url, tld, with_schema_only=with_schema_only):
+            return False
+
+        if not check_dns or self.resolver is None:
+            return True
+
+        host: str | ipaddress.IPv4Address = uritools.urisplit(url if "://" in url else f"http://{url}").gethost()
+        if not isinstance(host, str) or (self.extract_localhost and host == "localhost"):
+            return True
+
+        return self.resolver.resolves(host)
+
+
+def clean_found_url(url: str) -> str | None:
+    """Cleans up the found URL, removing unnecessary characters and validating it.
+
+    Args:
+        url (str): The URL to be cleaned up.
+
+    Returns:
+        str: A cleaned URL or None if it's invalid.
+
+    """
+    if "." not in url and "[" not in url:
+        # If we found a URL like http://afafasasfasfas; that makes no
+        # sense, thus skip it. Include http://[2001:db8::1]
+        return None
+
+    try:
+        url = url.lstrip("\"'\t \r\n").replace("\r", "").replace("\n", "").rstrip("/")
+        url = urllib.parse.urlparse(url).geturl()
+
+        if ":/" in url[:10]:
+            scheme_url = re.sub(r":/{1,3}", "://", url, count=1)
+
+        else:
+            scheme_url = f"noscheme://{url}"
+
+        hostname: str | None = urllib.parse.urlparse(scheme_url).hostname
+        if hostname is None:
+            return None
+
+        tld = hostname.rstrip(".").rsplit(".", 1)[-1].lower()
+        if tld in NON_DOMAIN_TLDS:
+            return None
+
+    except ValueError:
+        return None
+
+    # let's try to be smart by stripping of noisy bogus parts
+    url = re.split(r"""[', ")}\\]""", url, 1)[0]
+
+    # filter bogus URLs
+    if url.endswith("://"):
+        return None
+
+    if "&" in url:
+        url = unescape(url)
+
+    return url
+
+
+def extract_domains_from_urls(urls: list[str]) -> list[str]:
+    """Extracts domains from a list of URLs.
+
+    Args:
+        urls (list): List of URLs from which to extract domains.
+
+    Returns:
+        list: List of domains extracted from URLs.
+
+    """
+    domains: dict[str, None] = {}
+    for url in urls:
+        try:
+            dom: str = get_fld(url.lower(), fix_protocol=True)
+            domains[dom] = None
+
+        except Exception:
+            pass
+
+    return list(domains)
+
+
+def _get_trie_pattern(words: list[str]) -> str:
+    """Get a regex matching the longest of the words found at a position.
+
+    URLExtract joins its TLDs, longest first, into an alternation that every
+    position of the text is tried against. Nesting them by their common
+    prefixes matches the same TLDs, but checks each character once.
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        node: dict[str, dict] = trie
+        for char in word.lower():
+            node = node.setdefault(char, {})
+
+        node[""] = {}
+
+    return _get_node_pattern(trie)
+
+
+def _get_node_pattern(node: dict[str, dict]) -> str:
+    branches: list[str] = [re.escape(char) + _get_node_pattern(child) for char, child in node.items() if char]
+    if not branches:
+        return ""
+
+    pattern: str = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    return f"(?:{pattern})?" if "" in node else pattern
+
+
+def _add_ips(ips: dict[str, None], matches: list[str]) -> None:
+    for match in matches:
+        try:
+            ip: ipaddress.IPv4Address | ipaddress.IPv6Address = ipaddress.ip_address(match)
+
+        except ValueError:
+            continue
+
+        if not ip.is_private or match != "::":
+            ips[match] = None
+
+
+def _is_private_directory(path: str) -> bool:
+    try:
+        stat: os.stat_result = os.stat(path)
+
+    except OSError:
+        return False
+
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o077
@@ -0,0 +1,149 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import ipaddress
+import json
+import time
+from typing import TYPE_CHECKING
+
+from functions.core.IocExtraction import (
+    EMAIL_REGEXP,
+    IPV4_REGEX,
+    IPV6_REGEX,
+    CachingResolver,
+    IocExtractor,
+    Iocs,
+)
+
+if TYPE_CHECKING:
+    import pathlib
+
+TEXT: str = (
+    "Alert from 1.2.3.4 and 2001:db8::1 to (https://micr0soft.com/me/keep-data) "
+    'and "www.unknown-host.org", reply to Security.Alert@Micr0soft.com\n'
+    "callback\thttp://10.0.0.1:8080/c2 then\x0bhttps://sub.micr0soft.com/?a=1&b=2 "
+    '"a\\ b"@example.com ::1 999.1.1.1 page.html localhost:3000'
+)
+
+
+class FakeResolver:
+    def __init__(self, hosts: set[str]) -> None:
+        self.hosts: set[str] = hosts
+        self.lookups: list[str] = []
+
+    def resolves(self, host: str) -> bool:
+        self.lookups.append(host)
+        return host in self.hosts
+
+
+def test_extract_finds_iocs_of_resolving_hosts() -> None:
+    """Verify URLs are kept only when their host names resolve."""
+    resolver: FakeResolver = FakeResolver({"micr0soft.com", "sub.micr0soft.com"})
+
+    iocs: Iocs = IocExtractor(resolver).extract(TEXT)
+
+    assert iocs.urls == [
+        "https://micr0soft.com/me/keep-data",
+        "http://10.0.0.1:8080/c2",
+        "https://sub.micr0soft.com/?a=1&b=2",
+    ]
+    assert iocs.domains == ["micr0soft.com"]
+    assert iocs.ips == ["1.2.3.4", "10.0.0.1", "2001:db8::1", "::1"]
+    assert iocs.emails == ["security.alert@micr0soft.com", '"a\\ b"@example.com']
+    assert resolver.lookups == ["micr0soft.com", "www.unknown-host.org", "sub.micr0soft.com"]
+
+
+def test_extract_finds_ips_and_emails_of_the_whole_text() -> None:
+    """Verify splitting the text into tokens finds what searching it all finds."""
+    text: str = TEXT * 3 + " 192.168.1.1,fe80::1;user@example.co.uk"
+    ipv4s: list[str] = [ip for ip in IPV4_REGEX.findall(text) if _is_ip(ip)]
+    ipv6s: list[str] = [ip for ip in IPV6_REGEX.findall(text) if _is_ip(ip)]
+    emails: list[str] = [email.lower() for email in EMAIL_REGEXP.findall(text)]
+
+    iocs: Iocs = IocExtractor().extract(text)
+
+    assert iocs.ips == list(dict.fromkeys(ipv4s + ipv6s))
+    assert iocs.emails == list(dict.fromkeys(emails))
+
+
+def test_extract_finds_every_url_of_large_texts() -> None:
+    """Verify URLs after IP addresses and past 10000 URLs are all extracted."""
+    text: str = " ".join(f"10.0.{i // 256}.{i % 256} host-{i}.example.com" for i in range(10_500))
+
+    iocs: Iocs = IocExtractor().extract(text)
+
+    assert len(iocs.urls) == 10_500
+    assert iocs.urls[-1] == "host-10499.example.com"
+    assert iocs.domains == ["example.com"]
+
+
+def test_caching_resolver_shares_results_until_they_expire(tmp_path: pathlib.Path) -> None:
+    """Verify results are cached in the file and resolved again once expired.
+
+    Args:
+        tmp_path: Temporary directory of the cache file.
+    """
+    path: str = str(tmp_path / "cache" / "dns.json")
+    resolver: FakeResolver = FakeResolver({"example.com"})
+
+    first: CachingResolver = CachingResolver(resolver, path=path)
+    assert first.resolves("example.com")
+    assert not first.resolves("unknown.com")
+    assert first.resolves("example.com")
+    first.save()
+    assert (tmp_path / "cache").stat().st_mode & 0o777 == 0o700
+
+    second: CachingResolver = CachingResolver(resolver, path=path)
+    assert second.resolves("example.com")
+    assert not second.resolves("unknown.com")
+    assert resolver.lookups == ["example.com", "unknown.com"]
+
+    expired: CachingResolver = CachingResolver(resolver, ttl_seconds=-1, path=None)
+    assert expired.resolves("example.com")
+    assert expired.resolves("example.com")
+    assert resolver.lookups == ["example.com", "unknown.com", "example.com", "example.com"]
+
+
+def test_caching_resolver_ignores_a_shared_cache_directory(tmp_path: pathlib.Path) -> None:
+    """Verify a cache directory other users can access is neither read nor written.
+
+    Args:
+        tmp_path: Temporary directory of the cache file.
+    """
+    directory: pathlib.Path = tmp_path / "cache"
+    directory.mkdir(mode=0o777)
+    directory.chmod(0o777)
+    path: pathlib.Path = directory / "dns.json"
+    planted: str = json.dumps({"planted.com": [True, time.time() + 600]})
+    path.write_text(planted)
+    resolver: FakeResolver = FakeResolver(set())
+
+    cached: CachingResolver = CachingResolver(resolver, path=str(path))
+    assert not cached.resolves("planted.com")
+    cached.save()
+
+    assert resolver.lookups == ["planted.com"]
+    assert path.read_text() == planted
+
+
+def _is_ip(value: str) -> bool:
+    try:
+        ipaddress.ip_address(value)
+
+    except ValueError:
+        return False
+
+    return value != "::"
@@ -19,6 +19,8 @@ from soar_sdk.SiemplifyAction import SiemplifyAction
 from soar_sdk.SiemplifyDataModel import CustomList
 from soar_sdk.SiemplifyUtils import output_handler
 
+from ..core.CustomListsManager import CustomListsManager
+
 
 def get_custom_list_items(siemplify, category_name, input_string):
     """Get a list of custom list items from category and entities list.
@@ -45,6 +47,7 @@ def main():
         list_item = siemplify.parameters.get("ListItem")
         custom_list_items = get_custom_list_items(siemplify, category, list_item)
         siemplify.add_entities_to_custom_list(custom_list_items)
+        CustomListsManager(siemplify).invalidate()
         output_message = f"Added {list_item} to category {category}"
 
     except Exception:
@@ -17,7 +17,8 @@ from __future__ import annotations
 from soar_sdk.ScriptResult import EXECUTION_STATE_COMPLETED, EXECUTION_STATE_FAILED
 from soar_sdk.SiemplifyAction import SiemplifyAction
 from soar_sdk.SiemplifyUtils import output_handler
-from TIPCommon.rest.soar_api import get_traking_list_record
+
+from ..core.CustomListsManager import CustomListsManager
 
 
 @output_handler
@@ -48,27 +49,14 @@ def main():
 
     try:
         siemplify.LOGGER.info("Getting custom list records")
-        records = get_traking_list_record(siemplify, list_categories)
-        records = records.get("custom_lists", []) if isinstance(records, dict) else records
+        index = CustomListsManager(siemplify).get_index(
+            list_categories,
+            environment_only=False,
+        )
 
         siemplify.LOGGER.info("Searching records for match criteria")
-        if list_categories:
-            relevant_records = []
-            for record in records:
-                if record["category"] in list_categories:
-                    relevant_records.append(record)
-        else:
-            relevant_records = records
-
         json_result = []
-        match_records = []
-        if relevant_records:
-            if string:
-                for record in relevant_records:
-                    if string in record["entityIdentifier"]:
-                        match_records.append(record)
-            else:
-                match_records = relevant_records
+        match_records = index.search(list_categories, string)
         if match_records:
             siemplify.LOGGER.info(f"Found {len(match_records)} matching records")
             json_result = match_records
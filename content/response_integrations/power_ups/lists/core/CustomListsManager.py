@@ -0,0 +1,239 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import itertools
+import json
+import os
+import tempfile
+import time
+import uuid
+from typing import TYPE_CHECKING
+
+from TIPCommon.rest.soar_api import get_traking_list_record, get_traking_list_records_filtered
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from soar_sdk.SiemplifyAction import SiemplifyAction
+    from TIPCommon.types import SingleJson
+
+CACHE_TTL_SECONDS: float = 300
+CACHE_DIRECTORY: str = os.path.join(tempfile.gettempdir(), "lists_custom_lists")
+GLOBAL_CONTEXT: int = 0
+GLOBAL_CONTEXT_IDENTIFIER: str = "GLOBAL"
+VERSION_CONTEXT_KEY: str = "custom_lists_version"
+SEPARATOR: str = "\n"
+
+
+class CustomListIndex:
+    """Index of custom list records by category and entity identifier.
+
+    Substring searches run `str.find` over all the identifiers joined in one
+    string and map each match back to its record, instead of checking every
+    record.
+    """
+
+    def __init__(self, records: list[SingleJson]) -> None:
+        """Index the records.
+
+        Args:
+            records: The custom list records.
+        """
+        self.records: list[SingleJson] = records
+        self._categories: dict[str, list[int]] = {}
+        for index, record in enumerate(records):
+            self._categories.setdefault(record["category"], []).append(index)
+
+        self._texts: dict[bool, tuple[str, list[int]]] = {}
+
+    def search(
+        self,
+        categories: Iterable[str],
+        string: str | None,
+        is_case_sensitive: bool = True,
+    ) -> list[SingleJson]:
+        """Search the records of categories whose identifier contains a string.
+
+        Args:
+            categories: The categories of the records. All records match if empty.
+            string: The string to search in the identifiers. All records match
+                if empty.
+            is_case_sensitive: Whether the string search is case sensitive.
+
+        Returns:
+            The matching records, in their original order.
+        """
+        indexes: Iterable[int] = range(len(self.records))
+        if string:
+            indexes = self._find(string, is_case_sensitive)
+
+        categories = set(categories)
+        if categories:
+            in_categories: set[int] = {i for category in categories for i in self._categories.get(category, [])}
+            indexes = (i for i in indexes if i in in_categories)
+
+        return [self.records[i] for i in indexes]
+
+    def _find(self, string: str, is_case_sensitive: bool) -> list[int]:
+        if not is_case_sensitive:
+            string = string.lower()
+
+        if SEPARATOR in string:
+            return [i for i, identifier in enumerate(self._get_identifiers(is_case_sensitive)) if string in identifier]
+
+        text, offsets = self._get_text(is_case_sensitive)
+        indexes: list[int] = []
+        position: int = text.find(string)
+        while position != -1:
+            index: int = bisect.bisect_right(offsets, position) - 1
+            indexes.append(index)
+            if index + 1 == len(offsets):
+                break
+
+            position = text.find(string, offsets[index + 1])
+
+        return indexes
+
+    def _get_text(self, is_case_sensitive: bool) -> tuple[str, list[int]]:
+        if is_case_sensitive not in self._texts:
+            identifiers: list[str] = self._get_identifiers(is_case_sensitive)
+            offsets: list[int] = list(itertools.accumulate((len(i) + 1 for i in identifiers[:-1]), initial=0))
+            self._texts[is_case_sensitive] = SEPARATOR.join(identifiers), offsets
+
+        return self._texts[is_case_sensitive]
+
+    def _get_identifiers(self, is_case_sensitive: bool) -> list[str]:
+        if is_case_sensitive:
+            return [record["entityIdentifier"] for record in self.records]
+
+        return [record["entityIdentifier"].lower() for record in self.records]
+
+
+class CustomListsManager:
+    """Access to the custom list records, cached on the local disk.
+
+    The records are fetched with the categories filtered by the server, and
+    kept in a cache file per platform, environment and categories for a few
+    minutes. Adding or removing records changes a version in the global
+    context, which invalidates all the cache files. The cache files are kept
+    in a directory only the current user can access, and are not used if the
+    directory is accessible by others.
+    """
+
+    def __init__(self, siemplify: SiemplifyAction, ttl_seconds: float = CACHE_TTL_SECONDS) -> None:
+        """Initiate the manager.
+
+        Args:
+            siemplify: The action's SDK object.
+            ttl_seconds: The number of seconds cached records are used for.
+        """
+        self.siemplify: SiemplifyAction = siemplify
+        self.ttl_seconds: float = ttl_seconds
+
+    def get_index(self, categories: list[str], environment_only: bool) -> CustomListIndex:
+        """Get an index of the records of categories.
+
+        Args:
+            categories: The categories of the records. All records are indexed
+                if empty.
+            environment_only: Whether to index only the records available in
+                the current environment.
+
+        Returns:
+            The index of the records.
+        """
+        version: str = self._get_version()
+        environment: str | None = self.siemplify.environment if environment_only else None
+        cache_key: str = json.dumps([self.siemplify.API_ROOT, environment, sorted(categories)])
+        path: str = os.path.join(CACHE_DIRECTORY, f"{hashlib.sha256(cache_key.encode()).hexdigest()}.json")
+
+        records: list[SingleJson] | None = self._read_cache(path, version)
+        if records is None:
+            self.siemplify.LOGGER.info("Fetching custom list records")
+            records = self._fetch(categories, environment_only)
+            self._write_cache(path, version, records)
+
+        return CustomListIndex(records)
+
+    def invalidate(self) -> None:
+        """Invalidate the cached records after adding or removing records."""
+        self.siemplify.set_context_property(
+            context_type=GLOBAL_CONTEXT,
+            identifier=GLOBAL_CONTEXT_IDENTIFIER,
+            property_key=VERSION_CONTEXT_KEY,
+            property_value=uuid.uuid4().hex,
+        )
+
+    def _get_version(self) -> str:
+        version: str | None = self.siemplify.get_context_property(
+            context_type=GLOBAL_CONTEXT,
+            identifier=GLOBAL_CONTEXT_IDENTIFIER,
+            property_key=VERSION_CONTEXT_KEY,
+        )
+        return version or ""
+
+    def _fetch(self, categories: list[str], environment_only: bool) -> list[SingleJson]:
+        if environment_only:
+            records: SingleJson | list[SingleJson] = get_traking_list_records_filtered(self.siemplify, categories)
+        else:
+            records = get_traking_list_record(self.siemplify, categories)
+
+        return records.get("custom_lists", []) if isinstance(records, dict) else records
+
+    def _read_cache(self, path: str, version: str) -> list[SingleJson] | None:
+        if not _is_private_directory(CACHE_DIRECTORY):
+            return None
+
+        try:
+            with open(path) as f:
+                cache: SingleJson = json.load(f)
+
+        except (OSError, ValueError):
+            return None
+
+        if cache.get("version") != version or time.time() - cache.get("fetched_at", 0) > self.ttl_seconds:
+            return None
+
+        self.siemplify.LOGGER.info("Using cached custom list records")
+        return cache["records"]
+
+    def _write_cache(self, path: str, version: str, records: list[SingleJson]) -> None:
+        temp_path: str = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(CACHE_DIRECTORY, mode=0o700, exist_ok=True)
+            if not _is_private_directory(CACHE_DIRECTORY):
+                self.siemplify.LOGGER.info(f"Not caching the custom list records, {CACHE_DIRECTORY} is not private")
+                return
+
+            with open(temp_path, "w") as f:
+                json.dump({"version": version, "fetched_at": time.time(), "records": records}, f)
+
+            os.replace(temp_path, path)
+
+        except OSError as e:
+            self.siemplify.LOGGER.info(f"Failed to cache the custom list records: {e}")
+
+
+def _is_private_directory(path: str) -> bool:
+    try:
+        stat: os.stat_result = os.stat(path)
+
+    except OSError:
+        return False
+
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o077
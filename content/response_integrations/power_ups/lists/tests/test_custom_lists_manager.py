@@ -0,0 +1,128 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import logging
+import random
+from typing import TYPE_CHECKING
+
+import pytest
+
+from lists.core import CustomListsManager as manager_module
+from lists.core.CustomListsManager import CustomListIndex, CustomListsManager
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from TIPCommon.types import SingleJson
+
+CATEGORIES: tuple[str, ...] = ("Allowlist", "Blocklist", "VIP")
+
+
+class FakeSiemplify:
+    API_ROOT: str = "https://soar.example.com/api"
+    environment: str = "Default Environment"
+    LOGGER: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self) -> None:
+        self.context: dict[str, str] = {}
+
+    def get_context_property(self, context_type: int, identifier: str, property_key: str) -> str | None:
+        return self.context.get(property_key)
+
+    def set_context_property(self, context_type: int, identifier: str, property_key: str, property_value: str) -> None:
+        self.context[property_key] = property_value
+
+
+def _records(count: int) -> list[SingleJson]:
+    rng: random.Random = random.Random(count)
+    return [
+        {
+            "category": rng.choice(CATEGORIES),
+            "entityIdentifier": "".join(rng.choices("abAB.\n", k=rng.randint(1, 8))),
+        }
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("is_case_sensitive", [True, False])
+def test_index_search_matches_scanning_the_records(is_case_sensitive: bool) -> None:
+    """Verify the index returns the records a scan of all the records returns.
+
+    Args:
+        is_case_sensitive: Whether the string search is case sensitive.
+    """
+    records: list[SingleJson] = _records(2_000)
+    index: CustomListIndex = CustomListIndex(records)
+
+    for categories in ([], ["VIP"], ["Allowlist", "Blocklist"]):
+        for string in ("", "a", "aB", "b.a", "a\nb", "AbAbAbAbA"):
+            expected: list[SingleJson] = [
+                record
+                for record in records
+                if (not categories or record["category"] in categories)
+                and (
+                    string in record["entityIdentifier"]
+                    if is_case_sensitive
+                    else string.lower() in record["entityIdentifier"].lower()
+                )
+            ]
+            assert index.search(categories, string, is_case_sensitive) == expected
+
+
+def test_manager_caches_records_until_they_change(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify records are fetched once per version, platform, environment and categories.
+
+    Args:
+        tmp_path: Temporary directory of the cache files.
+        monkeypatch: Pytest fixture to patch the API calls.
+    """
+    fetches: list[tuple[str, list[str]]] = []
+
+    def fetch(_siemplify: FakeSiemplify, categories: list[str]) -> SingleJson:
+        fetches.append(("environment", categories))
+        return {"custom_lists": [{"category": "VIP", "entityIdentifier": f"HOST-{len(fetches)}"}]}
+
+    monkeypatch.setattr(manager_module, "CACHE_DIRECTORY", str(tmp_path / "cache"))
+    monkeypatch.setattr(manager_module, "get_traking_list_records_filtered", fetch)
+    siemplify: FakeSiemplify = FakeSiemplify()
+    manager: CustomListsManager = CustomListsManager(siemplify)
+
+    assert _identifiers(manager.get_index(["VIP"], environment_only=True)) == ["HOST-1"]
+    assert _identifiers(manager.get_index(["VIP"], environment_only=True)) == ["HOST-1"]
+    assert _identifiers(manager.get_index([], environment_only=True)) == ["HOST-2"]
+    assert (tmp_path / "cache").stat().st_mode & 0o777 == 0o700
+
+    manager.invalidate()
+    assert _identifiers(manager.get_index(["VIP"], environment_only=True)) == ["HOST-3"]
+    assert fetches == [("environment", ["VIP"]), ("environment", []), ("environment", ["VIP"])]
+
+    assert _identifiers(CustomListsManager(siemplify, ttl_seconds=-1).get_index(["VIP"], True)) == ["HOST-4"]
+
+    other_platform: FakeSiemplify = FakeSiemplify()
+    other_platform.API_ROOT = "https://other.example.com/api"
+    other_platform.context = siemplify.context
+    assert _identifiers(CustomListsManager(other_platform).get_index(["VIP"], True)) == ["HOST-5"]
+
+    (tmp_path / "cache").chmod(0o755)
+    assert _identifiers(manager.get_index(["VIP"], environment_only=True)) == ["HOST-6"]
+    assert _identifiers(manager.get_index(["VIP"], environment_only=True)) == ["HOST-7"]
+
+
+def _identifiers(index: CustomListIndex) -> list[str]:
+    return [record["entityIdentifier"] for record in index.records]
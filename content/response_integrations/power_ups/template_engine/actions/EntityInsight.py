@@ -16,15 +16,13 @@ from __future__ import annotations
 
 import json
 import time
-from inspect import getmembers, isfunction
 
 import dateutil
-from jinja2 import Environment
 from soar_sdk.ScriptResult import EXECUTION_STATE_COMPLETED, EXECUTION_STATE_FAILED
 from soar_sdk.SiemplifyAction import SiemplifyAction
 from soar_sdk.SiemplifyUtils import convert_dict_to_json_result_dict, output_handler
 
-from ..core import JinjaFilters
+from ..core.TemplateRendering import create_environment, get_template
 
 # Example Consts:
 INTEGRATION_NAME = "TemplateEngine"
@@ -122,37 +120,12 @@ def main():
                 status = EXECUTION_STATE_FAILED
                 result_value = "Failed"
                 output_message += "\n failure parsing JSON object."
-            jinja_env = Environment(autoescape=True)
-            jinja_env = Environment(
-                autoescape=True,
-                extensions=["jinja2.ext.do", "jinja2.ext.loopcontrols"],
-                trim_blocks=True,
-                lstrip_blocks=True,
-            )
-            filters = {
-                name: function
-                for name, function in getmembers(JinjaFilters)
-                if isfunction(function)
-            }
-
-            jinja_env.filters.update(filters)
-            try:
-                import CustomFilters
-
-                custom_filters = {
-                    name: function
-                    for name, function in getmembers(CustomFilters)
-                    if isfunction(function)
-                }
-                jinja_env.filters.update(custom_filters)
-            except Exception as e:
-                siemplify.LOGGER.info("Unable to load CustomFilters")
-                siemplify.LOGGER.info(e)
+            jinja_env = create_environment(siemplify.LOGGER)
 
             if remove_br:
                 template = template.replace("<br>", "")
             pre_temp = template
-            template = jinja_env.from_string(template)
+            template = get_template(jinja_env, template)
             for entity in siemplify.target_entities:
                 siemplify.LOGGER.info(f"Started processing entity: {entity.identifier}")
                 result_value = ""
@@ -16,16 +16,14 @@ from __future__ import annotations
 
 import json
 from enum import Enum
-from inspect import getmembers, isfunction
 from typing import Any
 
-from jinja2 import Environment
 from soar_sdk.ScriptResult import EXECUTION_STATE_COMPLETED, EXECUTION_STATE_FAILED
 from soar_sdk.SiemplifyAction import SiemplifyAction
 from soar_sdk.SiemplifyUtils import output_handler
 from TIPCommon.types import SingleJson
 
-from ..core import JinjaFilters
+from ..core.TemplateRendering import create_environment, get_template, render_each
 
 
 class ExecutionScope(Enum):
@@ -175,32 +173,7 @@ def main():
             status = EXECUTION_STATE_FAILED
             result_value = "Failed"
             output_message += "\n failure parsing JSON object."
-        jinja_env = Environment(
-            autoescape=True,
-            extensions=["jinja2.ext.do", "jinja2.ext.loopcontrols"],
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        filters = {
-            name: function
-            for name, function in getmembers(JinjaFilters)
-            if isfunction(function)
-        }
-
-        jinja_env.filters.update(filters)
-
-        try:
-            import CustomFilters
-
-            custom_filters = {
-                name: function
-                for name, function in getmembers(CustomFilters)
-                if isfunction(function)
-            }
-            jinja_env.filters.update(custom_filters)
-        except Exception as e:
-            siemplify.LOGGER.info("Unable to load CustomFilters")
-            siemplify.LOGGER.info(e)
+        jinja_env = create_environment(siemplify.LOGGER)
 
         success_message = (
             "Successfully rendered the template."
@@ -209,23 +182,23 @@ def main():
         )
 
         if isinstance(input_json, list):
-            result_value = ""
             if jinja:
-                template = jinja_env.from_string(jinja)
+                template = get_template(jinja_env, jinja)
             else:
-                template = jinja_env.from_string(template)
-            for entry in input_json:
-                if include_case_data:
+                template = get_template(jinja_env, template)
+            if include_case_data:
+                for entry in input_json:
                     entry.update(case_data)
-                result_value += template.render(entry, input_json=entry)
+            result_value = "".join(render_each(template, input_json, "input_json"))
+            if input_json:
                 output_message = success_message
         elif isinstance(input_json, dict):
             if include_case_data:
                 input_json.update(case_data)
             if jinja:
-                template = jinja_env.from_string(jinja)
+                template = get_template(jinja_env, jinja)
             else:
-                template = jinja_env.from_string(template)
+                template = get_template(jinja_env, template)
             result_value = template.render(input_json=input_json)
             output_message = success_message
         else:
@@ -15,14 +15,12 @@
 from __future__ import annotations
 
 import json
-from inspect import getmembers, isfunction
 
-from jinja2 import Environment
 from soar_sdk.ScriptResult import EXECUTION_STATE_COMPLETED, EXECUTION_STATE_FAILED
 from soar_sdk.SiemplifyAction import SiemplifyAction
 from soar_sdk.SiemplifyUtils import output_handler
 
-from ..core import JinjaFilters
+from ..core.TemplateRendering import create_environment, get_template, render_each
 
 # Example Consts:
 INTEGRATION_NAME = "TemplateEngine"
@@ -87,41 +85,14 @@ def main():
         if not isinstance(input_json, list):
             input_json = [input_json]
 
-        jinja_env = Environment(
-            autoescape=True,
-            extensions=["jinja2.ext.do", "jinja2.ext.loopcontrols"],
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        filters = {
-            name: function
-            for name, function in getmembers(JinjaFilters)
-            if isfunction(function)
-        }
-
-        jinja_env.filters.update(filters)
-        try:
-            import CustomFilters
-
-            custom_filters = {
-                name: function
-                for name, function in getmembers(CustomFilters)
-                if isfunction(function)
-            }
-            jinja_env.filters.update(custom_filters)
-        except Exception as e:
-            siemplify.LOGGER.info("Unable to load CustomFilters")
-            siemplify.LOGGER.info(e)
+        jinja_env = create_environment(siemplify.LOGGER)
 
         result_value = ""
 
-        template = jinja_env.from_string(jinja)
-
-        outputArray = []
+        template = get_template(jinja_env, jinja)
 
-        for entry in input_json:
-            siemplify.LOGGER.info(entry)
-            outputArray.append(template.render(entry, row=entry))
+        siemplify.LOGGER.info(f"Rendering {len(input_json)} entries")
+        outputArray = render_each(template, input_json, "row")
 
         result_value = prefix + join.join(outputArray) + suffix
 
@@ -0,0 +1,156 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import hashlib
+from inspect import getmembers, isfunction
+from typing import TYPE_CHECKING, Any
+
+from jinja2 import BaseLoader, Environment, FileSystemBytecodeCache, TemplateNotFound
+
+from . import JinjaFilters
+
+if TYPE_CHECKING:
+    import logging
+    from collections.abc import Callable, Iterable
+
+    from jinja2 import Template
+
+ENVIRONMENT_OPTIONS: dict[str, Any] = {
+    "autoescape": True,
+    "extensions": ["jinja2.ext.do", "jinja2.ext.loopcontrols"],
+    "trim_blocks": True,
+    "lstrip_blocks": True,
+}
+
+
+class SourceLoader(BaseLoader):
+    """Loader of templates given by their source.
+
+    Each template is named after the hash of its source and of the filters and
+    tests of the environment, which the compiled code depends on. The bytecode
+    cache stores compiled templates by name, so a template is compiled once
+    for each set of filters on the runner, and loaded from the cache by later
+    executions.
+    """
+
+    def __init__(self) -> None:
+        self.sources: dict[str, str] = {}
+
+    def add(self, environment: Environment, source: str) -> str:
+        """Add a template source.
+
+        Args:
+            environment: The environment the template is compiled in.
+            source: The template source.
+
+        Returns:
+            The name of the template.
+        """
+        name: str = hashlib.sha256(f"{_get_functions_key(environment)}\0{source}".encode()).hexdigest()
+        self.sources[name] = source
+        return name
+
+    def get_source(self, environment: Environment, template: str) -> tuple[str, None, Callable[[], bool]]:
+        if template not in self.sources:
+            raise TemplateNotFound(template)
+
+        return self.sources[template], None, lambda: True
+
+
+def create_environment(logger: logging.Logger, cache_directory: str | None = None) -> Environment:
+    """Create the Jinja environment with the integration's and custom filters.
+
+    Args:
+        logger: The action's logger.
+        cache_directory: The directory of the compiled templates. Defaults to
+            a directory of the user in the temporary directory.
+
+    Returns:
+        The environment.
+    """
+    try:
+        bytecode_cache: FileSystemBytecodeCache | None = FileSystemBytecodeCache(cache_directory)
+
+    except (OSError, RuntimeError) as e:
+        logger.info(f"Unable to use the template cache: {e}")
+        bytecode_cache = None
+
+    environment: Environment = Environment(
+        loader=SourceLoader(),
+        bytecode_cache=bytecode_cache,
+        **ENVIRONMENT_OPTIONS,
+    )
+    environment.filters.update(_get_module_functions(JinjaFilters))
+    try:
+        import CustomFilters
+
+        environment.filters.update(_get_module_functions(CustomFilters))
+    except Exception as e:
+        logger.info("Unable to load CustomFilters")
+        logger.info(e)
+
+    return environment
+
+
+def get_template(environment: Environment, source: str) -> Template:
+    """Compile a template, or load it from the bytecode cache.
+
+    Args:
+        environment: The environment created by `create_environment`.
+        source: The template source.
+
+    Returns:
+        The template.
+    """
+    return environment.get_template(environment.loader.add(environment, source))
+
+
+def render_each(template: Template, entries: Iterable[Any], entry_name: str) -> list[str]:
+    """Render a template for each entry of an array.
+
+    Gives the same results as `template.render(entry, **{entry_name: entry})`
+    for each entry, but merges the template's globals into the variables once
+    instead of once per entry.
+
+    Args:
+        template: The template.
+        entries: The entries, whose items are the variables of their render.
+        entry_name: The variable the whole entry is also available as.
+
+    Returns:
+        The rendered entries.
+    """
+    template_globals: dict[str, Any] = dict(template.globals)
+    results: list[str] = []
+    for entry in entries:
+        context = template.new_context({**template_globals, **dict(entry, **{entry_name: entry})}, shared=True)
+        try:
+            results.append("".join(template.root_render_func(context)))
+        except Exception:
+            template.environment.handle_exception()
+
+    return results
+
+
+def _get_module_functions(module: Any) -> dict[str, Callable]:
+    return {name: function for name, function in getmembers(module) if isfunction(function)}
+
+
+def _get_functions_key(environment: Environment) -> str:
+    return repr([
+        sorted((name, repr(getattr(function, "jinja_pass_arg", None))) for name, function in functions.items())
+        for functions in (environment.filters, environment.tests)
+    ])
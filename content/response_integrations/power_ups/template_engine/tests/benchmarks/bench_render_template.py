@@ -0,0 +1,120 @@
+"""Benchmark the cached template rendering against compiling on every execution.
+
+Usage:
+    python -m template_engine.tests.benchmarks.bench_render_template
+
+Each execution of Render Template From Array creates a Jinja environment,
+gets the template and renders it for each entry of the array. Before the
+bytecode cache, the template was compiled by every execution and rendered
+with `Template.render` per entry. The table shows the time of an execution,
+split in getting the template and rendering the entries.
+"""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import logging
+import tempfile
+import time
+from inspect import getmembers, isfunction
+from typing import TYPE_CHECKING, Any
+
+from jinja2 import Environment
+from template_engine.core import JinjaFilters
+from template_engine.core.TemplateRendering import (
+    ENVIRONMENT_OPTIONS,
+    create_environment,
+    get_template,
+    render_each,
+)
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+ENTRIES: tuple[int, ...] = (1_000, 10_000)
+RUNS: int = 5
+LOGGER: logging.Logger = logging.getLogger(__name__)
+
+TEMPLATE: str = """
+<tr class="{{ 'high' if severity > 7 else 'low' }}">
+{% for key, value in row.items() if key != 'tags' %}
+  <td>{{ key | title }}</td><td>{{ value | to_json }}</td>
+{% endfor %}
+  <td>{{ tags | join(', ') }}</td>
+  <td>{{ first_seen[:10] }}</td>
+</tr>
+"""
+
+
+def _entries(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "host": f"host-{i}.example.com",
+            "ip": f"10.0.{i // 256 % 256}.{i % 256}",
+            "severity": i % 10,
+            "tags": ["malware", f"campaign-{i % 7}"],
+            "first_seen": "2026-10-18T10:00:00Z",
+        }
+        for i in range(count)
+    ]
+
+
+def _legacy_template() -> Template:
+    environment: Environment = Environment(**ENVIRONMENT_OPTIONS)
+    environment.filters.update({name: f for name, f in getmembers(JinjaFilters) if isfunction(f)})
+    return environment.from_string(TEMPLATE)
+
+
+def _measure(get: Any, render: Any, entries: list[dict[str, Any]]) -> tuple[float, float]:
+    get_time: float = 0
+    render_time: float = 0
+    for _ in range(RUNS):
+        start: float = time.perf_counter()
+        template: Template = get()
+        get_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        render(template, entries)
+        render_time += time.perf_counter() - start
+
+    return get_time / RUNS, render_time / RUNS
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as cache_directory:
+        get_template(create_environment(LOGGER, cache_directory), TEMPLATE)
+        variants: tuple[tuple[str, Any, Any], ...] = (
+            (
+                "compiled",
+                _legacy_template,
+                lambda template, entries: [template.render(entry, row=entry) for entry in entries],
+            ),
+            (
+                "cached",
+                lambda: get_template(create_environment(LOGGER, cache_directory), TEMPLATE),
+                lambda template, entries: render_each(template, entries, "row"),
+            ),
+        )
+        print(f"{'entries':>8}{'template':>10}{'get ms':>10}{'render ms':>11}")  # ruff:ignore[print]
+        for count in ENTRIES:
+            entries: list[dict[str, Any]] = _entries(count)
+            for name, get, render in variants:
+                get_time, render_time = _measure(get, render, entries)
+                print(f"{count:>8}{name:>10}{get_time * 1000:>10.2f}{render_time * 1000:>11.2f}")  # ruff:ignore[print]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import pytest
+
+from template_engine.core.TemplateRendering import create_environment, get_template, render_each
+
+if TYPE_CHECKING:
+    import pathlib
+
+    from jinja2 import Environment, Template
+
+LOGGER: logging.Logger = logging.getLogger(__name__)
+TEMPLATE: str = (
+    "{% set total = severity * 2 %}<td>{{ name }}</td><td>{{ row.ip | upper }}</td>"
+    "{% for i in range(2) %}{{ total + i }}{% endfor %}"
+)
+
+
+def test_render_each_matches_rendering_each_entry(tmp_path: pathlib.Path) -> None:
+    """Verify entries render as if the template was rendered once per entry.
+
+    Args:
+        tmp_path: Temporary directory of the compiled templates.
+    """
+    entries: list[dict[str, object]] = [{"name": f"<host-{i}>", "ip": f"10.0.0.{i}", "severity": i} for i in range(5)]
+    template: Template = get_template(create_environment(LOGGER, str(tmp_path)), TEMPLATE)
+
+    assert render_each(template, entries, "row") == [template.render(entry, row=entry) for entry in entries]
+    assert render_each(template, entries, "row")[0] == "<td>&lt;host-0&gt;</td><td>10.0.0.0</td>01"
+
+
+def test_templates_are_compiled_once_per_filter_set(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify later environments load compiled templates from the cache.
+
+    Args:
+        tmp_path: Temporary directory of the compiled templates.
+        monkeypatch: Pytest fixture to detect compilations.
+    """
+    get_template(create_environment(LOGGER, str(tmp_path)), TEMPLATE)
+    environment: Environment = create_environment(LOGGER, str(tmp_path))
+    compiled: list[str] = []
+    compile_template = environment.compile
+    monkeypatch.setattr(environment, "compile", lambda *args: compiled.append(args[1]) or compile_template(*args))
+
+    template: Template = get_template(environment, TEMPLATE)
+    assert template.render(name="a", row={"ip": "b"}, severity=1) == "<td>a</td><td>B</td>23"
+    assert not compiled
+
+    environment.filters["reverse_words"] = lambda value: " ".join(reversed(value.split()))
+    get_template(environment, TEMPLATE)
+    assert len(compiled) == 1
+    assert len(list(tmp_path.iterdir())) == 2
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import copy
+import functools
 import json
 import re
 from typing import Any
@@ -23,6 +24,7 @@ from soar_sdk.ScriptResult import EXECUTION_STATE_COMPLETED, EXECUTION_STATE_FAI
 from soar_sdk.SiemplifyAction import SiemplifyAction
 from soar_sdk.SiemplifyUtils import convert_dict_to_json_result_dict, output_handler
 
+from ..core.TextMatching import TextMatcher
 from ..core.ToolsCommon import (
     ExecutionScope,
     get_case_alerts,
@@ -31,22 +33,25 @@ from ..core.ToolsCommon import (
 )
 
 
-def get_entity_object_by_identifier(
-    target_entities: list[Any], identifier: str
-) -> Any | None:
-    """Find an entity object in target entities list by case-insensitive identifier.
+@functools.cache
+def compile_regex(pattern: str) -> re.Pattern:
+    """Compile a regex once per action run."""
+    return re.compile(pattern)
+
+
+def get_entities_by_identifier(target_entities: list[Any]) -> dict[str, Any]:
+    """Index the target entities by their case-insensitive identifiers.
 
     Args:
-        target_entities: Pre-extracted list of target entities to search.
-        identifier: The target identifier to locate.
+        target_entities: Pre-extracted list of target entities to index.
 
     Returns:
-        The matching Entity SDK object if found, otherwise None.
+        The first entity of each lowercase identifier.
     """
+    entities_by_identifier = {}
     for entity in target_entities:
-        if identifier.lower() == entity.identifier.lower():
-            return entity
-    return None
+        entities_by_identifier.setdefault(entity.identifier.lower(), entity)
+    return entities_by_identifier
 
 
 @output_handler
@@ -77,6 +82,10 @@ def main() -> None:
             case_alerts=get_case_alerts(siemplify),
         )
 
+        # The search strings of each regex are extracted once. As before, every
+        # item overwrites the search items' strings, and the strings of the last
+        # processed item are the ones searched for all entities.
+        search_strings = {}
         for entity in target_entities:
             try:
                 entity_fields_json = copy.deepcopy(fields_json)
@@ -84,7 +93,7 @@ def main() -> None:
                     item_results = []
                     if item.get("RegexForFieldName"):
                         for key in entity.additional_properties.keys():
-                            if re.search(item.get("RegexForFieldName"), key):
+                            if compile_regex(item.get("RegexForFieldName")).search(key):
                                 item_results.append(
                                     {
                                         "key": key,
@@ -106,10 +115,9 @@ def main() -> None:
                     if item.get("RegexForFieldValue"):
                         values_post_regex = []
                         for val in item_results:
-                            post_regex_val = re.findall(
+                            post_regex_val = compile_regex(
                                 item.get("RegexForFieldValue"),
-                                val["val"],
-                            )
+                            ).findall(val["val"])
                             if isinstance(post_regex_val, list):
                                 values_post_regex.append(
                                     [
@@ -130,14 +138,15 @@ def main() -> None:
                     regex_for_search_field = item.get("RegEx")
                     if not regex_for_search_field:
                         regex_for_search_field = ".*"
-                    for search_item in search_data_json:
-                        search_string = re.findall(
-                            regex_for_search_field, search_item["Data"]
-                        )
-                        if isinstance(search_string, list):
-                            search_item["search_string"] = " ".join(search_string)
-                        else:
-                            search_item["search_string"] = search_string
+                    for index, search_item in enumerate(search_data_json):
+                        search_key = (regex_for_search_field, index)
+                        if search_key not in search_strings:
+                            search_strings[search_key] = " ".join(
+                                compile_regex(regex_for_search_field).findall(
+                                    search_item["Data"],
+                                ),
+                            )
+                        search_item["search_string"] = search_strings[search_key]
                 json_result[entity.identifier] = entity_fields_json
             except Exception as e:
                 failed_entities.append(entity.identifier)
@@ -146,19 +155,24 @@ def main() -> None:
                 )
                 siemplify.LOGGER.exception(e)
 
+        text_matcher = TextMatcher(
+            [search_item.get("search_string") for search_item in search_data_json],
+            (
+                val["val"]
+                for entity_data in json_result.values()
+                for item in entity_data
+                for vals in item["ResultsToSearch"]["val_to_search"]
+                for val in vals
+            ),
+            is_case_sensitive,
+        )
+        entities_by_identifier = get_entities_by_identifier(target_entities)
         for entity_id, entity_data in json_result.items():
             for item in entity_data:
                 for vals in item["ResultsToSearch"]["val_to_search"]:
-                    for search_in_item in search_data_json:
+                    for text_index, search_in_item in enumerate(search_data_json):
                         for val in vals:
-                            if (
-                                is_case_sensitive
-                                and val["val"] in search_in_item.get("search_string")
-                            ) or (
-                                not is_case_sensitive
-                                and val["val"].lower()
-                                in search_in_item.get("search_string").lower()
-                            ):
+                            if text_matcher.is_in(val["val"], text_index):
                                 item["ResultsToSearch"]["found_results"].append(
                                     {
                                         "to_search": val,
@@ -171,10 +185,7 @@ def main() -> None:
                                     1 + item["ResultsToSearch"]["num_of_results"]
                                 )
 
-                                ent = get_entity_object_by_identifier(
-                                    target_entities,
-                                    entity_id,
-                                )
+                                ent = entities_by_identifier.get(entity_id.lower())
                                 if ent:
                                     successfull_entities.append(ent)
                                     if enrich_key:
@@ -0,0 +1,151 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import functools
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+# Below this number of patterns, searching each text once per pattern with
+# `str.__contains__` is faster than running the automaton over it.
+AUTOMATON_MIN_PATTERNS = 256
+
+
+class AhoCorasick:
+    """Automaton that finds which of many patterns occur in a text in one pass."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """Build the automaton.
+
+        Args:
+            patterns: The non-empty patterns to search for.
+        """
+        self._transitions: list[dict[str, int]] = [{}]
+        self._outputs: list[list[str]] = [[]]
+        for pattern in dict.fromkeys(patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._transitions[state].get(char)
+                if next_state is None:
+                    next_state = len(self._transitions)
+                    self._transitions[state][char] = next_state
+                    self._transitions.append({})
+                    self._outputs.append([])
+                state = next_state
+            self._outputs[state].append(pattern)
+
+        self._fail: list[int] = [0] * len(self._transitions)
+        self._output_link: list[int] = [0] * len(self._transitions)
+        queue = collections.deque(self._transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._transitions[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._transitions[fail]:
+                    fail = self._fail[fail]
+                fail = self._transitions[fail].get(char, 0)
+                self._fail[next_state] = fail
+                self._output_link[next_state] = fail if self._outputs[fail] else self._output_link[fail]
+
+    def find(self, text: str) -> set[str]:
+        """Find the patterns that occur in a text.
+
+        Args:
+            text: The text to search in.
+
+        Returns:
+            The patterns found in the text.
+        """
+        transitions = self._transitions
+        fail = self._fail
+        found: set[str] = set()
+        visited: set[int] = set()
+        state = 0
+        for char in text:
+            while state and char not in transitions[state]:
+                state = fail[state]
+            state = transitions[state].get(char, 0)
+            output_state = state if self._outputs[state] else self._output_link[state]
+            while output_state and output_state not in visited:
+                visited.add(output_state)
+                found.update(self._outputs[output_state])
+                output_state = self._output_link[output_state]
+        return found
+
+
+class TextMatcher:
+    """Checks whether values are substrings of a fixed list of texts.
+
+    Each text is lowercased once and searched once for all the distinct
+    candidate values, with an Aho-Corasick automaton when there are many of
+    them, after which every check is a set lookup. The checks give the same
+    results as `value in text`, or `value.lower() in text.lower()` when not
+    case sensitive.
+    """
+
+    def __init__(
+        self,
+        texts: Sequence[Any],
+        values: Iterable[Any],
+        is_case_sensitive: bool,
+    ) -> None:
+        """Search the texts for the candidate values.
+
+        Args:
+            texts: The texts to search in.
+            values: The candidate values that will be checked.
+            is_case_sensitive: Whether the checks are case sensitive.
+        """
+        self.is_case_sensitive = is_case_sensitive
+        self._texts = texts
+        patterns = {self._normalize(value) for value in values if isinstance(value, str) and value}
+        find = (
+            AhoCorasick(patterns).find
+            if len(patterns) >= AUTOMATON_MIN_PATTERNS
+            else functools.partial(_find_each, patterns)
+        )
+        self._found: list[set[str] | None] = [
+            find(self._normalize(text)) if isinstance(text, str) else None for text in texts
+        ]
+
+    def is_in(self, value: Any, text_index: int) -> bool:
+        """Check whether a value is a substring of one of the texts.
+
+        Args:
+            value: The value to look for.
+            text_index: The index of the text to look in.
+
+        Returns:
+            True if the value occurs in the text.
+        """
+        found = self._found[text_index]
+        if found is None or not isinstance(value, str):
+            text = self._texts[text_index]
+            if self.is_case_sensitive:
+                return value in text
+            return value.lower() in text.lower()
+
+        return not value or self._normalize(value) in found
+
+    def _normalize(self, value: str) -> str:
+        return value if self.is_case_sensitive else value.lower()
+
+
+def _find_each(patterns: Iterable[str], text: str) -> set[str]:
+    return {pattern for pattern in patterns if pattern in text}
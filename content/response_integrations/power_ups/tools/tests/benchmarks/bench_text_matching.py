@@ -0,0 +1,80 @@
+"""Benchmark the text matcher against the per-check substring search.
+
+Usage:
+    python -m tools.tests.benchmarks.bench_text_matching
+
+Check Entities Fields In Text checks every value extracted from the entities
+against every search text. Without the matcher, each check searches the whole
+text again, and lowercases both the value and the text when the search isn't
+case sensitive. The table shows the time to check all the values of a run.
+"""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import random
+import string
+import time
+from typing import TYPE_CHECKING
+
+from tools.core.TextMatching import TextMatcher
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+TEXT_WORDS: tuple[int, ...] = (10_000, 100_000)
+VALUES: tuple[int, ...] = (50, 500, 2_000)
+TEXTS: int = 3
+RUNS: int = 3
+
+_RANDOM: random.Random = random.Random(0)
+
+
+def _word() -> str:
+    return "".join(_RANDOM.choices(string.ascii_letters + ".-", k=_RANDOM.randint(6, 14)))
+
+
+def _substring_checks(texts: list[str], values: list[str]) -> int:
+    return sum(value.lower() in text.lower() for text in texts for value in values)
+
+
+def _matcher_checks(texts: list[str], values: list[str]) -> int:
+    matcher: TextMatcher = TextMatcher(texts, values, is_case_sensitive=False)
+    return sum(matcher.is_in(value, text_index) for text_index in range(len(texts)) for value in values)
+
+
+def _measure(check: Callable[[list[str], list[str]], int], texts: list[str], values: list[str]) -> tuple[float, int]:
+    start: float = time.perf_counter()
+    for _ in range(RUNS):
+        found: int = check(texts, values)
+
+    return (time.perf_counter() - start) / RUNS, found
+
+
+def main() -> None:
+    print(f"{'words':>8}{'values':>8}{'search':>12}{'s/run':>10}{'found':>8}")  # ruff:ignore[print]
+    for words in TEXT_WORDS:
+        texts: list[str] = [" ".join(_word() for _ in range(words)) for _ in range(TEXTS)]
+        for value_count in VALUES:
+            values: list[str] = [_word() for _ in range(value_count // 2)]
+            values += [_RANDOM.choice(texts).split()[_RANDOM.randrange(words)] for _ in range(value_count // 2)]
+            for name, check in (("substring", _substring_checks), ("matcher", _matcher_checks)):
+                elapsed, found = _measure(check, texts, values)
+                print(f"{words:>8}{value_count:>8}{name:>12}{elapsed:>10.3f}{found:>8}")  # ruff:ignore[print]
+
+
+if __name__ == "__main__":
+    main()
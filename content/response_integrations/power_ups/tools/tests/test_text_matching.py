@@ -0,0 +1,64 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from tools.core.TextMatching import AUTOMATON_MIN_PATTERNS, AhoCorasick, TextMatcher
+
+ALPHABET: str = "abAB."
+
+
+def test_automaton_finds_overlapping_and_nested_patterns() -> None:
+    """Verify the automaton reports every pattern that occurs in a text."""
+    automaton: AhoCorasick = AhoCorasick(["he", "she", "his", "hers", "e", "xyz"])
+
+    assert automaton.find("ushers") == {"he", "she", "hers", "e"}
+    assert automaton.find("ahishe") == {"his", "she", "he", "e"}
+    assert not automaton.find("")
+
+
+@pytest.mark.parametrize("is_case_sensitive", [True, False])
+@pytest.mark.parametrize("pattern_count", [10, AUTOMATON_MIN_PATTERNS * 2])
+def test_matcher_agrees_with_substring_checks(is_case_sensitive: bool, pattern_count: int) -> None:
+    """Verify the matcher gives the same results as the substring checks.
+
+    Args:
+        is_case_sensitive: Whether the checks are case sensitive.
+        pattern_count: The number of candidate values.
+    """
+    rng: random.Random = random.Random(pattern_count)
+    texts: list[str] = ["".join(rng.choices(ALPHABET, k=500)) for _ in range(5)]
+    values: list[str] = ["", *("".join(rng.choices(ALPHABET, k=rng.randint(1, 6))) for _ in range(pattern_count))]
+
+    matcher: TextMatcher = TextMatcher(texts, values, is_case_sensitive)
+
+    for text_index, text in enumerate(texts):
+        for value in values:
+            expected: bool = value in text if is_case_sensitive else value.lower() in text.lower()
+            assert matcher.is_in(value, text_index) is expected
+
+
+def test_matcher_falls_back_to_substring_checks_for_other_types() -> None:
+    """Verify values and texts that aren't strings behave like substring checks."""
+    matcher: TextMatcher = TextMatcher(["1.1.1.1", None], ["1.1", 1], is_case_sensitive=True)
+
+    assert matcher.is_in("1.1", 0)
+    with pytest.raises(TypeError):
+        matcher.is_in(1, 0)
+    with pytest.raises(TypeError):
+        matcher.is_in("1.1", 1)
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import collections
 import dataclasses
 import re
 import urllib.parse
@@ -26,6 +27,7 @@ from TIPCommon.base.utils import is_native, nativemethod
 from integration_testing.aiohttp.response import MockClientResponse
 from integration_testing.custom_types import NO_RESPONSE, Product, Request, RouteFunction, UrlPath
 from integration_testing.request import HttpMethod, MockRequest
+from integration_testing.route_table import RouteMap, RouteMatchMode, RouteTables, warn_overridden_route
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, MutableMapping
@@ -34,7 +36,7 @@ if TYPE_CHECKING:
 
 
 Response = TypeVar("Response", bound=MockClientResponse)
-Routes = dict[str, dict[UrlPath, RouteFunction]]
+Routes = dict[str, RouteMap]
 
 
 @dataclasses.dataclass(slots=True, frozen=True)
@@ -44,15 +46,22 @@ class HistoryRecord(Generic[Request, Response]):
 
 
 class HistoryRecordsList(UserList[HistoryRecord[Request, Response]]):
-    def __init__(self, *history_records: HistoryRecord) -> None:
+    def __init__(self, *history_records: HistoryRecord, maxlen: int | None = None) -> None:
         if not all(isinstance(el, HistoryRecord) for el in history_records):
             msg: str = "List items must be of type HistoryRecord"
             raise TypeError(msg)
 
-        super().__init__(history_records)
+        self.maxlen: int | None = maxlen
+        super().__init__(history_records[-maxlen:] if maxlen else history_records)
 
     def __copy__(self) -> HistoryRecordsList:
-        return HistoryRecordsList(*self)
+        return HistoryRecordsList(*self, maxlen=self.maxlen)
+
+    def append(self, item: HistoryRecord) -> None:
+        """Append a record, dropping the oldest one if the list is full."""
+        super().append(item)
+        if self.maxlen is not None and len(self.data) > self.maxlen:
+            del self.data[0]
 
     def __getitem__(
         self,
@@ -88,18 +97,21 @@ class MockClientSession(aiohttp.ClientSession, Generic[Request, Response, Produc
         self,
         *args: Any,  # noqa: ANN401
         mock_product: Product | None = None,
+        history_limit: int | None = None,
         **kwargs: Any,  # noqa: ANN401
     ) -> None:
         super().__init__(*args, **kwargs)
         self._default_headers: SingleJson = {}
-        self.request_history: HistoryRecordsList[HistoryRecord] = HistoryRecordsList()
+        self.request_history: HistoryRecordsList[HistoryRecord] = HistoryRecordsList(maxlen=history_limit)
+        self.request_counts: collections.Counter[tuple[str, str]] = collections.Counter()
         self.routes: Routes = {
-            HttpMethod.GET.value: {},
-            HttpMethod.DELETE.value: {},
-            HttpMethod.POST.value: {},
-            HttpMethod.PUT.value: {},
-            HttpMethod.PATCH.value: {},
+            HttpMethod.GET.value: RouteMap(),
+            HttpMethod.DELETE.value: RouteMap(),
+            HttpMethod.POST.value: RouteMap(),
+            HttpMethod.PUT.value: RouteMap(),
+            HttpMethod.PATCH.value: RouteMap(),
         }
+        self._route_tables: RouteTables[RouteFunction] = RouteTables(RouteMatchMode.SEARCH)
 
         self._product: Product | None = mock_product
 
@@ -112,6 +124,7 @@ class MockClientSession(aiohttp.ClientSession, Generic[Request, Response, Produc
 
     def clear_record(self) -> None:
         self.request_history.clear()
+        self.request_counts.clear()
 
     async def request(
         self,
@@ -134,6 +147,7 @@ class MockClientSession(aiohttp.ClientSession, Generic[Request, Response, Produc
 
         history_record: HistoryRecord = HistoryRecord(request, response)
         self.request_history.append(history_record)
+        self.request_counts[method, parsed_url.path] += 1
 
         return response
 
@@ -155,11 +169,10 @@ class MockClientSession(aiohttp.ClientSession, Generic[Request, Response, Produc
     async def _do_request(self, method: str, request: Request) -> Response:
         response: Response = NO_RESPONSE
         path: str = request.url.path
-        for path_pattern, fn in self.routes[method].items():
-            if re.search(path_pattern, path) is not None:
-                response = fn(request)
-                response._request_info = request  # noqa: SLF001
-                break
+        fn: RouteFunction | None = self._route_tables.get(method, self.routes).match(path)
+        if fn is not None:
+            response = fn(request)
+            response._request_info = request  # noqa: SLF001
 
         self._validate_response(response, method, path)
         return response
@@ -191,4 +204,5 @@ class MockClientSession(aiohttp.ClientSession, Generic[Request, Response, Produc
             routes: MutableMapping[str, list[UrlPath]] = function.__routes__
             for method, paths in routes.items():
                 for path in paths:
+                    warn_overridden_route(self.routes[method], method, path, function)
                     self.routes[method][path] = function
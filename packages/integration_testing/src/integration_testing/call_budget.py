@@ -0,0 +1,274 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import contextvars
+import dataclasses
+import re
+import urllib.parse
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from TIPCommon.types import Entity, SingleJson
+
+    from .aiohttp.session import MockClientSession
+    from .platform.external_context import MockExternalContext
+    from .requests.session import MockSession
+
+    Session = MockSession | MockClientSession
+
+DEFAULT_N_PLUS_ONE_THRESHOLD: int = 3
+ID_PLACEHOLDER: str = "{id}"
+
+_ID_SEGMENT: re.Pattern[str] = re.compile(
+    r"""
+    \d+                                   # numeric IDs
+    | [0-9a-f]{8}(-[0-9a-f]{4}){3}-[0-9a-f]{12}  # UUIDs
+    | [0-9a-f]{16,}                       # hashes and hex IDs
+    | \d{1,3}(\.\d{1,3}){3}               # IPv4 addresses
+    | [^@]+@[^@]+                         # emails
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+_CURRENT_RECORDER: contextvars.ContextVar[CallRecorder | None] = contextvars.ContextVar(
+    "integration_testing_call_recorder",
+    default=None,
+)
+
+
+class CallBudgetExceededError(AssertionError):
+    """A test made more calls than its call budget allows."""
+
+
+class NPlusOneWarning(UserWarning):
+    """A test called the same route once per ID of its input."""
+
+
+@dataclasses.dataclass(slots=True)
+class CallBudget:
+    """The maximal number of calls a test may make.
+
+    Route patterns are "METHOD path regex" or a path regex for any method, and
+    fully match the URL path of requests. Context key patterns fully match
+    either a context row's property key or its "identifier/property key".
+
+    Attributes:
+        routes: The maximal number of requests by route pattern.
+        context_reads: The maximal number of context reads by key pattern.
+        context_writes: The maximal number of context writes by key pattern.
+        n_plus_one: Whether to flag N+1 call patterns.
+        n_plus_one_threshold: The number of distinct IDs called on the same
+            route from which it is flagged as N+1.
+
+    """
+
+    routes: dict[str, int] = dataclasses.field(default_factory=dict)
+    context_reads: dict[str, int] = dataclasses.field(default_factory=dict)
+    context_writes: dict[str, int] = dataclasses.field(default_factory=dict)
+    n_plus_one: bool = True
+    n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD
+
+    def route(self, pattern: str, max_calls: int) -> CallBudget:
+        """Limit the number of requests to a route pattern.
+
+        Returns:
+            Self
+
+        """
+        self.routes[pattern] = max_calls
+        return self
+
+    def context_key(self, pattern: str, max_reads: int | None = None, max_writes: int | None = None) -> CallBudget:
+        """Limit the number of reads or writes of a context key pattern.
+
+        Returns:
+            Self
+
+        """
+        if max_reads is not None:
+            self.context_reads[pattern] = max_reads
+
+        if max_writes is not None:
+            self.context_writes[pattern] = max_writes
+
+        return self
+
+    def check(self, profile: CallProfile) -> list[str]:
+        """Get the budget violations of a call profile."""
+        violations: list[str] = []
+        for pattern, max_calls in self.routes.items():
+            calls: int = sum(count for route, count in profile.routes.items() if _route_matches(pattern, route))
+            if calls > max_calls:
+                violations.append(f"route '{pattern}' was called {calls} times, over its budget of {max_calls}")
+
+        for operation, budgets, counts in (
+            ("read", self.context_reads, profile.context_reads),
+            ("written", self.context_writes, profile.context_writes),
+        ):
+            for pattern, max_calls in budgets.items():
+                calls: int = sum(count for key, count in counts.items() if _context_key_matches(pattern, key))
+                if calls > max_calls:
+                    violations.append(
+                        f"context key '{pattern}' was {operation} {calls} times, over its budget of {max_calls}"
+                    )
+
+        return violations
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class NPlusOneFinding:
+    """A route called once per ID of a test's input.
+
+    Attributes:
+        route: The route, with its ID segments replaced by "{id}".
+        calls: The number of requests to the route.
+        distinct_ids: The number of distinct IDs the route was called with.
+
+    """
+
+    route: str
+    calls: int
+    distinct_ids: int
+
+
+@dataclasses.dataclass(slots=True)
+class CallProfile:
+    """The calls a test made.
+
+    Attributes:
+        routes: The number of requests by "METHOD path".
+        context_reads: The number of context reads by "identifier/property key".
+        context_writes: The number of context writes by "identifier/property key".
+        n_plus_one: The routes called once per ID of the test's input.
+
+    """
+
+    routes: dict[str, int]
+    context_reads: dict[str, int]
+    context_writes: dict[str, int]
+    n_plus_one: list[NPlusOneFinding]
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.routes.values())
+
+    def to_json(self) -> SingleJson:
+        return {
+            "total_calls": self.total_calls,
+            "routes": self.routes,
+            "context_reads": self.context_reads,
+            "context_writes": self.context_writes,
+            "n_plus_one": [dataclasses.asdict(finding) for finding in self.n_plus_one],
+        }
+
+
+class CallRecorder:
+    """Records the calls of a test's mock sessions and external contexts."""
+
+    def __init__(self, n_plus_one_threshold: int = DEFAULT_N_PLUS_ONE_THRESHOLD) -> None:
+        self.n_plus_one_threshold: int = n_plus_one_threshold
+        self.identifiers: set[str] = set()
+        self._sessions: dict[int, tuple[Session, collections.Counter[tuple[str, str]]]] = {}
+        self._contexts: dict[int, tuple[MockExternalContext, collections.Counter, collections.Counter]] = {}
+
+    def track_session(self, session: Session) -> None:
+        """Record the requests a mock session sends from now on."""
+        if id(session) not in self._sessions:
+            self._sessions[id(session)] = (session, collections.Counter(session.request_counts))
+
+    def track_context(self, external_context: MockExternalContext) -> None:
+        """Record the reads and writes of an external context from now on."""
+        if id(external_context) not in self._contexts:
+            self._contexts[id(external_context)] = (
+                external_context,
+                collections.Counter(external_context.key_reads),
+                collections.Counter(external_context.key_writes),
+            )
+
+    def track_entities(self, entities: Iterable[Entity]) -> None:
+        """Treat the identifiers of the test's entities as IDs in URL paths."""
+        self.identifiers.update(entity.identifier.lower() for entity in entities)
+
+    def profile(self) -> CallProfile:
+        """Get the profile of the calls recorded so far."""
+        routes: collections.Counter[str] = collections.Counter()
+        normalized_calls: collections.Counter[str] = collections.Counter()
+        paths_by_route: dict[str, set[str]] = collections.defaultdict(set)
+        for session, counts in self._sessions.values():
+            for (method, path), count in (session.request_counts - counts).items():
+                normalized_route: str = f"{method} {self.normalize_path(path)}"
+                routes[f"{method} {path}"] += count
+                normalized_calls[normalized_route] += count
+                paths_by_route[normalized_route].add(path)
+
+        context_reads: collections.Counter[str] = collections.Counter()
+        context_writes: collections.Counter[str] = collections.Counter()
+        for external_context, reads, writes in self._contexts.values():
+            context_reads.update(_context_keys(external_context.key_reads - reads))
+            context_writes.update(_context_keys(external_context.key_writes - writes))
+
+        n_plus_one: list[NPlusOneFinding] = [
+            NPlusOneFinding(route, normalized_calls[route], len(paths))
+            for route, paths in paths_by_route.items()
+            if ID_PLACEHOLDER in route and len(paths) >= self.n_plus_one_threshold
+        ]
+        return CallProfile(dict(routes), dict(context_reads), dict(context_writes), n_plus_one)
+
+    def normalize_path(self, path: str) -> str:
+        """Replace the ID segments of a URL path with "{id}"."""
+        return "/".join(ID_PLACEHOLDER if self._is_id(segment) else segment for segment in path.split("/"))
+
+    def _is_id(self, segment: str) -> bool:
+        segment = urllib.parse.unquote(segment)
+        return bool(segment) and (segment.lower() in self.identifiers or _ID_SEGMENT.fullmatch(segment) is not None)
+
+
+def get_call_recorder() -> CallRecorder | None:
+    """Get the call recorder of the running test, if any."""
+    return _CURRENT_RECORDER.get()
+
+
+@contextlib.contextmanager
+def recording(recorder: CallRecorder) -> Generator[CallRecorder, None, None]:
+    """Make a recorder the running test's call recorder in a scope."""
+    token: contextvars.Token = _CURRENT_RECORDER.set(recorder)
+    try:
+        yield recorder
+
+    finally:
+        _CURRENT_RECORDER.reset(token)
+
+
+def _route_matches(pattern: str, route: str) -> bool:
+    method, _, path = route.partition(" ")
+    pattern_method, _, pattern_path = pattern.partition(" ")
+    if not pattern_path:
+        return re.fullmatch(pattern, path) is not None
+
+    return pattern_method.upper() == method and re.fullmatch(pattern_path, path) is not None
+
+
+def _context_key_matches(pattern: str, key: str) -> bool:
+    _, _, property_key = key.rpartition("/")
+    return re.fullmatch(pattern, property_key) is not None or re.fullmatch(pattern, key) is not None
+
+
+def _context_keys(counts: collections.Counter[tuple[str, str]]) -> collections.Counter[str]:
+    return collections.Counter({f"{identifier}/{key}": count for (identifier, key), count in counts.items()})
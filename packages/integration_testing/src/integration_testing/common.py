@@ -328,8 +328,12 @@ def get_def_file_content(def_file_path: str | pathlib.Path | None) -> SingleJson
 
 
 def set_sys_argv(args: list[str]) -> None:
-    """Set 'sys.argv'."""
-    sys.argv = args
+    """Set 'sys.argv'.
+
+    The arguments are replaced in place, so within `isolation.scoped_argv` only
+    the current test's arguments change.
+    """
+    sys.argv[:] = args
 
 
 def set_is_first_run_to_true() -> None:
@@ -14,7 +14,10 @@
 
 from __future__ import annotations
 
+import json
+import pathlib
 import sys
+import warnings
 from typing import TYPE_CHECKING
 
 import pytest
@@ -24,115 +27,218 @@ from SiemplifyBase import SiemplifyBase
 from SiemplifyConnectors import SiemplifyConnectorExecution
 from TIPCommon.base.utils import CreateSession
 
+from .call_budget import CallBudget, CallBudgetExceededError, CallProfile, CallRecorder, NPlusOneWarning, recording
 from .common import use_live_api
+from .isolation import scoped_argv, scoped_patches, shared_patch
+from .load.harness import LoadHarness
 from .logger import Logger
 from .platform.external_context import MockExternalContext
 from .platform.script_output import MockActionOutput, MockConnectorOutput
 from .requests.session import MockSession
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Generator, Iterator
+
+CALL_BUDGET_KEY: pytest.StashKey[CallBudget] = pytest.StashKey[CallBudget]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the call profile options."""
+    group: pytest.OptionGroup = parser.getgroup("integration_testing")
+    group.addoption(
+        "--call-profile",
+        metavar="PATH",
+        default=None,
+        help="Append the call profile of each test to a JSON Lines file.",
+    )
+    group.addoption(
+        "--fail-on-n-plus-one",
+        action="store_true",
+        default=False,
+        help="Fail tests that call a route once per ID of their input, instead of warning.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the call budget marker."""
+    config.addinivalue_line(
+        "markers",
+        "call_budget(routes=None, context_reads=None, context_writes=None, n_plus_one=True, "
+        "n_plus_one_threshold=3): limit the requests and context operations of a test. "
+        "See integration_testing.call_budget.CallBudget",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item) -> Generator[None, object, object]:
+    """Profile the calls of each test and check them against its call budget.
+
+    Raises:
+        CallBudgetExceededError: If the test made more calls than its budget
+            allows, or called a route once per ID of its input while
+            `--fail-on-n-plus-one` is set.
+
+    """
+    budget: CallBudget = _get_call_budget(item)
+    recorder: CallRecorder = CallRecorder()
+    funcargs: dict[str, object] = getattr(item, "funcargs", {})
+    for session_fixture in ("script_session", "sdk_session"):
+        if isinstance(funcargs.get(session_fixture), MockSession):
+            recorder.track_session(funcargs[session_fixture])
+
+    with recording(recorder):
+        result: object = yield
+
+    recorder.n_plus_one_threshold = budget.n_plus_one_threshold
+    profile: CallProfile = recorder.profile()
+    _report_call_profile(item, profile)
+
+    violations: list[str] = budget.check(profile)
+    if budget.n_plus_one:
+        for finding in profile.n_plus_one:
+            msg: str = (
+                f"route '{finding.route}' was called {finding.calls} times with "
+                f"{finding.distinct_ids} distinct IDs, consider batching the calls"
+            )
+            if item.config.getoption("fail_on_n_plus_one"):
+                violations.append(msg)
+
+            else:
+                warnings.warn(msg, NPlusOneWarning, stacklevel=1)
+
+    if violations:
+        raise CallBudgetExceededError("Call budget exceeded:\n" + "\n".join(violations))
+
+    return result
+
+
+@pytest.fixture
+def call_budget(request: pytest.FixtureRequest) -> CallBudget:
+    """The call budget of the test, set by its `call_budget` marker.
+
+    Tests can extend it, e.g. `call_budget.route("GET /api/alerts/.+", 1)`.
+
+    Returns:
+        The test's call budget.
+
+    """
+    return _get_call_budget(request.node)
+
+
+def _get_call_budget(item: pytest.Item) -> CallBudget:
+    if CALL_BUDGET_KEY not in item.stash:
+        marker: pytest.Mark | None = item.get_closest_marker("call_budget")
+        item.stash[CALL_BUDGET_KEY] = CallBudget(**marker.kwargs) if marker is not None else CallBudget()
+
+    return item.stash[CALL_BUDGET_KEY]
+
+
+def _report_call_profile(item: pytest.Item, profile: CallProfile) -> None:
+    profile_json: dict[str, object] = profile.to_json()
+    item.user_properties.append(("call_profile", json.dumps(profile_json)))
+
+    path: str | None = item.config.getoption("call_profile")
+    if path is not None:
+        with pathlib.Path(path).open("a", encoding="utf-8") as file:
+            file.write(json.dumps({"test": item.nodeid, **profile_json}) + "\n")
 
 
 @pytest.fixture(autouse=True)
-def script_session(monkeypatch: pytest.MonkeyPatch) -> MockSession:
+def script_session() -> Iterator[MockSession]:
     """Mock scripts' sessions and to view request and response history.
 
-    Returns:
+    Yields:
         A mock session object.
 
     """
     session: MockSession = MockSession()
-    if not use_live_api():
-        monkeypatch.setattr(CreateSession, "create_session", lambda: session)
+    if use_live_api():
+        yield session
+        return
 
-    return session
+    with scoped_patches([(CreateSession, "create_session", lambda: session)]):
+        yield session
 
 
 @pytest.fixture(autouse=True)
-def sdk_session(monkeypatch: pytest.MonkeyPatch) -> MockSession:
+def sdk_session() -> Iterator[MockSession]:
     """Automatic fixture used in tests to provide a mock HTTP session for SDK tests.
 
     It substitutes the real API call with a mocked session for test purposes unless
     the live API is explicitly used.
 
-    Args:
-        monkeypatch: A monkeypatch fixture used to dynamically modify or patch
-            module or object attributes within the test session.
-
-    Returns:
+    Yields:
         MockSession: A custom session object used as a mock when interacting with
             the SDK during tests.
 
     """
     session: MockSession = MockSession()
-    if not use_live_api():
-        monkeypatch.setattr(SiemplifyBase, "create_session", lambda *_: session)
+    if use_live_api():
+        yield session
+        return
 
-    return session
+    with scoped_patches([(SiemplifyBase, "create_session", lambda *_: session)]):
+        yield session
 
 
 @pytest.fixture(autouse=True)
-def mock_sys_exit(monkeypatch: pytest.MonkeyPatch) -> None:
-    """Fixture to mock the `sys.exit` function with a no-operation lambda.
+def mock_sys_exit() -> Iterator[None]:
+    """Fixture to mock the `sys.exit` function with a no-operation function.
 
     This fixture is automatically used in all tests to prevent the actual
     termination of the Python interpreter when `sys.exit` is called during testing.
-
-    Args:
-        monkeypatch (pytest.MonkeyPatch): A pytest utility to set or alter
-            attributes during tests.
-
     """
-    monkeypatch.setattr(sys, "exit", lambda _: ...)
+    with shared_patch(sys, "exit", _do_not_exit):
+        yield
 
 
 @pytest.fixture(autouse=True)
-def mock_siemplify_logger(monkeypatch: pytest.MonkeyPatch) -> None:
+def mock_siemplify_logger() -> Iterator[None]:
     """Mock the SiemplifyLogger class with a custom Logger.
 
     This fixture ensures that the Logger class replaces any references to the
     SiemplifyLogger class within the test environment. This is particularly useful for
     testing purposes where dependency injection or mocking is required.
-
-    Args:
-        monkeypatch: A special test object provided by pytest to temporarily
-            modify or patch objects, methods, or properties.
-
     """
-    monkeypatch.setattr(SiemplifyLogger, "SiemplifyLogger", Logger)
+    with shared_patch(SiemplifyLogger, "SiemplifyLogger", Logger):
+        yield
 
 
 @pytest.fixture(autouse=True)
-def mock_sys_argv(monkeypatch: pytest.MonkeyPatch) -> None:
+def mock_sys_argv() -> Iterator[list[str]]:
     """Mock `sys.argv` for tests to provide custom arguments during test execution.
 
     This fixture is automatically used in tests.
-    It replaces the `sys.argv` attribute with a predefined list of command-line
-    arguments to simulate different runtime inputs.
+    It sets `sys.argv` to a predefined list of command-line arguments, in the
+    test's own context, to simulate different runtime inputs.
 
-    Args:
-        monkeypatch: The pytest MonkeyPatch fixture used to modify or replace
-            attributes dynamically during test execution.
+    Yields:
+        The test's arguments.
 
     """
-    monkeypatch.setattr(sys, "argv", ["", "True", ""])
+    with scoped_argv(["", "True", ""]) as argv:
+        yield argv
 
 
 @pytest.fixture(autouse=True)
-def run_folder(monkeypatch: pytest.MonkeyPatch) -> None:
+def run_folder(tmp_path: pathlib.Path) -> Iterator[pathlib.Path]:
     """Automatically applied fixture to mock the `run_folder`.
 
-    Mocking the method of the`SiemplifyConnectorExecution` class.
-    This fixture ensures that the `run_folder`
-    method always returns the string "run".
+    Mocking the property of the `SiemplifyConnectorExecution` class.
+    This fixture ensures that the `run_folder` of each test is its own
+    temporary folder, so tests running in parallel don't share files.
 
     Args:
-        monkeypatch: A pytest fixture that enables monkeypatching
-            of methods and properties during tests.
+        tmp_path: The test's temporary directory.
+
+    Yields:
+        The test's run folder.
 
     """
-    monkeypatch.setattr(SiemplifyConnectorExecution, "run_folder", lambda: "run")
+    folder: pathlib.Path = tmp_path / "run"
+    folder.mkdir()
+    with scoped_patches([(SiemplifyConnectorExecution, "run_folder", property(lambda _: str(folder)))]):
+        yield folder
 
 
 @pytest.fixture
@@ -192,3 +298,29 @@ def external_context() -> MockExternalContext:
 
     """
     return MockExternalContext()
+
+
+@pytest.fixture
+def load_harness(
+    request: pytest.FixtureRequest,
+    script_session: MockSession,
+    sdk_session: MockSession,
+) -> LoadHarness:
+    """Load harness that measures the test's script under a generated workload.
+
+    The harness counts the requests of the script's and the SDK's mock sessions.
+    To count external context reads and writes, set its `external_context` to the
+    context passed to `set_metadata`.
+
+    Returns:
+        A load harness named after the test.
+
+    """
+    return LoadHarness(
+        request.node.name,
+        product_sessions=[script_session],
+        platform_sessions=[sdk_session],
+    )
+
+
+def _do_not_exit(_: object) -> None: ...
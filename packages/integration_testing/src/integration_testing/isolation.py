@@ -0,0 +1,261 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
+import dataclasses
+import functools
+import pkgutil
+import sys
+import threading
+import types
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable, Mapping
+
+PatchKey = tuple[int, str]
+
+_PATCHES: contextvars.ContextVar[Mapping[PatchKey, object]] = contextvars.ContextVar(
+    "integration_testing_patches",
+    default=types.MappingProxyType({}),
+)
+_ARGV: contextvars.ContextVar[list[str] | None] = contextvars.ContextVar("integration_testing_argv", default=None)
+_LOCK: threading.Lock = threading.Lock()
+
+
+@dataclasses.dataclass(slots=True)
+class _InstalledPatch:
+    owner: object
+    name: str
+    original: object
+    is_local: bool
+    replacement: object
+    users: int = 0
+
+
+_INSTALLED: dict[PatchKey, _InstalledPatch] = {}
+
+
+class ScopedArgv(collections.UserList):
+    """`sys.argv` whose items are set per context by `scoped_argv`.
+
+    Outside any scope, it holds the process's original arguments.
+    """
+
+    def __init__(self, default: list[str]) -> None:
+        self._default: list[str] = default
+
+    @property
+    def data(self) -> list[str]:
+        argv: list[str] | None = _ARGV.get()
+        return self._default if argv is None else argv
+
+    @data.setter
+    def data(self, value: list[str]) -> None:
+        self.data[:] = value
+
+    def __getitem__(self, i: int | slice) -> str | list[str]:
+        return self.data[i]
+
+    def __repr__(self) -> str:
+        return repr(self.data)
+
+
+class _ScopedAttribute:
+    """A class attribute whose value is looked up in the current context."""
+
+    def __init__(self, key: PatchKey, original: object) -> None:
+        self.key: PatchKey = key
+        self.original: object = original
+
+    def __get__(self, instance: object, owner: type | None = None) -> object:
+        value: object = _PATCHES.get().get(self.key, self.original)
+        get: Callable | None = getattr(type(value), "__get__", None)
+        return value if get is None else get(value, instance, owner)
+
+
+def resolve_target(target: str) -> tuple[object, str]:
+    """Resolve a patch target like "package.module.Class.attribute".
+
+    Returns:
+        The object that owns the attribute, and the attribute's name.
+
+    """
+    owner_path, _, name = target.rpartition(".")
+    return pkgutil.resolve_name(owner_path), name
+
+
+@contextlib.contextmanager
+def scoped_patches(patches: Iterable[tuple[object, str, object]]) -> Generator[None, None, None]:
+    """Patch class and module attributes for the current context only.
+
+    Each attribute is replaced once, while any scope patches it, by a dispatcher
+    that looks its value up in a context variable. Tests running concurrently
+    in other threads or tasks see only their own patches, and code outside any
+    scope sees the original attribute. Threads started and thread pool tasks
+    submitted within the scope run in a copy of its context, so they see its
+    patches too.
+
+    Args:
+        patches: The owner, attribute name and patched value of each patch.
+            Module attributes can only be patched with callables.
+
+    """
+    values: dict[PatchKey, object] = {}
+    with _LOCK:
+        for owner, name, value in patches:
+            key: PatchKey = _acquire(owner, name, _create_dispatcher)
+            values[key] = value
+
+        propagation_keys: list[PatchKey] = _acquire_context_propagation()
+
+    token: contextvars.Token = _PATCHES.set(types.MappingProxyType({**_PATCHES.get(), **values}))
+    try:
+        yield
+
+    finally:
+        _PATCHES.reset(token)
+        with _LOCK:
+            for key in (*values, *propagation_keys):
+                _release(key)
+
+
+@contextlib.contextmanager
+def shared_patch(owner: object, name: str, value: object) -> Generator[None, None, None]:
+    """Patch an attribute with the same value for all concurrent scopes.
+
+    The attribute is restored when the last scope that patched it exits.
+
+    Raises:
+        ValueError: If the attribute is already patched with a different value.
+
+    """
+    with _LOCK:
+        key: PatchKey = _acquire(owner, name, lambda *_: value)
+        if _INSTALLED[key].replacement is not value:
+            _release(key)
+            msg: str = f"'{name}' of {owner!r} is already patched with another value"
+            raise ValueError(msg)
+
+    try:
+        yield
+
+    finally:
+        with _LOCK:
+            _release(key)
+
+
+@contextlib.contextmanager
+def scoped_argv(args: Iterable[str]) -> Generator[list[str], None, None]:
+    """Set `sys.argv` for the current context only.
+
+    Like patches, the arguments are seen by threads started and thread pool
+    tasks submitted within the scope.
+
+    Yields:
+        The context's arguments, which `sys.argv` reads and writes in the scope.
+
+    """
+    argv: list[str] = list(args)
+    with _LOCK:
+        keys: list[PatchKey] = [_acquire(sys, "argv", _create_scoped_argv), *_acquire_context_propagation()]
+
+    token: contextvars.Token = _ARGV.set(argv)
+    try:
+        yield argv
+
+    finally:
+        _ARGV.reset(token)
+        with _LOCK:
+            for key in keys:
+                _release(key)
+
+
+def _acquire(owner: object, name: str, create_replacement: Callable[[object, PatchKey, object], object]) -> PatchKey:
+    key: PatchKey = id(owner), name
+    installed: _InstalledPatch | None = _INSTALLED.get(key)
+    if installed is None:
+        is_local: bool = name in getattr(owner, "__dict__", {})
+        original: object = vars(owner)[name] if is_local else getattr(owner, name)
+        replacement: object = create_replacement(owner, key, original)
+        installed = _InstalledPatch(owner, name, original, is_local, replacement)
+        setattr(owner, name, replacement)
+        _INSTALLED[key] = installed
+
+    installed.users += 1
+    return key
+
+
+def _acquire_context_propagation() -> list[PatchKey]:
+    return [
+        _acquire(threading.Thread, "start", _create_context_start),
+        _acquire(concurrent.futures.ThreadPoolExecutor, "submit", _create_context_submit),
+    ]
+
+
+def _release(key: PatchKey) -> None:
+    installed: _InstalledPatch = _INSTALLED[key]
+    installed.users -= 1
+    if installed.users:
+        return
+
+    del _INSTALLED[key]
+    if installed.is_local or isinstance(installed.owner, types.ModuleType):
+        setattr(installed.owner, installed.name, installed.original)
+
+    else:
+        delattr(installed.owner, installed.name)
+
+
+def _create_dispatcher(owner: object, key: PatchKey, original: object) -> object:
+    if not isinstance(owner, types.ModuleType):
+        return _ScopedAttribute(key, original)
+
+    if not callable(original):
+        msg: str = f"Module attribute '{key[1]}' can only be patched per context if it is callable"
+        raise TypeError(msg)
+
+    @functools.wraps(original)
+    def dispatch(*args: object, **kwargs: object) -> object:
+        return _PATCHES.get().get(key, original)(*args, **kwargs)
+
+    return dispatch
+
+
+def _create_scoped_argv(_owner: object, _key: PatchKey, original: list[str]) -> ScopedArgv:
+    return original if isinstance(original, ScopedArgv) else ScopedArgv(original)
+
+
+def _create_context_start(_owner: object, _key: PatchKey, original: Callable) -> Callable:
+    @functools.wraps(original)
+    def start(thread: threading.Thread) -> None:
+        thread.run = functools.partial(contextvars.copy_context().run, thread.run)
+        original(thread)
+
+    return start
+
+
+def _create_context_submit(_owner: object, _key: PatchKey, original: Callable) -> Callable:
+    @functools.wraps(original)
+    def submit(
+        executor: concurrent.futures.ThreadPoolExecutor, fn: Callable, /, *args: object, **kwargs: object
+    ) -> concurrent.futures.Future:
+        return original(executor, contextvars.copy_context().run, fn, *args, **kwargs)
+
+    return submit
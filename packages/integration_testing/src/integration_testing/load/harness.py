@@ -0,0 +1,271 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import dataclasses
+import gc
+import inspect
+import json
+import pathlib
+import statistics
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from .profiles import apply_profiles
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from TIPCommon.types import SingleJson
+
+    from integration_testing.aiohttp.session import MockClientSession
+    from integration_testing.platform.external_context import MockExternalContext
+    from integration_testing.requests.session import MockSession
+
+    from .profiles import ErrorProfile, LatencyProfile
+    from .workload import Workload
+
+    Session = MockSession | MockClientSession
+
+
+@dataclasses.dataclass(slots=True)
+class RunMetrics:
+    """The measurements of a single script run.
+
+    Attributes:
+        wall_time_s: The elapsed time of the run.
+        cpu_time_s: The CPU time of the process during the run.
+        peak_memory_bytes: The peak memory allocated during the run, if traced.
+        product_calls: The number of requests sent to the mocked product.
+        platform_calls: The number of requests sent to the mocked platform.
+        calls_by_route: The number of product and platform requests by
+            "METHOD /path".
+        context_reads: The number of external context values read.
+        context_writes: The number of external context values written.
+        context_bytes_written: The total size of external context values written.
+        context_lost_updates: The number of external context writes that
+            overwrote a concurrent instance's write.
+        error: The error the script raised, if any.
+
+    """
+
+    wall_time_s: float
+    cpu_time_s: float
+    peak_memory_bytes: int | None
+    product_calls: int
+    platform_calls: int
+    calls_by_route: dict[str, int]
+    context_reads: int = 0
+    context_writes: int = 0
+    context_bytes_written: int = 0
+    context_lost_updates: int = 0
+    error: str | None = None
+
+    def to_json(self) -> SingleJson:
+        return dataclasses.asdict(self)
+
+
+@dataclasses.dataclass(slots=True)
+class LoadReport:
+    """The results of running a script under a workload."""
+
+    name: str
+    workload: Workload
+    runs: list[RunMetrics]
+
+    def summary(self) -> SingleJson:
+        """Get the median of each numeric measurement across the runs."""
+        fields: tuple[str, ...] = (
+            "wall_time_s",
+            "cpu_time_s",
+            "peak_memory_bytes",
+            "product_calls",
+            "platform_calls",
+            "context_reads",
+            "context_writes",
+            "context_bytes_written",
+            "context_lost_updates",
+        )
+        summary: SingleJson = {}
+        for field in fields:
+            values: list[float] = [getattr(run, field) for run in self.runs if getattr(run, field) is not None]
+            summary[field] = statistics.median(values) if values else None
+
+        summary["errors"] = sum(run.error is not None for run in self.runs)
+        return summary
+
+    def to_json(self) -> SingleJson:
+        return {
+            "name": self.name,
+            "workload": self.workload.to_json(),
+            "summary": self.summary(),
+            "runs": [run.to_json() for run in self.runs],
+        }
+
+    def append_to(self, path: str | pathlib.Path) -> None:
+        """Append the report to a JSON Lines file, one report per line."""
+        with pathlib.Path(path).open("a", encoding="utf-8") as file:
+            file.write(json.dumps(self.to_json()) + "\n")
+
+
+class LoadHarness:
+    """Runs a marketplace script under a generated workload and measures it.
+
+    The harness measures each run's wall time, CPU time and peak memory, the
+    requests sent to the mocked product and platform, and the external context
+    reads and writes. Latency and error profiles are applied to the product's
+    mock sessions during the runs.
+
+    Example:
+        >>> workload = Workload(alerts_per_page=100, pages=10)
+        >>> product.alert_pages = workload.create_alert_pages(create_alert)
+        >>> report = load_harness.run(lambda: MyConnector().start(), workload, runs=3)
+        >>> report.append_to("load_reports.jsonl")
+
+    Attributes:
+        name: The name of the measured script, used in the report.
+        product_sessions: The mock sessions of the product.
+        platform_sessions: The mock sessions of the SOAR platform.
+        external_context: The mock external context the script uses.
+        latency: The latency profile of the product.
+        errors: The error profile of the product.
+        trace_memory: Whether to trace the peak memory of runs. Tracing slows
+            the run, so disable it to measure timing alone.
+
+    """
+
+    def __init__(  # ruff:ignore[too-many-arguments]
+        self,
+        name: str,
+        *,
+        product_sessions: Iterable[Session] = (),
+        platform_sessions: Iterable[Session] = (),
+        external_context: MockExternalContext | None = None,
+        latency: LatencyProfile | None = None,
+        errors: ErrorProfile | None = None,
+        trace_memory: bool = True,
+    ) -> None:
+        self.name: str = name
+        self.product_sessions: list[Session] = list(product_sessions)
+        self.platform_sessions: list[Session] = list(platform_sessions)
+        self.external_context: MockExternalContext | None = external_context
+        self.latency: LatencyProfile | None = latency
+        self.errors: ErrorProfile | None = errors
+        self.trace_memory: bool = trace_memory
+
+    def run(
+        self,
+        script: Callable[[], object],
+        workload: Workload,
+        *,
+        runs: int = 1,
+        setup: Callable[[Workload], object] | None = None,
+    ) -> LoadReport:
+        """Run a script under a workload and measure each run.
+
+        Args:
+            script: Runs the script, e.g. `lambda: MyAction().run()`. Coroutines
+                it returns are run to completion.
+            workload: The workload the mocked product was set up with.
+            runs: The number of times to run the script.
+            setup: Called with the workload before each run, outside the
+                measurement, e.g. to reset the mocked product.
+
+        Returns:
+            The report of all runs.
+
+        """
+        return LoadReport(self.name, workload, [self._run_once(script, workload, setup) for _ in range(runs)])
+
+    def _run_once(
+        self,
+        script: Callable[[], object],
+        workload: Workload,
+        setup: Callable[[Workload], object] | None,
+    ) -> RunMetrics:
+        if setup is not None:
+            setup(workload)
+
+        product_calls: collections.Counter[str] = _count_calls(self.product_sessions)
+        platform_calls: collections.Counter[str] = _count_calls(self.platform_sessions)
+        context_counters: tuple[int, int, int, int] = self._context_counters()
+        error: str | None = None
+
+        gc.collect()
+        start_tracing: bool = self.trace_memory and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+
+        wall_start: float = time.perf_counter()
+        cpu_start: float = time.process_time()
+        try:
+            with apply_profiles(self.product_sessions, self.latency, self.errors):
+                result: object = script()
+                if inspect.iscoroutine(result):
+                    asyncio.run(result)
+
+        except Exception as e:  # ruff:ignore[blind-except]
+            error = f"{type(e).__name__}: {e}"
+
+        wall_time: float = time.perf_counter() - wall_start
+        cpu_time: float = time.process_time() - cpu_start
+        peak_memory: int | None = tracemalloc.get_traced_memory()[1] if self.trace_memory else None
+        if start_tracing:
+            tracemalloc.stop()
+
+        product_calls = _count_calls(self.product_sessions) - product_calls
+        platform_calls = _count_calls(self.platform_sessions) - platform_calls
+        reads, writes, bytes_written, lost_updates = (
+            after - before for after, before in zip(self._context_counters(), context_counters, strict=True)
+        )
+        return RunMetrics(
+            wall_time_s=wall_time,
+            cpu_time_s=cpu_time,
+            peak_memory_bytes=peak_memory,
+            product_calls=product_calls.total(),
+            platform_calls=platform_calls.total(),
+            calls_by_route=dict(product_calls + platform_calls),
+            context_reads=reads,
+            context_writes=writes,
+            context_bytes_written=bytes_written,
+            context_lost_updates=lost_updates,
+            error=error,
+        )
+
+    def _context_counters(self) -> tuple[int, int, int, int]:
+        if self.external_context is None:
+            return 0, 0, 0, 0
+
+        return (
+            self.external_context.reads,
+            self.external_context.writes,
+            self.external_context.bytes_written,
+            self.external_context.lost_updates.total(),
+        )
+
+
+def _count_calls(sessions: Iterable[Session]) -> collections.Counter[str]:
+    calls: collections.Counter[str] = collections.Counter()
+    for session in sessions:
+        for (method, path), count in session.request_counts.items():
+            calls[f"{method} {path}"] += count
+
+    return calls
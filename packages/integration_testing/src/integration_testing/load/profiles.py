@@ -0,0 +1,171 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import functools
+import random
+import re
+import time
+from typing import TYPE_CHECKING
+
+from integration_testing.aiohttp.response import MockClientResponse
+from integration_testing.aiohttp.session import MockClientSession
+from integration_testing.requests.response import MockResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+    from integration_testing.aiohttp.session import MockClientSession as AsyncSession
+    from integration_testing.request import MockRequest
+    from integration_testing.requests.session import MockSession
+
+
+@dataclasses.dataclass(slots=True)
+class LatencyProfile:
+    """Simulated latency of a mocked product's responses.
+
+    Attributes:
+        base_ms: The latency of every response.
+        jitter_ms: The maximal random latency added to the base latency.
+        path_pattern: If set, only requests whose URL path matches this regex
+            are delayed.
+        seed: The seed of the jitter, so runs are reproducible.
+
+    """
+
+    base_ms: float = 0.0
+    jitter_ms: float = 0.0
+    path_pattern: str | None = None
+    seed: int | None = 0
+    _random: random.Random = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._random = random.Random(self.seed)  # ruff:ignore[suspicious-non-cryptographic-random-usage]
+
+    def delay(self, path: str) -> float:
+        """Get the latency in seconds of a response to a URL path."""
+        if self.path_pattern is not None and re.search(self.path_pattern, path) is None:
+            return 0.0
+
+        return (self.base_ms + self._random.uniform(0, self.jitter_ms)) / 1_000
+
+
+@dataclasses.dataclass(slots=True)
+class ErrorProfile:
+    """Simulated errors of a mocked product.
+
+    Attributes:
+        rate: The probability of a request to fail, between 0 and 1.
+        status_code: The status code of failed requests.
+        exception: If set, failed requests raise this exception type instead of
+            returning an error response, e.g. `requests.ConnectionError`.
+        path_pattern: If set, only requests whose URL path matches this regex
+            can fail.
+        seed: The seed of the failures, so runs are reproducible.
+
+    """
+
+    rate: float = 0.0
+    status_code: int = 503
+    exception: type[Exception] | None = None
+    path_pattern: str | None = None
+    seed: int | None = 0
+    _random: random.Random = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._random = random.Random(self.seed)  # ruff:ignore[suspicious-non-cryptographic-random-usage]
+
+    def should_fail(self, path: str) -> bool:
+        """Decide whether a request to a URL path fails."""
+        if self.path_pattern is not None and re.search(self.path_pattern, path) is None:
+            return False
+
+        return self._random.random() < self.rate
+
+    def fail(self, request: MockRequest) -> None:
+        """Raise the profile's exception for a failed request, if it has one."""
+        if self.exception is not None:
+            msg: str = f"Simulated failure of {request.method.value} {request.url.path}"
+            raise self.exception(msg)
+
+
+@contextlib.contextmanager
+def apply_profiles(
+    sessions: list[MockSession | AsyncSession],
+    latency: LatencyProfile | None = None,
+    errors: ErrorProfile | None = None,
+) -> Generator[None, None, None]:
+    """Apply latency and error profiles to mock sessions within a scope.
+
+    Args:
+        sessions: The mock sessions of the product.
+        latency: The latency profile of the product's responses.
+        errors: The error profile of the product.
+
+    """
+    if latency is None and errors is None:
+        yield
+        return
+
+    for session in sessions:
+        session._do_request = _profiled(session, latency, errors)  # ruff:ignore[private-member-access]
+
+    try:
+        yield
+
+    finally:
+        for session in sessions:
+            vars(session).pop("_do_request", None)
+
+
+def _profiled(
+    session: MockSession | AsyncSession,
+    latency: LatencyProfile | None,
+    errors: ErrorProfile | None,
+) -> Callable:
+    do_request: Callable = session._do_request  # ruff:ignore[private-member-access]
+
+    if isinstance(session, MockClientSession):
+
+        @functools.wraps(do_request)
+        async def do_async_request(method: str, request: MockRequest) -> MockClientResponse:
+            path: str = request.url.path
+            if latency is not None:
+                await asyncio.sleep(latency.delay(path))
+
+            if errors is not None and errors.should_fail(path):
+                errors.fail(request)
+                return MockClientResponse(status_code=errors.status_code, method=method, url=path)
+
+            return await do_request(method, request)
+
+        return do_async_request
+
+    @functools.wraps(do_request)
+    def do_sync_request(method: str, request: MockRequest) -> MockResponse:
+        path: str = request.url.path
+        if latency is not None:
+            time.sleep(latency.delay(path))
+
+        if errors is not None and errors.should_fail(path):
+            errors.fail(request)
+            return MockResponse(status_code=errors.status_code)
+
+        return do_request(method, request)
+
+    return do_sync_request
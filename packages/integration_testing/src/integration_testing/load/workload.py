@@ -0,0 +1,78 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING, TypeVar
+
+from TIPCommon.base.action import EntityTypesEnum
+
+from integration_testing.common import create_entity
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from TIPCommon.types import Entity, SingleJson
+
+_T = TypeVar("_T")
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class Workload:
+    """The size of a generated workload.
+
+    Attributes:
+        entities: The number of entities an action runs on.
+        alerts_per_page: The number of alerts in each page the product returns.
+        pages: The number of alert pages the product returns.
+        entity_identifier: The template of the entities' identifiers, formatted
+            with the entity's index.
+
+    """
+
+    entities: int = 0
+    alerts_per_page: int = 0
+    pages: int = 1
+    entity_identifier: str = "entity-{index}"
+
+    @property
+    def total_alerts(self) -> int:
+        return self.alerts_per_page * self.pages
+
+    def create_entities(self, type_: EntityTypesEnum = EntityTypesEnum.HOST_NAME) -> list[Entity]:
+        """Create the workload's entities, to pass to `set_metadata`."""
+        return [create_entity(self.entity_identifier.format(index=index), type_) for index in range(self.entities)]
+
+    def create_alert_pages(self, create_alert: Callable[[int], _T]) -> list[list[_T]]:
+        """Create the alert pages of the workload for a mocked product.
+
+        Args:
+            create_alert: Creates the product's alert with a running index.
+
+        Returns:
+            The alert pages, each with `alerts_per_page` alerts.
+
+        """
+        return [
+            [create_alert(page * self.alerts_per_page + index) for index in range(self.alerts_per_page)]
+            for page in range(self.pages)
+        ]
+
+    def to_json(self) -> SingleJson:
+        return {
+            "entities": self.entities,
+            "alerts_per_page": self.alerts_per_page,
+            "pages": self.pages,
+        }
@@ -14,31 +14,100 @@
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
+import contextvars
 import dataclasses
+import itertools
+import threading
+import time
 from typing import TYPE_CHECKING, Generic, TypeVar
 
+import SiemplifyUtils
 from TIPCommon.data_models import DatabaseContextType
 from TIPCommon.utils import none_to_default_value
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Hashable, Sequence
 
     from TIPCommon.types import SingleJson
 
+    from integration_testing.load.profiles import LatencyProfile
+
 _T = TypeVar("_T")
+_R = TypeVar("_R")
 
 _KEY_GROUP_SEPARATOR: str = "␝"
 
+_INSTANCE: contextvars.ContextVar[Hashable | None] = contextvars.ContextVar(
+    "integration_testing_context_instance",
+    default=None,
+)
 
-class MockExternalContext(Generic[_T]):
-    __slots__: tuple[str] = ("_rows",)
+_CONCURRENT_RUNS: itertools.count = itertools.count()
+
+RowKey = tuple[str, str]
 
-    def __init__(self, rows: list[ExternalContextRow[_T]] | None = None) -> None:
+
+class MockExternalContext(Generic[_T]):
+    """A simulated external context store of the SOAR platform.
+
+    Besides storing rows, the store counts the reads, writes and bytes written
+    of each (identifier, property key), can enforce the platform's maximal
+    property value size and delay each operation, and is safe to share between
+    script instances running concurrently (see `run_concurrently`). An instance
+    that writes a key another instance wrote since the first instance last read
+    or wrote it overwrites that write, which is counted as a lost update.
+
+    Args:
+        rows: The initial rows of the context.
+        enforce_size_limit: Whether writing values larger than
+            `SiemplifyUtils.MAXIMUM_PROPERTY_VALUE` raises an error, as the
+            platform does. The limit is read on each write, so tests can patch it.
+        latency: The latency of each operation, matched against the property key.
+
+    """
+
+    __slots__: tuple[str, ...] = (
+        "_bytes_written",
+        "_enforce_size_limit",
+        "_key_bytes_written",
+        "_key_reads",
+        "_key_writes",
+        "_latency",
+        "_lock",
+        "_lost_updates",
+        "_reads",
+        "_rows",
+        "_seen_versions",
+        "_versions",
+        "_writes",
+    )
+
+    def __init__(
+        self,
+        rows: list[ExternalContextRow[_T]] | None = None,
+        *,
+        enforce_size_limit: bool = False,
+        latency: LatencyProfile | None = None,
+    ) -> None:
         rows: list[ExternalContextRow[_T]] = none_to_default_value(rows, [])
         self._rows: SingleJson = {
             _create_key(r.context_type, r.identifier, r.property_key): r.property_value
             for r in rows
         }
+        self._reads: int = 0
+        self._writes: int = 0
+        self._bytes_written: int = 0
+        self._key_reads: collections.Counter[RowKey] = collections.Counter()
+        self._key_writes: collections.Counter[RowKey] = collections.Counter()
+        self._key_bytes_written: collections.Counter[RowKey] = collections.Counter()
+        self._lost_updates: collections.Counter[RowKey] = collections.Counter()
+        self._versions: collections.Counter[str] = collections.Counter()
+        self._seen_versions: dict[tuple[Hashable, str], int] = {}
+        self._enforce_size_limit: bool = enforce_size_limit
+        self._latency: LatencyProfile | None = latency
+        self._lock: threading.RLock = threading.RLock()
 
     def __contains__(self, item: _T) -> bool:
         return (
@@ -54,6 +123,63 @@ class MockExternalContext(Generic[_T]):
     def number_of_rows(self) -> int:
         return len(self._rows)
 
+    @property
+    def reads(self) -> int:
+        """The number of row values read by scripts."""
+        return self._reads
+
+    @property
+    def writes(self) -> int:
+        """The number of row values written by scripts."""
+        return self._writes
+
+    @property
+    def bytes_written(self) -> int:
+        """The total size of the row values written by scripts."""
+        return self._bytes_written
+
+    @property
+    def key_reads(self) -> collections.Counter[RowKey]:
+        """The number of reads by (identifier, property key)."""
+        return self._key_reads
+
+    @property
+    def key_writes(self) -> collections.Counter[RowKey]:
+        """The number of writes by (identifier, property key)."""
+        return self._key_writes
+
+    @property
+    def key_bytes_written(self) -> collections.Counter[RowKey]:
+        """The total size of the values written by (identifier, property key)."""
+        return self._key_bytes_written
+
+    @property
+    def lost_updates(self) -> collections.Counter[RowKey]:
+        """The number of writes that overwrote another instance's unseen write."""
+        return self._lost_updates
+
+    def report(self) -> ExternalContextReport:
+        """Get the reads, writes and sizes of each key in the context."""
+        with self._lock:
+            sizes: collections.Counter[RowKey] = collections.Counter()
+            for key, value in self._rows.items():
+                _, identifier, property_key = key.split(_KEY_GROUP_SEPARATOR, 2)
+                sizes[identifier, property_key] += _value_size(value)
+
+            row_keys: set[RowKey] = {*sizes, *self._key_reads, *self._key_writes}
+            return ExternalContextReport([
+                ExternalContextKeyStats(
+                    identifier=identifier,
+                    property_key=property_key,
+                    reads=self._key_reads[identifier, property_key],
+                    writes=self._key_writes[identifier, property_key],
+                    bytes_written=self._key_bytes_written[identifier, property_key],
+                    size=sizes[identifier, property_key],
+                    lost_updates=self._lost_updates[identifier, property_key],
+                )
+                for identifier, property_key in sorted(row_keys)
+            ])
+
     def has_row(self, row: ExternalContextRow[_T] | ExternalContextRowKey) -> bool:
         """Check whether a row is in the context.
 
@@ -96,7 +222,12 @@ class MockExternalContext(Generic[_T]):
 
         """
         key: str = _create_key(context_type, identifier, property_key)
-        return self._rows.get(key)
+        self._simulate_latency(property_key)
+        with self._lock:
+            self._reads += 1
+            self._key_reads[identifier, property_key] += 1
+            self._seen_versions[_get_instance(), key] = self._versions[key]
+            return self._rows.get(key)
 
     def set_row_value(
         self,
@@ -113,9 +244,34 @@ class MockExternalContext(Generic[_T]):
             property_key: The property key of the row to set
             property_value: The property value of the row to set
 
+        Raises:
+            ValueError: If the size limit is enforced and the value is larger
+                than the platform's maximal property value size.
+
         """
         key: str = _create_key(context_type, identifier, property_key)
-        self._rows[key] = property_value
+        size: int = _value_size(property_value)
+        if self._enforce_size_limit and size > SiemplifyUtils.MAXIMUM_PROPERTY_VALUE:
+            msg: str = (
+                f"The value of '{property_key}' is {size} bytes, over the maximal "
+                f"property value size of {SiemplifyUtils.MAXIMUM_PROPERTY_VALUE}"
+            )
+            raise ValueError(msg)
+
+        self._simulate_latency(property_key)
+        with self._lock:
+            instance_key: tuple[Hashable, str] = (_get_instance(), key)
+            seen_version: int | None = self._seen_versions.get(instance_key)
+            if seen_version is not None and seen_version != self._versions[key]:
+                self._lost_updates[identifier, property_key] += 1
+
+            self._versions[key] += 1
+            self._seen_versions[instance_key] = self._versions[key]
+            self._rows[key] = property_value
+            self._writes += 1
+            self._key_writes[identifier, property_key] += 1
+            self._key_bytes_written[identifier, property_key] += size
+            self._bytes_written += size
 
     def delete_row(
         self,
@@ -135,14 +291,14 @@ class MockExternalContext(Generic[_T]):
 
         """
         key: str = _create_key(context_type, identifier, property_key)
+        self._simulate_latency(property_key)
+        with self._lock:
+            if key not in self._rows:
+                msg: str = "Could not find a value in the external context using the provided parameters"
+                raise ValueError(msg)
 
-        if key not in self._rows:
-            msg: str = (
-                "Could not find a value in the external context using the provided parameters"
-            )
-            raise ValueError(msg)
-
-        del self._rows[key]
+            del self._rows[key]
+            self._versions[key] += 1
 
     def set_rows(self, rows: Sequence[ExternalContextRow[_T]]) -> MockExternalContext:
         """Set a list of rows in the context.
@@ -214,6 +370,118 @@ class MockExternalContext(Generic[_T]):
 
         return self
 
+    def _simulate_latency(self, property_key: str) -> None:
+        if self._latency is not None:
+            time.sleep(self._latency.delay(property_key))
+
+
+def run_concurrently(scripts: Sequence[Callable[[], _R]]) -> list[_R]:
+    """Run scripts as concurrent instances, e.g. of a connector.
+
+    Each script runs in its own thread, in a copy of the caller's context so it
+    keeps the test's patches, and all scripts start together. External context
+    operations are attributed to the script's instance, so instances racing on
+    the same keys are reported as lost updates.
+
+    Args:
+        scripts: The scripts to run, e.g. `set_metadata` decorated functions.
+
+    Returns:
+        The scripts' results, in order.
+
+    """
+    if not scripts:
+        return []
+
+    run: int = next(_CONCURRENT_RUNS)
+    barrier: threading.Barrier = threading.Barrier(len(scripts))
+
+    def run_instance(instance: int, script: Callable[[], _R]) -> _R:
+        _INSTANCE.set((run, instance))
+        barrier.wait()
+        return script()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(scripts)) as executor:
+        futures: list[concurrent.futures.Future[_R]] = [
+            executor.submit(contextvars.copy_context().run, run_instance, instance, script)
+            for instance, script in enumerate(scripts)
+        ]
+        return [future.result() for future in futures]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ExternalContextKeyStats:
+    """The operations on a single (identifier, property key) of the context.
+
+    Attributes:
+        identifier: The identifier of the rows.
+        property_key: The property key of the rows.
+        reads: The number of reads of the key.
+        writes: The number of writes of the key.
+        bytes_written: The total size of the values written to the key.
+        size: The size of the key's current value.
+        lost_updates: The number of writes that overwrote another instance's
+            unseen write.
+
+    """
+
+    identifier: str
+    property_key: str
+    reads: int
+    writes: int
+    bytes_written: int
+    size: int
+    lost_updates: int
+
+    @property
+    def write_amplification(self) -> float | None:
+        """The bytes written to the key per byte of its current value."""
+        return self.bytes_written / self.size if self.size else None
+
+    def to_json(self) -> SingleJson:
+        return {**dataclasses.asdict(self), "write_amplification": self.write_amplification}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ExternalContextReport:
+    """The operations on each key of an external context."""
+
+    keys: list[ExternalContextKeyStats]
+
+    @property
+    def bytes_written(self) -> int:
+        return sum(key.bytes_written for key in self.keys)
+
+    @property
+    def size(self) -> int:
+        return sum(key.size for key in self.keys)
+
+    @property
+    def lost_updates(self) -> int:
+        return sum(key.lost_updates for key in self.keys)
+
+    def to_json(self) -> SingleJson:
+        return {
+            "reads": sum(key.reads for key in self.keys),
+            "writes": sum(key.writes for key in self.keys),
+            "bytes_written": self.bytes_written,
+            "size": self.size,
+            "lost_updates": self.lost_updates,
+            "keys": [key.to_json() for key in self.keys],
+        }
+
+
+def _get_instance() -> Hashable:
+    instance: Hashable | None = _INSTANCE.get()
+    return threading.get_ident() if instance is None else instance
+
+
+def _value_size(value: object) -> int:
+    if isinstance(value, bytes):
+        return len(value)
+
+    return len(str(value).encode())
+
 
 def _create_key(context_type: int | DatabaseContextType, identifier: str, property_key: str) -> str:
     if isinstance(context_type, DatabaseContextType):
@@ -14,8 +14,8 @@
 
 from __future__ import annotations
 
+import collections
 import dataclasses
-import re
 import urllib.parse
 from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
@@ -26,6 +26,7 @@ from TIPCommon.base.utils import is_native, nativemethod
 
 from integration_testing.custom_types import NO_RESPONSE, Product, Request, RouteFunction, UrlPath
 from integration_testing.request import HttpMethod, MockRequest
+from integration_testing.route_table import RouteMap, RouteMatchMode, RouteTables, warn_overridden_route
 
 from .response import MockResponse
 
@@ -36,7 +37,7 @@ if TYPE_CHECKING:
 
 
 Response = TypeVar("Response", bound=MockResponse)
-Routes = dict[str, dict[UrlPath, RouteFunction[Response]]]
+Routes = dict[str, RouteMap]
 
 
 @dataclasses.dataclass(slots=True, frozen=True)
@@ -46,21 +47,32 @@ class HistoryRecord(Generic[Request, Response]):
 
 
 class MockSession(requests.Session, Session[Response], Generic[Request, Response, Product]):
-    def __init__(self, mock_product: Product | None = None) -> None:
-        """Initialize the session."""
+    def __init__(self, mock_product: Product | None = None, *, history_limit: int | None = None) -> None:
+        """Initialize the session.
+
+        Args:
+            mock_product: The mocked product the routes act on.
+            history_limit: If set, only the last `history_limit` requests are
+                kept in `request_history`. `request_counts` counts all requests.
+
+        """
         super().__init__()
         self.verify: bool = True
         self.headers: SingleJson = {}
         self.adapters: OrderedDict = OrderedDict()
         self.stream: bool = False
-        self.request_history: list[HistoryRecord] = []
+        self.request_history: list[HistoryRecord] | collections.deque[HistoryRecord] = (
+            [] if history_limit is None else collections.deque(maxlen=history_limit)
+        )
+        self.request_counts: collections.Counter[tuple[str, str]] = collections.Counter()
         self.routes: Routes = {
-            HttpMethod.GET.value: {},
-            HttpMethod.DELETE.value: {},
-            HttpMethod.POST.value: {},
-            HttpMethod.PUT.value: {},
-            HttpMethod.PATCH.value: {},
+            HttpMethod.GET.value: RouteMap(),
+            HttpMethod.DELETE.value: RouteMap(),
+            HttpMethod.POST.value: RouteMap(),
+            HttpMethod.PUT.value: RouteMap(),
+            HttpMethod.PATCH.value: RouteMap(),
         }
+        self._route_tables: RouteTables[RouteFunction[Response]] = RouteTables(RouteMatchMode.FULL)
 
         self._product: Product | None = mock_product
 
@@ -75,6 +87,7 @@ class MockSession(requests.Session, Session[Response], Generic[Request, Response
     def clear_record(self) -> None:
         """Clear the request history."""
         self.request_history.clear()
+        self.request_counts.clear()
 
     def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> Response:  # noqa: ANN401
         """Mock a general request method."""
@@ -91,6 +104,7 @@ class MockSession(requests.Session, Session[Response], Generic[Request, Response
 
         history_record: HistoryRecord = HistoryRecord(request, response)
         self.request_history.append(history_record)
+        self.request_counts[method, parsed_url.path] += 1
 
         return response
 
@@ -117,10 +131,9 @@ class MockSession(requests.Session, Session[Response], Generic[Request, Response
     def _do_request(self, method: str, request: Request) -> Response:
         response: Response = NO_RESPONSE
         path: str = request.url.path
-        for path_pattern, fn in self.routes[method].items():
-            if re.fullmatch(path_pattern, path) is not None:
-                response = fn(request)
-                break
+        fn: RouteFunction[Response] | None = self._route_tables.get(method, self.routes).match(path)
+        if fn is not None:
+            response = fn(request)
 
         self._validate_response(response, method, path)
         return response
@@ -159,4 +172,5 @@ class MockSession(requests.Session, Session[Response], Generic[Request, Response
             routes: MutableMapping[str, set[UrlPath]] = function.__routes__
             for method, paths in routes.items():
                 for path in paths:
+                    warn_overridden_route(self.routes[method], method, path, function)
                     self.routes[method][path] = function
@@ -0,0 +1,304 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import enum
+import re
+import warnings
+from collections import UserDict
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, MutableMapping
+
+    from .custom_types import RouteFunction, UrlPath
+
+Route = TypeVar("Route")
+
+_META_CHARS: frozenset[str] = frozenset("\\.^$*+?{}[]|()")
+_QUANTIFIERS: frozenset[str] = frozenset("*+?{")
+_SCOPED_FLAGS: dict[re.RegexFlag, str] = {
+    re.IGNORECASE: "i",
+    re.MULTILINE: "m",
+    re.DOTALL: "s",
+    re.VERBOSE: "x",
+}
+_BACKREFERENCE: re.Pattern[str] = re.compile(r"\\\d|\(\?P=")
+
+
+class RouteMatchMode(enum.Enum):
+    """How a route pattern is matched against a request's URL path."""
+
+    FULL = "fullmatch"
+    SEARCH = "search"
+
+
+class RouteConflictWarning(UserWarning):
+    """A route overrides another route, or can never be reached."""
+
+
+class RouteMap(UserDict):
+    """A method's routes, counting changes so compiled tables know when to rebuild."""
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        self.version: int = 0
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, key: UrlPath, value: object) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: UrlPath) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+
+class RouteTable(Generic[Route]):
+    """Routes of an HTTP method, compiled once for fast dispatch.
+
+    Routes are bucketed by the first segment of their literal prefix, so a
+    request is only matched against the routes that can match its path and
+    the routes without a usable prefix. The routes of each bucket are matched
+    by a single alternation regex with a named group per route, compiled the
+    first time the bucket is used. The first route, in registration order,
+    that matches a path wins, as when trying the patterns one by one.
+
+    Routes that can't be combined, like patterns with backreferences, make the
+    table fall back to trying precompiled patterns one by one.
+
+    Attributes:
+        shadowed_routes: Pairs of (route, literal route it shadows), for literal
+            routes that an earlier route always matches first.
+
+    """
+
+    def __init__(self, routes: Mapping[UrlPath, Route], match_mode: RouteMatchMode = RouteMatchMode.FULL) -> None:
+        self.match_mode: RouteMatchMode = match_mode
+        self._patterns: list[UrlPath] = list(routes)
+        self._routes: list[Route] = list(routes.values())
+        self._compiled: list[re.Pattern[str]] = [re.compile(pattern) for pattern in self._patterns]
+        self._combinable: bool = all(map(_is_combinable, self._compiled))
+        self._matchers: dict[str | None, _Matcher[Route]] = {}
+        self._buckets: dict[str | None, list[int]] = {}
+        for index, pattern in enumerate(self._compiled):
+            self._buckets.setdefault(_bucket_key(pattern, match_mode), []).append(index)
+
+        self.shadowed_routes: list[tuple[UrlPath, UrlPath]] = self._find_shadowed_routes()
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def match(self, path: str) -> Route | None:
+        """Get the first route matching a URL path, or None if no route matches."""
+        key: str | None = _path_key(path)
+        matcher: _Matcher[Route] | None = self._matchers.get(key)
+        if matcher is None:
+            matcher = self._matchers[key] = self._build_matcher(key)
+
+        return matcher.match(path)
+
+    def warn_shadowed_routes(self, method: str) -> None:
+        """Warn about literal routes that an earlier route always matches first."""
+        for pattern, shadowed in self.shadowed_routes:
+            msg: str = (
+                f"'{method}' route {_pattern_repr(shadowed)} is never reached, "
+                f"since route {_pattern_repr(pattern)} matches it first"
+            )
+            warnings.warn(msg, RouteConflictWarning, stacklevel=2)
+
+    def _build_matcher(self, key: str | None) -> _Matcher[Route]:
+        indexes: list[int] = self._buckets.get(None, [])
+        if key is not None and key in self._buckets:
+            indexes = sorted(indexes + self._buckets[key])
+
+        if self._combinable:
+            try:
+                return _CombinedMatcher(
+                    [self._compiled[i] for i in indexes],
+                    [self._routes[i] for i in indexes],
+                    self.match_mode,
+                )
+
+            except re.error:
+                self._combinable = False
+
+        return _SequentialMatcher(
+            [self._compiled[i] for i in indexes], [self._routes[i] for i in indexes], self.match_mode
+        )
+
+    def _find_shadowed_routes(self) -> list[tuple[UrlPath, UrlPath]]:
+        shadowed: list[tuple[UrlPath, UrlPath]] = []
+        for later, pattern in enumerate(self._compiled):
+            if pattern.flags & ~re.UNICODE or _literal_prefix(pattern.pattern) != pattern.pattern:
+                continue
+
+            for earlier in range(later):
+                if _match(self._compiled[earlier], pattern.pattern, self.match_mode):
+                    shadowed.append((self._patterns[earlier], self._patterns[later]))
+                    break
+
+        return shadowed
+
+
+class RouteTables(Generic[Route]):
+    """The compiled route tables of a session, rebuilt when its routes change."""
+
+    def __init__(self, match_mode: RouteMatchMode = RouteMatchMode.FULL) -> None:
+        self.match_mode: RouteMatchMode = match_mode
+        self._tables: dict[str, tuple[RouteMap, int, RouteTable[Route]]] = {}
+
+    def get(self, method: str, routes: MutableMapping[str, MutableMapping[UrlPath, Route]]) -> RouteTable[Route]:
+        """Get the compiled table of a method's routes.
+
+        Args:
+            method: The HTTP method.
+            routes: The session's routes by method. A method's routes are
+                replaced with a `RouteMap` if they are a plain mapping.
+
+        Returns:
+            The compiled table of the method's current routes.
+
+        """
+        method_routes: MutableMapping[UrlPath, Route] = routes[method]
+        if not isinstance(method_routes, RouteMap):
+            method_routes = routes[method] = RouteMap(method_routes)
+
+        cached: tuple[RouteMap, int, RouteTable[Route]] | None = self._tables.get(method)
+        if cached is not None and cached[0] is method_routes and cached[1] == method_routes.version:
+            return cached[2]
+
+        table: RouteTable[Route] = RouteTable(method_routes, self.match_mode)
+        table.warn_shadowed_routes(method)
+        self._tables[method] = (method_routes, method_routes.version, table)
+        return table
+
+
+class _Matcher(Generic[Route]):
+    def match(self, path: str) -> Route | None:
+        raise NotImplementedError
+
+
+class _SequentialMatcher(_Matcher[Route]):
+    def __init__(
+        self,
+        patterns: list[re.Pattern[str]],
+        routes: list[Route],
+        match_mode: RouteMatchMode,
+    ) -> None:
+        self._pairs: list[tuple[re.Pattern[str], Route]] = list(zip(patterns, routes, strict=True))
+        self._match_mode: RouteMatchMode = match_mode
+
+    def match(self, path: str) -> Route | None:
+        for pattern, route in self._pairs:
+            if _match(pattern, path, self._match_mode):
+                return route
+
+        return None
+
+
+class _CombinedMatcher(_Matcher[Route]):
+    def __init__(
+        self,
+        patterns: list[re.Pattern[str]],
+        routes: list[Route],
+        match_mode: RouteMatchMode,
+    ) -> None:
+        self._routes: dict[str, Route] = {f"_route_{i}": route for i, route in enumerate(routes)}
+        prefix: str = "(?s:.*?)" if match_mode is RouteMatchMode.SEARCH else ""
+        alternatives: Iterable[str] = (
+            f"{prefix}(?P<_route_{i}>{_scoped(pattern)})" for i, pattern in enumerate(patterns)
+        )
+        regex: re.Pattern[str] = re.compile("|".join(alternatives) or "(?!)")
+        self._match = regex.match if match_mode is RouteMatchMode.SEARCH else regex.fullmatch
+
+    def match(self, path: str) -> Route | None:
+        match: re.Match[str] | None = self._match(path)
+        return None if match is None else self._routes[match.lastgroup]
+
+
+def warn_overridden_route(
+    routes: Mapping[UrlPath, RouteFunction],
+    method: str,
+    path: UrlPath,
+    function: RouteFunction,
+) -> None:
+    """Warn if a route path is already routed to another function."""
+    routed: RouteFunction | None = routes.get(path)
+    if routed is not None and routed is not function:
+        msg: str = f"'{method}' route {path!r} of '{routed.__name__}' is overridden by '{function.__name__}'"
+        warnings.warn(msg, RouteConflictWarning, stacklevel=3)
+
+
+def _match(pattern: re.Pattern[str], path: str, match_mode: RouteMatchMode) -> bool:
+    if match_mode is RouteMatchMode.SEARCH:
+        return pattern.search(path) is not None
+
+    return pattern.fullmatch(path) is not None
+
+
+def _is_combinable(pattern: re.Pattern[str]) -> bool:
+    flags: int = pattern.flags & ~re.UNICODE
+    for flag in _SCOPED_FLAGS:
+        flags &= ~flag
+
+    return not flags and _BACKREFERENCE.search(pattern.pattern) is None
+
+
+def _scoped(pattern: re.Pattern[str]) -> str:
+    flags: str = "".join(letter for flag, letter in _SCOPED_FLAGS.items() if pattern.flags & flag)
+    return f"(?{flags}:{pattern.pattern})" if flags else f"(?:{pattern.pattern})"
+
+
+def _literal_prefix(pattern: str) -> str:
+    if "|" in pattern:
+        return ""
+
+    for index, char in enumerate(pattern):
+        if char in _META_CHARS:
+            return pattern[: max(index - 1, 0)] if char in _QUANTIFIERS else pattern[:index]
+
+    return pattern
+
+
+def _bucket_key(pattern: re.Pattern[str], match_mode: RouteMatchMode) -> str | None:
+    source: str = pattern.pattern
+    if pattern.flags & (re.IGNORECASE | re.VERBOSE):
+        return None
+
+    if match_mode is RouteMatchMode.SEARCH:
+        if not source.startswith("^") or pattern.flags & re.MULTILINE:
+            return None
+
+        source = source[1:]
+
+    # The prefix must hold the whole first segment, unless a full match
+    # of a literal pattern ends it
+    prefix: str = _literal_prefix(source)
+    whole_segment: bool = prefix.count("/") > 1 or (prefix == source and match_mode is RouteMatchMode.FULL)
+    if not prefix.startswith("/") or not whole_segment:
+        return None
+
+    return _path_key(prefix)
+
+
+def _path_key(path: str) -> str | None:
+    if not path.startswith("/"):
+        return None
+
+    return path.split("/", 2)[1]
+
+
+def _pattern_repr(pattern: UrlPath) -> str:
+    return repr(pattern.pattern if isinstance(pattern, re.Pattern) else pattern)
@@ -16,14 +16,15 @@ from __future__ import annotations
 
 import functools
 import inspect
-import unittest.mock
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from TIPCommon.types import Entity, GeneralFunction, SingleJson, Supplier
 from TIPCommon.utils import none_to_default_value
 
+from .call_budget import get_call_recorder
 from .common import get_def_file_content, prepare_connector_params, prepare_job_params
+from .isolation import resolve_target, scoped_patches
 from .platform.external_context import MockExternalContext
 from .platform.input_context import get_mock_input_context
 
@@ -33,6 +34,8 @@ if TYPE_CHECKING:
     from TIPCommon.base.job import JobParameter
     from TIPCommon.data_models import ConnectorParameter
 
+    from .call_budget import CallRecorder
+
 TestFn = Callable[..., None]
 PatchParams = tuple[str, GeneralFunction]
 
@@ -116,21 +119,26 @@ def set_metadata(  # noqa: PLR0913, PLR0917
             get_db_context_path_2, mock_get_db_context_2 = _get_get_context_path_and_fn_2(ec)
             entities_path, get_entities = _get_entities_path_and_fn(entities)
             entities_path_2, get_entities_2 = _get_entities_path_and_fn_2(entities)
-
-            with (
-                unittest.mock.patch(json_context_path, mock_get_context),
-                unittest.mock.patch(json_context_path_2, mock_get_context_2),
-                unittest.mock.patch(config_path, mock_get_config),
-                unittest.mock.patch(config_path_2, mock_get_config_2),
-                unittest.mock.patch(set_db_context_path, mock_set_db_context),
-                unittest.mock.patch(set_db_context_path_2, mock_set_db_context_2),
-                unittest.mock.patch(get_db_context_path, mock_get_db_context),
-                unittest.mock.patch(get_db_context_path_2, mock_get_db_context_2),
-                unittest.mock.patch(job_params_path, mock_job_params),
-                unittest.mock.patch(connector_params_path, mock_connector_params),
-                unittest.mock.patch(entities_path, get_entities),
-                unittest.mock.patch(entities_path_2, get_entities_2),
-            ):
+            recorder: CallRecorder | None = get_call_recorder()
+            if recorder is not None:
+                recorder.track_context(ec)
+                recorder.track_entities(entities)
+
+            patches: dict[str, object] = {
+                json_context_path: mock_get_context,
+                json_context_path_2: mock_get_context_2,
+                config_path: mock_get_config,
+                config_path_2: mock_get_config_2,
+                set_db_context_path: mock_set_db_context,
+                set_db_context_path_2: mock_set_db_context_2,
+                get_db_context_path: mock_get_db_context,
+                get_db_context_path_2: mock_get_db_context_2,
+                job_params_path: mock_job_params,
+                connector_params_path: mock_connector_params,
+                entities_path: get_entities,
+                entities_path_2: get_entities_2,
+            }
+            with scoped_patches((*resolve_target(path), value) for path, value in patches.items()):
                 fn(*args, **kwargs)
 
         return wrapper
@@ -0,0 +1,100 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from TIPCommon.base.action import EntityTypesEnum
+from TIPCommon.data_models import DatabaseContextType
+
+from integration_testing.call_budget import CallBudget, CallProfile, CallRecorder, get_call_recorder, recording
+from integration_testing.common import create_entity
+from integration_testing.platform.external_context import MockExternalContext
+from integration_testing.request import HttpMethod
+from integration_testing.requests.response import MockResponse
+from integration_testing.requests.session import MockSession
+
+
+def _session() -> MockSession:
+    session: MockSession = MockSession()
+    session.routes[HttpMethod.GET.value]["/api/.+"] = lambda _: MockResponse()
+    session.routes[HttpMethod.POST.value]["/api/.+"] = lambda _: MockResponse()
+    return session
+
+
+def test_recorder_profiles_calls_made_after_tracking() -> None:
+    session: MockSession = _session()
+    external_context: MockExternalContext = MockExternalContext()
+    session.get("https://product.com/api/alerts")
+    external_context.set_row_value(DatabaseContextType.CONNECTOR, "connector", "ids", "[]")
+
+    recorder: CallRecorder = CallRecorder()
+    recorder.track_session(session)
+    recorder.track_context(external_context)
+    for _ in range(2):
+        session.get("https://product.com/api/alerts")
+        external_context.get_row_value(DatabaseContextType.CONNECTOR, "connector", "ids")
+
+    session.post("https://product.com/api/alerts")
+    external_context.set_row_value(DatabaseContextType.CONNECTOR, "connector", "ids", "[1]")
+    profile: CallProfile = recorder.profile()
+
+    assert profile.routes == {"GET /api/alerts": 2, "POST /api/alerts": 1}
+    assert profile.total_calls == 3
+    assert profile.context_reads == {"connector/ids": 2}
+    assert profile.context_writes == {"connector/ids": 1}
+    assert not profile.n_plus_one
+
+
+def test_routes_called_once_per_id_are_flagged() -> None:
+    session: MockSession = _session()
+    recorder: CallRecorder = CallRecorder()
+    recorder.track_session(session)
+    recorder.track_entities([create_entity(f"host-{i}", EntityTypesEnum.HOST_NAME) for i in range(3)])
+    for i in range(3):
+        session.get(f"https://product.com/api/hosts/HOST-{i}")
+        session.get(f"https://product.com/api/alerts/{i}/events")
+
+    session.get("https://product.com/api/alerts/7")
+    profile: CallProfile = recorder.profile()
+
+    assert {(finding.route, finding.calls, finding.distinct_ids) for finding in profile.n_plus_one} == {
+        ("GET /api/hosts/{id}", 3, 3),
+        ("GET /api/alerts/{id}/events", 3, 3),
+    }
+
+
+def test_budget_reports_routes_and_context_keys_over_their_limits() -> None:
+    profile: CallProfile = CallProfile(
+        routes={"GET /api/alerts/1": 2, "GET /api/alerts/2": 1, "POST /api/alerts": 1},
+        context_reads={"connector/ids": 3},
+        context_writes={"connector/ids": 1},
+        n_plus_one=[],
+    )
+    budget: CallBudget = (
+        CallBudget(routes={"POST /api/alerts": 1}).route(r"GET /api/alerts/\d+", 2).context_key("ids", max_reads=1)
+    )
+
+    assert budget.check(profile) == [
+        r"route 'GET /api/alerts/\d+' was called 3 times, over its budget of 2",
+        "context key 'ids' was read 3 times, over its budget of 1",
+    ]
+    assert not CallBudget().route("/api/alerts/.+", 3).context_key("connector/ids", max_writes=1).check(profile)
+
+
+def test_recording_sets_the_current_recorder() -> None:
+    recorder: CallRecorder = CallRecorder()
+    with recording(recorder):
+        assert get_call_recorder() is recorder
+
+    assert get_call_recorder() is None
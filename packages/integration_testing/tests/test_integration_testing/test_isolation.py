@@ -0,0 +1,143 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import concurrent.futures
+import sys
+import threading
+import types
+
+import pytest
+
+from integration_testing.common import set_is_test_run_to_false, set_sys_argv
+from integration_testing.isolation import ScopedArgv, scoped_argv, scoped_patches, shared_patch
+
+WORKERS: int = 8
+TESTS: int = 200
+
+
+class Product:
+    name: str = "product"
+
+    def get_alerts(self) -> str:
+        return "live alerts"
+
+    @property
+    def run_folder(self) -> str:
+        return "run"
+
+
+module: types.ModuleType = types.ModuleType("product_module")
+module.connect = lambda: "live connection"
+
+
+def _run_test(index: int, barrier: threading.Barrier) -> tuple[str, ...]:
+    with (
+        scoped_argv(["", "False", ""]),
+        scoped_patches([
+            (Product, "get_alerts", lambda _: f"alerts of test {index}"),
+            (Product, "run_folder", property(lambda _: f"run/{index}")),
+            (module, "connect", lambda: f"connection of test {index}"),
+        ]),
+    ):
+        barrier.wait()
+        set_sys_argv(["", "False", str(index)])
+        set_is_test_run_to_false()
+        barrier.wait()
+        return Product().get_alerts(), Product().run_folder, module.connect(), *sys.argv
+
+
+def test_concurrent_tests_see_only_their_own_patches() -> None:
+    original_argv: list[str] = sys.argv
+    original_get_alerts: object = vars(Product)["get_alerts"]
+    barrier: threading.Barrier = threading.Barrier(WORKERS)
+    with concurrent.futures.ThreadPoolExecutor(WORKERS) as executor:
+        results: list[tuple[str, ...]] = list(executor.map(_run_test, range(TESTS), [barrier] * TESTS))
+
+    assert results == [
+        (f"alerts of test {i}", f"run/{i}", f"connection of test {i}", "", "True", str(i)) for i in range(TESTS)
+    ]
+    assert sys.argv is original_argv
+    assert vars(Product)["get_alerts"] is original_get_alerts
+    assert Product().run_folder == "run"
+    assert module.connect() == "live connection"
+
+
+def test_code_outside_a_scope_sees_the_original_attributes() -> None:
+    entered: threading.Event = threading.Event()
+    done: threading.Event = threading.Event()
+
+    def patched_test() -> None:
+        with scoped_argv(["", "patched"]), scoped_patches([(Product, "name", "patched")]):
+            entered.set()
+            done.wait()
+
+    thread: threading.Thread = threading.Thread(target=patched_test)
+    thread.start()
+    entered.wait()
+    try:
+        assert isinstance(sys.argv, ScopedArgv)
+        assert sys.argv[1:] != ["patched"]
+        assert Product.name == "product"
+
+    finally:
+        done.set()
+        thread.join()
+
+    assert "name" in vars(Product)
+    assert not isinstance(sys.argv, ScopedArgv)
+
+
+def test_threads_of_a_scope_see_its_patches() -> None:
+    def read() -> tuple[str, ...]:
+        return Product().get_alerts(), Product.name, module.connect(), *sys.argv
+
+    original_start: object = vars(threading.Thread)["start"]
+    original_submit: object = vars(concurrent.futures.ThreadPoolExecutor)["submit"]
+    with concurrent.futures.ThreadPoolExecutor(2) as outside_executor:
+        with (
+            scoped_argv(["", "scoped"]),
+            scoped_patches([
+                (Product, "get_alerts", lambda _: "scoped alerts"),
+                (Product, "name", "scoped"),
+                (module, "connect", lambda: "scoped connection"),
+            ]),
+            concurrent.futures.ThreadPoolExecutor(2) as executor,
+        ):
+            thread_results: list[tuple[str, ...]] = []
+            thread: threading.Thread = threading.Thread(target=lambda: thread_results.append(read()))
+            thread.start()
+            thread.join()
+            pool_results: list[tuple[str, ...]] = [f.result() for f in [executor.submit(read) for _ in range(4)]]
+            outside_pool_result: tuple[str, ...] = outside_executor.submit(read).result()
+
+        unscoped_result: tuple[str, ...] = outside_executor.submit(read).result()
+
+    scoped: tuple[str, ...] = ("scoped alerts", "scoped", "scoped connection", "", "scoped")
+    assert thread_results == [scoped]
+    assert pool_results == [scoped] * 4
+    assert outside_pool_result == scoped
+    assert unscoped_result[:3] == ("live alerts", "product", "live connection")
+    assert vars(threading.Thread)["start"] is original_start
+    assert vars(concurrent.futures.ThreadPoolExecutor)["submit"] is original_submit
+
+
+def test_shared_patches_must_agree_on_their_value() -> None:
+    with shared_patch(Product, "name", "shared"), shared_patch(Product, "name", "shared"):
+        assert Product.name == "shared"
+        with pytest.raises(ValueError, match="already patched"), shared_patch(Product, "name", "other"):
+            pass
+
+    assert Product.name == "product"
@@ -0,0 +1,131 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from TIPCommon.data_models import DatabaseContextType
+
+from integration_testing.load.harness import LoadHarness
+from integration_testing.load.profiles import ErrorProfile, LatencyProfile
+from integration_testing.load.workload import Workload
+from integration_testing.platform.external_context import MockExternalContext
+from integration_testing.request import HttpMethod
+from integration_testing.requests.response import MockResponse
+from integration_testing.requests.session import MockSession
+
+if TYPE_CHECKING:
+    import pathlib
+
+    import requests
+
+    from integration_testing.request import MockRequest
+
+WORKLOAD: Workload = Workload(alerts_per_page=5, pages=3)
+
+
+class MockProduct:
+    def __init__(self) -> None:
+        self.alert_pages: list[list[dict[str, str]]] = []
+
+    def get_page(self, request: MockRequest) -> MockResponse:
+        page: int = int(request.url.path.rsplit("/", 1)[-1])
+        return MockResponse(content={"alerts": self.alert_pages[page]})
+
+
+def _connector(
+    product_session: MockSession,
+    platform_session: MockSession,
+    external_context: MockExternalContext,
+) -> None:
+    ids: list[str] = []
+    for page in range(WORKLOAD.pages):
+        response: requests.Response = product_session.get(f"https://product.com/alerts/page/{page}")
+        response.raise_for_status()
+        ids.extend(alert["id"] for alert in response.json()["alerts"])
+
+    platform_session.post("https://soar.com/api/external/v1/cases/AddComment")
+    external_context.set_row_value(DatabaseContextType.CONNECTOR, "connector", "ids", json.dumps(ids))
+
+
+def test_run_reports_calls_context_writes_and_resources(tmp_path: pathlib.Path) -> None:
+    product: MockProduct = MockProduct()
+    product_session: MockSession = MockSession(product)
+    product_session.routes[HttpMethod.GET.value][r"/alerts/page/\d+"] = product.get_page
+    platform_session: MockSession = MockSession()
+    platform_session.routes[HttpMethod.POST.value]["/api/.+"] = lambda _: MockResponse()
+    external_context: MockExternalContext = MockExternalContext()
+    harness: LoadHarness = LoadHarness(
+        "connector",
+        product_sessions=[product_session],
+        platform_sessions=[platform_session],
+        external_context=external_context,
+        latency=LatencyProfile(base_ms=1),
+    )
+
+    def setup(workload: Workload) -> None:
+        product.alert_pages = workload.create_alert_pages(lambda index: {"id": f"alert-{index}"})
+
+    report = harness.run(
+        lambda: _connector(product_session, platform_session, external_context),
+        WORKLOAD,
+        runs=2,
+        setup=setup,
+    )
+
+    expected_bytes: int = len(json.dumps([f"alert-{index}" for index in range(WORKLOAD.total_alerts)]))
+    for run in report.runs:
+        assert run.error is None
+        assert run.wall_time_s >= 0.003
+        assert run.peak_memory_bytes > 0
+        assert run.product_calls == 3
+        assert run.platform_calls == 1
+        assert run.calls_by_route["GET /alerts/page/0"] == 1
+        assert run.context_writes == 1
+        assert run.context_bytes_written == expected_bytes
+
+    report_path: pathlib.Path = tmp_path / "reports.jsonl"
+    report.append_to(report_path)
+    report.append_to(report_path)
+    lines: list[str] = report_path.read_text(encoding="utf-8").splitlines()
+
+    assert len(lines) == 2
+    assert json.loads(lines[0])["summary"]["product_calls"] == 3
+    assert json.loads(lines[0])["workload"] == {"entities": 0, "alerts_per_page": 5, "pages": 3}
+
+
+def test_error_profile_fails_requests_and_errors_are_reported() -> None:
+    product: MockProduct = MockProduct()
+    product.alert_pages = WORKLOAD.create_alert_pages(lambda index: {"id": str(index)})
+    product_session: MockSession = MockSession(product)
+    product_session.routes[HttpMethod.GET.value][r"/alerts/page/\d+"] = product.get_page
+    harness: LoadHarness = LoadHarness(
+        "connector",
+        product_sessions=[product_session],
+        errors=ErrorProfile(rate=1, status_code=429, path_pattern="/page/1$"),
+        trace_memory=False,
+    )
+
+    report = harness.run(
+        lambda: _connector(product_session, MockSession(), MockExternalContext()),
+        WORKLOAD,
+    )
+
+    assert report.runs[0].product_calls == 2
+    assert report.runs[0].peak_memory_bytes is None
+    assert report.runs[0].error.startswith("HTTPError: 429")
+    assert report.summary()["errors"] == 1
+    assert product_session.get("https://product.com/alerts/page/1").status_code == 200
@@ -14,13 +14,18 @@
 
 from __future__ import annotations
 
+import threading
+
 import pytest
+import SiemplifyUtils
 from TIPCommon.data_models import DatabaseContextType
 
 from integration_testing.platform.external_context import (
+    ExternalContextReport,
     ExternalContextRow,
     ExternalContextRowKey,
     MockExternalContext,
+    run_concurrently,
 )
 
 
@@ -240,3 +245,73 @@ class TestMethods:
         ec.drop()
 
         assert ec.number_of_rows == 0
+
+
+class TestSimulatedStore:
+    def test_values_over_the_platform_limit_are_rejected(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(SiemplifyUtils, "MAXIMUM_PROPERTY_VALUE", 10)
+        ec: MockExternalContext = MockExternalContext(enforce_size_limit=True)
+
+        ec.set_row_value(DatabaseContextType.CONNECTOR, "connector", "ids", "x" * 10)
+        with pytest.raises(ValueError, match="'ids' is 11 bytes"):
+            ec.set_row_value(DatabaseContextType.CONNECTOR, "connector", "ids", "x" * 11)
+
+        assert ec.writes == 1
+
+    def test_report_counts_operations_and_bytes_per_key(self) -> None:
+        ec: MockExternalContext = MockExternalContext()
+        for ids in ("[1]", "[1, 2]", "[1, 2, 3]"):
+            ec.get_row_value(DatabaseContextType.CONNECTOR, "connector", "ids")
+            ec.set_row_value(DatabaseContextType.CONNECTOR, "connector", "ids", ids)
+
+        ec.set_row_value(DatabaseContextType.CONNECTOR, "connector", "offset", "10")
+        report: ExternalContextReport = ec.report()
+
+        assert report.to_json() == {
+            "reads": 3,
+            "writes": 4,
+            "bytes_written": 20,
+            "size": 11,
+            "lost_updates": 0,
+            "keys": [
+                {
+                    "identifier": "connector",
+                    "property_key": "ids",
+                    "reads": 3,
+                    "writes": 3,
+                    "bytes_written": 18,
+                    "size": 9,
+                    "lost_updates": 0,
+                    "write_amplification": 2.0,
+                },
+                {
+                    "identifier": "connector",
+                    "property_key": "offset",
+                    "reads": 0,
+                    "writes": 1,
+                    "bytes_written": 2,
+                    "size": 2,
+                    "lost_updates": 0,
+                    "write_amplification": 1.0,
+                },
+            ],
+        }
+
+    def test_concurrent_instances_racing_on_a_key_lose_updates(self) -> None:
+        ec: MockExternalContext = MockExternalContext()
+        ec.set_row_value(DatabaseContextType.CONNECTOR, "connector", "count", 0)
+        instances: int = 3
+        all_read: threading.Barrier = threading.Barrier(instances)
+
+        def increment_count() -> None:
+            count: int = ec.get_row_value(DatabaseContextType.CONNECTOR, "connector", "count")
+            all_read.wait()
+            ec.set_row_value(DatabaseContextType.CONNECTOR, "connector", "count", count + 1)
+
+        run_concurrently([increment_count] * instances)
+
+        assert ec.get_row_value(DatabaseContextType.CONNECTOR, "connector", "count") == 1
+        assert ec.lost_updates["connector", "count"] == instances - 1
+
+        run_concurrently([lambda: ec.set_row_value(DatabaseContextType.CONNECTOR, "connector", "count", 0)])
+        assert ec.report().lost_updates == instances - 1
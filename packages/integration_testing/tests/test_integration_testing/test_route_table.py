@@ -0,0 +1,117 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from integration_testing import router
+from integration_testing.request import HttpMethod, MockRequest
+from integration_testing.requests.response import MockResponse
+from integration_testing.requests.session import MockSession
+from integration_testing.route_table import RouteConflictWarning, RouteMatchMode, RouteTable
+
+ROUTES: dict[str | re.Pattern, str] = {
+    "/api/v1/alerts": "alerts",
+    r"/api/v1/alerts/(?P<alert_id>\d+)": "alert",
+    r"/api/v1/alerts/\d+/.*": "alert_sub_resource",
+    "/api/v1/.+": "api_fallback",
+    r"/auth/(token|refresh)": "auth",
+    re.compile(r"/CASE/[a-z]+", re.IGNORECASE): "case",
+    "/(?:x|y)/items": "items",
+    ".*/health": "health",
+}
+PATHS: list[str] = [
+    "/api/v1/alerts",
+    "/api/v1/alerts/12",
+    "/api/v1/alerts/12/comments",
+    "/api/v1/alerts/abc",
+    "/api/v2/alerts",
+    "/auth/token",
+    "/auth/other",
+    "/case/Open",
+    "/y/items",
+    "/auth/health",
+    "/unknown",
+    "",
+]
+
+
+def _first_match(path: str, match_mode: RouteMatchMode) -> str | None:
+    match = re.fullmatch if match_mode is RouteMatchMode.FULL else re.search
+    return next((route for pattern, route in ROUTES.items() if match(pattern, path)), None)
+
+
+@pytest.mark.parametrize("match_mode", list(RouteMatchMode))
+def test_table_matches_the_first_route_in_order(match_mode: RouteMatchMode) -> None:
+    table: RouteTable[str] = RouteTable(ROUTES, match_mode)
+
+    for path in PATHS:
+        assert table.match(path) == _first_match(path, match_mode), path
+
+
+def test_table_falls_back_to_sequential_matching_for_backreferences() -> None:
+    table: RouteTable[str] = RouteTable({r"/(\w+)/\1": "repeated", r"/(\w+)/(\w+)": "pair"})
+
+    assert table.match("/a/a") == "repeated"
+    assert table.match("/a/b") == "pair"
+
+
+def test_shadowed_literal_routes_are_reported() -> None:
+    table: RouteTable[str] = RouteTable({"/api/.+": "any", "/api/alerts": "alerts", "/other": "other"})
+
+    assert table.shadowed_routes == [("/api/.+", "/api/alerts")]
+    with pytest.warns(RouteConflictWarning, match="/api/alerts"):
+        table.warn_shadowed_routes(HttpMethod.GET.value)
+
+
+def test_session_dispatch_follows_route_changes() -> None:
+    def first(request: MockRequest) -> MockResponse:
+        return MockResponse(content="first")
+
+    def second(request: MockRequest) -> MockResponse:
+        return MockResponse(content="second")
+
+    session: MockSession = MockSession(history_limit=2)
+    session.routes[HttpMethod.GET.value]["/api/.+"] = first
+    assert session.get("https://example.com/api/one").text == "first"
+
+    session.routes[HttpMethod.GET.value] = {"/api/one": second, "/api/.+": first}
+    assert session.get("https://example.com/api/one").text == "second"
+
+    del session.routes[HttpMethod.GET.value]["/api/one"]
+    for _ in range(3):
+        assert session.get("https://example.com/api/one").text == "first"
+
+    assert len(session.request_history) == 2
+    assert session.request_counts[HttpMethod.GET.value, "/api/one"] == 5
+
+
+def test_routing_a_path_to_another_function_warns() -> None:
+    @router.get("/api/alerts")
+    def alerts(request: MockRequest) -> MockResponse:
+        return MockResponse()
+
+    @router.get("/api/alerts")
+    def other_alerts(request: MockRequest) -> MockResponse:
+        return MockResponse()
+
+    class ProductSession(MockSession):
+        def get_routed_functions(self) -> list:
+            return [alerts, other_alerts]
+
+    with pytest.warns(RouteConflictWarning, match="overridden by 'other_alerts'"):
+        ProductSession()
@@ -21,7 +21,7 @@ deconstructed project's configuration.
 
 from __future__ import annotations
 
-import ast
+import fnmatch
 import itertools
 import logging
 import re
@@ -34,6 +34,7 @@ from typing import NamedTuple
 from packaging.version import Version
 
 import mp.core.constants
+from mp.build_project.restructure.integrations.import_index import ImportIndex, get_shared_index
 from mp.core import config
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -74,15 +75,17 @@ PACAKGE_SUFFIXES: tuple[str, str] = ("*.whl", "*.tar.gz")
 class DependencyDeconstructor:
     """Deconstructs dependencies for an integration."""
 
-    def __init__(self, integration_path: Path) -> None:
+    def __init__(self, integration_path: Path, index: ImportIndex | None = None) -> None:
         """Initialize the deconstructor.
 
         Args:
             integration_path: The path to the integration.
+            index: The import index to use. Defaults to the index shared by the whole run.
 
         """
         self.integration_path = integration_path
         self.local_packages_base_path = config.get_local_packages_path()
+        self.index: ImportIndex = index if index is not None else get_shared_index()
 
     def get_dependencies(self) -> DependencyResolutionResult:
         """Get the dependencies of the integration.
@@ -99,19 +102,12 @@ class DependencyDeconstructor:
         core_modules_path: Path = self.integration_path / mp.core.constants.OUT_MANAGERS_SCRIPTS_DIR
         manager_modules: set[str] = {p.stem for p in core_modules_path.glob("*.py")}
         for path in self.integration_path.rglob("*.py"):
-            try:
-                tree = ast.parse(path.read_text(encoding="utf-8"))
-            except SyntaxError:
+            file_imports: set[str] | None = self.index.get_imported_modules(path)
+            if file_imports is None:
                 logger.warning("Warning: Could not parse %s, skipping for dependency analysis.", path)
                 continue
 
-            for node in ast.walk(tree):
-                match node:
-                    case ast.Import(names=names):
-                        imported_modules.update(alias.name.split(".")[0] for alias in names)
-
-                    case ast.ImportFrom(module=module) if module:
-                        imported_modules.add(module.split(".")[0])
+            imported_modules.update(file_imports)
 
         return {
             m
@@ -173,7 +169,8 @@ class DependencyDeconstructor:
         package_install_name: str = match.group("name")
         version: str = match.group("version").replace("_", "-")
 
-        provided_imports = _get_provided_imports(package_path).union({package_install_name})
+        provided_imports: set[str] = self.index.get_provided_imports(package_path, _get_provided_imports)
+        provided_imports.add(package_install_name)
         if package_install_name in mp.core.constants.SDK_DEPENDENCIES_MIN_VERSIONS:
             min_version = mp.core.constants.SDK_DEPENDENCIES_MIN_VERSIONS[package_install_name]
             if Version(version) < Version(min_version):
@@ -231,7 +228,7 @@ class DependencyDeconstructor:
             msg: str = f"Could not find local dependency directory: {wheels_dir}"
             raise FileNotFoundError(msg)
 
-        package_file: Path = _find_package_file(wheels_dir, f"{name}-{version}")
+        package_file: Path = _find_package_file(wheels_dir, f"{name}-{version}", self.index)
         local_deps_to_add: list[str] = [str(package_file)]
         local_dev_deps_to_add: list[str] = []
 
@@ -243,16 +240,18 @@ class DependencyDeconstructor:
                 logger.warning("integration_testing directory not found at %s", integration_testing_version_dir)
             else:
                 it_package_file: Path = _find_package_file(
-                    integration_testing_version_dir, f"{INTEGRATION_TESTING}-{version}"
+                    integration_testing_version_dir, f"{INTEGRATION_TESTING}-{version}", self.index
                 )
                 local_dev_deps_to_add.append(str(it_package_file))
 
         return Dependencies(local_deps_to_add, local_dev_deps_to_add)
 
 
-def _find_package_file(package_dir: Path, wheel_name_prefix: str) -> Path:
+def _find_package_file(package_dir: Path, wheel_name_prefix: str, index: ImportIndex | None = None) -> Path:
     """Find a wheel or source distribution file in a directory.
 
+    When an index is given, the directory is listed once and reused for later lookups.
+
     Returns:
         The path to the package file.
 
@@ -260,13 +259,16 @@ def _find_package_file(package_dir: Path, wheel_name_prefix: str) -> Path:
         FileNotFoundError: If no wheel or source distribution is found.
 
     """
+    names: tuple[str, ...] = (
+        index.list_dir(package_dir) if index is not None else tuple(p.name for p in package_dir.iterdir())
+    )
     for extension in PACAKGE_SUFFIXES:
         ext_suffix = extension.lstrip("*")
         wheel_prefix_with_dash = f"{wheel_name_prefix}-"
         exact_match_name = f"{wheel_name_prefix}{ext_suffix}"
-        for file in package_dir.glob(f"{wheel_name_prefix}*{ext_suffix}"):
-            if file.name.startswith(wheel_prefix_with_dash) or file.name == exact_match_name:
-                return file
+        for name in fnmatch.filter(names, f"{wheel_name_prefix}*{ext_suffix}"):
+            if name.startswith(wheel_prefix_with_dash) or name == exact_match_name:
+                return package_dir / name
 
     msg: str = f"No wheel or source distribution found in {package_dir}"
     raise FileNotFoundError(msg)
@@ -0,0 +1,248 @@
+"""Persistent index of the imports found while deconstructing integrations.
+
+The index maps wheel content hashes to the top-level modules they provide, and
+Python source hashes to the top-level modules they import. Integrations usually
+ship the same wheels and many identical files, so one index is shared by all
+the integrations deconstructed in a single `mp` run and stored between runs.
+"""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import ast
+import atexit
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from platformdirs import user_cache_dir
+
+import mp.core.constants
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+CACHE_DIR: Path = Path(user_cache_dir(mp.core.constants.APP_NAME, mp.core.constants.APP_AUTHOR))
+INDEX_FILE_NAME: str = "import_index.json"
+INDEX_VERSION: int = 1
+MAX_SOURCE_ENTRIES: int = 100_000
+_IMPORT_KEYWORD: bytes = b"import"
+
+
+class ImportIndex:
+    """A thread-safe cache of provided and imported module names.
+
+    Wheels are keyed by the hash of their content, so a re-downloaded wheel with
+    the same name is still a hit, and a changed wheel is never served stale data.
+    Source files are keyed the same way, which lets the scanner skip parsing any
+    file whose content it has already seen.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the index.
+
+        Args:
+            path: The JSON file the index is loaded from and saved to.
+                When None, the index is kept in memory only.
+
+        """
+        self.path: Path | None = path
+        self.wheels: dict[str, frozenset[str]] = {}
+        self.sources: dict[str, frozenset[str]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+        self._dirs: dict[Path, tuple[str, ...]] = {}
+        self._dirty: bool = False
+        self._lock: threading.Lock = threading.Lock()
+        if path is not None:
+            self._load(path)
+
+    def get_provided_imports(self, wheel_path: Path, reader: Callable[[Path], set[str]]) -> set[str]:
+        """Get the module names provided by a wheel.
+
+        Args:
+            wheel_path: The path to the wheel or source distribution.
+            reader: The function reading the provided modules on a cache miss.
+
+        Returns:
+            The set of import names provided by the package.
+
+        """
+        try:
+            key: str = _hash_file(wheel_path)
+        except OSError:
+            return reader(wheel_path)
+
+        cached: frozenset[str] | None = self._lookup(self.wheels, key)
+        if cached is not None:
+            return set(cached)
+
+        provided: set[str] = reader(wheel_path)
+        with self._lock:
+            self.wheels[key] = frozenset(provided)
+            self._dirty = True
+
+        return provided
+
+    def get_imported_modules(self, path: Path) -> set[str] | None:
+        """Get the top-level module names imported by a Python file.
+
+        Args:
+            path: The path to the Python file.
+
+        Returns:
+            The set of imported top-level modules, or None if the file cannot be parsed.
+
+        """
+        source: bytes = path.read_bytes()
+        key: str = hashlib.sha256(source).hexdigest()
+        cached: frozenset[str] | None = self._lookup(self.sources, key)
+        if cached is not None:
+            return set(cached)
+
+        imported: set[str] | None = scan_imports(source)
+        if imported is None:
+            return None
+
+        with self._lock:
+            self.sources[key] = frozenset(imported)
+            self._dirty = True
+
+        return imported
+
+    def list_dir(self, directory: Path) -> tuple[str, ...]:
+        """List the file names in a directory once per run.
+
+        Args:
+            directory: The directory to list.
+
+        Returns:
+            The sorted names of the directory's entries.
+
+        """
+        with self._lock:
+            names: tuple[str, ...] | None = self._dirs.get(directory)
+
+        if names is None:
+            names = tuple(sorted(p.name for p in directory.iterdir()))
+            with self._lock:
+                self._dirs[directory] = names
+
+        return names
+
+    def save(self) -> None:
+        """Write the index to its file if it has changed since it was loaded."""
+        if self.path is None or not self._dirty:
+            return
+
+        with self._lock:
+            sources: list[tuple[str, frozenset[str]]] = list(self.sources.items())[-MAX_SOURCE_ENTRIES:]
+            data: dict[str, object] = {
+                "version": INDEX_VERSION,
+                "wheels": {k: sorted(v) for k, v in self.wheels.items()},
+                "sources": {k: sorted(v) for k, v in sources},
+            }
+            self._dirty = False
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path: Path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except OSError as e:
+            logger.debug("Could not save the import index to %s: %s", self.path, e)
+
+    def _lookup(self, entries: dict[str, frozenset[str]], key: str) -> frozenset[str] | None:
+        with self._lock:
+            cached: frozenset[str] | None = entries.get(key)
+            if cached is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return cached
+
+    def _load(self, path: Path) -> None:
+        try:
+            data: dict = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+
+        self.wheels = {k: frozenset(v) for k, v in data.get("wheels", {}).items()}
+        self.sources = {k: frozenset(v) for k, v in data.get("sources", {}).items()}
+
+
+@functools.cache
+def get_shared_index() -> ImportIndex:
+    """Get the index shared by all deconstructions of the current run.
+
+    The index is loaded from the user's cache directory on first use and saved
+    back when the process exits.
+
+    Returns:
+        The shared import index.
+
+    """
+    index: ImportIndex = ImportIndex(CACHE_DIR / INDEX_FILE_NAME)
+    atexit.register(index.save)
+    return index
+
+
+def scan_imports(source: bytes) -> set[str] | None:
+    """Find the top-level modules imported by Python source code.
+
+    Sources that never mention the `import` keyword are not parsed at all.
+
+    Args:
+        source: The Python source code.
+
+    Returns:
+        The set of imported top-level modules, or None if the source cannot be parsed.
+
+    """
+    if _IMPORT_KEYWORD not in source:
+        return set()
+
+    try:
+        tree: ast.Module = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+
+    imported: set[str] = set()
+    for node in ast.walk(tree):
+        match node:
+            case ast.Import(names=names):
+                imported.update(alias.name.split(".")[0] for alias in names)
+
+            case ast.ImportFrom(module=module) if module:
+                imported.add(module.split(".")[0])
+
+    return imported
+
+
+def _hash_file(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
@@ -31,7 +31,7 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 
 @config_app.callback(invoke_without_command=True)
-def config(
+def config(  # ruff:ignore[too-many-arguments]
     root_path: Annotated[
         str | None,
         typer.Option(
@@ -62,7 +62,23 @@ def config(
             show_default=False,
         ),
     ] = None,
+    llm_backend: Annotated[
+        str | None,
+        typer.Option(
+            "--llm-backend",
+            help="Configure the LLM backend used by 'mp describe' ('gemini' or the offline 'fake' backend)",
+            show_default=False,
+        ),
+    ] = None,
     *,
+    llm_cache: Annotated[
+        bool | None,
+        typer.Option(
+            "--llm-cache/--no-llm-cache",
+            help="Enable or disable the local cache of LLM responses",
+            show_default=False,
+        ),
+    ] = None,
     display_config: Annotated[
         bool,
         typer.Option(
@@ -77,6 +93,8 @@ def config(
         root_path: the path to the repository root directory
         processes: the number of processes can be run in parallel
         gemini_api_key: the Gemini API key
+        llm_backend: the LLM backend used by 'mp describe'
+        llm_cache: whether to cache LLM responses locally
         display_config: whether to display the configuration after making the changes
 
     """
@@ -92,28 +110,45 @@ def config(
     if gemini_concurrency is not None:
         _set_gemini_concurrency(gemini_concurrency)
 
+    if llm_backend is not None:
+        _set_llm_backend(llm_backend)
+
+    if llm_cache is not None:
+        mp.core.config.set_is_llm_cache_enabled(value=llm_cache)
+
     if display_config:
-        p: pathlib.Path = mp.core.config.get_marketplace_path()
-        n: int = mp.core.config.get_processes_number()
-        c: int = mp.core.config.get_gemini_concurrency()
-        k: str | None = mp.core.config.get_gemini_api_key()
-        env_k: str | None = os.environ.get("GEMINI_API_KEY")
-
-        display_k: str = "N/A"
-        if k:
-            display_k = f"{k[:4]}{'*' * (len(k) - 4)} (from config)"
-            if env_k and k != env_k:
-                display_k += (
-                    f"\nWarning: GEMINI_API_KEY environment variable is also set "
-                    f"({env_k[:4]}{'*' * (len(env_k) - 4)}), but the configuration above "
-                    "takes priority."
-                )
-        elif env_k:
-            display_k = f"{env_k[:4]}{'*' * (len(env_k) - 4)} (from GEMINI_API_KEY env var)"
-
-        logger.info(
-            "Marketplace path: %s\nNumber of processes: %s\nGemini concurrency: %s\nAPI Key: %s", p, n, c, display_k
-        )
+        _display_config()
+
+
+def _display_config() -> None:
+    p: pathlib.Path = mp.core.config.get_marketplace_path()
+    n: int = mp.core.config.get_processes_number()
+    c: int = mp.core.config.get_gemini_concurrency()
+    k: str | None = mp.core.config.get_gemini_api_key()
+    env_k: str | None = os.environ.get("GEMINI_API_KEY")
+
+    display_k: str = "N/A"
+    if k:
+        display_k = f"{k[:4]}{'*' * (len(k) - 4)} (from config)"
+        if env_k and k != env_k:
+            display_k += (
+                f"\nWarning: GEMINI_API_KEY environment variable is also set "
+                f"({env_k[:4]}{'*' * (len(env_k) - 4)}), but the configuration above "
+                "takes priority."
+            )
+    elif env_k:
+        display_k = f"{env_k[:4]}{'*' * (len(env_k) - 4)} (from GEMINI_API_KEY env var)"
+
+    logger.info(
+        "Marketplace path: %s\nNumber of processes: %s\nGemini concurrency: %s\nAPI Key: %s"
+        "\nLLM backend: %s\nLLM cache: %s",
+        p,
+        n,
+        c,
+        display_k,
+        mp.core.config.get_llm_backend(),
+        "enabled" if mp.core.config.is_llm_cache_enabled() else "disabled",
+    )
 
 
 def _set_marketplace_path(marketplace_path: str) -> None:
@@ -149,5 +184,13 @@ def _set_gemini_concurrency(concurrency: int) -> None:
     mp.core.config.set_gemini_concurrency(concurrency)
 
 
+def _set_llm_backend(backend: str) -> None:
+    if backend not in mp.core.config.LLM_BACKENDS:
+        msg: str = f"LLM backend must be one of: {', '.join(mp.core.config.LLM_BACKENDS)}"
+        raise ValueError(msg)
+
+    mp.core.config.set_llm_backend(backend)
+
+
 def _is_processes_in_range(processes: int) -> bool:
     return mp.core.config.PROCESSES_MIN_VALUE <= processes <= mp.core.config.PROCESSES_MAX_VALUE
@@ -44,6 +44,9 @@ CUSTOM_DST_KEY: str = "dst"
 PROCESSES_NUMBER_KEY: str = "processes"
 GEMINI_API_KEY_KEY: str = "gemini_api_key"
 GEMINI_CONCURRENCY_KEY: str = "gemini_concurrency"
+LLM_BACKEND_KEY: str = "llm_backend"
+LLM_CACHE_KEY: str = "llm_cache"
+LLM_CACHE_BYPASS_KEY: str = "bypass_llm_cache"
 VERBOSE_LOG_KEY: str = "is_verbose"
 QUIET_LOG_KEY: str = "is_quiet"
 DEFAULT_SECTION_NAME: str = "DEFAULT"
@@ -52,6 +55,8 @@ PROCESSES_MIN_VALUE: int = 1
 PROCESSES_MAX_VALUE: int = 10
 DEFAULT_PROCESSES_NUMBER: int = 5
 DEFAULT_GEMINI_CONCURRENCY: int = 5
+LLM_BACKENDS: tuple[str, ...] = ("gemini", "fake")
+DEFAULT_LLM_BACKEND: str = "gemini"
 DEFAULT_QUIET_VALUE: str = "no"
 DEFAULT_VERBOSE_VALUE: str = "no"
 DEFAULT_MARKETPLACE_PATH: Path = Path.home() / mp.core.constants.REPO_NAME
@@ -206,6 +211,53 @@ def set_gemini_concurrency(n: int, /) -> None:
     _set_config_key(DEFAULT_SECTION_NAME, GEMINI_CONCURRENCY_KEY, value=n)
 
 
+def get_llm_backend() -> str:
+    """Get the LLM backend used by `mp describe`.
+
+    Returns:
+        The name of the LLM backend.
+
+    """
+    return _get_config_key(DEFAULT_SECTION_NAME, LLM_BACKEND_KEY, str) or DEFAULT_LLM_BACKEND
+
+
+def set_llm_backend(backend: str, /) -> None:
+    """Set the LLM backend used by `mp describe`."""
+    _set_config_key(DEFAULT_SECTION_NAME, LLM_BACKEND_KEY, value=backend)
+
+
+def is_llm_cache_enabled() -> bool:
+    """Check whether LLM responses are cached locally.
+
+    Returns:
+        Whether the LLM response cache is enabled. Defaults to True.
+
+    """
+    c: bool | None = _get_config_key(DEFAULT_SECTION_NAME, LLM_CACHE_KEY, bool)
+    return c if c is not None else True
+
+
+def set_is_llm_cache_enabled(*, value: bool) -> None:
+    """Set whether LLM responses are cached locally."""
+    _set_config_key(DEFAULT_SECTION_NAME, LLM_CACHE_KEY, value="yes" if value else "no")
+
+
+def is_llm_cache_bypassed() -> bool:
+    """Check whether the current run ignores the cached LLM responses.
+
+    Returns:
+        Whether cached LLM responses are ignored. Fresh responses are still cached.
+
+    """
+    b: bool | None = _get_config_key(RUNTIME_SECTION_NAME, LLM_CACHE_BYPASS_KEY, bool)
+    return bool(b)
+
+
+def set_is_llm_cache_bypassed(*, value: bool) -> None:
+    """Set whether the current run ignores the cached LLM responses."""
+    _set_config_key(RUNTIME_SECTION_NAME, LLM_CACHE_BYPASS_KEY, value="yes" if value else "no")
+
+
 def is_verbose() -> bool:
     """Check whether verbose logging is enabled for the project.
 
@@ -360,12 +412,14 @@ def _write_config_to_file(config: configparser.ConfigParser) -> None:
 class RuntimeParams:
     quiet: bool
     verbose: bool
+    bypass_llm_cache: bool = False
 
     def set_in_config(self) -> None:
         """Set the runtime parameters in the global configuration."""
         self.validate()
         set_is_quiet(value=self.quiet)
         set_is_verbose(value=self.verbose)
+        set_is_llm_cache_bypassed(value=self.bypass_llm_cache)
 
     def validate(self) -> None:
         """Validate the runtime parameters.
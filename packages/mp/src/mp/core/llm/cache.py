@@ -0,0 +1,329 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, Self, overload
+
+from platformdirs import user_cache_dir
+
+import mp.core.constants
+
+from .sdk import LlmConfig, LlmSdk, T_Schema
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from pydantic import BaseModel
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+CACHE_DIR: Path = Path(user_cache_dir(mp.core.constants.APP_NAME, mp.core.constants.APP_AUTHOR))
+CACHE_FILE_NAME: str = "llm_responses.sqlite3"
+DEFAULT_TTL_SECONDS: int = 14 * 24 * 60 * 60
+DEFAULT_MAX_SIZE_BYTES: int = 256 * 1024 * 1024
+
+
+class LlmResponseCache:
+    """A local, content-addressed store of LLM responses.
+
+    Entries are keyed by a hash of the model configuration, system prompt, response
+    schema and prompt. Entries expire after a TTL, and the least recently used ones
+    are evicted once the total stored size exceeds the configured limit.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+    ) -> None:
+        self.path: Path = path
+        self.ttl_seconds: int = ttl_seconds
+        self.max_size_bytes: int = max_size_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: sqlite3.Connection = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses(accessed_at)")
+        self._conn.commit()
+
+    @classmethod
+    def open_default(cls) -> Self:
+        """Open the cache stored in the user's cache directory.
+
+        Returns:
+            The default response cache.
+
+        """
+        return cls(CACHE_DIR / CACHE_FILE_NAME)
+
+    @staticmethod
+    def make_key(config: LlmConfig, system_prompt: str, schema: type[BaseModel] | None, prompt: str) -> str:
+        """Build the cache key of a prompt.
+
+        Args:
+            config: The LLM configuration the prompt is sent with.
+            system_prompt: The system prompt of the session.
+            schema: The response schema, if any.
+            prompt: The prompt itself.
+
+        Returns:
+            The hex digest identifying the response.
+
+        """
+        schema_fingerprint: str = ""
+        if schema is not None:
+            schema_fingerprint = json.dumps(schema.model_json_schema(by_alias=True), sort_keys=True)
+
+        h = hashlib.sha256()
+        for part in (config.model_dump_json(), system_prompt, schema_fingerprint, prompt):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+
+        return h.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Get a cached response if it exists and has not expired.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached response, or None on a miss.
+
+        """
+        now: float = time.time()
+        row: tuple[str, float] | None = self._conn.execute(
+            "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or now - row[1] > self.ttl_seconds:
+            self.misses += 1
+            return None
+
+        self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+        self.hits += 1
+        return row[0]
+
+    def set_many(self, items: dict[str, str]) -> None:
+        """Store multiple responses and enforce the cache limits.
+
+        Args:
+            items: A mapping of cache keys to responses.
+
+        """
+        if not items:
+            return
+
+        now: float = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO responses (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                [(k, v, len(v.encode("utf-8")), now, now) for k, v in items.items()],
+            )
+        self.prune()
+
+    def prune(self) -> None:
+        """Remove expired entries and evict the least recently used ones above the size limit."""
+        with self._conn:
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+            total: int = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total <= self.max_size_bytes:
+                return
+
+            excess: int = total - self.max_size_bytes
+            for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall():
+                if excess <= 0:
+                    break
+
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                excess -= size
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with contextlib.suppress(sqlite3.ProgrammingError):
+            self._conn.close()
+
+
+class CachedLlm(LlmSdk[LlmConfig]):
+    """An LLM SDK that serves repeated bulk prompts from a local response cache.
+
+    Only `send_bulk_messages` is cached, as its prompts are independent of the
+    session history. Calls to `send_message` are always forwarded to the wrapped SDK.
+    With `read=False`, every prompt is sent to the wrapped SDK and its response
+    replaces the cached one.
+    """
+
+    def __init__(self, llm: LlmSdk[LlmConfig], cache: LlmResponseCache, *, read: bool = True) -> None:
+        self.llm: LlmSdk[LlmConfig] = llm
+        self.cache: LlmResponseCache = cache
+        self.config: LlmConfig = llm.config
+        self.read: bool = read
+
+    @property
+    def system_prompt(self) -> str:
+        """The system prompt of the wrapped LLM session."""
+        return self.llm.system_prompt
+
+    @system_prompt.setter
+    def system_prompt(self, value: str) -> None:
+        self.llm.system_prompt = value
+
+    @property
+    def bulk_threshold(self) -> int:
+        """The bulk threshold of the wrapped LLM."""
+        return self.llm.bulk_threshold
+
+    @bulk_threshold.setter
+    def bulk_threshold(self, value: int) -> None:
+        self.llm.bulk_threshold = value
+
+    async def __aenter__(self) -> Self:
+        await self.llm.__aenter__()
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        try:
+            await self.llm.__aexit__(exc_type, exc_value, traceback)
+        finally:
+            self.cache.close()
+
+    @overload
+    async def send_message(
+        self, prompt: str, /, *, raise_error_if_empty_response: Literal[True], response_json_schema: type[T_Schema]
+    ) -> T_Schema: ...
+
+    @overload
+    async def send_message(
+        self, prompt: str, /, *, raise_error_if_empty_response: Literal[False], response_json_schema: type[T_Schema]
+    ) -> T_Schema | Literal[""]: ...
+
+    @overload
+    async def send_message(
+        self, prompt: str, /, *, raise_error_if_empty_response: bool, response_json_schema: None = None
+    ) -> str: ...
+
+    async def send_message(
+        self, prompt: str, /, *, raise_error_if_empty_response: bool, response_json_schema: type[T_Schema] | None = None
+    ) -> T_Schema | str:
+        """Forward a session message to the wrapped LLM.
+
+        Args:
+            prompt: The prompt to send to the LLM.
+            raise_error_if_empty_response: Whether to raise an error if the response is empty.
+            response_json_schema: The JSON schema to validate the response against.
+
+        Returns:
+            The response from the wrapped LLM.
+
+        """
+        return await self.llm.send_message(
+            prompt,
+            raise_error_if_empty_response=raise_error_if_empty_response,
+            response_json_schema=response_json_schema,
+        )
+
+    async def send_bulk_messages(
+        self,
+        prompts: list[str],
+        /,
+        *,
+        response_json_schema: type[T_Schema] | None = None,
+        use_batch: bool = False,
+    ) -> list[T_Schema | str]:
+        """Send multiple messages, only forwarding prompts without a cached response.
+
+        Args:
+            prompts: The prompts to send to the LLM.
+            response_json_schema: The JSON schema to validate the responses against.
+            use_batch: Whether the wrapped LLM should use its batch API for the missing prompts.
+
+        Returns:
+            The responses, in the order of the prompts.
+
+        """
+        keys: list[str] = [
+            LlmResponseCache.make_key(self.config, self.system_prompt, response_json_schema, p) for p in prompts
+        ]
+        results: list[T_Schema | str | None] = [
+            _deserialize(cached, response_json_schema)
+            if self.read and (cached := self.cache.get(k)) is not None
+            else None
+            for k in keys
+        ]
+        missing: dict[str, str] = {k: p for k, p, r in zip(keys, prompts, results, strict=True) if r is None}
+        logger.debug("LLM cache: %d hit(s), %d miss(es)", len(prompts) - len(missing), len(missing))
+        if missing:
+            responses: list[T_Schema | str] = await self.llm.send_bulk_messages(
+                list(missing.values()), response_json_schema=response_json_schema, use_batch=use_batch
+            )
+            fetched: dict[str, T_Schema | str] = dict(zip(missing, responses, strict=False))
+            self.cache.set_many({k: _serialize(r) for k, r in fetched.items() if r})
+            results = [fetched.get(k, "") if r is None else r for k, r in zip(keys, results, strict=True)]
+
+        return [r if r is not None else "" for r in results]
+
+    def clean_session_history(self) -> None:
+        """Clean the session history of the wrapped LLM."""
+        self.llm.clean_session_history()
+
+    async def close(self) -> None:
+        """Close the wrapped LLM and the cache."""
+        try:
+            await self.llm.close()
+        finally:
+            self.cache.close()
+
+
+def _serialize(response: BaseModel | str) -> str:
+    if isinstance(response, str):
+        return json.dumps({"text": response})
+
+    return json.dumps({"json": response.model_dump_json(by_alias=True)})
+
+
+def _deserialize(value: str, schema: type[T_Schema] | None) -> T_Schema | str:
+    data: dict[str, str] = json.loads(value)
+    if "json" in data and schema is not None:
+        return schema.model_validate_json(data["json"], by_alias=True)
+
+    return data.get("text", "")
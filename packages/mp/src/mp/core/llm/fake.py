@@ -0,0 +1,221 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import enum
+import hashlib
+import types
+import typing
+from typing import TYPE_CHECKING, Any, Literal, Self, Union, overload
+
+import anyio
+from pydantic import BaseModel, ValidationError
+
+from .sdk import DEFAULT_BULK_THRESHOLD, LlmConfig, LlmSdk, T_Schema
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+MAX_CONCURRENT_REQUESTS: int = 4
+
+Responder = typing.Callable[[str, type[BaseModel] | None], BaseModel | str]
+
+
+class FakeLlmConfig(LlmConfig):
+    model_name: str = "fake"
+    latency_sec: float = 0.0
+
+    @property
+    def api_key(self) -> str:
+        """Api Key. The fake backend does not need one."""
+        return ""
+
+
+class FakeLlm(LlmSdk[FakeLlmConfig]):
+    """A deterministic, offline LLM backend.
+
+    Responses are derived only from the prompt, so identical prompts always get
+    identical responses. Structured responses are generated from the requested
+    schema. A custom `responder` can be passed to control the responses.
+    """
+
+    def __init__(
+        self,
+        config: FakeLlmConfig | None = None,
+        *,
+        bulk_threshold: int = DEFAULT_BULK_THRESHOLD,
+        responder: Responder | None = None,
+    ) -> None:
+        super().__init__(config or FakeLlmConfig(), bulk_threshold=bulk_threshold)
+        self.responder: Responder = responder or fake_response
+        self.prompts: list[str] = []
+        self.history: list[str] = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        await self.close()
+
+    @overload
+    async def send_message(
+        self, prompt: str, /, *, raise_error_if_empty_response: Literal[True], response_json_schema: type[T_Schema]
+    ) -> T_Schema: ...
+
+    @overload
+    async def send_message(
+        self, prompt: str, /, *, raise_error_if_empty_response: Literal[False], response_json_schema: type[T_Schema]
+    ) -> T_Schema | Literal[""]: ...
+
+    @overload
+    async def send_message(
+        self, prompt: str, /, *, raise_error_if_empty_response: bool, response_json_schema: None = None
+    ) -> str: ...
+
+    async def send_message(
+        self, prompt: str, /, *, raise_error_if_empty_response: bool, response_json_schema: type[T_Schema] | None = None
+    ) -> T_Schema | str:
+        """Generate a fake response for a prompt within the session.
+
+        Args:
+            prompt: The prompt to respond to.
+            raise_error_if_empty_response: Whether to raise an error if the response is empty.
+            response_json_schema: The schema of the response, if any.
+
+        Returns:
+            The generated response.
+
+        Raises:
+            ValueError: If the response is empty and `raise_error_if_empty_response` is set.
+
+        """
+        self.history.append(prompt)
+        response: T_Schema | str = await self._respond(prompt, response_json_schema)
+        if raise_error_if_empty_response and not response:
+            msg: str = f"Received {response!r} from the LLM as generation results"
+            raise ValueError(msg)
+
+        return response
+
+    async def send_bulk_messages(
+        self,
+        prompts: list[str],
+        /,
+        *,
+        response_json_schema: type[T_Schema] | None = None,
+        use_batch: bool = False,  # ruff:ignore[unused-method-argument]
+    ) -> list[T_Schema | str]:
+        """Generate fake responses for multiple prompts concurrently.
+
+        Args:
+            prompts: The prompts to respond to.
+            response_json_schema: The schema of the responses, if any.
+            use_batch: Ignored, the fake backend has no batch API.
+
+        Returns:
+            The generated responses, in the order of the prompts.
+
+        """
+        results: list[T_Schema | str] = [""] * len(prompts)
+        limiter: anyio.CapacityLimiter = anyio.CapacityLimiter(MAX_CONCURRENT_REQUESTS)
+
+        async def _bounded_respond(i: int, p: str) -> None:
+            async with limiter:
+                results[i] = await self._respond(p, response_json_schema)
+
+        async with anyio.create_task_group() as tg:
+            for i, prompt in enumerate(prompts):
+                tg.start_soon(_bounded_respond, i, prompt)
+
+        return results
+
+    def clean_session_history(self) -> None:
+        """Clean the session history."""
+        self.history.clear()
+
+    async def _respond(self, prompt: str, schema: type[T_Schema] | None) -> T_Schema | str:
+        self.prompts.append(prompt)
+        if self.config.latency_sec:
+            await anyio.sleep(self.config.latency_sec)
+
+        return typing.cast("T_Schema | str", self.responder(prompt, schema))
+
+
+def fake_response(prompt: str, schema: type[BaseModel] | None) -> BaseModel | str:
+    """Build a deterministic response for a prompt.
+
+    Args:
+        prompt: The prompt to respond to.
+        schema: The schema of the response, if any.
+
+    Returns:
+        A text response, or an instance of `schema` with deterministic values.
+
+    """
+    seed: str = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+    if schema is None:
+        return f"Fake response {seed}"
+
+    return _fake_model(schema, seed)
+
+
+def _fake_model(schema: type[BaseModel], seed: str) -> BaseModel:
+    values: dict[str, Any] = {
+        name: _fake_value(field.annotation, f"{name}-{seed}")
+        for name, field in schema.model_fields.items()
+        if field.is_required()
+    }
+    try:
+        return schema.model_validate(values)
+    except ValidationError:
+        return schema.model_construct(**values)
+
+
+def _fake_value(annotation: Any, seed: str) -> Any:  # ruff:ignore[any-type, too-many-return-statements]
+    origin: Any = typing.get_origin(annotation)
+    args: tuple[Any, ...] = typing.get_args(annotation)
+    if origin in {Union, types.UnionType}:
+        return None if type(None) in args else _fake_value(args[0], seed)
+
+    if origin is Literal:
+        return args[0]
+
+    if origin in {list, set, frozenset, tuple}:
+        return []
+
+    if origin is dict:
+        return {}
+
+    if isinstance(annotation, type):
+        builders: dict[type, Callable[[], Any]] = {
+            bool: lambda: False,
+            int: lambda: 0,
+            float: lambda: 0.0,
+            str: lambda: seed,
+        }
+        if issubclass(annotation, BaseModel):
+            return _fake_model(annotation, seed)
+
+        if issubclass(annotation, enum.Enum):
+            return next(iter(annotation))
+
+        for type_, build in builders.items():
+            if issubclass(annotation, type_):
+                return build()
+
+    return None
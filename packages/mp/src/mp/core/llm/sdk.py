@@ -127,6 +127,10 @@ class LlmSdk(AbstractAsyncContextManager, abc.ABC, Generic[T_LlmConfig_co]):
     def clean_session_history(self) -> None:
         """Clean the session history."""
 
+    async def close(self) -> None:
+        """Close the session and release its resources."""
+        self.clean_session_history()
+
     def set_system_prompt_to_session(self, prompt: str) -> None:
         """Set the system prompt for the session."""
         self.system_prompt = prompt
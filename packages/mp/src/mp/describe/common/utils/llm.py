@@ -20,6 +20,9 @@ from typing import TYPE_CHECKING, TypeVar
 import anyio
 from pydantic import BaseModel
 
+import mp.core.config
+from mp.core.llm.cache import CachedLlm, LlmResponseCache
+from mp.core.llm.fake import FakeLlm, FakeLlmConfig
 from mp.core.llm.gemini import Gemini, GeminiConfig
 
 if TYPE_CHECKING:
@@ -62,12 +65,37 @@ async def create_llm_session() -> AsyncGenerator[LlmSdk[LlmConfig], None]:
 
     """
     llm_config: GeminiConfig = _create_gemini_config()
-    async with Gemini(config=llm_config) as gemini:
+    async with create_llm(llm_config) as gemini:
         system_prompt: str = await _get_system_prompt()
         gemini.set_system_prompt_to_session(system_prompt)
         yield gemini
 
 
+def create_llm(config: GeminiConfig) -> LlmSdk[LlmConfig]:
+    """Create the configured LLM backend, behind the local response cache if it is enabled.
+
+    When the run bypasses the cache, cached responses are ignored but fresh
+    responses are still stored.
+
+    Args:
+        config: The Gemini configuration. The fake backend only uses its model name.
+
+    Returns:
+        LlmSdk: The LLM SDK instance.
+
+    """
+    llm: LlmSdk[LlmConfig]
+    if mp.core.config.get_llm_backend() == "fake":
+        llm = FakeLlm(FakeLlmConfig(model_name=config.model_name))
+    else:
+        llm = Gemini(config=config)
+
+    if mp.core.config.is_llm_cache_enabled():
+        llm = CachedLlm(llm, LlmResponseCache.open_default(), read=not mp.core.config.is_llm_cache_bypassed())
+
+    return llm
+
+
 def _create_gemini_config() -> GeminiConfig:
     return GeminiConfig(model_name=GEMINI_MODEL_NAME, temperature=GEMINI_TEMPERATURE)
 
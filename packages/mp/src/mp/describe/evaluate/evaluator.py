@@ -357,6 +357,11 @@ class EvaluationEngine:
         """
         self.storage = storage
 
+    def close(self) -> None:
+        """Close the engine's storage, if any."""
+        if self.storage:
+            self.storage.close()
+
     @staticmethod
     def _validate_capabilities_field(val_str: str) -> tuple[bool, str]:
         """Validate capabilities JSON structure.
@@ -762,135 +767,139 @@ class EvaluationEngine:
         prompts: list[str] = []
         action_rules_list: list[tuple[str, Any]] = []
 
-        for action_name, fields in actions_dict.items():
-            if action_name in {
-                "integration",
-                "product_categories",
-                "security_domains",
-                "integration_categories",
-            }:
-                continue
-            action_code, action_files, shared_files = get_code_for_action(action_name, python_files)
-            logger.info(
-                "  📄 (%s) Using %d files for evaluation prompt:\n"
-                "    - Action-Specific (%d):\n        * %s\n"
-                "    - Shared / Common (%d):\n        * %s",
-                action_name,
-                len(action_files) + len(shared_files),
-                len(action_files),
-                "\n        * ".join(action_files) if action_files else "None",
-                len(shared_files),
-                "\n        * ".join(shared_files) if shared_files else "None",
-            )
-            for rule in active_rules:
-                is_valid, err_reason = self._validate_field_for_rule(rule.target_field, fields)
-                if not is_valid:
-                    eval_id = f"eval_{uuid.uuid4().hex[:8]}"
-                    res_fail = RuleEvaluationResult(
-                        evaluation_id=eval_id,
-                        integration_id=integration_id,
-                        action_id=action_name,
-                        run_id=run_id,
-                        evaluated_at=evaluated_at,
-                        rule_title=rule.title,
-                        actual_value=fields.get(rule.target_field, "-"),
-                        verdict=VerdictEnum.FAIL,
-                        reasoning=(
-                            f"target field '{rule.target_field}' is missing, empty, or malformed in YAML: {err_reason}."
-                        ),
-                        suggested_fix=f"Define a valid '{rule.target_field}' in the action YAML.",
-                        prompt=None,
-                    )
-                    results.append(res_fail)
-                    if self.storage:
-                        self.storage.save_evaluation(res_fail)
+        # Results are persisted even when an evaluation fails part way, so a
+        # failure does not lose the results of the integration's other rules
+        try:
+            for action_name, fields in actions_dict.items():
+                if action_name in {
+                    "integration",
+                    "product_categories",
+                    "security_domains",
+                    "integration_categories",
+                }:
+                    continue
+                action_code, action_files, shared_files = get_code_for_action(action_name, python_files)
+                logger.info(
+                    "  📄 (%s) Using %d files for evaluation prompt:\n"
+                    "    - Action-Specific (%d):\n        * %s\n"
+                    "    - Shared / Common (%d):\n        * %s",
+                    action_name,
+                    len(action_files) + len(shared_files),
+                    len(action_files),
+                    "\n        * ".join(action_files) if action_files else "None",
+                    len(shared_files),
+                    "\n        * ".join(shared_files) if shared_files else "None",
+                )
+                for rule in active_rules:
+                    is_valid, err_reason = self._validate_field_for_rule(rule.target_field, fields)
+                    if not is_valid:
+                        eval_id = f"eval_{uuid.uuid4().hex[:8]}"
+                        res_fail = RuleEvaluationResult(
+                            evaluation_id=eval_id,
+                            integration_id=integration_id,
+                            action_id=action_name,
+                            run_id=run_id,
+                            evaluated_at=evaluated_at,
+                            rule_title=rule.title,
+                            actual_value=fields.get(rule.target_field, "-"),
+                            verdict=VerdictEnum.FAIL,
+                            reasoning=(
+                                f"target field '{rule.target_field}' is missing, empty, or malformed in YAML: "
+                                f"{err_reason}."
+                            ),
+                            suggested_fix=f"Define a valid '{rule.target_field}' in the action YAML.",
+                            prompt=None,
+                        )
+                        results.append(res_fail)
+                        logger.info(
+                            "  [%s] %s: FAIL (Missing/Invalid Field: %s)",
+                            action_name,
+                            rule.title,
+                            rule.target_field,
+                        )
+                    else:
+                        prompt = build_evaluation_prompt(
+                            rule,
+                            original_prompt,
+                            action_code,
+                            fields.get(rule.target_field, ""),
+                        )
+                        prompts.append(prompt)
+                        action_rules_list.append((action_name, rule))
+
+            llm_responses: list[RuleVerdict | str] = []
+
+            if use_llm and prompts:
+                try:
+                    mode_str = "Batch API" if use_batch else "Direct Streaming"
                     logger.info(
-                        "  [%s] %s: FAIL (Missing/Invalid Field: %s)",
-                        action_name,
-                        rule.title,
-                        rule.target_field,
+                        "⚡ [3/4] Dispatching %d rule evaluation prompts to Gemini API (%s)...",
+                        len(prompts),
+                        mode_str,
+                    )
+                    llm_responses = EvaluationEngine._dispatch_prompts(prompts, use_batch=use_batch)
+                except Exception as err:  # ruff: ignore[blind-except]
+                    logger.warning(
+                        "Gemini API evaluation offline or unavailable: %s. Using heuristic evaluation.",
+                        err,
                     )
+                    llm_responses = []
+
+            heuristic_fallbacks: list[tuple[str, str]] = []
+
+            for idx, (action_name, rule) in enumerate(action_rules_list):
+                eval_id = f"eval_{uuid.uuid4().hex[:8]}"
+                fields = actions_dict.get(action_name, {})
+                target_val = fields.get(rule.target_field, f"Sample value for {rule.target_field}")
+
+                verdict_val = VerdictEnum.PASS
+                reasoning = f"Rule '{rule.title}' passed criteria verification."
+                fix = None
+
+                if idx < len(llm_responses) and isinstance(llm_responses[idx], RuleVerdict):
+                    v_resp = llm_responses[idx]
+                    if isinstance(v_resp, RuleVerdict):
+                        verdict_val = v_resp.verdict
+                        reasoning = v_resp.reasoning
+                        fix = v_resp.suggested_fix
+                        logger.info(
+                            "  [%s] %s: %s",
+                            action_name,
+                            rule.title,
+                            verdict_val.value,
+                        )
                 else:
-                    prompt = build_evaluation_prompt(
-                        rule,
-                        original_prompt,
-                        action_code,
-                        fields.get(rule.target_field, ""),
+                    heuristic_fallbacks.append((action_name, rule.title))
+                    verdict_val, reasoning, fix = self._heuristic_evaluate_rule(
+                        rule.title, rule.target_field, target_val
                     )
-                    prompts.append(prompt)
-                    action_rules_list.append((action_name, rule))
-
-        llm_responses: list[RuleVerdict | str] = []
-
-        if use_llm and prompts:
-            try:
-                mode_str = "Batch API" if use_batch else "Direct Streaming"
-                logger.info(
-                    "⚡ [3/4] Dispatching %d rule evaluation prompts to Gemini API (%s)...",
-                    len(prompts),
-                    mode_str,
-                )
-                llm_responses = EvaluationEngine._dispatch_prompts(prompts, use_batch=use_batch)
-            except Exception as err:  # ruff: ignore[blind-except]
-                logger.warning(
-                    "Gemini API evaluation offline or unavailable: %s. Using heuristic evaluation.",
-                    err,
-                )
-                llm_responses = []
-
-        heuristic_fallbacks: list[tuple[str, str]] = []
-
-        for idx, (action_name, rule) in enumerate(action_rules_list):
-            eval_id = f"eval_{uuid.uuid4().hex[:8]}"
-            fields = actions_dict.get(action_name, {})
-            target_val = fields.get(rule.target_field, f"Sample value for {rule.target_field}")
-
-            verdict_val = VerdictEnum.PASS
-            reasoning = f"Rule '{rule.title}' passed criteria verification."
-            fix = None
-
-            if idx < len(llm_responses) and isinstance(llm_responses[idx], RuleVerdict):
-                v_resp = llm_responses[idx]
-                if isinstance(v_resp, RuleVerdict):
-                    verdict_val = v_resp.verdict
-                    reasoning = v_resp.reasoning
-                    fix = v_resp.suggested_fix
                     logger.info(
-                        "  [%s] %s: %s",
+                        "  [%s] %s: %s (Heuristic)",
                         action_name,
                         rule.title,
                         verdict_val.value,
                     )
-            else:
-                heuristic_fallbacks.append((action_name, rule.title))
-                verdict_val, reasoning, fix = self._heuristic_evaluate_rule(rule.title, rule.target_field, target_val)
-                logger.info(
-                    "  [%s] %s: %s (Heuristic)",
-                    action_name,
-                    rule.title,
-                    verdict_val.value,
+
+                res = RuleEvaluationResult(
+                    evaluation_id=eval_id,
+                    integration_id=integration_id,
+                    action_id=action_name,
+                    run_id=run_id,
+                    evaluated_at=evaluated_at,
+                    rule_title=rule.title,
+                    actual_value=target_val,
+                    verdict=verdict_val,
+                    reasoning=reasoning,
+                    suggested_fix=fix,
+                    prompt=prompts[idx] if add_prompt and idx < len(prompts) else None,
                 )
 
-            res = RuleEvaluationResult(
-                evaluation_id=eval_id,
-                integration_id=integration_id,
-                action_id=action_name,
-                run_id=run_id,
-                evaluated_at=evaluated_at,
-                rule_title=rule.title,
-                actual_value=target_val,
-                verdict=verdict_val,
-                reasoning=reasoning,
-                suggested_fix=fix,
-                prompt=prompts[idx] if add_prompt and idx < len(prompts) else None,
-            )
+                results.append(res)
 
-            results.append(res)
+        finally:
             if self.storage:
-                self.storage.save_evaluation(res)
-
-        if self.storage:
-            logger.info("💾 [4/4] Persisted %d rule evaluation records to SQLite database.", len(results))
+                saved: int = self.storage.save_evaluations(results)
+                logger.info("💾 [4/4] Persisted %d rule evaluation records to SQLite database.", saved)
 
         if heuristic_fallbacks:
             logger.warning(
@@ -14,14 +14,41 @@
 
 from __future__ import annotations
 
+import itertools
 import sqlite3
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING, Self
 
 from .models import RuleEvaluationResult, VerdictEnum
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+
+WRITE_BATCH_SIZE: int = 1000
+_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-16000;",
+)
+_INSERT_QUERY: str = """
+    INSERT OR REPLACE INTO rule_evaluations (
+        evaluation_id, integration_id, action_id, run_id,
+        evaluated_at, rule_title, actual_value, verdict,
+        reasoning, suggested_fix
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+"""
+
 
 class EvaluationStorage:
-    """SQLite storage engine for mp describe evaluate rule_evaluations table."""
+    """SQLite storage engine for mp describe evaluate rule_evaluations table.
+
+    A single connection is kept open for the lifetime of the storage and shared
+    by all reads and writes. Call `close()`, or use the storage as a context
+    manager, to release it.
+    """
 
     def __init__(self, db_path: Path | str) -> None:
         """Initialize EvaluationStorage.
@@ -31,18 +58,40 @@ class EvaluationStorage:
 
         """
         self.db_path = Path(db_path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
         self._init_db()
 
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the storage's database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def _get_connection(self) -> sqlite3.Connection:
-        """Create sqlite3 connection with row factory.
+        """Get the long-lived sqlite3 connection, creating it on first use.
 
         Returns:
             sqlite3 Connection object.
 
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
+            self._conn = conn
+
+        return self._conn
 
     def _init_db(self) -> None:
         """Create rule_evaluations table and index if they do not exist."""
@@ -105,6 +154,11 @@ class EvaluationStorage:
             cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_eval_lookup ON rule_evaluations(integration_id, action_id, run_id);"
             )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_eval_integration_run"
+                " ON rule_evaluations(integration_id, run_id, rule_title);"
+            )
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_eval_run ON rule_evaluations(run_id, rule_title);")
             conn.commit()
 
     def save_evaluation(self, result: RuleEvaluationResult) -> None:
@@ -114,30 +168,27 @@ class EvaluationStorage:
             result: RuleEvaluationResult object to persist.
 
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO rule_evaluations (
-                    evaluation_id, integration_id, action_id, run_id,
-                    evaluated_at, rule_title, actual_value, verdict,
-                    reasoning, suggested_fix
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-                """,
-                (
-                    result.evaluation_id,
-                    result.integration_id,
-                    result.action_id,
-                    result.run_id,
-                    result.evaluated_at,
-                    result.rule_title,
-                    result.actual_value,
-                    result.verdict.value,
-                    result.reasoning,
-                    result.suggested_fix,
-                ),
-            )
-            conn.commit()
+        self.save_evaluations([result])
+
+    def save_evaluations(self, results: Iterable[RuleEvaluationResult], *, batch_size: int = WRITE_BATCH_SIZE) -> int:
+        """Persist multiple rule evaluation records in a single transaction.
+
+        Args:
+            results: RuleEvaluationResult objects to persist.
+            batch_size: Number of records sent to SQLite per `executemany` call.
+
+        Returns:
+            The number of persisted records.
+
+        """
+        count: int = 0
+        with self._lock, self._get_connection() as conn:
+            rows = (_to_row(result) for result in results)
+            while batch := list(itertools.islice(rows, batch_size)):
+                conn.executemany(_INSERT_QUERY, batch)
+                count += len(batch)
+
+        return count
 
     def get_evaluations(
         self,
@@ -157,6 +208,7 @@ class EvaluationStorage:
 
         """
         query = "SELECT * FROM rule_evaluations WHERE 1=1"
+        # Equality filters on the leading columns let SQLite use the lookup indexes
         params: list[str] = []
 
         if integration_id:
@@ -171,10 +223,8 @@ class EvaluationStorage:
 
         query += " ORDER BY rule_title ASC"
 
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
+        with self._lock:
+            rows = self._get_connection().execute(query, params).fetchall()
             return [
                 RuleEvaluationResult(
                     evaluation_id=row["evaluation_id"],
@@ -190,3 +240,18 @@ class EvaluationStorage:
                 )
                 for row in rows
             ]
+
+
+def _to_row(result: RuleEvaluationResult) -> tuple[str | None, ...]:
+    return (
+        result.evaluation_id,
+        result.integration_id,
+        result.action_id,
+        result.run_id,
+        result.evaluated_at,
+        result.rule_title,
+        result.actual_value,
+        result.verdict.value,
+        result.reasoning,
+        result.suggested_fix,
+    )
@@ -80,6 +80,7 @@ def evaluate(  # ruff: ignore[too-many-arguments]
     ] = False,
     quiet: Annotated[bool, typer.Option("--quiet", "-q", help="Log less on runtime.")] = False,
     verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Log more on runtime.")] = False,
+    no_cache: Annotated[bool, typer.Option("--no-cache", help="Ignore cached LLM responses for this run.")] = False,
 ) -> None:
     """Evaluate quality of generated AI descriptions for an integration.
 
@@ -87,7 +88,7 @@ def evaluate(  # ruff: ignore[too-many-arguments]
         typer.Exit: If integration is not specified and --all is False, or if integration path does not exist.
 
     """
-    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(quiet, verbose)
+    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(quiet, verbose, bypass_llm_cache=no_cache)
     run_params.set_in_config()
 
     if not integration and not all_marketplace:
@@ -114,33 +115,36 @@ def evaluate(  # ruff: ignore[too-many-arguments]
 
     engine = EvaluationEngine()
 
-    for target_integration in integrations_to_eval:
-        logger.info("Starting evaluation for integration: %s", target_integration)
-        report = engine.evaluate_integration(
-            integration_id=target_integration,
-            db_path=db_target,
-            src=src,
-            config_yaml=config_yaml,
-            ruleset=ruleset,
-            action=action,
-            add_prompt=add_prompt,
-            use_batch=use_batch_api,
-        )
-
-        if not output_path:
-            int_path = pathlib.Path(str(get_integration_path(target_integration, src=src)))
-            ai_dir = int_path / constants.RESOURCES_DIR / constants.AI_DIR
-            ext = {"json": "json", "html": "html"}.get(export_format.lower(), "md")
-            dest_file = ai_dir / f"evaluation_report.{ext}"
-        else:
-            dest_file = output_path
-
-        EvaluationReporter.export_report(
-            report=report,
-            export_format=export_format,
-            output_path=dest_file,
-        )
-
-        logger.debug("Evaluation report saved to: %s", dest_file)
-        if not quiet:
-            typer.echo(f"Evaluation report saved to: {dest_file}")
+    try:
+        for target_integration in integrations_to_eval:
+            logger.info("Starting evaluation for integration: %s", target_integration)
+            report = engine.evaluate_integration(
+                integration_id=target_integration,
+                db_path=db_target,
+                src=src,
+                config_yaml=config_yaml,
+                ruleset=ruleset,
+                action=action,
+                add_prompt=add_prompt,
+                use_batch=use_batch_api,
+            )
+
+            if not output_path:
+                int_path = pathlib.Path(str(get_integration_path(target_integration, src=src)))
+                ai_dir = int_path / constants.RESOURCES_DIR / constants.AI_DIR
+                ext = {"json": "json", "html": "html"}.get(export_format.lower(), "md")
+                dest_file = ai_dir / f"evaluation_report.{ext}"
+            else:
+                dest_file = output_path
+
+            EvaluationReporter.export_report(
+                report=report,
+                export_format=export_format,
+                output_path=dest_file,
+            )
+
+            logger.debug("Evaluation report saved to: %s", dest_file)
+            if not quiet:
+                typer.echo(f"Evaluation report saved to: {dest_file}")
+    finally:
+        engine.close()
@@ -57,6 +57,9 @@ def describe(  # ruff:ignore[too-many-arguments]
     override: Annotated[
         bool, typer.Option("--override", "-o", help="Rewrite integrations that already have their description.")
     ] = False,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="Ignore cached LLM responses for this run. Implied by --override.")
+    ] = False,
 ) -> None:
     """Describe integrations.
 
@@ -68,12 +71,15 @@ def describe(  # ruff:ignore[too-many-arguments]
         quiet: Quiet log options.
         verbose: Verbose log options.
         override: Whether to rewrite existing descriptions.
+        no_cache: Whether to ignore cached LLM responses.
 
     Raises:
         typer.Exit: If neither integrations nor --all is specified.
 
     """
-    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(quiet, verbose)
+    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(
+        quiet, verbose, bypass_llm_cache=no_cache or override
+    )
     run_params.set_in_config()
 
     if integrations and not all_marketplace:
@@ -62,6 +62,9 @@ def describe(  # ruff:ignore[too-many-arguments]
     override: Annotated[
         bool, typer.Option("--override", "-o", help="Whether to override existing descriptions.")
     ] = False,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="Ignore cached LLM responses for this run. Implied by --override.")
+    ] = False,
     quiet: Annotated[bool, typer.Option("--quiet", "-q", help="Log less on runtime.")] = False,
     verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Log more on runtime.")] = False,
 ) -> None:
@@ -74,6 +77,7 @@ def describe(  # ruff:ignore[too-many-arguments]
         src: The path to the marketplace.
         dst: The path to save the descriptions to.
         override: Whether to override existing descriptions.
+        no_cache: Whether to ignore cached LLM responses.
         quiet: Log less on runtime.
         verbose: Log more on runtime.
 
@@ -81,7 +85,9 @@ def describe(  # ruff:ignore[too-many-arguments]
         typer.Exit: If neither --integration nor --all is specified.
 
     """
-    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(quiet, verbose)
+    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(
+        quiet, verbose, bypass_llm_cache=no_cache or override
+    )
     run_params.set_in_config()
 
     sem = asyncio.Semaphore(mp.core.config.get_gemini_concurrency())
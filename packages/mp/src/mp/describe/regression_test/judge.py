@@ -21,11 +21,15 @@ import dataclasses
 import json
 import logging
 import time
-from typing import Literal, cast
+from typing import TYPE_CHECKING, Literal, cast
 
 from pydantic import BaseModel, Field, model_validator
 
 from mp.core.llm.gemini import Gemini, GeminiConfig
+from mp.describe.common.utils.llm import create_llm
+
+if TYPE_CHECKING:
+    from mp.core.llm.sdk import LlmConfig, LlmSdk
 
 logger = logging.getLogger(__name__)
 
@@ -252,6 +256,7 @@ async def evaluate_text_equivalence_batch(
     Args:
         candidates: List of candidate text pairs to evaluate.
         llm: Optional pre-configured Gemini SDK instance.
+            When omitted, the configured LLM backend is used.
         use_batch: Whether to use Google GenAI Batch API instead of concurrent interactive requests.
 
     Returns:
@@ -265,20 +270,22 @@ async def evaluate_text_equivalence_batch(
     prompts: list[str] = [create_judge_prompt(candidate) for candidate in candidates]
 
     close_after: bool = False
+    session: LlmSdk[LlmConfig]
     if llm is None:
         config = GeminiConfig()
         config.use_thinking = True
         config.temperature = 0.0
-        llm = Gemini(config)
+        session = create_llm(config)
         close_after = True
     else:
         llm.config.use_thinking = True
         llm.config.temperature = 0.0
+        session = llm
 
     try:
         # Override system prompt with our specialized Judge prompt protocol
-        llm.system_prompt = JUDGE_SYSTEM_PROMPT
-        responses = await llm.send_bulk_messages(
+        session.system_prompt = JUDGE_SYSTEM_PROMPT
+        responses = await session.send_bulk_messages(
             prompts, response_json_schema=SemanticAssessment, use_batch=use_batch
         )
     except Exception:
@@ -286,7 +293,7 @@ async def evaluate_text_equivalence_batch(
         return []
     finally:
         if close_after:
-            await llm.close()
+            await session.close()
 
     from mp.describe.regression_test.classifier import ChangeClassifier  # ruff:ignore[import-outside-top-level]
 
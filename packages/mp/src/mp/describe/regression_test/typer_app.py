@@ -56,6 +56,9 @@ def describe_action(  # ruff:ignore[too-many-arguments]
     override: Annotated[
         bool, typer.Option("--override", "-o", help="Rewrite content that already have their description.")
     ] = False,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="Ignore cached LLM responses for this run. Implied by --override.")
+    ] = False,
     report_file: Annotated[
         pathlib.Path | None, typer.Option("--report-file", help="CSV report file path for results.")
     ] = None,
@@ -86,6 +89,7 @@ def describe_action(  # ruff:ignore[too-many-arguments]
         src: Source directory.
         dst: Test/Destination directory.
         override: Override flag.
+        no_cache: Whether to ignore cached LLM responses.
         report_file: Report file path.
         run_describe: Run describe generation first.
         use_llm_judge: Use Gemini Judge to evaluate text field equivalence.
@@ -97,7 +101,9 @@ def describe_action(  # ruff:ignore[too-many-arguments]
         typer.Exit: If neither --integration nor --all is specified.
 
     """
-    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(quiet, verbose)
+    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(
+        quiet, verbose, bypass_llm_cache=no_cache or override
+    )
     run_params.set_in_config()
 
     if not integration and not all_marketplace:
@@ -134,6 +140,9 @@ def describe_integration(  # ruff:ignore[too-many-arguments]
     override: Annotated[
         bool, typer.Option("--override", "-o", help="Rewrite content that already have their description.")
     ] = False,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="Ignore cached LLM responses for this run. Implied by --override.")
+    ] = False,
     report_file: Annotated[
         pathlib.Path | None, typer.Option("--report-file", help="CSV report file path for results.")
     ] = None,
@@ -163,6 +172,7 @@ def describe_integration(  # ruff:ignore[too-many-arguments]
         src: Source directory.
         dst: Test/Destination directory.
         override: Override flag.
+        no_cache: Whether to ignore cached LLM responses.
         report_file: Report file path.
         run_describe: Run describe generation first.
         use_llm_judge: Use Gemini Judge to evaluate text field equivalence.
@@ -174,7 +184,9 @@ def describe_integration(  # ruff:ignore[too-many-arguments]
         typer.Exit: If neither integrations nor --all is specified.
 
     """
-    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(quiet, verbose)
+    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(
+        quiet, verbose, bypass_llm_cache=no_cache or override
+    )
     run_params.set_in_config()
 
     if not integrations and not all_marketplace:
@@ -213,6 +225,9 @@ def describe_connector(  # ruff:ignore[too-many-arguments]
     override: Annotated[
         bool, typer.Option("--override", "-o", help="Rewrite content that already have their description.")
     ] = False,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="Ignore cached LLM responses for this run. Implied by --override.")
+    ] = False,
     report_file: Annotated[
         pathlib.Path | None, typer.Option("--report-file", help="CSV report file path for results.")
     ] = None,
@@ -243,6 +258,7 @@ def describe_connector(  # ruff:ignore[too-many-arguments]
         src: Source directory.
         dst: Test/Destination directory.
         override: Override flag.
+        no_cache: Whether to ignore cached LLM responses.
         report_file: Report file path.
         run_describe: Run describe generation first.
         use_llm_judge: Use Gemini Judge to evaluate text field equivalence.
@@ -254,7 +270,9 @@ def describe_connector(  # ruff:ignore[too-many-arguments]
         typer.Exit: If neither --integration nor --all is specified.
 
     """
-    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(quiet, verbose)
+    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(
+        quiet, verbose, bypass_llm_cache=no_cache or override
+    )
     run_params.set_in_config()
 
     if not integration and not all_marketplace:
@@ -294,6 +312,9 @@ def describe_job(  # ruff:ignore[too-many-arguments]
     override: Annotated[
         bool, typer.Option("--override", "-o", help="Rewrite content that already have their description.")
     ] = False,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="Ignore cached LLM responses for this run. Implied by --override.")
+    ] = False,
     report_file: Annotated[
         pathlib.Path | None, typer.Option("--report-file", help="CSV report file path for results.")
     ] = None,
@@ -324,6 +345,7 @@ def describe_job(  # ruff:ignore[too-many-arguments]
         src: Source directory.
         dst: Test/Destination directory.
         override: Override flag.
+        no_cache: Whether to ignore cached LLM responses.
         report_file: Report file path.
         run_describe: Run describe generation first.
         use_llm_judge: Use Gemini Judge to evaluate text field equivalence.
@@ -335,7 +357,9 @@ def describe_job(  # ruff:ignore[too-many-arguments]
         typer.Exit: If neither --integration nor --all is specified.
 
     """
-    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(quiet, verbose)
+    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(
+        quiet, verbose, bypass_llm_cache=no_cache or override
+    )
     run_params.set_in_config()
 
     if not integration and not all_marketplace:
@@ -372,6 +396,9 @@ def describe_all_content(  # ruff:ignore[too-many-arguments]
     override: Annotated[
         bool, typer.Option("--override", "-o", help="Rewrite content that already have their description.")
     ] = False,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="Ignore cached LLM responses for this run. Implied by --override.")
+    ] = False,
     report_file: Annotated[
         pathlib.Path | None, typer.Option("--report-file", help="CSV report file path for results.")
     ] = None,
@@ -401,6 +428,7 @@ def describe_all_content(  # ruff:ignore[too-many-arguments]
         src: Source directory.
         dst: Test/Destination directory.
         override: Override flag.
+        no_cache: Whether to ignore cached LLM responses.
         report_file: Report file path.
         run_describe: Run describe generation first.
         use_llm_judge: Use Gemini Judge to evaluate text field equivalence.
@@ -412,7 +440,9 @@ def describe_all_content(  # ruff:ignore[too-many-arguments]
         typer.Exit: If neither integrations nor --all is specified.
 
     """
-    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(quiet, verbose)
+    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(
+        quiet, verbose, bypass_llm_cache=no_cache or override
+    )
     run_params.set_in_config()
 
     if not integrations and not all_marketplace:
@@ -67,6 +67,9 @@ def all_content(  # ruff:ignore[too-many-arguments]
     override: Annotated[
         bool, typer.Option("--override", "-o", help="Rewrite content that already have their description.")
     ] = False,
+    no_cache: Annotated[
+        bool, typer.Option("--no-cache", help="Ignore cached LLM responses for this run. Implied by --override.")
+    ] = False,
 ) -> None:
     """Describe all content in integrations.
 
@@ -74,7 +77,9 @@ def all_content(  # ruff:ignore[too-many-arguments]
         typer.Exit: If neither integrations nor --all is specified.
 
     """
-    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(quiet, verbose)
+    run_params: mp.core.config.RuntimeParams = mp.core.config.RuntimeParams(
+        quiet, verbose, bypass_llm_cache=no_cache or override
+    )
     run_params.set_in_config()
 
     if integrations and not all_marketplace:
@@ -0,0 +1,284 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, NamedTuple
+
+import requests
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+    from mp.dev_env.api import BackendAPI
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_RETRIES: int = 3
+DEFAULT_BACKOFF_SECONDS: float = 1.0
+MAX_BACKOFF_SECONDS: float = 30.0
+RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class PushItem(NamedTuple):
+    """A single piece of content to push to the SOAR environment.
+
+    Attributes:
+        key: A unique, stable name of the content, e.g. `integration:VirusTotal`.
+        fingerprint: A hash of the content. Unchanged fingerprints are not pushed again.
+        push: Pushes the content with the given backend API client.
+
+    """
+
+    key: str
+    fingerprint: str
+    push: Callable[[BackendAPI], object]
+
+
+class BulkPushResult(NamedTuple):
+    """The outcome of a bulk push."""
+
+    pushed: list[str]
+    skipped: list[str]
+    failed: dict[str, Exception]
+
+
+class PushManifest:
+    """A local record of the content last pushed to each SOAR environment.
+
+    The manifest is saved after every successful push, so an interrupted bulk
+    push resumes from where it stopped on the next run.
+    """
+
+    def __init__(self, path: Path, api_root: str) -> None:
+        """Initialize the manifest.
+
+        Args:
+            path: The JSON file holding the manifests of all environments.
+            api_root: The API root of the environment this manifest tracks.
+
+        """
+        self.path: Path = path
+        self.api_root: str = api_root.rstrip("/")
+        self._lock: threading.Lock = threading.Lock()
+        self._environments: dict[str, dict[str, str]] = self._load()
+
+    @property
+    def entries(self) -> dict[str, str]:
+        """The fingerprints of the content last pushed to this environment, by key."""
+        return self._environments.setdefault(self.api_root, {})
+
+    def is_current(self, item: PushItem) -> bool:
+        """Check whether an item was already pushed with the same fingerprint.
+
+        Args:
+            item: The item to check.
+
+        Returns:
+            True if the item is unchanged since its last successful push.
+
+        """
+        with self._lock:
+            return self.entries.get(item.key) == item.fingerprint
+
+    def record(self, item: PushItem) -> None:
+        """Record a successful push and save the manifest.
+
+        Args:
+            item: The pushed item.
+
+        """
+        with self._lock:
+            self.entries[item.key] = item.fingerprint
+            self._save()
+
+    def _load(self) -> dict[str, dict[str, str]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    def _save(self) -> None:
+        tmp_path: Path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self._environments, indent=2, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+
+class BulkPusher:
+    """Push many content items concurrently, with retries and change detection.
+
+    Each worker thread uses its own fork of the backend API client. Items that
+    fail with a connection error or a retryable HTTP status are retried with an
+    exponential backoff. Failures never stop the other items from being pushed.
+    """
+
+    def __init__(
+        self,
+        backend_api: BackendAPI,
+        manifest: PushManifest | None = None,
+        *,
+        max_workers: int = 1,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_seconds: float = DEFAULT_BACKOFF_SECONDS,
+    ) -> None:
+        """Initialize the pusher.
+
+        Args:
+            backend_api: An authenticated backend API client.
+            manifest: The manifest used to skip unchanged items and resume interrupted pushes.
+            max_workers: The number of items pushed concurrently.
+            max_retries: The number of times a failed item is retried.
+            backoff_seconds: The delay before the first retry. It doubles after each retry.
+
+        """
+        self.backend_api: BackendAPI = backend_api
+        self.manifest: PushManifest | None = manifest
+        self.max_workers: int = max(1, max_workers)
+        self.max_retries: int = max_retries
+        self.backoff_seconds: float = backoff_seconds
+        self._local: threading.local = threading.local()
+
+    def push(self, items: Iterable[PushItem], *, force: bool = False) -> BulkPushResult:
+        """Push all the items that changed since their last successful push.
+
+        Args:
+            items: The items to push.
+            force: Push all items, even if the manifest marks them as unchanged.
+
+        Returns:
+            The keys of the pushed and skipped items, and the errors of the failed ones.
+
+        """
+        result = BulkPushResult(pushed=[], skipped=[], failed={})
+        pending: list[PushItem] = []
+        for item in items:
+            if not force and self.manifest is not None and self.manifest.is_current(item):
+                result.skipped.append(item.key)
+            else:
+                pending.append(item)
+
+        if result.skipped:
+            logger.info("Skipping %d unchanged item(s)", len(result.skipped))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures: dict[Future[None], PushItem] = {pool.submit(self._push_with_retries, i): i for i in pending}
+            for future in as_completed(futures):
+                item: PushItem = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.debug("Failed to push %s", item.key, exc_info=e)
+                    result.failed[item.key] = e
+                else:
+                    result.pushed.append(item.key)
+
+        return result
+
+    def _push_with_retries(self, item: PushItem) -> None:
+        backend_api: BackendAPI = self._get_thread_api()
+        attempt: int = 0
+        while True:
+            try:
+                item.push(backend_api)
+                break
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable_error(e):
+                    raise
+
+                delay: float = min(self.backoff_seconds * 2**attempt, MAX_BACKOFF_SECONDS)
+                attempt += 1
+                logger.warning("Push of %s failed (%s), retry %d in %.1fs", item.key, e, attempt, delay)
+                time.sleep(delay)
+
+        logger.info("Successfully pushed: %s", item.key)
+        if self.manifest is not None:
+            self.manifest.record(item)
+
+    def _get_thread_api(self) -> BackendAPI:
+        backend_api: BackendAPI | None = getattr(self._local, "backend_api", None)
+        if backend_api is None:
+            backend_api = fork_backend_api(self.backend_api)
+            self._local.backend_api = backend_api
+
+        return backend_api
+
+
+def fork_backend_api(backend_api: BackendAPI) -> BackendAPI:
+    """Create a backend API client with its own HTTP session, reusing an existing authentication.
+
+    `requests.Session` is not thread-safe, so each worker thread pushes with its own fork.
+
+    Args:
+        backend_api: An authenticated backend API client.
+
+    Returns:
+        A client sharing the credentials, headers and TLS settings of `backend_api`.
+
+    """
+    forked: BackendAPI = copy.copy(backend_api)
+    forked.session = requests.Session()
+    forked.session.headers.update(backend_api.session.headers)
+    forked.session.verify = backend_api.session.verify
+    return forked
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Check whether a failed request is worth retrying.
+
+    Args:
+        error: The error raised by the request.
+
+    Returns:
+        True for connection errors, timeouts and transient HTTP statuses.
+
+    """
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code in RETRYABLE_STATUS_CODES
+
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+def fingerprint_path(path: Path) -> str:
+    """Hash the content of a file, or of all the files in a directory.
+
+    Directory fingerprints depend only on relative paths and file contents,
+    not on timestamps, so rebuilding unchanged content keeps its fingerprint.
+
+    Args:
+        path: The file or directory to hash.
+
+    Returns:
+        The hex digest of the content.
+
+    """
+    h = hashlib.sha256()
+    files: list[Path] = [path] if path.is_file() else sorted(p for p in path.rglob("*") if p.is_file())
+    for file in files:
+        h.update(file.relative_to(path).as_posix().encode("utf-8") if file != path else b"")
+        h.update(b"\0")
+        with file.open("rb") as f:
+            h.update(hashlib.file_digest(f, "sha256").digest())
+
+    return h.hexdigest()
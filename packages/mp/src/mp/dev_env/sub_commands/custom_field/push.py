@@ -14,13 +14,16 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
+import mp.core.config
 import mp.core.file_utils
+from mp.dev_env.bulk_push import BulkPusher, PushItem
 from mp.dev_env.sub_commands.push import push_app
 from mp.dev_env.sub_commands.utils import get_backend_api_clean as get_backend_api
 from mp.dev_env.utils import load_dev_env_config
@@ -28,6 +31,9 @@ from mp.telemetry import track_command
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    from mp.dev_env.api import BackendAPI
+
 
 def _normalize_scopes(val: str | list | set | None) -> set[str]:
     if not val:
@@ -171,7 +177,7 @@ def push_custom_field(  # ruff:ignore[complex-structure, too-many-branches, too-
             return
 
         pushed_keys = set()
-        pushed_count = 0
+        files_to_push: list[Path] = []
         for f in yaml_files:
             try:
                 field_data = mp.core.file_utils.load_yaml_file(f)
@@ -198,10 +204,10 @@ def push_custom_field(  # ruff:ignore[complex-structure, too-many-branches, too-
                         continue
                     pushed_keys.add(key)
 
-            _push_single_custom_field(f, force)
-            pushed_count += 1
+            files_to_push.append(f)
 
-        logger.info("Successfully finished pushing all %d custom fields.", pushed_count)
+        _push_custom_field_files(files_to_push, force=force)
+        logger.info("Successfully finished pushing all %d custom fields.", len(files_to_push))
         return
 
     # Standard single push
@@ -258,13 +264,70 @@ def push_custom_field(  # ruff:ignore[complex-structure, too-many-branches, too-
     if len(files_to_push) > 1:
         logger.info("Found %d files matching '%s'. Pushing all of them...", len(files_to_push), field_file_or_name)
 
-    for f in files_to_push:
-        _push_single_custom_field(f, force)
-
+    _push_custom_field_files(files_to_push, force=force)
     logger.info("Successfully pushed %d custom field(s).", len(files_to_push))
 
 
-def _push_single_custom_field(field_file: Path, force: bool) -> None:  # ruff:ignore[complex-structure, boolean-type-hint-positional-argument, too-many-branches, too-many-statements]
+def _push_custom_field_files(files: list[Path], *, force: bool) -> None:
+    """Push custom field files concurrently, each worker thread with its own backend API session.
+
+    Files of the same custom field and scopes are pushed in order by the same
+    worker, so a field created from one file is updated by the next one
+    instead of being created twice.
+
+    Raises:
+        typer.Exit: If any of the custom fields fails to push.
+
+    """
+    if len(files) == 1:
+        _push_single_custom_field(files[0], force)
+        return
+
+    groups: dict[object, list[Path]] = {}
+    for f in files:
+        groups.setdefault(_custom_field_key(f), []).append(f)
+
+    try:
+        max_workers: int = mp.core.config.get_processes_number()
+    except ValueError:
+        max_workers = mp.core.config.DEFAULT_PROCESSES_NUMBER
+
+    items: list[PushItem] = [
+        PushItem(
+            key=", ".join(str(f) for f in group),
+            fingerprint="",
+            push=functools.partial(_push_custom_field_group, files=group, force=force),
+        )
+        for group in groups.values()
+    ]
+    result = BulkPusher(get_backend_api(load_dev_env_config()), max_workers=max_workers).push(items)
+    if result.failed:
+        logger.error("Failed to push %d custom field file(s): %s", len(result.failed), ", ".join(sorted(result.failed)))
+        raise typer.Exit(1)
+
+
+def _custom_field_key(field_file: Path) -> object:
+    try:
+        field_data = mp.core.file_utils.load_yaml_file(field_file)
+    except Exception:  # ruff:ignore[blind-except]
+        return field_file
+
+    if not isinstance(field_data, dict) or not field_data.get("displayName"):
+        return field_file
+
+    return str(field_data["displayName"]).lower(), tuple(sorted(_normalize_scopes(field_data.get("scopes"))))
+
+
+def _push_custom_field_group(backend_api: BackendAPI, files: list[Path], *, force: bool) -> None:
+    for f in files:
+        _push_single_custom_field(f, force, backend_api=backend_api)
+
+
+def _push_single_custom_field(  # ruff:ignore[complex-structure, too-many-branches, too-many-statements]
+    field_file: Path,
+    force: bool,  # ruff:ignore[boolean-type-hint-positional-argument]
+    backend_api: BackendAPI | None = None,
+) -> None:
     logger.info("Loading custom field YAML from '%s'...", field_file)
     try:
         field_data = mp.core.file_utils.load_yaml_file(field_file)
@@ -276,8 +339,8 @@ def _push_single_custom_field(field_file: Path, force: bool) -> None:  # ruff:ig
         logger.error("Custom field data must be a dictionary.")
         raise typer.Exit(1)
 
-    config = load_dev_env_config()
-    backend_api = get_backend_api(config)
+    if backend_api is None:
+        backend_api = get_backend_api(load_dev_env_config())
 
     logger.info("Checking if custom field exists on server...")
     try:
@@ -14,14 +14,17 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from pathlib import Path  # ruff:ignore[typing-only-standard-library-import]
 from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
 
+import mp.core.config
+from mp.dev_env.bulk_push import BulkPusher, PushItem, PushManifest, fingerprint_path
 from mp.dev_env.sub_commands.push import push_app
-from mp.dev_env.utils import get_backend_api, load_dev_env_config
+from mp.dev_env.utils import PUSH_MANIFEST_PATH, get_backend_api, load_dev_env_config
 from mp.telemetry import track_command
 
 from . import utils
@@ -109,29 +112,58 @@ def _push_zip_to_soar(zip_path: Path, *, is_staging: bool) -> dict[str, Any]:
 
 @push_app.command(name="custom-integration-repository")
 @track_command
-def push_custom_integration_repository() -> None:
-    """Build, zip, and upload the entire custom integration repository."""
+def push_custom_integration_repository(
+    *,
+    force: Annotated[
+        bool,
+        typer.Option("--force", help="Push all integrations, including the ones unchanged since the last push."),
+    ] = False,
+) -> None:
+    """Build, zip, and upload the entire custom integration repository.
+
+    Integrations are uploaded concurrently. Integrations that did not change since
+    their last successful push to the same environment are skipped, so re-running
+    an interrupted push only uploads the remaining integrations.
+
+    Args:
+        force: Push all integrations, including the ones unchanged since the last push.
+
+    """
     utils.build_integrations_custom_repository()
     zipped_paths = utils.zip_integration_custom_repository()
-    _push_custom_integrations(zipped_paths)
+    _push_custom_integrations(zipped_paths, force=force)
 
 
-def _push_custom_integrations(zipped_paths: list[Path]) -> None:
+def _push_custom_integrations(zipped_paths: list[Path], *, force: bool = False) -> None:
     config = load_dev_env_config()
     backend_api = get_backend_api(config)
-    results: list[str] = []
-
-    for zip_path in zipped_paths:
-        try:
-            details = backend_api.get_integration_details(zip_path)
-            backend_api.upload_integration(zip_path, details["identifier"])
-            logger.info("Successfully pushed: %s", zip_path.name)
-
-        except Exception as e:  # ruff:ignore[blind-except]
-            results.append(f"{zip_path.name}: {e}")
-
-    if results:
+    try:
+        max_workers: int = mp.core.config.get_processes_number()
+    except ValueError:
+        max_workers = mp.core.config.DEFAULT_PROCESSES_NUMBER
+
+    pusher = BulkPusher(
+        backend_api,
+        PushManifest(PUSH_MANIFEST_PATH, backend_api.api_root),
+        max_workers=max_workers,
+    )
+    items: list[PushItem] = [
+        PushItem(
+            key=f"integration:{zip_path.stem}",
+            fingerprint=fingerprint_path(zip_path.with_suffix("")),
+            push=functools.partial(_upload_integration_zip, zip_path=zip_path),
+        )
+        for zip_path in zipped_paths
+    ]
+    result = pusher.push(items, force=force)
+
+    if result.failed:
         logger.error("\nUpload errors detected:")
-        for error in results:
-            logger.error("  - %s", error)
+        for key, error in sorted(result.failed.items()):
+            logger.error("  - %s: %s", key, error)
         raise typer.Exit(1)
+
+
+def _upload_integration_zip(backend_api: BackendAPI, zip_path: Path) -> dict[str, Any]:
+    details = backend_api.get_integration_details(zip_path)
+    return backend_api.upload_integration(zip_path, details["identifier"])
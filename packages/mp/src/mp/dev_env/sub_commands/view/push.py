@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import json
 import logging
 from pathlib import Path  # ruff:ignore[typing-only-standard-library-import]
@@ -23,10 +24,12 @@ from typing import TYPE_CHECKING, Annotated, Any, cast
 import requests
 import typer
 
+import mp.core.config
 import mp.core.constants
 import mp.core.file_utils
 from mp.build_project.restructure.views.build import ViewBuilder
 from mp.core.utils import to_snake_case
+from mp.dev_env.bulk_push import BulkPusher, PushItem, fingerprint_path
 from mp.dev_env.sub_commands.push import push_app
 from mp.dev_env.sub_commands.utils import get_backend_api_clean as get_backend_api
 from mp.dev_env.utils import load_dev_env_config
@@ -111,12 +114,9 @@ def push_view(
         else:
             logger.info("Found %d views to push. Pushing all of them...", len(local_views))
 
-        failed_views: list[str] = []
-        for view_dir in local_views:
-            try:
-                _push_single_view(view_dir, force=force, validate=validate)
-            except Exception:  # ruff:ignore[blind-except]
-                failed_views.append(view_dir.name)
+        failed_views: list[str] = (
+            _validate_views(local_views, force=force) if validate else _push_views(local_views, force=force)
+        )
 
         if failed_views:
             action_str = "Validation" if validate else "Push"
@@ -137,7 +137,53 @@ def push_view(
     _push_single_view(view_src_path, force=force, validate=validate)
 
 
-def _push_single_view(view_src_path: Path, *, force: bool = False, validate: bool = False) -> None:
+def _validate_views(view_dirs: list[Path], *, force: bool) -> list[str]:
+    failed_views: list[str] = []
+    for view_dir in view_dirs:
+        try:
+            _push_single_view(view_dir, force=force, validate=True)
+        except Exception:  # ruff:ignore[blind-except]
+            failed_views.append(view_dir.name)
+
+    return failed_views
+
+
+def _push_views(view_dirs: list[Path], *, force: bool) -> list[str]:
+    """Push views concurrently, each worker thread with its own backend API session.
+
+    Returns:
+        The directory names of the views that failed to push.
+
+    """
+    backend_api = get_backend_api(load_dev_env_config())
+    try:
+        max_workers: int = mp.core.config.get_processes_number()
+    except ValueError:
+        max_workers = mp.core.config.DEFAULT_PROCESSES_NUMBER
+
+    items: list[PushItem] = [
+        PushItem(
+            key=view_dir.name,
+            fingerprint=fingerprint_path(view_dir),
+            push=functools.partial(_push_view_with_api, view_src_path=view_dir, force=force),
+        )
+        for view_dir in view_dirs
+    ]
+    result = BulkPusher(backend_api, max_workers=max_workers).push(items)
+    return sorted(result.failed)
+
+
+def _push_view_with_api(backend_api: BackendAPI, view_src_path: Path, *, force: bool) -> None:
+    _push_single_view(view_src_path, force=force, backend_api=backend_api)
+
+
+def _push_single_view(
+    view_src_path: Path,
+    *,
+    force: bool = False,
+    validate: bool = False,
+    backend_api: BackendAPI | None = None,
+) -> None:
     """Build and push a single view directory.
 
     Raises:
@@ -185,7 +231,7 @@ def _push_single_view(view_src_path: Path, *, force: bool = False, validate: boo
         return
 
     # Upload to SOAR
-    _upload_built_view_data(view_data, view_src_path, force=force)
+    _upload_built_view_data(view_data, view_src_path, force=force, backend_api=backend_api)
 
 
 def _validate_view(
@@ -664,6 +710,7 @@ def _upload_built_view_data(
     view_src_path: Path,
     *,
     force: bool = False,
+    backend_api: BackendAPI | None = None,
 ) -> None:
     """Upload built view template data to the SOAR environment.
 
@@ -671,13 +718,14 @@ def _upload_built_view_data(
         view_data: The built view template dictionary structure.
         view_src_path: Path to the view source directory.
         force: Force creating a new view if it doesn't exist.
+        backend_api: The backend API client to upload with. A new one is authenticated if not given.
 
     Raises:
         typer.Exit: If the upload fails.
 
     """
-    config = load_dev_env_config()
-    backend_api = get_backend_api(config)
+    if backend_api is None:
+        backend_api = get_backend_api(load_dev_env_config())
 
     logger.info("Uploading view to SOAR platform...")
     errors: list[str] = []
@@ -27,6 +27,7 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 
 CONFIG_PATH: Path = Path.home() / ".mp_dev_env.json"
+PUSH_MANIFEST_PATH: Path = Path.home() / ".mp_dev_env_push_manifest.json"
 
 
 def load_dev_env_config() -> dict[str, str]:
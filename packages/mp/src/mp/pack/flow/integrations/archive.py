@@ -0,0 +1,285 @@
+"""Reproducible, parallel ZIP archive writer used when packing integrations."""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import struct
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import Iterator
+
+PRECOMPRESSED_SUFFIXES: frozenset[str] = frozenset({
+    ".7z",
+    ".bz2",
+    ".gif",
+    ".gz",
+    ".jpeg",
+    ".jpg",
+    ".png",
+    ".tgz",
+    ".whl",
+    ".xz",
+    ".zip",
+})
+DEFAULT_COMPRESS_LEVEL: int = 6
+PARALLEL_MIN_FILE_SIZE: int = 64 * 1024
+
+# 1980-01-01 00:00:00, the earliest timestamp representable in a ZIP entry
+_DOS_DATE: int = (0 << 9) | (1 << 5) | 1
+_DOS_TIME: int = 0
+_FILE_MODE: int = 0o100644
+_VERSION: int = 20
+_VERSION_MADE_BY: int = (3 << 8) | _VERSION
+_UTF8_FLAG: int = 0x800
+_ZIP32_LIMIT: int = 0xFFFFFFFF
+_ZIP32_ENTRIES_LIMIT: int = 0xFFFF
+
+_LOCAL_HEADER: struct.Struct = struct.Struct("<IHHHHHIIIHH")
+_LOCAL_HEADER_SIGNATURE: int = 0x04034B50
+_CENTRAL_HEADER: struct.Struct = struct.Struct("<IHHHHHHIIIHHHHHII")
+_CENTRAL_HEADER_SIGNATURE: int = 0x02014B50
+_END_OF_CENTRAL_DIR: struct.Struct = struct.Struct("<IHHHHIIH")
+_END_OF_CENTRAL_DIR_SIGNATURE: int = 0x06054B50
+
+
+class ZipMember(NamedTuple):
+    """A single file to be added to the archive."""
+
+    path: pathlib.Path
+    arcname: str
+
+
+class CompressedMember(NamedTuple):
+    """A member whose payload is ready to be written to the archive."""
+
+    arcname: str
+    method: int
+    crc: int
+    size: int
+    data: bytes
+
+
+class _CentralRecord(NamedTuple):
+    member: CompressedMember
+    offset: int
+
+
+def collect_members(src_dir: pathlib.Path) -> list[ZipMember]:
+    """Collect all files under a directory in a stable, platform-independent order.
+
+    Args:
+        src_dir: The directory to collect files from.
+
+    Returns:
+        list[ZipMember]: The files and their archive names, sorted by archive name.
+
+    """
+    members: list[ZipMember] = [
+        ZipMember(path=p, arcname=p.relative_to(src_dir).as_posix()) for p in src_dir.rglob("*") if p.is_file()
+    ]
+    return sorted(members, key=lambda m: m.arcname)
+
+
+def is_precompressed(path: pathlib.Path) -> bool:
+    """Check whether a file is already compressed and should be stored as-is.
+
+    Args:
+        path: The file path.
+
+    Returns:
+        bool: True if the file's suffix marks an already compressed format.
+
+    """
+    return path.suffix.lower() in PRECOMPRESSED_SUFFIXES
+
+
+def compress_member(member: ZipMember, compresslevel: int = DEFAULT_COMPRESS_LEVEL) -> CompressedMember:
+    """Read a file and prepare its archive payload.
+
+    Precompressed files are stored. Other files are deflated, unless deflating
+    does not make them smaller, in which case they are stored as well.
+
+    Args:
+        member: The file to prepare.
+        compresslevel: The zlib compression level to use.
+
+    Returns:
+        CompressedMember: The member's payload and metadata.
+
+    """
+    raw: bytes = member.path.read_bytes()
+    crc: int = zlib.crc32(raw)
+    if not is_precompressed(member.path):
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+        deflated: bytes = compressor.compress(raw) + compressor.flush()
+        if len(deflated) < len(raw):
+            return CompressedMember(member.arcname, zlib.DEFLATED, crc, len(raw), deflated)
+
+    return CompressedMember(member.arcname, 0, crc, len(raw), raw)
+
+
+def write_reproducible_zip(
+    src_dir: pathlib.Path,
+    zip_path: pathlib.Path,
+    *,
+    max_workers: int = 1,
+    compresslevel: int = DEFAULT_COMPRESS_LEVEL,
+) -> pathlib.Path:
+    """Write a byte-for-byte reproducible ZIP archive of a directory.
+
+    Members are ordered by their archive name and written with a fixed timestamp
+    and fixed permissions, so identical inputs always produce identical archives.
+    Members are compressed concurrently and streamed to the archive in order,
+    keeping only a bounded window of compressed payloads in memory.
+
+    Args:
+        src_dir: The directory to archive.
+        zip_path: The path of the ZIP file to create.
+        max_workers: The number of worker threads compressing members.
+        compresslevel: The zlib compression level to use.
+
+    Returns:
+        pathlib.Path: The path to the created ZIP file.
+
+    Raises:
+        ValueError: If the archive would require ZIP64 extensions.
+
+    """
+    members: list[ZipMember] = collect_members(src_dir)
+    if len(members) >= _ZIP32_ENTRIES_LIMIT:
+        msg: str = f"Cannot archive {len(members)} files without ZIP64 support"
+        raise ValueError(msg)
+
+    records: list[_CentralRecord] = []
+    with zip_path.open("wb") as f:
+        for compressed in _iter_compressed(members, max_workers, compresslevel):
+            records.append(_CentralRecord(compressed, f.tell()))
+            _write_local_entry(f, compressed)
+
+        _write_central_directory(f, records)
+
+    return zip_path
+
+
+def _iter_compressed(members: list[ZipMember], max_workers: int, compresslevel: int) -> Iterator[CompressedMember]:
+    if max_workers <= 1:
+        for member in members:
+            yield compress_member(member, compresslevel)
+        return
+
+    # Small files are cheaper to compress inline than to hand over to a worker
+    window: int = max_workers * 2
+    pending: collections.deque[Future[CompressedMember] | CompressedMember] = collections.deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for member in members:
+            if member.path.stat().st_size < PARALLEL_MIN_FILE_SIZE:
+                pending.append(compress_member(member, compresslevel))
+            else:
+                pending.append(pool.submit(compress_member, member, compresslevel))
+
+            while len(pending) >= window or (pending and not isinstance(pending[0], Future)):
+                yield _resolve(pending.popleft())
+
+        while pending:
+            yield _resolve(pending.popleft())
+
+
+def _resolve(item: Future[CompressedMember] | CompressedMember) -> CompressedMember:
+    return item.result() if isinstance(item, Future) else item
+
+
+def _write_local_entry(f: BinaryIO, member: CompressedMember) -> None:
+    name: bytes = member.arcname.encode("utf-8")
+    _check_zip32_limits(member, f.tell())
+    f.write(
+        _LOCAL_HEADER.pack(
+            _LOCAL_HEADER_SIGNATURE,
+            _VERSION,
+            _get_flags(member.arcname),
+            member.method,
+            _DOS_TIME,
+            _DOS_DATE,
+            member.crc,
+            len(member.data),
+            member.size,
+            len(name),
+            0,
+        )
+    )
+    f.write(name)
+    f.write(member.data)
+
+
+def _write_central_directory(f: BinaryIO, records: list[_CentralRecord]) -> None:
+    start: int = f.tell()
+    for record in records:
+        member: CompressedMember = record.member
+        name: bytes = member.arcname.encode("utf-8")
+        f.write(
+            _CENTRAL_HEADER.pack(
+                _CENTRAL_HEADER_SIGNATURE,
+                _VERSION_MADE_BY,
+                _VERSION,
+                _get_flags(member.arcname),
+                member.method,
+                _DOS_TIME,
+                _DOS_DATE,
+                member.crc,
+                len(member.data),
+                member.size,
+                len(name),
+                0,
+                0,
+                0,
+                0,
+                _FILE_MODE << 16,
+                record.offset,
+            )
+        )
+        f.write(name)
+
+    end: int = f.tell()
+    if end > _ZIP32_LIMIT:
+        msg: str = "Archive central directory exceeds the ZIP32 size limit"
+        raise ValueError(msg)
+
+    f.write(
+        _END_OF_CENTRAL_DIR.pack(
+            _END_OF_CENTRAL_DIR_SIGNATURE,
+            0,
+            0,
+            len(records),
+            len(records),
+            end - start,
+            start,
+            0,
+        )
+    )
+
+
+def _get_flags(arcname: str) -> int:
+    return 0 if arcname.isascii() else _UTF8_FLAG
+
+
+def _check_zip32_limits(member: CompressedMember, offset: int) -> None:
+    if max(member.size, len(member.data), offset) >= _ZIP32_LIMIT:
+        msg: str = f"Cannot archive '{member.arcname}' without ZIP64 support"
+        raise ValueError(msg)
@@ -16,7 +16,6 @@ from __future__ import annotations
 
 import datetime
 import sys
-import zipfile
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -24,9 +23,12 @@ if TYPE_CHECKING:
 
 import typer
 
+import mp.core.config
 from mp.core.file_utils import get_marketplace_integration_path
 from mp.core.utils import str_to_snake_case
 
+from .archive import write_reproducible_zip
+
 
 def find_integration_src_path(integration_name: str, src_path: pathlib.Path | None = None) -> tuple[pathlib.Path, str]:
     """Find the source path of the integration, trying snake_case if needed.
@@ -64,6 +66,10 @@ def find_integration_src_path(integration_name: str, src_path: pathlib.Path | No
 def create_zip(built_dir: pathlib.Path, identifier: str, zip_dir: pathlib.Path) -> pathlib.Path:
     """Create a ZIP archive of the built integration.
 
+    The archive is reproducible: identical built directories produce byte-identical
+    archives. Already compressed members, such as dependency wheels, are stored
+    as-is and the rest are compressed in parallel.
+
     Args:
         built_dir: The built integration directory.
         identifier: The integration identifier.
@@ -77,12 +83,12 @@ def create_zip(built_dir: pathlib.Path, identifier: str, zip_dir: pathlib.Path)
     zip_name: str = f"{identifier}{date}.zip"
     zip_path: pathlib.Path = zip_dir / zip_name
 
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for file_path in built_dir.rglob("*"):
-            if file_path.is_file():
-                zipf.write(file_path, arcname=file_path.relative_to(built_dir))
+    try:
+        max_workers: int = mp.core.config.get_processes_number()
+    except ValueError:
+        max_workers = mp.core.config.DEFAULT_PROCESSES_NUMBER
 
-    return zip_path
+    return write_reproducible_zip(built_dir, zip_path, max_workers=max_workers)
 
 
 def is_tty() -> bool:
@@ -0,0 +1,80 @@
+"""Benchmark the import index used when deconstructing integration dependencies.
+
+Usage:
+    python tests/benchmarks/bench_deconstruct_imports.py [INTEGRATION_DIR ...]
+
+Without arguments, every integration in the repository's content directory is
+scanned. Dependencies are resolved twice with a cold and then a warm index, after
+a baseline run that parses every file the way the deconstructor used to.
+"""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import ast
+import pathlib
+import sys
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from mp.build_project.restructure.integrations.deconstruct_dependencies import DependencyDeconstructor
+from mp.build_project.restructure.integrations.import_index import ImportIndex
+
+CONTENT_DIR: pathlib.Path = pathlib.Path(__file__).resolve().parents[4] / "content" / "response_integrations"
+
+
+def _legacy_scan(paths: list[pathlib.Path]) -> None:
+    for integration in paths:
+        for path in integration.rglob("*.py"):
+            try:
+                tree = ast.parse(path.read_text(encoding="utf-8"))
+            except (SyntaxError, UnicodeDecodeError):
+                continue
+
+            for node in ast.walk(tree):
+                match node:
+                    case ast.Import(names=names):
+                        _ = {alias.name.split(".")[0] for alias in names}
+                    case ast.ImportFrom(module=module) if module:
+                        _ = module.split(".")[0]
+
+
+def _resolve_all(paths: list[pathlib.Path], index: ImportIndex) -> None:
+    for integration in paths:
+        DependencyDeconstructor(integration, index).get_dependencies()
+
+
+def main(paths: list[pathlib.Path]) -> None:
+    table = Table("run", "integrations", "seconds", "index hits", "index misses")
+    start: float = time.perf_counter()
+    _legacy_scan(paths)
+    table.add_row("full AST parse", str(len(paths)), f"{time.perf_counter() - start:.3f}", "-", "-")
+
+    index = ImportIndex()
+    for run in ("cold index", "warm index"):
+        hits, misses = index.hits, index.misses
+        start = time.perf_counter()
+        _resolve_all(paths, index)
+        elapsed: float = time.perf_counter() - start
+        table.add_row(run, str(len(paths)), f"{elapsed:.3f}", str(index.hits - hits), str(index.misses - misses))
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main([pathlib.Path(p) for p in sys.argv[1:]] or sorted(p.parent for p in CONTENT_DIR.rglob("definition.yaml")))
@@ -0,0 +1,80 @@
+"""Benchmark the `mp describe` orchestration offline, using the fake LLM backend.
+
+Usage:
+    python tests/benchmarks/bench_describe_offline.py [INTEGRATION_NAME ...]
+
+Integrations are described twice from the repository's community integrations:
+once with a cold LLM response cache and once with a warm one. The fake backend
+simulates a fixed latency per prompt. The configuration
+and the cache are kept in a temporary directory.
+"""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import pathlib
+import sys
+import tempfile
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+import mp.core.config
+import mp.core.llm.cache
+import mp.describe.common.utils.llm
+from mp.core.llm.fake import FakeLlmConfig
+from mp.describe.all_content import describe_all_content
+
+COMMUNITY_DIR: pathlib.Path = (
+    pathlib.Path(__file__).resolve().parents[4] / "content" / "response_integrations" / "third_party" / "community"
+)
+DEFAULT_INTEGRATIONS_COUNT: int = 10
+SIMULATED_LATENCY_SEC: float = 0.05
+
+
+def _default_integrations() -> list[str]:
+    return sorted(p.parent.name for p in COMMUNITY_DIR.glob("*/definition.yaml"))[:DEFAULT_INTEGRATIONS_COUNT]
+
+
+async def _describe(integrations: list[str], dst: pathlib.Path) -> float:
+    start: float = time.perf_counter()
+    await describe_all_content(integrations=integrations, src=COMMUNITY_DIR, dst=dst, override=True)
+    return time.perf_counter() - start
+
+
+def main(integrations: list[str]) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = pathlib.Path(tmp)
+        mp.core.config.CONFIG_PATH = tmp_path / ".mp_config"
+        mp.core.llm.cache.CACHE_DIR = tmp_path / "cache"
+        mp.core.config.set_llm_backend("fake")
+        mp.core.config.set_is_llm_cache_enabled(value=True)
+        mp.describe.common.utils.llm.FakeLlmConfig = functools.partial(FakeLlmConfig, latency_sec=SIMULATED_LATENCY_SEC)
+
+        cold: float = asyncio.run(_describe(integrations, tmp_path / "cold"))
+        warm: float = asyncio.run(_describe(integrations, tmp_path / "warm"))
+        cache_size: int = (mp.core.llm.cache.CACHE_DIR / mp.core.llm.cache.CACHE_FILE_NAME).stat().st_size
+
+    table = Table("integrations", "cold cache s", "warm cache s", "cache KiB")
+    table.add_row(str(len(integrations)), f"{cold:.3f}", f"{warm:.3f}", f"{cache_size / 1024:.1f}")
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or _default_integrations())
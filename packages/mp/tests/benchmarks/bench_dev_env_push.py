@@ -0,0 +1,87 @@
+"""Benchmark the concurrent bulk push of integrations against a local fake backend.
+
+Usage:
+    python -m tests.benchmarks.bench_dev_env_push [INTEGRATIONS_COUNT]
+
+Run from `packages/mp`. Every request to the fake backend takes a fixed latency,
+simulating a remote SOAR environment.
+"""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import functools
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from mp.dev_env.api import BackendAPI
+from mp.dev_env.bulk_push import BulkPusher, BulkPushResult, PushItem, PushManifest, fingerprint_path
+from tests.test_mp.test_dev_env.fake_backend import FakeBackend
+
+DEFAULT_INTEGRATIONS_COUNT: int = 40
+LATENCY_SEC: float = 0.05
+ZIP_SIZE: int = 256 * 1024
+WORKERS: int = 8
+
+
+def _upload(backend_api: BackendAPI, zip_path: pathlib.Path) -> None:
+    details = backend_api.get_integration_details(zip_path)
+    backend_api.upload_integration(zip_path, details["identifier"])
+
+
+def _legacy_push(backend_api: BackendAPI, zip_paths: list[pathlib.Path]) -> None:
+    for zip_path in zip_paths:
+        _upload(backend_api, zip_path)
+
+
+def main(count: int) -> None:
+    table = Table("run", "pushed", "skipped", "seconds")
+    with tempfile.TemporaryDirectory() as tmp, FakeBackend(latency_sec=LATENCY_SEC) as backend:
+        out: pathlib.Path = pathlib.Path(tmp)
+        zip_paths: list[pathlib.Path] = []
+        for i in range(count):
+            zip_path: pathlib.Path = out / f"Integration{i}.zip"
+            zip_path.write_bytes(os.urandom(ZIP_SIZE))
+            zip_paths.append(zip_path)
+
+        backend_api = BackendAPI(backend.api_root, username="user", password="pass")  # ruff:ignore[hardcoded-password-func-arg]
+        backend_api.login()
+        items: list[PushItem] = [
+            PushItem(p.stem, fingerprint_path(p), functools.partial(_upload, zip_path=p)) for p in zip_paths
+        ]
+
+        start: float = time.perf_counter()
+        _legacy_push(backend_api, zip_paths)
+        table.add_row("sequential", str(count), "0", f"{time.perf_counter() - start:.3f}")
+
+        manifest = PushManifest(out / "manifest.json", backend_api.api_root)
+        for run in ("concurrent", "unchanged re-run"):
+            start = time.perf_counter()
+            result: BulkPushResult = BulkPusher(backend_api, manifest, max_workers=WORKERS).push(items)
+            elapsed: float = time.perf_counter() - start
+            table.add_row(run, str(len(result.pushed)), str(len(result.skipped)), f"{elapsed:.3f}")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_INTEGRATIONS_COUNT)
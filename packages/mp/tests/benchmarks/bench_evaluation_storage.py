@@ -0,0 +1,116 @@
+"""Benchmark EvaluationStorage writes and lookups.
+
+Usage:
+    python tests/benchmarks/bench_evaluation_storage.py [RESULTS_COUNT]
+
+Compares the previous per-result connect-and-commit writes with batched writes
+over the storage's long-lived connection, then times the report lookups.
+"""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import pathlib
+import sqlite3
+import sys
+import tempfile
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from mp.describe.evaluate.models import RuleEvaluationResult, VerdictEnum
+from mp.describe.evaluate.storage import EvaluationStorage
+
+DEFAULT_RESULTS_COUNT: int = 100_000
+LEGACY_RESULTS_COUNT: int = 2_000
+INTEGRATIONS_COUNT: int = 200
+LOOKUPS_COUNT: int = 200
+
+
+def _results(count: int, run_id: str) -> list[RuleEvaluationResult]:
+    return [
+        RuleEvaluationResult(
+            evaluation_id=f"{run_id}_{i}",
+            integration_id=f"Integration{i % INTEGRATIONS_COUNT}",
+            action_id=f"Action{i % 17}",
+            run_id=run_id,
+            evaluated_at="2026-07-29T12:00:00Z",
+            rule_title=f"Rule {i % 23}",
+            verdict=VerdictEnum.PASS if i % 3 else VerdictEnum.FAIL,
+            reasoning="Concise and starts with an active verb.",
+            suggested_fix=None,
+        )
+        for i in range(count)
+    ]
+
+
+def _legacy_save(db_path: pathlib.Path, results: list[RuleEvaluationResult]) -> None:
+    for r in results:
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO rule_evaluations (evaluation_id, integration_id, action_id, run_id,"
+                " evaluated_at, rule_title, actual_value, verdict, reasoning, suggested_fix)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    r.evaluation_id,
+                    r.integration_id,
+                    r.action_id,
+                    r.run_id,
+                    r.evaluated_at,
+                    r.rule_title,
+                    r.actual_value,
+                    r.verdict.value,
+                    r.reasoning,
+                    r.suggested_fix,
+                ),
+            )
+            conn.commit()
+        conn.close()
+
+
+def main(count: int) -> None:
+    table = Table("operation", "rows", "seconds", "rows/s")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path: pathlib.Path = pathlib.Path(tmp) / "rule_evaluations.db"
+        with EvaluationStorage(db_path) as storage:
+            legacy_results: list[RuleEvaluationResult] = _results(LEGACY_RESULTS_COUNT, "legacy")
+            start: float = time.perf_counter()
+            _legacy_save(db_path, legacy_results)
+            elapsed: float = time.perf_counter() - start
+            table.add_row(
+                "per-row commit", str(len(legacy_results)), f"{elapsed:.3f}", f"{len(legacy_results) / elapsed:,.0f}"
+            )
+
+            results: list[RuleEvaluationResult] = _results(count, "batched")
+            start = time.perf_counter()
+            storage.save_evaluations(results)
+            elapsed = time.perf_counter() - start
+            table.add_row("batched", str(count), f"{elapsed:.3f}", f"{count / elapsed:,.0f}")
+
+            start = time.perf_counter()
+            rows: int = sum(
+                len(storage.get_evaluations(integration_id=f"Integration{i}", run_id="batched"))
+                for i in range(LOOKUPS_COUNT)
+            )
+            elapsed = time.perf_counter() - start
+            table.add_row(f"{LOOKUPS_COUNT} report lookups", str(rows), f"{elapsed:.3f}", f"{rows / elapsed:,.0f}")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RESULTS_COUNT)
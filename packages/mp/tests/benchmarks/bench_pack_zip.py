@@ -0,0 +1,95 @@
+"""Benchmark the integration ZIP packer against the previous single-threaded writer.
+
+Usage:
+    python tests/benchmarks/bench_pack_zip.py [INTEGRATION_DIR ...]
+
+Without arguments, the largest integrations in the repository's content directory
+are packed. Pass built integration directories (with their `Dependencies` wheels)
+to measure the gain of storing precompressed members.
+"""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import pathlib
+import sys
+import tempfile
+import time
+import zipfile
+from typing import TYPE_CHECKING
+
+from rich.console import Console
+from rich.table import Table
+
+from mp.pack.flow.integrations.archive import write_reproducible_zip
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+CONTENT_DIR: pathlib.Path = pathlib.Path(__file__).resolve().parents[4] / "content" / "response_integrations"
+LARGEST_INTEGRATIONS_COUNT: int = 5
+WORKERS: int = 5
+
+
+def _dir_size(path: pathlib.Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def _largest_integrations(count: int) -> list[pathlib.Path]:
+    integrations: list[pathlib.Path] = [p.parent for p in CONTENT_DIR.rglob("definition.yaml")]
+    return sorted(integrations, key=_dir_size, reverse=True)[:count]
+
+
+def _legacy_zip(src: pathlib.Path, dst: pathlib.Path) -> None:
+    with zipfile.ZipFile(dst, "w", zipfile.ZIP_DEFLATED) as zipf:
+        for file_path in src.rglob("*"):
+            if file_path.is_file():
+                zipf.write(file_path, arcname=file_path.relative_to(src))
+
+
+def _timed(func: Callable[..., object], *args: object, **kwargs: object) -> float:
+    start: float = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main(paths: list[pathlib.Path]) -> None:
+    table = Table("integration", "MiB", "legacy s", "serial s", "parallel s", "size delta B")
+    with tempfile.TemporaryDirectory() as tmp:
+        out: pathlib.Path = pathlib.Path(tmp)
+        for src in paths:
+            legacy: float = _timed(_legacy_zip, src, out / "legacy.zip")
+            serial: float = _timed(write_reproducible_zip, src, out / "serial.zip", max_workers=1)
+            parallel: float = _timed(write_reproducible_zip, src, out / "parallel.zip", max_workers=WORKERS)
+            if (out / "serial.zip").read_bytes() != (out / "parallel.zip").read_bytes():
+                msg: str = f"Non reproducible archive for {src}"
+                raise RuntimeError(msg)
+
+            size_delta: int = (out / "parallel.zip").stat().st_size - (out / "legacy.zip").stat().st_size
+            table.add_row(
+                src.name,
+                f"{_dir_size(src) / 2**20:.2f}",
+                f"{legacy:.3f}",
+                f"{serial:.3f}",
+                f"{parallel:.3f}",
+                f"{size_delta:+}",
+            )
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main([pathlib.Path(p) for p in sys.argv[1:]] or _largest_integrations(LARGEST_INTEGRATIONS_COUNT))
@@ -19,6 +19,7 @@ from pathlib import Path
 
 import pytest
 
+import mp.build_project.restructure.integrations.import_index
 import mp.core.config
 import mp.core.constants
 from mp.core.config import RuntimeParams
@@ -43,6 +44,7 @@ def pytest_configure(config: pytest.Config) -> None:
 
     # Overwrite CONFIG_PATH globally to avoid using autouse monkeypatch
     mp.core.config.CONFIG_PATH = temp_config_path
+    mp.build_project.restructure.integrations.import_index.CACHE_DIR = Path(_temp_dir.name)
 
     params = RuntimeParams(quiet=True, verbose=False)
     params.set_in_config()
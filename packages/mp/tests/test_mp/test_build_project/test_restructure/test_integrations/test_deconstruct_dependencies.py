@@ -28,11 +28,26 @@ from mp.build_project.restructure.integrations.deconstruct_dependencies import (
     DependencyResolutionResult,
     _should_add_integration_testing,  # ruff:ignore[import-private-name]
 )
+from mp.build_project.restructure.integrations.import_index import ImportIndex, scan_imports
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 
+pytestmark = pytest.mark.usefixtures("fresh_import_index")
+
+
+@pytest.fixture
+def fresh_import_index() -> Iterator[ImportIndex]:
+    """Isolate each test from the import index shared by the test session."""
+    index = ImportIndex()
+    with unittest.mock.patch(
+        "mp.build_project.restructure.integrations.deconstruct_dependencies.get_shared_index", return_value=index
+    ):
+        yield index
+
+
 def _create_dummy_python_file(base_path: Path, content: str, filename: str = "main.py") -> None:
     (base_path / filename).write_text(content)
 
@@ -286,3 +301,37 @@ def test_should_add_integration_testing(tmp_path: Path, name: str, version: str,
 
     result = _should_add_integration_testing(name, version)
     assert result is expected
+
+
+def test_scan_imports_skips_sources_without_imports() -> None:
+    """Test the import scanner on sources with, without and with broken imports."""
+    assert scan_imports(b"x = 1\n") == set()
+    assert scan_imports(b"import os.path\nfrom requests.auth import Auth\nfrom . import utils\n") == {
+        "os",
+        "requests",
+    }
+    assert scan_imports(b"import (\n") is None
+
+
+def test_get_dependencies_reuses_import_index(tmp_path: Path, fresh_import_index: ImportIndex) -> None:
+    """Test that identical sources and wheels are only scanned once across integrations."""
+    for name in ("first", "second"):
+        integration = tmp_path / name
+        integration.mkdir()
+        _create_dummy_python_file(integration, "import requests")
+        dependencies_dir = _create_dependencies_dir(integration)
+        with zipfile.ZipFile(dependencies_dir / "requests-2.32.4-py3-none-any.whl", "w") as zf:
+            zf.writestr("requests-2.32.4.dist-info/top_level.txt", "requests\n")
+
+    with unittest.mock.patch(
+        "mp.build_project.restructure.integrations.deconstruct_dependencies._get_provided_imports",
+        return_value={"requests"},
+    ) as mock_provided_imports:
+        first = DependencyDeconstructor(tmp_path / "first").get_dependencies()
+        second = DependencyDeconstructor(tmp_path / "second").get_dependencies()
+
+    assert first == second
+    assert first.dependencies.dependencies == ["requests==2.32.4"]
+    mock_provided_imports.assert_called_once()
+    assert fresh_import_index.hits == 2
+    assert fresh_import_index.misses == 2
@@ -0,0 +1,127 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+import mp.core.config
+from mp.core.data_models.integrations.action.ai.metadata import ActionAiMetadata
+from mp.core.llm.cache import CachedLlm, LlmResponseCache
+from mp.core.llm.fake import FakeLlm, FakeLlmConfig
+from mp.core.llm.gemini import GeminiConfig
+from mp.describe.common.utils.llm import create_llm
+from mp.describe.evaluate.models import RuleVerdict
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> LlmResponseCache:
+    return LlmResponseCache(tmp_path / "cache.sqlite3")
+
+
+@pytest.mark.anyio
+async def test_repeated_prompts_are_served_from_cache(cache: LlmResponseCache) -> None:
+    fake = FakeLlm()
+    llm = CachedLlm(fake, cache)
+    llm.set_system_prompt_to_session("system")
+
+    first = await llm.send_bulk_messages(["a", "b", "a"], response_json_schema=RuleVerdict)
+    second = await llm.send_bulk_messages(["b", "a", "c"], response_json_schema=RuleVerdict)
+
+    assert sorted(fake.prompts) == ["a", "b", "c"]
+    assert first[0] == first[2] == second[1]
+    assert first[1] == second[0]
+    assert all(isinstance(r, RuleVerdict) for r in first + second)
+
+
+@pytest.mark.anyio
+async def test_cache_key_depends_on_system_prompt_and_schema(cache: LlmResponseCache) -> None:
+    fake = FakeLlm()
+    llm = CachedLlm(fake, cache)
+
+    await llm.send_bulk_messages(["a"])
+    await llm.send_bulk_messages(["a"], response_json_schema=RuleVerdict)
+    llm.set_system_prompt_to_session("other")
+    await llm.send_bulk_messages(["a"])
+
+    assert fake.prompts == ["a", "a", "a"]
+
+
+@pytest.mark.anyio
+async def test_cache_key_depends_on_model(cache: LlmResponseCache) -> None:
+    await CachedLlm(FakeLlm(FakeLlmConfig(model_name="m1")), cache).send_bulk_messages(["a"])
+    fake = FakeLlm(FakeLlmConfig(model_name="m2"))
+    await CachedLlm(fake, cache).send_bulk_messages(["a"])
+
+    assert fake.prompts == ["a"]
+
+
+def test_expired_entries_are_ignored(tmp_path: Path) -> None:
+    cache = LlmResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=-1)
+    cache.set_many({"key": "value"})
+
+    assert cache.get("key") is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    cache = LlmResponseCache(tmp_path / "cache.sqlite3", max_size_bytes=10)
+    cache.set_many({"old": "x" * 6})
+    cache.set_many({"new": "y" * 6})
+
+    assert cache.get("old") is None
+    assert cache.get("new") == "y" * 6
+
+
+@pytest.mark.anyio
+async def test_fake_llm_is_deterministic() -> None:
+    llm = FakeLlm()
+
+    first = await llm.send_bulk_messages(["prompt"], response_json_schema=ActionAiMetadata)
+    second = await llm.send_bulk_messages(["prompt"], response_json_schema=ActionAiMetadata)
+    text = await llm.send_message("prompt", raise_error_if_empty_response=True)
+
+    assert isinstance(first[0], ActionAiMetadata)
+    assert first == second
+    assert text == await FakeLlm().send_message("prompt", raise_error_if_empty_response=True)
+
+
+@pytest.mark.anyio
+async def test_bypassed_cache_sends_every_prompt_and_refreshes_responses(cache: LlmResponseCache) -> None:
+    await CachedLlm(FakeLlm(), cache).send_bulk_messages(["a"])
+    fake = FakeLlm()
+
+    await CachedLlm(fake, cache, read=False).send_bulk_messages(["a", "b"])
+    await CachedLlm(fake, cache).send_bulk_messages(["a", "b"])
+
+    assert fake.prompts == ["a", "b"]
+
+
+@pytest.mark.parametrize("bypassed", [True, False])
+def test_create_llm_bypasses_the_cache_for_the_run(
+    cache: LlmResponseCache, monkeypatch: pytest.MonkeyPatch, *, bypassed: bool
+) -> None:
+    monkeypatch.setattr(mp.core.config, "get_llm_backend", lambda: "fake")
+    monkeypatch.setattr(mp.core.config, "is_llm_cache_enabled", lambda: True)
+    monkeypatch.setattr(mp.core.config, "is_llm_cache_bypassed", lambda: bypassed)
+    monkeypatch.setattr(LlmResponseCache, "open_default", lambda: cache)
+
+    llm = create_llm(GeminiConfig(model_name="m1"))
+
+    assert isinstance(llm, CachedLlm)
+    assert llm.read is not bypassed
@@ -103,6 +103,41 @@ def test_storage_save_and_retrieve(tmp_path: pathlib.Path) -> None:
     assert records[0].verdict == VerdictEnum.PASS
 
 
+def test_storage_save_evaluations_in_batches(tmp_path: pathlib.Path) -> None:
+    """Test bulk persistence of evaluation results and indexed lookups."""
+    results = [
+        RuleEvaluationResult(
+            evaluation_id=f"eval_{i:03}",
+            integration_id="Okta" if i % 2 else "Jira",
+            action_id="all_actions",
+            run_id="run_bulk",
+            evaluated_at="2026-07-29T12:00:00Z",
+            rule_title=f"Rule {i:03}",
+            verdict=VerdictEnum.FAIL,
+            reasoning="Missing description.",
+            suggested_fix=None,
+        )
+        for i in range(25)
+    ]
+
+    db_file = tmp_path / "test_eval.db"
+    with EvaluationStorage(db_file) as storage:
+        assert storage.save_evaluations(iter(results), batch_size=10) == 25
+        records = storage.get_evaluations(integration_id="Okta", run_id="run_bulk")
+
+    with sqlite3.connect(db_file) as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM rule_evaluations WHERE integration_id = ? AND run_id = ?"
+            " ORDER BY rule_title",
+            ("Okta", "run_bulk"),
+        ).fetchall()
+    plan_details = " ".join(row[3] for row in plan)
+
+    assert [r.evaluation_id for r in records] == [r.evaluation_id for r in results if r.integration_id == "Okta"]
+    assert "idx_eval_integration_run" in plan_details
+    assert "TEMP B-TREE" not in plan_details
+
+
 def test_reporter_export(tmp_path: pathlib.Path) -> None:
     """Test EvaluationReporter exporting Markdown, JSON, and HTML."""
     res = RuleEvaluationResult(
@@ -712,3 +747,45 @@ def test_heuristic_fallback_summary_notification_logged(
     assert "RE-RUN RECOMMENDED" in caplog.text
     assert "fell back to heuristic verification" in caplog.text
     assert "Tip: Re-run 'mp describe evaluate mock_fallback --use-llm'" in caplog.text
+
+
+def test_results_are_persisted_when_evaluation_fails(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the results evaluated before a failure are saved to the database."""
+    integration_dir = tmp_path / "mock_failure"
+    ai_dir = integration_dir / "resources" / "ai"
+    ai_dir.mkdir(parents=True)
+    (ai_dir / "actions_ai_description.yaml").write_text(
+        "ValidAction:\n"
+        "  ai_description: 'General Description \\n Flow Description \\n Additional Notes'\n"
+        "  ai_short_description: 'Valid short description.'\n",
+        encoding="utf-8",
+    )
+    heuristic = EvaluationEngine._heuristic_evaluate_rule  # ruff:ignore[private-member-access]
+    calls: list[str] = []
+
+    def failing_heuristic(*args: object) -> tuple[VerdictEnum, str, str | None]:
+        calls.append("call")
+        if len(calls) > 1:
+            msg = "evaluation failed"
+            raise RuntimeError(msg)
+        return heuristic(*args)
+
+    monkeypatch.setattr(EvaluationEngine, "_heuristic_evaluate_rule", staticmethod(failing_heuristic))
+    db_file = tmp_path / "eval.db"
+    engine = EvaluationEngine()
+    with pytest.raises(RuntimeError, match="evaluation failed"):
+        engine.evaluate_integration(
+            integration_id="mock_failure",
+            src=tmp_path,
+            db_path=db_file,
+            use_llm=False,
+        )
+    engine.close()
+
+    with EvaluationStorage(db_file) as storage:
+        records = storage.get_evaluations(integration_id="mock_failure")
+    verdicts = [record.verdict for record in records]
+    assert VerdictEnum.FAIL in verdicts
+    assert len(records) == verdicts.count(VerdictEnum.FAIL) + 1
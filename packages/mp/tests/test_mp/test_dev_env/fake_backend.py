@@ -0,0 +1,117 @@
+"""A local HTTP fake of the SOAR backend endpoints used by `mp dev-env push`."""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import http
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Self
+from urllib.parse import urlparse
+
+TOKEN: str = "fake-token"  # ruff:ignore[hardcoded-password-string]
+LOGIN_PATH: str = "/api/external/v1/accounts/Login"
+DETAILS_PATH: str = "/api/external/v1/ide/GetPackageDetails"
+IMPORT_PATH: str = "/api/external/v1/ide/ImportPackage"
+POLL_INTERVAL_SEC: float = 0.01
+
+
+class FakeBackend:
+    """A threaded HTTP server answering login and integration upload requests.
+
+    Attributes:
+        latency_sec: The time each request takes to be answered.
+        failures: The number of upcoming upload requests answered with a 503.
+        uploads: The identifiers of the successfully uploaded integrations, in order.
+
+    """
+
+    def __init__(self, latency_sec: float = 0.0) -> None:
+        self.latency_sec: float = latency_sec
+        self.failures: int = 0
+        self.uploads: list[str] = []
+        self._lock: threading.Lock = threading.Lock()
+        self._server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(self))
+        self._thread: threading.Thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": POLL_INTERVAL_SEC}, daemon=True
+        )
+
+    @property
+    def api_root(self) -> str:
+        """The root URL of the fake backend."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def handle(self, path: str, body: dict[str, Any], headers: dict[str, str]) -> tuple[int, dict[str, Any]]:
+        """Answer a request.
+
+        Returns:
+            The response status and JSON body.
+
+        """
+        time.sleep(self.latency_sec)
+        if path == LOGIN_PATH:
+            return http.HTTPStatus.OK, {"token": TOKEN}
+
+        if headers.get("Authorization") != f"Bearer {TOKEN}":
+            return http.HTTPStatus.UNAUTHORIZED, {}
+
+        if path == DETAILS_PATH:
+            digest: str = hashlib.sha256(base64.b64decode(body["data"])).hexdigest()
+            return http.HTTPStatus.OK, {"identifier": digest[:12]}
+
+        if path == IMPORT_PATH:
+            with self._lock:
+                if self.failures > 0:
+                    self.failures -= 1
+                    return http.HTTPStatus.SERVICE_UNAVAILABLE, {}
+
+                self.uploads.append(body["integrationIdentifier"])
+            return http.HTTPStatus.OK, {}
+
+        return http.HTTPStatus.NOT_FOUND, {}
+
+
+def _make_handler(backend: FakeBackend) -> type[BaseHTTPRequestHandler]:
+    class _Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            length: int = int(self.headers.get("Content-Length", 0))
+            body: dict[str, Any] = json.loads(self.rfile.read(length) or b"{}")
+            status, payload = backend.handle(urlparse(self.path).path, body, dict(self.headers))
+            data: bytes = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: object) -> None:  # ruff:ignore[builtin-argument-shadowing]
+            pass
+
+    return _Handler
@@ -0,0 +1,148 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+import typer
+
+from mp.dev_env.api import BackendAPI
+from mp.dev_env.bulk_push import BulkPusher, PushItem, PushManifest, fingerprint_path
+from mp.dev_env.sub_commands.integration.push import _push_custom_integrations  # ruff:ignore[import-private-name]
+
+from .fake_backend import FakeBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+WORKERS: int = 4
+
+
+@pytest.fixture
+def fake_backend() -> Iterator[FakeBackend]:
+    with FakeBackend() as backend:
+        yield backend
+
+
+@pytest.fixture
+def backend_api(fake_backend: FakeBackend) -> BackendAPI:
+    api = BackendAPI(fake_backend.api_root, username="user", password="pass")  # ruff:ignore[hardcoded-password-func-arg]
+    api.login()
+    return api
+
+
+@pytest.fixture
+def zip_paths(tmp_path: Path) -> list[Path]:
+    paths: list[Path] = []
+    for i in range(6):
+        zip_path = tmp_path / f"Integration{i}.zip"
+        zip_path.write_bytes(f"integration {i}".encode())
+        paths.append(zip_path)
+    return paths
+
+
+def _upload(backend_api: BackendAPI, zip_path: Path) -> None:
+    details = backend_api.get_integration_details(zip_path)
+    backend_api.upload_integration(zip_path, details["identifier"])
+
+
+def _items(zip_paths: list[Path]) -> list[PushItem]:
+    return [
+        PushItem(key=p.stem, fingerprint=fingerprint_path(p), push=functools.partial(_upload, zip_path=p))
+        for p in zip_paths
+    ]
+
+
+def test_push_only_uploads_changed_items(
+    backend_api: BackendAPI, fake_backend: FakeBackend, zip_paths: list[Path], tmp_path: Path
+) -> None:
+    manifest = PushManifest(tmp_path / "manifest.json", backend_api.api_root)
+    pusher = BulkPusher(backend_api, manifest, max_workers=WORKERS)
+
+    first = pusher.push(_items(zip_paths))
+    assert sorted(first.pushed) == sorted(p.stem for p in zip_paths)
+    assert not first.failed
+    assert len(fake_backend.uploads) == len(zip_paths)
+
+    zip_paths[0].write_bytes(b"changed")
+    second = BulkPusher(backend_api, PushManifest(manifest.path, backend_api.api_root)).push(_items(zip_paths))
+    assert second.pushed == [zip_paths[0].stem]
+    assert len(second.skipped) == len(zip_paths) - 1
+
+    forced = pusher.push(_items(zip_paths), force=True)
+    assert len(forced.pushed) == len(zip_paths)
+
+
+def test_push_retries_transient_errors(
+    backend_api: BackendAPI, fake_backend: FakeBackend, zip_paths: list[Path]
+) -> None:
+    fake_backend.failures = 2
+    result = BulkPusher(backend_api, max_workers=1, backoff_seconds=0).push(_items(zip_paths[:1]))
+
+    assert result.pushed == [zip_paths[0].stem]
+    assert len(fake_backend.uploads) == 1
+
+
+def test_interrupted_push_resumes(
+    backend_api: BackendAPI, fake_backend: FakeBackend, zip_paths: list[Path], tmp_path: Path
+) -> None:
+    manifest_path: Path = tmp_path / "manifest.json"
+    broken: Path = zip_paths[2]
+    items: list[PushItem] = [
+        i._replace(push=functools.partial(_upload, zip_path=tmp_path / "missing.zip")) if i.key == broken.stem else i
+        for i in _items(zip_paths)
+    ]
+
+    first = BulkPusher(backend_api, PushManifest(manifest_path, backend_api.api_root), max_retries=0).push(items)
+    assert list(first.failed) == [broken.stem]
+    assert isinstance(first.failed[broken.stem], FileNotFoundError)
+
+    second = BulkPusher(backend_api, PushManifest(manifest_path, backend_api.api_root)).push(_items(zip_paths))
+    assert second.pushed == [broken.stem]
+    assert len(fake_backend.uploads) == len(zip_paths)
+
+
+def test_push_custom_integrations_reports_failures(
+    backend_api: BackendAPI, fake_backend: FakeBackend, zip_paths: list[Path], tmp_path: Path
+) -> None:
+    for zip_path in zip_paths:
+        zip_path.with_suffix("").mkdir()
+        (zip_path.with_suffix("") / "def.json").write_bytes(zip_path.read_bytes())
+    zip_paths[0].unlink()
+
+    with (
+        mock.patch("mp.dev_env.sub_commands.integration.push.load_dev_env_config"),
+        mock.patch("mp.dev_env.sub_commands.integration.push.get_backend_api", return_value=backend_api),
+        mock.patch("mp.dev_env.sub_commands.integration.push.PUSH_MANIFEST_PATH", tmp_path / "manifest.json"),
+        pytest.raises(typer.Exit),
+    ):
+        _push_custom_integrations(zip_paths)
+
+    assert len(fake_backend.uploads) == len(zip_paths) - 1
+
+
+def test_fingerprint_ignores_timestamps(tmp_path: Path) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "def.json").write_text("{}")
+    before: str = fingerprint_path(tmp_path / "a")
+    (tmp_path / "a" / "def.json").touch()
+    assert fingerprint_path(tmp_path / "a") == before
+
+    (tmp_path / "a" / "def.json").write_text('{"a": 1}')
+    assert fingerprint_path(tmp_path / "a") != before
@@ -869,3 +869,39 @@ def test_pull_all_custom_fields_shared_scope(
     assert (tmp_path / "shared" / "Field_3_alert_case.yaml").exists()
     assert not (tmp_path / "alert" / "Field_1_alert.yaml").exists()
     assert not (tmp_path / "case" / "Field_2_case.yaml").exists()
+
+
+@mock.patch("mp.dev_env.sub_commands.custom_field.push.load_dev_env_config")
+@mock.patch("mp.dev_env.sub_commands.custom_field.push.get_backend_api")
+def test_push_all_custom_fields_continues_after_a_failure(
+    mock_get_backend_api: mock.MagicMock,
+    mock_load_config: mock.MagicMock,
+    tmp_path: Path,
+) -> None:
+    mock_api = mock.MagicMock()
+    mock_get_backend_api.return_value = mock_api
+    mock_api.list_custom_fields.return_value = []
+
+    def create_custom_field(field_data: dict[str, str]) -> None:
+        if field_data["displayName"] == "Field 1":
+            msg = "Rejected"
+            raise RuntimeError(msg)
+
+    mock_api.create_custom_field.side_effect = create_custom_field
+    for i in range(4):
+        (tmp_path / f"Field_{i}.yaml").write_text(yaml.dump({"displayName": f"Field {i}", "scopes": "Case"}))
+
+    with mock.patch(
+        "mp.core.file_utils.create_or_get_custom_fields_root_dir",
+        return_value=tmp_path,
+    ):
+        result = runner.invoke(push_app, ["custom-field", "--all", "--force"])
+
+    assert result.exit_code == 1
+    assert sorted(c.args[0]["displayName"] for c in mock_api.create_custom_field.call_args_list) == [
+        "Field 0",
+        "Field 1",
+        "Field 2",
+        "Field 3",
+    ]
+    mock_get_backend_api.assert_called_once()
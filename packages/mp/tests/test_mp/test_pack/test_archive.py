@@ -0,0 +1,107 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import os
+import threading
+import zipfile
+from typing import TYPE_CHECKING
+
+import pytest
+
+from mp.pack.flow.integrations import archive
+from mp.pack.flow.integrations.archive import (
+    PARALLEL_MIN_FILE_SIZE,
+    CompressedMember,
+    ZipMember,
+    collect_members,
+    write_reproducible_zip,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def built_dir(tmp_path: Path) -> Path:
+    root: Path = tmp_path / "built"
+    (root / "ActionsScripts").mkdir(parents=True)
+    (root / "Dependencies").mkdir()
+    (root / "ActionsScripts" / "Ping.py").write_text("print('ping')\n" * 200, encoding="utf-8")
+    (root / "ActionsScripts" / "Échec.py").write_text("pass\n", encoding="utf-8")
+    (root / "Dependencies" / "requests-2.32.4-py3-none-any.whl").write_bytes(os.urandom(4096))
+    (root / "Integration-Mock.def").write_text("{}", encoding="utf-8")
+    (root / "empty.txt").write_bytes(b"")
+    return root
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_archive_content_round_trips(built_dir: Path, tmp_path: Path, max_workers: int) -> None:
+    zip_path: Path = write_reproducible_zip(built_dir, tmp_path / "out.zip", max_workers=max_workers)
+
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.testzip() is None
+        names: list[str] = zf.namelist()
+        assert names == sorted(names)
+        assert names == [m.arcname for m in collect_members(built_dir)]
+        for name in names:
+            assert zf.read(name) == (built_dir / name).read_bytes()
+
+
+def test_precompressed_members_are_stored(built_dir: Path, tmp_path: Path) -> None:
+    zip_path: Path = write_reproducible_zip(built_dir, tmp_path / "out.zip")
+
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.getinfo("Dependencies/requests-2.32.4-py3-none-any.whl").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("ActionsScripts/Ping.py").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("ActionsScripts/Ping.py").date_time == (1980, 1, 1, 0, 0, 0)
+
+
+def test_archive_is_byte_identical_across_runs(built_dir: Path, tmp_path: Path) -> None:
+    first: Path = write_reproducible_zip(built_dir, tmp_path / "first.zip", max_workers=1)
+    os.utime(built_dir / "Integration-Mock.def", (0, 0))
+    second: Path = write_reproducible_zip(built_dir, tmp_path / "second.zip", max_workers=4)
+
+    assert first.read_bytes() == second.read_bytes()
+
+
+def test_large_members_compressed_in_parallel_match_serial_archive(
+    built_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for i in range(6):
+        (built_dir / "Dependencies" / f"lib_{i}.py").write_text(
+            f"value_{i} = {i!r}\n" * PARALLEL_MIN_FILE_SIZE, encoding="utf-8"
+        )
+    (built_dir / "Dependencies" / "large.whl").write_bytes(os.urandom(PARALLEL_MIN_FILE_SIZE * 2))
+
+    compress_member = archive.compress_member
+    worker_arcnames: list[str] = []
+
+    def record_worker(member: ZipMember, compresslevel: int) -> CompressedMember:
+        if threading.current_thread() is not threading.main_thread():
+            worker_arcnames.append(member.arcname)
+        return compress_member(member, compresslevel)
+
+    serial: Path = write_reproducible_zip(built_dir, tmp_path / "serial.zip", max_workers=1)
+    monkeypatch.setattr(archive, "compress_member", record_worker)
+    parallel: Path = write_reproducible_zip(built_dir, tmp_path / "parallel.zip", max_workers=4)
+
+    assert sorted(worker_arcnames) == [
+        "Dependencies/large.whl",
+        *(f"Dependencies/lib_{i}.py" for i in range(6)),
+    ]
+    assert parallel.read_bytes() == serial.read_bytes()
+    with zipfile.ZipFile(parallel) as zf:
+        assert zf.testzip() is None
@@ -44,14 +44,17 @@ functions in its core, so usage example will be something like this:
 
 """
 
+import base64
 import json
 import os
 import sys
+import zlib
 
 from SiemplifyAction import SiemplifyAction
 from SiemplifyConnectors import SiemplifyConnectorExecution
 from SiemplifyJob import SiemplifyJob
 
+from .consts import SEGMENTED_STREAM_MAX_DELTA_SEGMENTS, SEGMENTED_STREAM_SEGMENT_MAX_ENTRIES
 from .utils import is_empty_string_or_none, none_to_default_value, platform_supports_db
 
 PYTHON_2 = 2
@@ -151,7 +154,7 @@ class DataStreamFactory:
     """
 
     @staticmethod
-    def get_stream_object(file_name, db_key, siemplify, identifier):
+    def get_stream_object(file_name, db_key, siemplify, identifier, segmented=False):
         """Get a (connector/action/job) ``DataStream`` object based on platform
 
         Args:
@@ -159,30 +162,40 @@ class DataStreamFactory:
             db_key (str): The key to use to access the database.
             siemplify (``SiemplifyConnectorExecution``|``SiemplifyAction``|``SiemplifyJob``): The Siemplify object to use.
             identifier (str): The identifier of the data stream.
+            segmented (bool): Whether to store the data as compressed segments
+                that are updated incrementally (see ``SegmentedDataStream``).
 
         Returns:
             A ``FileStream`` object if the platform should handle files, or a
             ``DatabaseStream`` object if the platform should handle a database
             for connectors, actions or jobs - depends on the requestor.
+            If ``segmented`` is set, a ``SegmentedDataStream`` stored in the
+            same file or database key is returned instead.
         """
         # uses_db = TIPCommon.platform_supports_db(siemplify)
         uses_db = platform_supports_db(siemplify)
+        stream = None
 
         # Connector stream object
         if isinstance(siemplify, SiemplifyConnectorExecution):
-            return (
+            stream = (
                 ConnectorDBStream(db_key, siemplify, identifier)
                 if uses_db
                 else ConnectorFileStream(file_name, siemplify)
             )
         # Action stream object
-        if isinstance(siemplify, SiemplifyAction):
+        elif isinstance(siemplify, SiemplifyAction):
             # TODO: Implement "return ActionDBStream() if is_using_db else ActionFileStream()" once available
             pass
 
         # Job stream object
-        if isinstance(siemplify, SiemplifyJob):
-            return JobDBStream(db_key, siemplify, identifier) if uses_db else JobFileStream(file_name, siemplify)
+        elif isinstance(siemplify, SiemplifyJob):
+            stream = JobDBStream(db_key, siemplify, identifier) if uses_db else JobFileStream(file_name, siemplify)
+
+        if segmented and stream is not None:
+            return SegmentedDataStream.from_stream(stream)
+
+        return stream
 
 
 ##################################################################
@@ -751,6 +764,641 @@ class ConnectorDBStream(AbstractDataStream):
             raise
 
 
+##################################################################
+#       SEGMENTED CLASS         ##       SEGMENTED CLASS         #
+##################################################################
+
+
+SEGMENTS_FILE_HEADER = "#tipcommon-segments:1"
+SEGMENTS_MANIFEST_MARKER = "__tipcommon_segments__"
+
+_MISSING = object()
+_CONTAINER_TYPES = (dict, list, tuple)
+
+
+class _EncodedValue(str):
+    """A JSON container value, kept encoded so callers can't mutate stored state."""
+
+    __slots__ = ()
+
+
+def _json_key(key):
+    if isinstance(key, str):
+        return key
+
+    return json.dumps(key) if key is None or isinstance(key, bool) else str(key)
+
+
+def _freeze_item(value):
+    if isinstance(value, _CONTAINER_TYPES):
+        return _EncodedValue(json.dumps(value, separators=(",", ":")))
+
+    return value
+
+
+def _thaw_item(value):
+    return json.loads(value) if isinstance(value, _EncodedValue) else value
+
+
+def _split_entries(entries):
+    """Split dict entries into primitive values and JSON encoded container values."""
+    primitives, containers = {}, {}
+    for key, value in entries.items():
+        if not isinstance(key, str):
+            key = _json_key(key)
+
+        if isinstance(value, _CONTAINER_TYPES):
+            containers[key] = json.dumps(value, separators=(",", ":"))
+        else:
+            primitives[key] = value
+
+    return primitives, containers
+
+
+def _same(old, new):
+    return old is new or (type(old) is type(new) and old == new)
+
+
+def _encode_segment(record):
+    return base64.b64encode(zlib.compress(json.dumps(record, separators=(",", ":")).encode())).decode()
+
+
+def _decode_segment(segment):
+    return json.loads(zlib.decompress(base64.b64decode(segment)))
+
+
+class FileSegmentStorage:
+    """Stores the segments of a ``SegmentedDataStream`` as lines of a file.
+
+    New segments are appended to the end of the file, and compaction replaces
+    the file atomically. A file without the segments header holds plain JSON
+    written by a ``FileStream``.
+    """
+
+    def __init__(self, file_path):
+        """
+        Args:
+            file_path: (str) The path of the file
+        """
+        self.file_path = file_path
+
+    def exists(self):
+        return os.path.exists(self.file_path)
+
+    def load(self):
+        """Load the stored data.
+
+        Returns:
+            (tuple) The plain JSON content, or ``None`` if the file holds
+            segments, and the list of encoded segments.
+        """
+        if not self.exists():
+            return None, []
+
+        with open(self.file_path) as f:
+            content = f.read()
+
+        if not content.startswith(SEGMENTS_FILE_HEADER):
+            return content, []
+
+        return None, [line for line in content.splitlines()[1:] if line]
+
+    def append(self, segment):
+        with open(self.file_path, "a") as f:
+            f.write(f"{segment}\n")
+
+    def replace(self, segments):
+        directory = os.path.dirname(self.file_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        tmp_path = f"{self.file_path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(f"{SEGMENTS_FILE_HEADER}\n")
+            for segment in segments:
+                f.write(f"{segment}\n")
+
+        os.replace(tmp_path, self.file_path)
+
+
+class ContextSegmentStorage:
+    """Stores the segments of a ``SegmentedDataStream`` as context properties.
+
+    The DB key holds a small manifest, and each segment is its own property,
+    so appending a segment never rewrites the others. Compaction writes the
+    new segments to the other of two slots before switching the manifest, so
+    an interrupted compaction leaves the previous segments readable. A DB key
+    without a manifest holds plain JSON written by a ``DBStream``.
+    """
+
+    def __init__(self, get_property, set_property, db_key):
+        """
+        Args:
+            get_property: (callable) Reads a context property by key
+            set_property: (callable) Writes a context property by key and value
+            db_key: (str) The name of the DB key
+        """
+        self.get_property = get_property
+        self.set_property = set_property
+        self.db_key = db_key
+        self._manifest = None
+
+    def _segment_key(self, slot, index):
+        return f"{self.db_key}__{slot}_{index}"
+
+    def _write_manifest(self, slot, count):
+        self._manifest = {SEGMENTS_MANIFEST_MARKER: 1, "slot": slot, "count": count}
+        self.set_property(self.db_key, json.dumps(self._manifest, separators=(",", ":")))
+
+    def exists(self):
+        return not is_empty_string_or_none(self.get_property(self.db_key))
+
+    def load(self):
+        """Load the stored data.
+
+        Returns:
+            (tuple) The plain JSON content, or ``None`` if the key holds
+            segments, and the list of encoded segments.
+        """
+        content = self.get_property(self.db_key)
+        if is_empty_string_or_none(content):
+            self._manifest = None
+            return None, []
+
+        if not content.startswith(f'{{"{SEGMENTS_MANIFEST_MARKER}"'):
+            self._manifest = None
+            return content, []
+
+        self._manifest = json.loads(content)
+        slot = self._manifest["slot"]
+        return None, [self.get_property(self._segment_key(slot, i)) for i in range(self._manifest["count"])]
+
+    def append(self, segment):
+        slot, count = self._manifest["slot"], self._manifest["count"]
+        self.set_property(self._segment_key(slot, count), segment)
+        self._write_manifest(slot, count + 1)
+
+    def replace(self, segments):
+        previous = self._manifest
+        slot = 0 if previous is None else 1 - previous["slot"]
+        for index, segment in enumerate(segments):
+            self.set_property(self._segment_key(slot, index), segment)
+
+        self._write_manifest(slot, len(segments))
+        if previous is not None:
+            for index in range(previous["count"]):
+                self.set_property(self._segment_key(previous["slot"], index), "")
+
+
+class SegmentedDataStream(AbstractDataStream):
+    """A data stream that stores its content as compressed segments.
+
+    The first segments hold a snapshot of the content. Every write stores only
+    what changed since the previous one: the set and removed keys of a dict,
+    or the trimmed and appended items of a list. After
+    ``max_delta_segments`` such writes, the segments are compacted back into
+    a snapshot. Plain JSON stored by the other streams is read as is and
+    migrated on the first write.
+
+    Besides the ``AbstractDataStream`` methods, dict content can be read and
+    updated by key without writing the whole content:
+
+    .. code-block:: python
+
+        stream = DataStreamFactory.get_stream_object("ids.json", "ids", siemplify, None, segmented=True)
+        if alert_id not in stream:
+            stream.update({alert_id: unix_now()})
+    """
+
+    def __init__(
+        self,
+        storage,
+        siemplify,
+        max_delta_segments=SEGMENTED_STREAM_MAX_DELTA_SEGMENTS,
+        segment_max_entries=SEGMENTED_STREAM_SEGMENT_MAX_ENTRIES,
+    ):
+        """
+        Args:
+            storage: (``FileSegmentStorage``|``ContextSegmentStorage``) Where the segments are stored
+            siemplify: (obj) An instance of the SDK class
+            max_delta_segments: (int) Number of delta segments that triggers a compaction
+            segment_max_entries: (int) Maximum number of entries in a snapshot segment
+        """
+        self.storage = storage
+        self.siemplify = siemplify
+        self.max_delta_segments = max_delta_segments
+        self.segment_max_entries = segment_max_entries
+        self._loaded = False
+        self._reset(None)
+
+    @classmethod
+    def from_stream(cls, stream, **kwargs):
+        """Create a ``SegmentedDataStream`` over the storage of another stream.
+
+        Args:
+            stream: (``AbstractDataStream``) A file or DB stream
+            **kwargs: Passed to the constructor
+
+        Returns:
+            A ``SegmentedDataStream`` that stores in the same file or DB key.
+        """
+        siemplify = stream.siemplify
+        if isinstance(stream, (JobFileStream, ConnectorFileStream)):
+            storage = FileSegmentStorage(stream.file_path)
+
+        elif isinstance(stream, ConnectorDBStream):
+            storage = ContextSegmentStorage(
+                lambda key: siemplify.get_connector_context_property(stream.identifier, key),
+                lambda key, value: siemplify.set_connector_context_property(stream.identifier, key, value),
+                stream.db_key,
+            )
+
+        else:
+            storage = ContextSegmentStorage(
+                lambda key: siemplify.get_job_context_property(stream.identifier, key),
+                lambda key, value: siemplify.set_job_context_property(stream.identifier, key, value),
+                stream.db_key,
+            )
+
+        return cls(storage, siemplify, **kwargs)
+
+    def _reset(self, kind, value=None):
+        """Reset the in-memory content.
+
+        Dict values are kept as is, except for containers that are kept JSON
+        encoded, with their keys in ``_encoded_keys``.
+        """
+        self._kind = kind
+        self._encoded_keys = set()
+        self._delta_segments = 0
+        self._snapshot_pending = True
+        if kind == "dict":
+            self._state = {}
+        elif kind == "list":
+            self._state = []
+        else:
+            self._state = value
+
+    def _set_content(self, content):
+        if isinstance(content, dict):
+            self._reset("dict")
+            primitives, containers = _split_entries(content)
+            self._apply({"s": primitives, "c": containers})
+
+        elif isinstance(content, (list, tuple)):
+            self._reset("list")
+            self._apply({"e": list(content)})
+
+        else:
+            self._reset("value", content)
+
+    def _apply(self, record):
+        state = self._state
+        if self._kind == "dict":
+            if "d" in record:
+                for key in record["d"]:
+                    state.pop(key, None)
+
+                self._encoded_keys.difference_update(record["d"])
+
+            if "s" in record:
+                state.update(record["s"])
+                if self._encoded_keys:
+                    self._encoded_keys.difference_update(record["s"])
+
+            if "c" in record:
+                state.update({key: _EncodedValue(value) for key, value in record["c"].items()})
+                self._encoded_keys.update(record["c"])
+
+        elif self._kind == "list":
+            del state[: record.get("t", 0)]
+            state.extend(_freeze_item(value) for value in record.get("e", ()))
+
+    def _content(self):
+        if self._kind == "dict":
+            content = dict(self._state)
+            for key in self._encoded_keys:
+                content[key] = json.loads(content[key])
+
+            return content
+
+        if self._kind == "list":
+            return [_thaw_item(value) for value in self._state]
+
+        return self._state
+
+    def _load(self):
+        if self._loaded:
+            return
+
+        legacy_content, segments = self.storage.load()
+        self._reset(None)
+        if legacy_content is not None:
+            self._set_content(json.loads(legacy_content))
+
+        delta_segments = 0
+        for segment in segments:
+            record = _decode_segment(segment)
+            if "r" in record:
+                self._reset(record["r"], record.get("v"))
+
+            elif "b" not in record:
+                delta_segments += 1
+
+            self._apply(record)
+
+        self._delta_segments = delta_segments
+        self._snapshot_pending = self._kind is None or legacy_content is not None
+        self._loaded = True
+
+    def _snapshot_segments(self):
+        size = self.segment_max_entries
+        if self._kind == "dict":
+            items = list(self._state.items())
+            records = []
+            for start in range(0, len(items) or 1, size):
+                chunk = dict(items[start : start + size])
+                record = {"r": "dict"} if start == 0 else {"b": 1}
+                if self._encoded_keys and not self._encoded_keys.isdisjoint(chunk):
+                    record["c"] = {key: chunk.pop(key) for key in self._encoded_keys.intersection(chunk)}
+
+                record["s"] = chunk
+                records.append(record)
+
+        elif self._kind == "list":
+            content = self._content()
+            records = [
+                {"r": "list", "e": content[start : start + size]}
+                if start == 0
+                else {"b": 1, "e": content[start : start + size]}
+                for start in range(0, len(content) or 1, size)
+            ]
+
+        else:
+            records = [{"r": "value", "v": self._state}]
+
+        return [_encode_segment(record) for record in records]
+
+    def _commit(self, record, snapshot=False):
+        """Store a change of the content and apply it in memory.
+
+        Args:
+            record: (dict|None) The delta record of the change, or ``None`` if
+                the in-memory content was already replaced.
+            snapshot: (bool) Whether to store a snapshot instead of the delta.
+        """
+        snapshot = (
+            snapshot
+            or record is None
+            or self._snapshot_pending
+            or (bool(record) and self._delta_segments >= self.max_delta_segments)
+        )
+        try:
+            if record and not snapshot:
+                self.storage.append(_encode_segment(record))
+                self._delta_segments += 1
+
+            if record:
+                self._apply(record)
+
+            if snapshot:
+                self.storage.replace(self._snapshot_segments())
+                self._delta_segments = 0
+                self._snapshot_pending = False
+
+        except Exception:
+            self._loaded = False
+            raise
+
+    def _dict_delta(self, content):
+        """Get the delta record that turns the stored dict into ``content``.
+
+        Values are compared by type as well, so ``True`` replacing ``1`` is a
+        change even though they are equal.
+        """
+        state = self._state
+        if not all(isinstance(key, str) for key in content):
+            content = {_json_key(key): value for key, value in content.items()}
+
+        get = state.get
+        changed = {key: value for key, value in content.items() if not _same(get(key, _MISSING), value)}
+        removed = state.keys() - content.keys()
+        primitives, containers = _split_entries(changed)
+        containers = {key: value for key, value in containers.items() if get(key) != value}
+
+        record = {}
+        if removed:
+            record["d"] = list(removed)
+
+        if primitives:
+            record["s"] = primitives
+
+        if containers:
+            record["c"] = containers
+
+        return record
+
+    def _list_delta(self, content):
+        """Get the delta record that turns the stored list into ``content``.
+
+        Returns:
+            (dict|None) The record, or ``None`` if the lists don't overlap.
+        """
+        state = self._state
+        new_state = [_freeze_item(value) for value in content]
+        if not state or not new_state:
+            return None
+
+        try:
+            trim = state.index(new_state[0])
+        except ValueError:
+            return None
+
+        kept = len(state) - trim
+        if kept > len(new_state) or not all(_same(a, b) for a, b in zip(state[trim:], new_state[:kept], strict=True)):
+            return None
+
+        record = {}
+        if trim:
+            record["t"] = trim
+
+        if len(new_state) > kept:
+            record["e"] = list(content[kept:])
+
+        return record
+
+    def compact(self):
+        """Rewrite the stored segments as a single snapshot."""
+        self._load()
+        if self._kind is not None:
+            self._commit({}, snapshot=True)
+
+    def validate_existence(self, default_value_to_set):
+        """Validate the existence of a ``DataStream`` object.
+
+        If it does not exist, initiate it with default value.
+
+        Args:
+            default_value_to_set: (dict/list/str) the default value to be set in case a new file/key is created.
+        """
+        try:
+            if not self.storage.exists():
+                self._set_content(default_value_to_set)
+                self._loaded = True
+                self._commit(None)
+                self.siemplify.LOGGER.info("Created segmented data stream")
+
+        except Exception as e:
+            self.siemplify.LOGGER.error(f"Unable to create segmented data stream. ERROR: {e}")
+            self.siemplify.LOGGER.exception(e)
+            raise
+
+    def read_content(self, default_value_to_return):
+        """Read the content of a ``DataStream`` object.
+
+        Args:
+            default_value_to_return: (dict|list|str) the value to return if
+                there is no content or it can't be parsed.
+
+        Returns:
+            (dict) The stored content, or the default value.
+        """
+        try:
+            self._load()
+
+        except (ValueError, TypeError, zlib.error) as err:
+            self.siemplify.LOGGER.error(
+                f"Failed to parse stored segments. "
+                f'Returning default value instead: "{default_value_to_return}". \nERROR: {err}'
+            )
+            self.siemplify.LOGGER.exception(err)
+            return default_value_to_return
+
+        if self._kind is None:
+            self.siemplify.LOGGER.info(
+                f"Segmented data stream does not exist. Returning default value instead: {default_value_to_return}"
+            )
+            return default_value_to_return
+
+        return self._content()
+
+    def write_content(self, content_to_write, default_value_to_set):
+        """Write content into a ``DataStream`` object.
+
+        Only the difference from the stored content is written. Top-level dict
+        values are compared by type as well, so ``1`` replaced by ``1.0`` or
+        ``True`` is written as a change.
+
+        Args:
+            content_to_write: (dict/list/str) Content that would be written to the dedicated data stream.
+            default_value_to_set: (dict/list/str) the default value to be set in case the content can't be encoded.
+
+        Returns:
+            (bool) True once the content was written.
+        """
+        try:
+            try:
+                self._load()
+            except (ValueError, TypeError, zlib.error) as err:
+                self.siemplify.LOGGER.error(f"Failed to parse stored segments, overwriting them. ERROR: {err}")
+                self._reset(None)
+                self._loaded = True
+
+            record = None
+            if self._kind == "dict" and isinstance(content_to_write, dict):
+                record = self._dict_delta(content_to_write)
+            elif self._kind == "list" and isinstance(content_to_write, (list, tuple)):
+                record = self._list_delta(content_to_write)
+
+            if record is None:
+                self._set_content(content_to_write)
+                self._commit(None)
+            else:
+                changes = len(record.get("d", ())) + len(record.get("s", ())) + len(record.get("c", ()))
+                self._commit(record, snapshot=changes > len(content_to_write) // 2 + 1)
+
+        except TypeError as err:
+            self.siemplify.LOGGER.error(
+                f"Failed parsing JSON to string. "
+                f'Writing default value instead: "{default_value_to_set}". \nERROR: {err}'
+            )
+            self.siemplify.LOGGER.exception(err)
+            self._set_content(default_value_to_set)
+            self._commit(None)
+
+        except Exception as err:
+            self.siemplify.LOGGER.error(f"Failed writing segmented data stream. ERROR: {err}")
+            self.siemplify.LOGGER.exception(err)
+            raise
+
+        return True
+
+    def _dict_state(self):
+        self._load()
+        if self._kind is None:
+            self._reset("dict")
+
+        if self._kind != "dict":
+            raise TypeError("Key-level access requires the stored content to be a dict")
+
+        return self._state
+
+    def __contains__(self, key):
+        return _json_key(key) in self._dict_state()
+
+    def key_count(self):
+        """Get the number of keys of dict content.
+
+        Returns:
+            (int) The number of stored keys.
+        """
+        return len(self._dict_state())
+
+    def get(self, key, default=None):
+        """Get the value of a single key of dict content.
+
+        Args:
+            key: (str) The key
+            default: The value to return if the key is not stored
+
+        Returns:
+            The stored value of the key, or the default value.
+        """
+        value = self._dict_state().get(_json_key(key), _MISSING)
+        return default if value is _MISSING else _thaw_item(value)
+
+    def update(self, entries):
+        """Set keys of dict content, writing only the changed ones.
+
+        Args:
+            entries: (dict) The keys and values to set
+        """
+        state = self._dict_state()
+        primitives, containers = _split_entries(entries)
+        record = {}
+        primitives = {key: value for key, value in primitives.items() if not _same(state.get(key, _MISSING), value)}
+        containers = {key: value for key, value in containers.items() if state.get(key) != value}
+        if primitives:
+            record["s"] = primitives
+
+        if containers:
+            record["c"] = containers
+
+        if record:
+            self._commit(record)
+
+    def delete(self, *keys):
+        """Remove keys from dict content.
+
+        Args:
+            *keys: (str) The keys to remove
+        """
+        state = self._dict_state()
+        removed = [key for key in dict.fromkeys(_json_key(key) for key in keys) if key in state]
+        if removed:
+            self._commit({"d": removed})
+
+
 def validate_existence(file_name, db_key, default_value_to_set, siemplify, identifier=None):
     """
     Validates the existence of a ``DataStream`` object.
@@ -13,3 +13,5 @@
 # limitations under the License.
 
 from .pubsub.pubsub import PubSubAdapter as PubSubAdapter
+from .pubsub.streaming import PubSubBatchPublisher as PubSubBatchPublisher
+from .pubsub.streaming import PubSubStreamingConsumer as PubSubStreamingConsumer
@@ -34,7 +34,15 @@ PUBSUB_ENDPOINTS = {
     "publish": "v1/projects/{project_id}/topics/{topic_name}:publish",
     "pull": "v1/projects/{project_id}/subscriptions/{sub_name}:pull",
     "ack": "v1/projects/{project_id}/subscriptions/{sub_name}:acknowledge",
+    "modify_ack_deadline": "v1/projects/{project_id}/subscriptions/{sub_name}:modifyAckDeadline",
 }
+# Pub/Sub accepts at most 1000 messages and 10MB per publish request. The byte
+# limit leaves room for the request envelope around the messages.
+PUBSUB_MAX_PUBLISH_MESSAGES = 1000
+PUBSUB_MAX_PUBLISH_BYTES = 9_000_000
+PUBSUB_MAX_ACK_IDS_PER_REQUEST = 2500
+PUBSUB_MIN_ACK_DEADLINE_SECONDS = 10
+PUBSUB_MAX_ACK_DEADLINE_SECONDS = 600
 PUBSUB_ERROR_STATUS_MAPPING = {
     "ALREADY_EXISTS": AlreadyExistsError,
     "NOT_FOUND": NotFoundError,
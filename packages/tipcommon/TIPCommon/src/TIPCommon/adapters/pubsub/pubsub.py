@@ -486,6 +486,24 @@ class PubSubAdapter:
         response = self.session.post(url, json=payload)
         self._validate_response(response)
 
+    def modify_ack_deadline(self, sub_name, ack_ids, ack_deadline_seconds) -> None:
+        """Modifies the ack deadline of messages pulled with `PubSubAdapter.pull()`.
+
+        Args:
+            sub_name (str):
+                The subscription name
+            ack_ids (list[str]):
+                List of acknowledgment IDs of the messages to modify
+            ack_deadline_seconds (int):
+                The new ack deadline, relative to the time of the request.
+                0 makes the messages immediately available for redelivery
+
+        """
+        url = self._get_full_url("modify_ack_deadline", project_id=self.project_id, sub_name=sub_name)
+        payload = {"ackIds": ack_ids, "ackDeadlineSeconds": ack_deadline_seconds}
+        response = self.session.post(url, json=payload)
+        self._validate_response(response)
+
     @staticmethod
     def topic_name(project_id, topic):
         """Retrieves 'projects/{project_id}/topics/{topic_name}'
@@ -0,0 +1,449 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import collections
+import copy
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from TIPCommon.rest.httplib import fork_session
+
+from . import consts
+from .data_models import PubSubMessage
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from types import TracebackType
+
+    from TIPCommon.types import SingleJson
+
+    from .data_models import ReceivedMessage
+    from .pubsub import PubSubAdapter
+
+DEFAULT_MAX_OUTSTANDING_PULLS = 2
+DEFAULT_ACK_FLUSH_INTERVAL_SECONDS = 1.0
+DEFAULT_MAX_LEASE_SECONDS = 3600
+DEFAULT_PUBLISH_WORKERS = 4
+LEASE_SAFETY_MARGIN_SECONDS = 2.0
+
+
+class PubSubStreamingConsumer:
+    """Consumes a subscription with several pulls in flight and acks sent in the background.
+
+    Pulls are pipelined, so new messages are fetched while the previous ones are
+    being processed. Acks are queued, coalesced and sent in batches by a background
+    thread, which also extends the ack deadline of messages that are still being
+    processed, until they are acked or `max_lease_seconds` have passed.
+
+    Each background thread sends its requests with its own copy of the adapter's
+    HTTP session, as sessions are not thread-safe.
+
+    Example:
+        >>> with PubSubStreamingConsumer(adapter, "alerts") as consumer:
+        ...     for message in consumer.messages(limit=1000):
+        ...         process(message)
+        ...         consumer.ack(message)
+
+    """
+
+    def __init__(
+        self,
+        adapter: PubSubAdapter,
+        sub_name: str,
+        max_messages_per_pull: int = 100,
+        max_outstanding_pulls: int = DEFAULT_MAX_OUTSTANDING_PULLS,
+        ack_deadline_seconds: int = consts.PUBSUB_MIN_ACK_DEADLINE_SECONDS,
+        max_lease_seconds: float = DEFAULT_MAX_LEASE_SECONDS,
+        ack_flush_interval: float = DEFAULT_ACK_FLUSH_INTERVAL_SECONDS,
+        pull_timeout: int = 60,
+        encoding: str = "utf-8",
+    ) -> None:
+        """Initialize the consumer.
+
+        Args:
+            adapter (PubSubAdapter): The adapter used to send the requests.
+            sub_name (str): The subscription name.
+            max_messages_per_pull (int): The maximum number of messages returned by each pull.
+            max_outstanding_pulls (int): The number of pulls kept in flight.
+            ack_deadline_seconds (int): The ack deadline of the subscription. Deadlines are
+                extended by this amount whenever they are about to expire.
+            max_lease_seconds (float): The time after which the deadline of an unacked
+                message is no longer extended, so it can be redelivered.
+            ack_flush_interval (float): The maximum time, in seconds, an ack is queued before
+                it is sent.
+            pull_timeout (int): HTTP timeout of each pull request, in seconds.
+            encoding (str): Pub/Sub message encoding.
+
+        """
+        self.adapter = adapter
+        self.sub_name = sub_name
+        self.max_messages_per_pull = max_messages_per_pull
+        self.max_outstanding_pulls = max(1, max_outstanding_pulls)
+        self.ack_deadline_seconds = min(
+            max(ack_deadline_seconds, consts.PUBSUB_MIN_ACK_DEADLINE_SECONDS),
+            consts.PUBSUB_MAX_ACK_DEADLINE_SECONDS,
+        )
+        self.max_lease_seconds = max_lease_seconds
+        self.ack_flush_interval = ack_flush_interval
+        self.pull_timeout = pull_timeout
+        self.encoding = encoding
+        self._condition = threading.Condition()
+        self._pending_acks: dict[str, None] = {}
+        self._pending_nacks: dict[str, None] = {}
+        self._leases: dict[str, tuple[float, float]] = {}
+        self._closed = False
+        self._error: Exception | None = None
+        self._dispatcher: threading.Thread | None = None
+        self._thread_local = threading.local()
+
+    def __enter__(self) -> PubSubStreamingConsumer:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Start the background thread sending acks and extending ack deadlines."""
+        with self._condition:
+            if self._dispatcher is not None:
+                return
+
+            self._dispatcher = threading.Thread(
+                target=self._run_dispatcher,
+                name=f"pubsub-dispatcher-{self.sub_name}",
+                daemon=True,
+            )
+            self._dispatcher.start()
+
+    def messages(self, limit: int | None = None) -> Iterator[ReceivedMessage]:
+        """Yield received messages until the subscription is drained.
+
+        The subscription is considered drained once a pull returns no messages.
+        Messages received beyond `limit`, or not yielded because the consumer
+        stopped iterating, are released for immediate redelivery.
+
+        Args:
+            limit (int | None): The maximum number of messages to yield.
+
+        Yields:
+            ReceivedMessage: The received messages, in the order they were pulled.
+
+        Raises:
+            Exception: The first error raised by a background ack or deadline request.
+
+        """
+        self.start()
+        yielded = 0
+        draining = False
+        pending: collections.deque[Future[list[ReceivedMessage]]] = collections.deque()
+        received: list[ReceivedMessage] = []
+        unyielded_index = 0
+        with ThreadPoolExecutor(max_workers=self.max_outstanding_pulls) as pool:
+            try:
+                pending.extend(pool.submit(self._pull) for _ in range(self.max_outstanding_pulls))
+                while pending:
+                    received = pending.popleft().result()
+                    unyielded_index = 0
+                    self._raise_background_error()
+                    in_flight = len(pending) * self.max_messages_per_pull
+                    if not received:
+                        draining = True
+
+                    elif not draining and (limit is None or yielded + len(received) + in_flight < limit):
+                        pending.append(pool.submit(self._pull))
+
+                    for index, message in enumerate(received):
+                        if limit is not None and yielded >= limit:
+                            break
+
+                        yielded += 1
+                        unyielded_index = index + 1
+                        yield message
+
+                    if unyielded_index < len(received):
+                        self.nack(*received[unyielded_index:])
+                        unyielded_index = len(received)
+
+            finally:
+                for future in pending:
+                    future.cancel()
+
+                pool.shutdown(wait=True)
+                if not self._closed and unyielded_index < len(received):
+                    self.nack(*received[unyielded_index:])
+
+                for future in pending:
+                    if not self._closed and not future.cancelled() and future.exception() is None:
+                        self.nack(*future.result())
+
+    def ack(self, *messages: ReceivedMessage) -> None:
+        """Queue messages to be acknowledged.
+
+        Args:
+            *messages (ReceivedMessage): The messages to acknowledge.
+
+        """
+        self._queue(self._pending_acks, messages)
+
+    def nack(self, *messages: ReceivedMessage) -> None:
+        """Queue messages to be released for immediate redelivery.
+
+        Args:
+            *messages (ReceivedMessage): The messages to release.
+
+        """
+        self._queue(self._pending_nacks, messages)
+
+    def close(self) -> None:
+        """Send all the queued acks and stop the background thread.
+
+        Raises:
+            Exception: The first error raised by a background ack or deadline request.
+
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            dispatcher = self._dispatcher
+
+        if dispatcher is not None:
+            dispatcher.join()
+
+        self._raise_background_error()
+
+    def _pull(self) -> list[ReceivedMessage]:
+        """Pull messages and start leasing them."""
+        received = self._get_thread_adapter().pull(
+            self.sub_name,
+            self.max_messages_per_pull,
+            timeout=self.pull_timeout,
+            encoding=self.encoding,
+        )
+        now = time.monotonic()
+        with self._condition:
+            for message in received:
+                self._leases[message.ack_id] = (now + self.ack_deadline_seconds, now + self.max_lease_seconds)
+
+        return received
+
+    def _get_thread_adapter(self) -> PubSubAdapter:
+        """Get a copy of the adapter with its own HTTP session, created once per thread."""
+        return _get_thread_adapter(self._thread_local, self.adapter)
+
+    def _queue(self, queue: dict[str, None], messages: Iterable[ReceivedMessage]) -> None:
+        """Add the ack IDs of messages to a queue and wake the dispatcher if a batch is full."""
+        with self._condition:
+            if self._closed:
+                msg = "Cannot acknowledge messages after the consumer was closed"
+                raise RuntimeError(msg)
+
+            for message in messages:
+                self._leases.pop(message.ack_id, None)
+                queue[message.ack_id] = None
+
+            if len(queue) >= consts.PUBSUB_MAX_ACK_IDS_PER_REQUEST:
+                self._condition.notify_all()
+
+    def _run_dispatcher(self) -> None:
+        """Send queued acks and extend expiring deadlines until the consumer is closed."""
+        adapter = self._get_thread_adapter()
+        closed = False
+        while not closed:
+            with self._condition:
+                self._condition.wait_for(self._has_full_batch, timeout=self.ack_flush_interval)
+                closed = self._closed
+                ack_ids = list(self._pending_acks)
+                nack_ids = list(self._pending_nacks)
+                self._pending_acks.clear()
+                self._pending_nacks.clear()
+                expiring_ids = self._renew_expiring_leases(time.monotonic())
+
+            self._send(adapter.ack, ack_ids)
+            self._send(lambda sub_name, ids: adapter.modify_ack_deadline(sub_name, ids, 0), nack_ids)
+            self._send(
+                lambda sub_name, ids: adapter.modify_ack_deadline(sub_name, ids, self.ack_deadline_seconds),
+                expiring_ids,
+            )
+
+    def _has_full_batch(self) -> bool:
+        """Whether the dispatcher should run before the flush interval ends."""
+        return (
+            self._closed
+            or len(self._pending_acks) >= consts.PUBSUB_MAX_ACK_IDS_PER_REQUEST
+            or len(self._pending_nacks) >= consts.PUBSUB_MAX_ACK_IDS_PER_REQUEST
+        )
+
+    def _renew_expiring_leases(self, now: float) -> list[str]:
+        """Get the ack IDs whose deadline must be extended, and drop the expired leases.
+
+        Must be called while holding the condition lock.
+        """
+        margin = self.ack_flush_interval + LEASE_SAFETY_MARGIN_SECONDS
+        expiring_ids = []
+        for ack_id, (expires_at, lease_until) in list(self._leases.items()):
+            if expires_at - now > margin:
+                continue
+
+            if now >= lease_until:
+                del self._leases[ack_id]
+                continue
+
+            self._leases[ack_id] = (now + self.ack_deadline_seconds, lease_until)
+            expiring_ids.append(ack_id)
+
+        return expiring_ids
+
+    def _send(self, request: Callable[[str, list[str]], None], ack_ids: list[str]) -> None:
+        """Send ack IDs in chunks, keeping the first error to raise it to the consumer."""
+        for start in range(0, len(ack_ids), consts.PUBSUB_MAX_ACK_IDS_PER_REQUEST):
+            try:
+                request(self.sub_name, ack_ids[start : start + consts.PUBSUB_MAX_ACK_IDS_PER_REQUEST])
+            except Exception as e:
+                if self.adapter.logger is not None:
+                    self.adapter.logger.error(f"Pub/Sub request for subscription {self.sub_name} failed: {e}")
+                with self._condition:
+                    self._error = self._error or e
+
+    def _raise_background_error(self) -> None:
+        """Raise the first error of the background requests, if any."""
+        with self._condition:
+            error, self._error = self._error, None
+
+        if error is not None:
+            raise error
+
+
+class PubSubBatchPublisher:
+    """Publishes any number of messages in request-sized chunks, sent concurrently.
+
+    Chunks are bounded by the Pub/Sub limits on the number of messages and on the
+    size of a publish request. Message IDs are returned in the order of the messages.
+    Each publishing thread sends its requests with its own copy of the adapter's
+    HTTP session.
+    """
+
+    def __init__(
+        self,
+        adapter: PubSubAdapter,
+        topic_name: str,
+        max_messages: int = consts.PUBSUB_MAX_PUBLISH_MESSAGES,
+        max_bytes: int = consts.PUBSUB_MAX_PUBLISH_BYTES,
+        max_workers: int = DEFAULT_PUBLISH_WORKERS,
+    ) -> None:
+        """Initialize the publisher.
+
+        Args:
+            adapter (PubSubAdapter): The adapter used to send the requests.
+            topic_name (str): The name of the topic to publish to.
+            max_messages (int): The maximum number of messages in each publish request.
+            max_bytes (int): The maximum size of the messages in each publish request.
+            max_workers (int): The number of publish requests sent concurrently.
+
+        """
+        self.adapter = adapter
+        self.topic_name = topic_name
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self.max_workers = max(1, max_workers)
+        self._thread_local = threading.local()
+
+    def publish(self, messages: Iterable[PubSubMessage | SingleJson]) -> list[str]:
+        """Publish messages to the topic.
+
+        If a chunk fails, its error is raised once the chunks already sent are done,
+        and the other chunks may have been published.
+
+        Args:
+            messages (Iterable[PubSubMessage | SingleJson]): The messages to publish.
+
+        Returns:
+            list[str]: The message IDs, in the order of the messages.
+
+        """
+        chunks = list(chunk_messages(messages, self.max_messages, self.max_bytes))
+        if len(chunks) <= 1 or self.max_workers == 1:
+            return [message_id for chunk in chunks for message_id in self._publish_chunk(chunk)]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as pool:
+            return [message_id for ids in pool.map(self._publish_chunk, chunks) for message_id in ids]
+
+    def _publish_chunk(self, chunk: list[SingleJson]) -> list[str]:
+        """Publish a single chunk of messages."""
+        return _get_thread_adapter(self._thread_local, self.adapter).publish(self.topic_name, chunk)
+
+
+def _get_thread_adapter(thread_local: threading.local, adapter: PubSubAdapter) -> PubSubAdapter:
+    """Get the copy of an adapter kept for the current thread, with its own HTTP session.
+
+    Args:
+        thread_local (threading.local): The per-thread storage of the copies.
+        adapter (PubSubAdapter): The adapter to copy.
+
+    Returns:
+        PubSubAdapter: The copy of the adapter for the current thread.
+
+    """
+    thread_adapter = getattr(thread_local, "adapter", None)
+    if thread_adapter is None:
+        thread_adapter = copy.copy(adapter)
+        thread_adapter.session = fork_session(adapter.session)
+        thread_local.adapter = thread_adapter
+
+    return thread_adapter
+
+
+def chunk_messages(
+    messages: Iterable[PubSubMessage | SingleJson],
+    max_messages: int = consts.PUBSUB_MAX_PUBLISH_MESSAGES,
+    max_bytes: int = consts.PUBSUB_MAX_PUBLISH_BYTES,
+) -> Iterator[list[SingleJson]]:
+    """Split messages into chunks that fit in a single publish request.
+
+    A message larger than `max_bytes` is put in a chunk of its own.
+
+    Args:
+        messages (Iterable[PubSubMessage | SingleJson]): The messages to split.
+        max_messages (int): The maximum number of messages in a chunk.
+        max_bytes (int): The maximum JSON size of the messages in a chunk.
+
+    Yields:
+        list[SingleJson]: The JSON payloads of the messages in each chunk.
+
+    """
+    chunk = []
+    chunk_bytes = 0
+    for message in messages:
+        payload = message.json() if isinstance(message, PubSubMessage) else message
+        size = len(json.dumps(payload, separators=(",", ":"))) + 1
+        if chunk and (len(chunk) >= max_messages or chunk_bytes + size > max_bytes):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+
+        chunk.append(payload)
+        chunk_bytes += size
+
+    if chunk:
+        yield chunk
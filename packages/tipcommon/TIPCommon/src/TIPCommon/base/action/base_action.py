@@ -23,6 +23,7 @@ from SiemplifyUtils import output_handler, unix_now
 
 from TIPCommon.base.interfaces import ApiClient, ScriptLogger
 from TIPCommon.base.utils import create_logger, create_params_container, create_soar_action, is_native, nativemethod
+from TIPCommon.deadline import RunDeadline, deadline_scope
 from TIPCommon.exceptions import (
     ActionSetupError,
     CaseResultError,
@@ -111,6 +112,7 @@ class Action(ABC, Generic[ApiClient]):
         api_client (Apiable): The api client of the integration
         name (str): The name of the script that is using this action.
         action_start_time (int): The starting time of the action
+        deadline (RunDeadline | None): The time budget of the action run.
         logger (SiemplifyLogger): The logger object used for logging in actions.
         params (Container): The parameters container for this connector.
 
@@ -407,32 +409,33 @@ class Action(ABC, Generic[ApiClient]):
 
         self.logger.info("-------------------- Main - Started --------------------")
         try:
-            try:
-                self._api_client: Contains[ApiClient] = self._init_api_clients()
+            with deadline_scope(self.deadline):
+                try:
+                    self._api_client: Contains[ApiClient] = self._init_api_clients()
 
-                if not is_native(self._validate_params):
-                    self.logger.info("Validating input parameters")
-                    self._validate_params()
+                    if not is_native(self._validate_params):
+                        self.logger.info("Validating input parameters")
+                        self._validate_params()
 
-            except Exception as e:
-                raise ActionSetupError(e) from e
+                except Exception as e:
+                    raise ActionSetupError(e) from e
 
-            if not is_native(self._get_entity_types):
-                self.logger.info("Setting entity types")
-                self.entity_types = self._get_entity_types()
+                if not is_native(self._get_entity_types):
+                    self.logger.info("Setting entity types")
+                    self.entity_types = self._get_entity_types()
 
-            if self.entity_types:
-                self.__entities_main_loop(
-                    perform_action_fn=self._perform_action,
-                )
+                if self.entity_types:
+                    self.__entities_main_loop(
+                        perform_action_fn=self._perform_action,
+                    )
 
-            else:
-                self.__no_entities_action(perform_action_fn=self._perform_action)
+                else:
+                    self.__no_entities_action(perform_action_fn=self._perform_action)
 
-            self.__create_entity_insights()
-            self.__create_case_insights()
+                self.__create_entity_insights()
+                self.__create_case_insights()
 
-            self.__send_json_results()
+                self.__send_json_results()
 
         except Exception as error:
             self.logger.info("-------------------- Main - Failed --------------------")
@@ -531,7 +534,12 @@ class Action(ABC, Generic[ApiClient]):
 
             # Checking timeout
             self.logger.info("Checking timeout")
-            approaching_timeout = is_approaching_action_timeout(self.soar_action.execution_deadline_unix_time_ms)
+            deadline = self.deadline
+            approaching_timeout = (
+                deadline.expired
+                if deadline is not None
+                else is_approaching_action_timeout(self.soar_action.execution_deadline_unix_time_ms)
+            )
             if approaching_timeout:
                 self.logger.info(f"Action {action_name} is approaching time out. Stopping execution gracefully")
                 if not is_native(self._handle_entity_loop_timeout):
@@ -1592,6 +1600,21 @@ class Action(ABC, Generic[ApiClient]):
         """
         return self._action_start_time
 
+    @property
+    def deadline(self) -> RunDeadline | None:
+        """Returns the time budget of the action run.
+
+        Returns:
+            A `RunDeadline` ending `ACTION_TIMEOUT_THRESHOLD_IN_SEC` seconds before
+            the action's execution deadline, or `None` if the deadline is unknown.
+
+        """
+        execution_deadline = getattr(self.soar_action, "execution_deadline_unix_time_ms", None)
+        if not isinstance(execution_deadline, int) or execution_deadline <= 0:
+            return None
+
+        return RunDeadline.from_action_deadline(execution_deadline)
+
     @property
     def logger(self) -> ScriptLogger:
         """Returns a NewLineLogger object for actions.
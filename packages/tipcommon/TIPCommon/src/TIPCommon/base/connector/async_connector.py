@@ -22,6 +22,7 @@ import SiemplifyUtils
 
 from TIPCommon.base.utils import async_output_handler, coros_to_tasks_with_limit, is_native, nativemethod
 from TIPCommon.consts import NUM_OF_MILLI_IN_SEC, TIMEOUT_THRESHOLD
+from TIPCommon.deadline import deadline_scope
 from TIPCommon.exceptions import ConnectorSetupError
 from TIPCommon.smp_time import save_timestamp
 
@@ -487,35 +488,36 @@ class AsyncConnector(BaseConnector, ABC):
         self.logger.info("------------------- Main - Started -------------------")
         processed_alerts = []
 
-        try:
+        with deadline_scope(self.deadline):
             try:
-                self.validate_params_wrapper()
-                self.read_context_wrapper()
-                self.logger.info("Initializing managers...")
-                self.init_managers()
-            except Exception as e:
-                raise ConnectorSetupError(e) from e
+                try:
+                    self.validate_params_wrapper()
+                    self.read_context_wrapper()
+                    self.logger.info("Initializing managers...")
+                    self.init_managers()
+                except Exception as e:
+                    raise ConnectorSetupError(e) from e
 
-            self.logger.info("Fetching data from manager and starting case ingestion...")
-            fetched_alerts = await self.get_alerts()
-            self.logger.info(f"Fetched {len(fetched_alerts)} alerts from the manager")
+                self.logger.info("Fetching data from manager and starting case ingestion...")
+                fetched_alerts = await self.get_alerts()
+                self.logger.info(f"Fetched {len(fetched_alerts)} alerts from the manager")
 
-            filtered_alerts = self.filter_alerts(fetched_alerts)
-            if not is_native(self.filter_alerts):
-                self.logger.info(f"Successfully filtered alerts. Filtered alerts count: {len(filtered_alerts)}")
+                filtered_alerts = self.filter_alerts(fetched_alerts)
+                if not is_native(self.filter_alerts):
+                    self.logger.info(f"Successfully filtered alerts. Filtered alerts count: {len(filtered_alerts)}")
 
-            self.logger.info("Starting to process alerts...")
-            processed_alerts, unprocessed_alerts = await self.process_alerts(filtered_alerts)
-            if not self.is_test_run:
-                self.write_context_wrapper(filtered_alerts, unprocessed_alerts)
+                self.logger.info("Starting to process alerts...")
+                processed_alerts, unprocessed_alerts = await self.process_alerts(filtered_alerts)
+                if not self.is_test_run:
+                    self.write_context_wrapper(filtered_alerts, unprocessed_alerts)
 
-        except Exception as e:
-            self.logger.error(f"{self.error_msg}")
-            self.logger.error(f"Error: {e}")
-            self.logger.exception(e)
+            except Exception as e:
+                self.logger.error(f"{self.error_msg}")
+                self.logger.error(f"Error: {e}")
+                self.logger.exception(e)
 
-            if self.is_test_run:
-                raise
+                if self.is_test_run:
+                    raise
 
         try:
             await self.finalize()
@@ -30,6 +30,7 @@ from TIPCommon.base.utils import (
 )
 from TIPCommon.consts import DATETIME_FORMAT, NONE_VALS, UNIX_FORMAT
 from TIPCommon.data_models import BaseAlert, ConnectorParamTypes, Container
+from TIPCommon.deadline import RunDeadline
 from TIPCommon.envcommon import EnvironmentHandle, GetEnvironmentCommonFactory
 from TIPCommon.exceptions import ConnectorSetupError
 from TIPCommon.smp_time import get_last_success_time
@@ -76,6 +77,7 @@ class BaseConnector(ABC):
             The Siemplify connector execution object.
         script_name (str): The name of the script that is using this connector.
         connector_start_time (int): The time at which the connector started.
+        deadline (RunDeadline | None): The time budget of the connector run.
         logger (str): The logger for this connector.
         is_test_run (bool): Whether this is a test run or not.
         params (Container): The parameters container for this connector.
@@ -130,6 +132,7 @@ class BaseConnector(ABC):
         self._vars = create_params_container()
         self._error_msg = "Got exception on main handler."
         self._env_common = None
+        self._deadline: RunDeadline | None = None
         self._perspectives()
 
     # Connector Properties ######################
@@ -145,6 +148,24 @@ class BaseConnector(ABC):
     def connector_start_time(self) -> int:
         return self._connector_start_time
 
+    @property
+    def deadline(self) -> RunDeadline | None:
+        """The time budget of the run, based on the Python Process Timeout parameter.
+
+        The budget ends at the same point `is_approaching_timeout` does with
+        the default threshold. It is `None` until the parameter is extracted.
+        """
+        if self._deadline is None:
+            try:
+                timeout = int(self.params.python_process_timeout)
+
+            except (AttributeError, TypeError, ValueError):
+                return None
+
+            self._deadline = RunDeadline.from_timeout(self.connector_start_time, timeout)
+
+        return self._deadline
+
     @property
     def logger(self) -> SiemplifyLogger:
         return self._logger
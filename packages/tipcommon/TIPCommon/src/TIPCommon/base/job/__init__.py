@@ -15,6 +15,7 @@
 from .base_job import *
 from .base_job_refresh_token import *
 from .base_sync_job import *
+from .case_writes import *
 from .consts import *
 from .data_models import *
 from .job_case import *
@@ -41,6 +41,7 @@ from TIPCommon.base.utils import (
 )
 from TIPCommon.consts import DATETIME_FORMAT, NONE_VALS, NUM_OF_MILLI_IN_SEC, UNIX_FORMAT
 from TIPCommon.data_models import Container, JobParamType
+from TIPCommon.deadline import RunDeadline, deadline_scope
 from TIPCommon.exceptions import JobSetupError, ParameterExtractionError
 from TIPCommon.extraction import extract_job_param
 from TIPCommon.rest.soar_api import get_installed_jobs
@@ -69,6 +70,11 @@ class Job(ABC, Generic[ApiClient]):
         logger: A logger from the soar_job object
         params: A descriptor that contains the parameters of the job
         error_msg: The error message to display on script failure.
+
+    Attributes:
+        deadline: The time budget of the job run. Jobs have no platform deadline,
+            so set it, e.g. with `RunDeadline.from_timeout(self.job_start_time, timeout)`,
+            to cap the job's requests and stop its work in time.
     """
 
     def __init__(self, name: str) -> None:
@@ -80,6 +86,7 @@ class Job(ABC, Generic[ApiClient]):
 
         self._job_start_time: int = -1
         self._error_msg: str = "Got exception on main handler."
+        self.deadline: RunDeadline | None = None
         self.name_id: str = f"{self.soar_job.script_name}_{self.soar_job.unique_identifier}"
 
         self._soar_job.script_name = self._name
@@ -215,7 +222,8 @@ class Job(ABC, Generic[ApiClient]):
             except Exception as e:
                 raise JobSetupError(e) from e
 
-            self._perform_job()
+            with deadline_scope(self.deadline):
+                self._perform_job()
 
         except Exception as error:
             self.logger.info("-------------------- Main - Failed --------------------")
@@ -14,10 +14,12 @@
 
 from __future__ import annotations
 
+import contextlib
 import itertools
 import json
 import math
 import operator
+import threading
 from abc import abstractmethod
 from typing import TYPE_CHECKING, Generic
 
@@ -25,12 +27,20 @@ from requests.exceptions import HTTPError, JSONDecodeError
 from SiemplifyUtils import convert_unixtime_to_datetime, unix_now
 
 from TIPCommon.base.interfaces import ApiClient
-from TIPCommon.base.utils import is_native, merge_ids_by_timestamp, nativemethod
+from TIPCommon.base.utils import (
+    fork_chronicle_soar,
+    is_native,
+    merge_ids_by_timestamp,
+    nativemethod,
+    prefetch_in_order,
+)
 from TIPCommon.consts import (
     CASE_ALERTS_LIMIT,
     COMMENTS_MODIFICATION_TIME_FILTER,
     INCREMENT_CASE_UPDATED_TIME_BY_MS,
+    JOB_PREFETCH_WORKERS,
     JOB_SYNC_LIMIT,
+    JOB_WRITE_WORKERS,
     MILLISECONDS_PER_DAY,
     TAGS_KEY,
     UNIX_FORMAT,
@@ -47,6 +57,7 @@ from TIPCommon.rest.soar_api import (
 from TIPCommon.soar_ops import get_user_by_id, get_users_profile_cards_with_pagination
 
 from .base_job import Job
+from .case_writes import CaseWrite, CaseWriteBatch, CaseWriteResult
 from .job_case import (
     JobAssigneeResult,
     JobCase,
@@ -59,6 +70,9 @@ if TYPE_CHECKING:
     from collections.abc import Iterator
     from typing import Any
 
+    from SiemplifyJob import SiemplifyJob
+
+    from TIPCommon.data_models import CaseDetails
     from TIPCommon.types import SingleJson, SyncData, SyncItem
 
 
@@ -76,6 +90,11 @@ class BaseSyncJob(Job, Generic[ApiClient]):
         self.context_identifier: str = context_identifier
         self.sync_limit: int = JOB_SYNC_LIMIT
         self.product_alerts_limit: int = CASE_ALERTS_LIMIT
+        self.prefetch_workers: int = JOB_PREFETCH_WORKERS
+        self.batch_case_writes: bool = False
+        self.write_workers: int = JOB_WRITE_WORKERS
+        self.case_writes: CaseWriteBatch | None = None
+        self.failed_case_ids: set[str] = set()
         self.processed_items: SyncData = {}
         self.last_run_time: int = 0
         self.current_run_latest_timestamp_ms: int = 0
@@ -84,6 +103,7 @@ class BaseSyncJob(Job, Generic[ApiClient]):
         self.sorted_modified_ids: list[tuple[str, int]] = []
         self.job_completed_successfully: bool = False
         self._cached_unix_now: int = 0
+        self._prefetch_local: threading.local = threading.local()
 
     # Abstract methods for standard synchronization actions
     @abstractmethod
@@ -352,45 +372,96 @@ class BaseSyncJob(Job, Generic[ApiClient]):
         total_alerts_accumulated = 0
         final_prepared_ids = []
 
-        for case_id, modification_time in potential_cases:
-            try:
-                case_details = get_case_overview_details(
-                    self.soar_job,
-                    case_id,
-                    case_expand=["tags"],
-                    alert_expand=["ClosureDetails"],
-                )
-                alert_count = len(case_details.alerts)
-                if self.product_alerts_limit and total_alerts_accumulated + alert_count > (self.product_alerts_limit):
-                    if total_alerts_accumulated == 0:
-                        self.logger.info(
-                            f"Case {case_id} has {alert_count} alerts, exceeding "
-                            f"the limit ({self.product_alerts_limit}) alone. "
-                            "Processing anyway to ensure progress."
-                        )
-                    else:
-                        self.logger.info(
-                            "Alert limit reached "
-                            f"({total_alerts_accumulated}/{self.product_alerts_limit}). "
-                            f"Skipping case {case_id} with {alert_count} alerts for next run."
-                        )
-                        break
+        prefetched_cases = prefetch_in_order(potential_cases, self._fetch_case_details, self.prefetch_workers)
+        with contextlib.closing(prefetched_cases):
+            for (case_id, modification_time), case_details_future in prefetched_cases:
+                try:
+                    case_details = case_details_future.result()
+                    alert_count = len(case_details.alerts)
+                    if self.product_alerts_limit and total_alerts_accumulated + alert_count > (
+                        self.product_alerts_limit
+                    ):
+                        if total_alerts_accumulated == 0:
+                            self.logger.info(
+                                f"Case {case_id} has {alert_count} alerts, exceeding "
+                                f"the limit ({self.product_alerts_limit}) alone. "
+                                "Processing anyway to ensure progress."
+                            )
+                        else:
+                            self.logger.info(
+                                "Alert limit reached "
+                                f"({total_alerts_accumulated}/{self.product_alerts_limit}). "
+                                f"Skipping case {case_id} with {alert_count} alerts for next run."
+                            )
+                            break
+
+                    case_details.alerts = list(reversed(case_details.alerts))
+                    total_alerts_accumulated += alert_count
+                    job_case = JobCase(case_detail=case_details, modification_time=modification_time)
+                    incident_ids = self._extract_product_ids_from_case(job_case)
+
+                    if incident_ids:
+                        self.processed_items[case_id] = incident_ids
+                        final_prepared_cases.append(job_case)
+                        final_prepared_ids.append((case_id, modification_time))
+
+                except (HTTPError, JSONDecodeError) as e:
+                    self.logger.info(f"Could not retrieve details for new case {case_id}. Skipping. Error: {e}")
+        self.sorted_modified_ids = final_prepared_ids
 
-                case_details.alerts = list(reversed(case_details.alerts))
-                total_alerts_accumulated += alert_count
-                job_case = JobCase(case_detail=case_details, modification_time=modification_time)
-                incident_ids = self._extract_product_ids_from_case(job_case)
+        return final_prepared_cases
 
-                if incident_ids:
-                    self.processed_items[case_id] = incident_ids
-                    final_prepared_cases.append(job_case)
-                    final_prepared_ids.append((case_id, modification_time))
+    def _fetch_case_details(self, case: tuple[str, int]) -> CaseDetails:
+        """Fetches the details of a candidate case, including its tags and alerts' closure details.
 
-            except (HTTPError, JSONDecodeError) as e:
-                self.logger.info(f"Could not retrieve details for new case {case_id}. Skipping. Error: {e}")
-        self.sorted_modified_ids = final_prepared_ids
+        The case is parsed lazily, so its wall data, entities and alert field
+        groups are only parsed if a sync job reads them. It runs in a prefetch
+        thread, so it calls the SOAR API with the thread's own SDK session.
 
-        return final_prepared_cases
+        Args:
+            case (tuple[str, int]): The case ID and its modification timestamp.
+
+        Returns:
+            CaseDetails: The details of the case.
+
+        """
+        case_id, _ = case
+        return get_case_overview_details(
+            self._get_prefetch_soar_job(),
+            case_id,
+            case_expand=["tags"],
+            alert_expand=["ClosureDetails"],
+            lazy=True,
+        )
+
+    def _fetch_case_comments(self, job_case: JobCase) -> list[Any]:
+        """Fetches the case comments modified since the last run, with the prefetch thread's SDK session.
+
+        Args:
+            job_case (JobCase): The JobCase object to fetch the comments of.
+
+        Returns:
+            list[Any]: The comments of the case.
+
+        """
+        return self._get_prefetch_soar_job().fetch_case_comments(
+            case_id=job_case.case_detail.id_,
+            time_filter_type=COMMENTS_MODIFICATION_TIME_FILTER,
+            from_timestamp=self.last_run_time,
+        )
+
+    def _get_prefetch_soar_job(self) -> SiemplifyJob:
+        """Gets the SDK object of the current prefetch thread, with its own HTTP session.
+
+        Returns:
+            SiemplifyJob: A fork of the job's SDK object, created once per thread.
+
+        """
+        soar_job = getattr(self._prefetch_local, "soar_job", None)
+        if soar_job is None:
+            soar_job = self._prefetch_local.soar_job = fork_chronicle_soar(self.soar_job)
+
+        return soar_job
 
     def _get_case_ids_by_timestamp(self, ids: list[str] | None = None) -> list[tuple[str, int]]:
         """Fetches all relevant case IDs by timestamp range, filters them by tags.
@@ -460,6 +531,10 @@ class BaseSyncJob(Job, Generic[ApiClient]):
         for comment in comments:
             alert_identifier = comment.split(":")[0]
             comment = comment.replace(f"{alert_identifier}:", "", 1)
+            if self.case_writes is not None:
+                self.case_writes.add_comment(case_id, comment, alert_identifier)
+                continue
+
             self.soar_job.add_comment(
                 case_id=case_id,
                 comment=comment,
@@ -505,6 +580,11 @@ class BaseSyncJob(Job, Generic[ApiClient]):
             tags (ProductTagsData): An object containing the tags to add and remove for syncing.
 
         """
+        if self.case_writes is not None:
+            self.case_writes.add_tags(case_id, tags.tags_to_add)
+            self.case_writes.remove_tags(case_id, tags.tags_to_remove)
+            return
+
         if tags.tags_to_add:
             add_tags_to_case_in_bulk(self.soar_job, [case_id], tags.tags_to_add)
             self.logger.info(f"Successfully added tags to case {case_id}.")
@@ -587,6 +667,10 @@ class BaseSyncJob(Job, Generic[ApiClient]):
             user_display_name (str): The display name of the user to assign to the case.
 
         """
+        if self.case_writes is not None:
+            self.case_writes.assign(case_id, alert_id, user_display_name)
+            return
+
         self.soar_job.assign_case(user_display_name, case_id, alert_id)
         self.logger.info(f"Successfully synced assignee to case {case_id}.")
 
@@ -606,6 +690,10 @@ class BaseSyncJob(Job, Generic[ApiClient]):
             new_priority (str): The new priority for the alert.
 
         """
+        if self.case_writes is not None:
+            self.case_writes.set_alert_priority(case_id, alert_identifier, alert_name, new_priority)
+            return
+
         try:
             set_alert_priority(self.soar_job, case_id, alert_identifier, alert_name, new_priority)
             self.logger.info(f"Successfully updated alert {alert_identifier} priority to {new_priority}.")
@@ -643,27 +731,48 @@ class BaseSyncJob(Job, Generic[ApiClient]):
             self.last_run_time: int = self.get_last_run_time()
             self.current_run_latest_timestamp_ms = self.last_run_time
             self.processed_items = self._read_ids()
+            if self.batch_case_writes:
+                self.case_writes = CaseWriteBatch(self.soar_job, self.write_workers)
+
             self.job_cases_to_sync = self._get_cases_to_sync()
             case_ids = [job_case.case_detail.id_ for job_case in self.job_cases_to_sync]
             self.logger.info(f"Found {len(self.job_cases_to_sync)} case ids to sync: {case_ids}")
 
-            for job_case in self.job_cases_to_sync:
-                job_case.case_comments = self.soar_job.fetch_case_comments(
-                    case_id=job_case.case_detail.id_,
-                    time_filter_type=COMMENTS_MODIFICATION_TIME_FILTER,
-                    from_timestamp=self.last_run_time,
-                )
-                self.map_product_data_to_case(job_case=job_case)
-                if not is_native(self.sync_comments):
-                    self.sync_comments(job_case)
-                if not is_native(self.sync_tags):
-                    self.sync_tags(job_case)
-                if not is_native(self.sync_severity):
-                    self.sync_severity(job_case)
-                if not is_native(self.sync_assignee):
-                    self.sync_assignee(job_case)
-                if not is_native(self.sync_status):
-                    self.sync_status(job_case)
+            # Comments of the next cases are fetched while the current case is synced
+            prefetched_comments = prefetch_in_order(
+                self.job_cases_to_sync,
+                self._fetch_case_comments,
+                self.prefetch_workers,
+            )
+            with contextlib.closing(prefetched_comments):
+                for index, (job_case, comments_future) in enumerate(prefetched_comments):
+                    if self.deadline is not None and self.deadline.expired:
+                        self.logger.info(
+                            f"The job's time budget ran out. {len(self.job_cases_to_sync) - index} cases "
+                            "are left for the next run."
+                        )
+                        self.sorted_modified_ids = self.sorted_modified_ids[:index]
+                        break
+
+                    job_case.case_comments = comments_future.result()
+                    self.map_product_data_to_case(job_case=job_case)
+                    if not is_native(self.sync_comments):
+                        self.sync_comments(job_case)
+                    if not is_native(self.sync_tags):
+                        self.sync_tags(job_case)
+                    if not is_native(self.sync_severity):
+                        self.sync_severity(job_case)
+                    if not is_native(self.sync_assignee):
+                        self.sync_assignee(job_case)
+                    if not is_native(self.sync_status):
+                        self.sync_status(job_case)
+
+            if self.case_writes is not None:
+                if self.deadline is not None and self.deadline.expired:
+                    self._handle_discarded_case_writes(self.case_writes.discard())
+
+                else:
+                    self._handle_case_write_results(self.case_writes.flush())
 
             self.job_completed_successfully = True
 
@@ -675,12 +784,70 @@ class BaseSyncJob(Job, Generic[ApiClient]):
         finally:
             self._finalize_job()
 
+    def _handle_case_write_results(self, results: list[CaseWriteResult]) -> None:
+        """Logs the results of the batched case writes and records the cases that failed.
+
+        Args:
+            results (list[CaseWriteResult]): The results of the flushed case writes.
+
+        """
+        synced_case_ids: set[str] = set()
+        for result in results:
+            case_id = str(result.write.case_id)
+            if result.succeeded:
+                synced_case_ids.add(case_id)
+                continue
+
+            self.failed_case_ids.add(case_id)
+            self.logger.error(
+                f"Failed to {result.write.type_.value.replace('_', ' ')} in case {case_id}: {result.error}"
+            )
+
+        self.logger.info(
+            f"Flushed {len(results)} case writes. "
+            f"Synced cases: {sorted(synced_case_ids - self.failed_case_ids)}, "
+            f"failed cases: {sorted(self.failed_case_ids)}"
+        )
+
+    def _handle_discarded_case_writes(self, writes: list[CaseWrite]) -> None:
+        """Records the cases of case writes left unflushed when the time budget ran out.
+
+        Args:
+            writes (list[CaseWrite]): The discarded case writes.
+
+        """
+        discarded_case_ids = {str(write.case_id) for write in writes}
+        self.failed_case_ids.update(discarded_case_ids)
+        self.logger.info(
+            f"The job's time budget ran out before {len(writes)} case writes were flushed. "
+            f"Cases left for the next run: {sorted(discarded_case_ids)}"
+        )
+
+    def _get_latest_synced_timestamp(self) -> int:
+        """Gets the modification time up to which all cases of the run were synced.
+
+        A case with failed writes, and every case modified after it, are picked up
+        again in the next run.
+
+        Returns:
+            int: The modification time of the last case synced without failures.
+
+        """
+        latest_timestamp = self.current_run_latest_timestamp_ms
+        for case_id, modification_time in self.sorted_modified_ids:
+            if str(case_id) in self.failed_case_ids:
+                break
+
+            latest_timestamp = modification_time
+
+        return latest_timestamp
+
     def _finalize_job(self) -> None:
         """Perform final steps before the job script ends."""
         self._write_ids(self.processed_items)
 
         if self.job_completed_successfully and len(self.sorted_modified_ids) > 0:
-            self.current_run_latest_timestamp_ms = self.sorted_modified_ids[-1][1]
+            self.current_run_latest_timestamp_ms = self._get_latest_synced_timestamp()
         latest_time = self.current_run_latest_timestamp_ms
         self._save_timestamp_by_unique_id(new_timestamp=latest_time)
         self.logger.info(
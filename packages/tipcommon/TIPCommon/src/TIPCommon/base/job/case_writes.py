@@ -0,0 +1,221 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from TIPCommon.base.utils import fork_chronicle_soar
+from TIPCommon.consts import JOB_WRITE_WORKERS
+from TIPCommon.rest.soar_api import add_tags_to_case_in_bulk, remove_case_tag, set_alert_priority
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from SiemplifyJob import SiemplifyJob
+
+
+class CaseWriteType(Enum):
+    """The case mutations a sync job can batch."""
+
+    ADD_TAG = "add_tag"
+    REMOVE_TAG = "remove_tag"
+    ADD_COMMENT = "add_comment"
+    SET_ALERT_PRIORITY = "set_alert_priority"
+    ASSIGN = "assign"
+
+
+class CaseWrite(NamedTuple):
+    """A single pending case mutation."""
+
+    type_: CaseWriteType
+    case_id: int | str
+    value: Any
+    alert_identifier: str | None = None
+    alert_name: str | None = None
+
+
+class CaseWriteResult(NamedTuple):
+    """The outcome of a flushed case mutation."""
+
+    write: CaseWrite
+    error: Exception | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+class CaseWriteBatch:
+    """Accumulates case mutations of a sync job run and flushes them together.
+
+    Tags added to cases are grouped into as few bulk add calls as possible.
+    Mutations without a bulk endpoint are run concurrently across cases by a
+    bounded thread pool, while the mutations of a single case keep their order,
+    so comments appear on the case wall in the order they were added. A tag
+    that is both added to and removed from a case is not added in bulk, so
+    its writes also run in the order they were queued. Each worker thread
+    uses its own fork of the SDK object, and the writes run in copies of the
+    flushing thread's context, so they follow the run deadline in scope.
+
+    Example:
+        >>> batch = CaseWriteBatch(soar_job)
+        >>> batch.add_tags(case_id, ["Synced"])
+        >>> batch.add_comment(case_id, "Closed in product", alert_identifier)
+        >>> failed = [r for r in batch.flush() if not r.succeeded]
+
+    """
+
+    def __init__(self, soar_job: SiemplifyJob, max_workers: int = JOB_WRITE_WORKERS) -> None:
+        self.soar_job: SiemplifyJob = soar_job
+        self.max_workers: int = max_workers
+        self._writes: list[CaseWrite] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._writes)
+
+    def add_tags(self, case_id: int | str, tags: list[str]) -> None:
+        """Queue tags to add to a case."""
+        self._add(CaseWrite(CaseWriteType.ADD_TAG, case_id, tag) for tag in tags)
+
+    def remove_tags(self, case_id: int | str, tags: list[str]) -> None:
+        """Queue tags to remove from a case."""
+        self._add(CaseWrite(CaseWriteType.REMOVE_TAG, case_id, tag) for tag in tags)
+
+    def add_comment(self, case_id: int | str, comment: str, alert_identifier: str | None = None) -> None:
+        """Queue a comment to add to a case or one of its alerts."""
+        self._add([CaseWrite(CaseWriteType.ADD_COMMENT, case_id, comment, alert_identifier)])
+
+    def set_alert_priority(
+        self,
+        case_id: int | str,
+        alert_identifier: str,
+        alert_name: str,
+        priority: int | str,
+    ) -> None:
+        """Queue a priority change of an alert."""
+        self._add([CaseWrite(CaseWriteType.SET_ALERT_PRIORITY, case_id, priority, alert_identifier, alert_name)])
+
+    def assign(self, case_id: int | str, alert_identifier: str, user_display_name: str) -> None:
+        """Queue an assignee change of a case."""
+        self._add([CaseWrite(CaseWriteType.ASSIGN, case_id, user_display_name, alert_identifier)])
+
+    def flush(self) -> list[CaseWriteResult]:
+        """Run all queued mutations and clear the queue.
+
+        Errors don't stop the flush. Each mutation's error is reported in its
+        result instead.
+
+        Returns:
+            list[CaseWriteResult]: The result of each mutation, in queue order.
+
+        """
+        with self._lock:
+            writes, self._writes = self._writes, []
+
+        if not writes:
+            return []
+
+        errors: dict[int, Exception] = {}
+        tags_by_case: dict[int | str, list[int]] = {}
+        writes_by_case: dict[int | str, list[int]] = {}
+        removed_tags = {(write.case_id, write.value) for write in writes if write.type_ is CaseWriteType.REMOVE_TAG}
+        for index, write in enumerate(writes):
+            in_bulk = write.type_ is CaseWriteType.ADD_TAG and (write.case_id, write.value) not in removed_tags
+            group = tags_by_case if in_bulk else writes_by_case
+            group.setdefault(write.case_id, []).append(index)
+
+        cases_by_tags: dict[tuple[str, ...], list[int | str]] = {}
+        for case_id, indexes in tags_by_case.items():
+            tags = tuple(dict.fromkeys(writes[i].value for i in indexes))
+            cases_by_tags.setdefault(tags, []).append(case_id)
+
+        for tags, case_ids in cases_by_tags.items():
+            try:
+                add_tags_to_case_in_bulk(self.soar_job, case_ids, list(tags))
+
+            except Exception as e:  # ruff:ignore[blind-except]
+                for case_id in case_ids:
+                    errors.update(dict.fromkeys(tags_by_case[case_id], e))
+
+        thread_local = threading.local()
+
+        def run_case_writes(indexes: list[int]) -> dict[int, Exception]:
+            soar_job = getattr(thread_local, "soar_job", None)
+            if soar_job is None:
+                soar_job = thread_local.soar_job = fork_chronicle_soar(self.soar_job)
+
+            case_errors: dict[int, Exception] = {}
+            for i in indexes:
+                try:
+                    self._run(soar_job, writes[i])
+
+                except Exception as e:  # ruff:ignore[blind-except]
+                    case_errors[i] = e
+
+            return case_errors
+
+        if writes_by_case:
+            workers = max(1, min(self.max_workers, len(writes_by_case)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(contextvars.copy_context().run, run_case_writes, indexes)
+                    for indexes in writes_by_case.values()
+                ]
+                for future in futures:
+                    errors.update(future.result())
+
+        return [CaseWriteResult(write, errors.get(index)) for index, write in enumerate(writes)]
+
+    def discard(self) -> list[CaseWrite]:
+        """Clear the queue without running the queued mutations.
+
+        Returns:
+            list[CaseWrite]: The discarded mutations, in queue order.
+
+        """
+        with self._lock:
+            writes, self._writes = self._writes, []
+
+        return writes
+
+    def _add(self, writes: Iterable[CaseWrite]) -> None:
+        with self._lock:
+            self._writes.extend(writes)
+
+    @staticmethod
+    def _run(soar_job: SiemplifyJob, write: CaseWrite) -> None:
+        if write.type_ is CaseWriteType.ADD_TAG:
+            add_tags_to_case_in_bulk(soar_job, [write.case_id], [write.value])
+
+        elif write.type_ is CaseWriteType.REMOVE_TAG:
+            remove_case_tag(chronicle_soar=soar_job, case_id=write.case_id, tag=write.value)
+
+        elif write.type_ is CaseWriteType.ADD_COMMENT:
+            soar_job.add_comment(
+                case_id=write.case_id,
+                comment=write.value,
+                alert_identifier=write.alert_identifier,
+            )
+
+        elif write.type_ is CaseWriteType.SET_ALERT_PRIORITY:
+            set_alert_priority(soar_job, write.case_id, write.alert_identifier, write.alert_name, write.value)
+
+        elif write.type_ is CaseWriteType.ASSIGN:
+            soar_job.assign_case(write.value, write.case_id, write.alert_identifier)
@@ -186,11 +186,9 @@ class JobCase:
             SingleJson | None: The corresponding product incident if found, otherwise None.
 
         """
-        for product_id, alert in self.product_ids_from_secops_alerts.items():
-            if product_id == alert_id and hasattr(alert, "incident"):
-                return alert.incident
+        alert = self.product_ids_from_secops_alerts.get(alert_id)
 
-        return None
+        return getattr(alert, "incident", None)
 
     def add_product_comment(
         self,
@@ -210,9 +208,10 @@ class JobCase:
         product_comments = [comment]
         matched_incident = next(
             (
-                alert.incident
+                incident
                 for alert in self.case_detail.alerts
-                if getattr(alert.incident, product_key) == incident_id
+                if (incident := getattr(alert, "incident", None)) is not None
+                and getattr(incident, product_key) == incident_id
             ),
             None,
         )
@@ -247,8 +246,8 @@ class JobCase:
             product.
 
         """
-        case_hashes = self.get_case_comments_hashes()
-        product_hashes = self.get_product_comments_hashes()
+        case_hashes = set(self.get_case_comments_hashes())
+        product_hashes = set(self.get_product_comments_hashes())
 
         return JobCommentsResult(
             product_comments_sync_to_case=self._collect_product_comments_to_sync_to_case(
@@ -271,7 +270,7 @@ class JobCase:
         case_prefix: str,
         comment_key: str,
         incident_key: str,
-        case_hashes: list[str],
+        case_hashes: set[str],
     ) -> list[str]:
         """Collects comments from product incidents that should be synced to the case.
 
@@ -282,7 +281,7 @@ class JobCase:
             incident.
             incident_key (str): The key to use for fetching the incident identifier from the product
             incident.
-            case_hashes (list[str]): A list of hashes of existing case comments to avoid duplicates.
+            case_hashes (set[str]): The hashes of existing case comments to avoid duplicates.
 
         Returns:
             list[str]: A list of formatted comments to sync to the case.
@@ -315,14 +314,14 @@ class JobCase:
         self,
         case_prefix: str,
         product_prefix: str,
-        product_hashes: list[str],
+        product_hashes: set[str],
     ) -> list[str]:
         """Collects comments from the case that should be synced to product incidents.
 
         Args:
             case_prefix (str): The prefix to add to comments originating from the case.
             product_prefix (str): The prefix used to identify comments originating from the product.
-            product_hashes (list[str]): A list of hashes of existing product comments
+            product_hashes (set[str]): The hashes of existing product comments
             to avoid duplicates.
 
         Returns:
@@ -438,6 +437,7 @@ class JobCase:
         """
         all_tags = self.__get_all_product_tags(product_properties_key=product_properties_key, tags_key=tags_key)
         incident_to_update_tags = []
+        all_tags_set = set(all_tags)
 
         for alert in self.case_detail.alerts:
             if not hasattr(alert, "incident") or alert.incident is None:
@@ -445,8 +445,7 @@ class JobCase:
             incident = alert.incident
             tags = set(getattr(incident, tags_key, []))
             tags = [getattr(tag, tags_name, None) or tag for tag in tags]
-            tags_to_update = set(all_tags).difference(tags)
-            if tags_to_update:
+            if not all_tags_set.issubset(tags):
                 incident_to_update_tags.append(incident)
 
         return incident_to_update_tags, all_tags
@@ -672,11 +671,12 @@ class JobCase:
 
         """
         new_tags = []
+        existing = set(existing_tags)
         for tag in source_tags:
             stripped_tag = tag.strip()
             if self._is_tag_valid(stripped_tag, prefix_to_exclude, tag_to_exclude, min_len, max_len):
                 prefixed_tag = f"{prefix_to_add}{stripped_tag}"
-                if prefixed_tag not in existing_tags:
+                if prefixed_tag not in existing:
                     new_tags.append(prefixed_tag)
 
         return new_tags
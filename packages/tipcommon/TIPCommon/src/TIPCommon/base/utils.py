@@ -15,9 +15,13 @@
 from __future__ import annotations
 
 import asyncio
+import collections
+import contextvars
+import copy
 import operator
 import sys
-from typing import TYPE_CHECKING
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, TypeVar
 
 import requests
 import SiemplifyVaultUtils
@@ -27,12 +31,14 @@ from SiemplifyJob import SiemplifyJob
 from SiemplifyUtils import my_stdout
 
 from TIPCommon.data_models import Container
+from TIPCommon.deadline import bind_session
 from TIPCommon.exceptions import ActionSetupError
+from TIPCommon.rest.httplib import fork_session
 
 from .interfaces.logger import Logger, ScriptLogger
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine, Iterable
+    from collections.abc import Callable, Coroutine, Iterable, Iterator
     from typing import Any
 
     from SiemplifyLogger import SiemplifyLogger
@@ -40,10 +46,16 @@ if TYPE_CHECKING:
     from TIPCommon.types import ChronicleSOAR, Entity, GeneralFunction, SingleJson
 
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+_C = TypeVar("_C", bound="ChronicleSOAR")
+
+
 class CreateSession:
     @staticmethod
     def create_session() -> requests.Session:
-        return requests.Session()
+        """Create a session whose requests are capped by the run's deadline, if any."""
+        return bind_session(requests.Session())
 
 
 def create_soar_action() -> SiemplifyAction:
@@ -149,6 +161,65 @@ def coros_to_tasks_with_limit(coros: Iterable[Coroutine], limit: int) -> list[as
     return [asyncio.create_task(await_coro(coro)) for coro in coros]
 
 
+def prefetch_in_order(
+    items: Iterable[_T],
+    fetch: Callable[[_T], _R],
+    max_workers: int,
+) -> Iterator[tuple[_T, Future[_R]]]:
+    """Run a blocking fetch for each item in a thread pool and yield the results in order.
+
+    Up to twice `max_workers` items are fetched ahead of the consumer, so the
+    consumer's work on one item overlaps with the fetching of the next ones.
+    Fetches that have not started yet are cancelled when the generator is closed.
+    Each fetch runs in a copy of the consumer's context, so it follows the run
+    deadline and any other context variable set where the items are consumed.
+
+    Args:
+        items (Iterable[_T]): The items to fetch, in the order they should be yielded.
+        fetch (Callable[[_T], _R]): The blocking function fetching a single item.
+        max_workers (int): The maximum number of concurrent fetches.
+
+    Yields:
+        tuple[_T, Future[_R]]: Each item with the completed or pending future of its
+        fetch. Calling `result()` re-raises the fetch's error, if any.
+
+    """
+    window: int = max(1, max_workers) * 2
+    pending: collections.deque[tuple[_T, Future[_R]]] = collections.deque()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        try:
+            for item in items:
+                pending.append((item, pool.submit(contextvars.copy_context().run, fetch, item)))
+                if len(pending) >= window:
+                    yield pending.popleft()
+
+            while pending:
+                yield pending.popleft()
+
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def fork_chronicle_soar(chronicle_soar: _C) -> _C:
+    """Create a copy of a ChronicleSOAR object with its own HTTP session.
+
+    Some SOAR API calls change the session's headers while they run, so each
+    thread calling the SOAR API concurrently with others needs its own fork.
+    See `fork_session` for the settings the new session keeps.
+
+    Args:
+        chronicle_soar (ChronicleSOAR): The SDK object to fork.
+
+    Returns:
+        ChronicleSOAR: A shallow copy of the SDK object with a new session.
+
+    """
+    forked = copy.copy(chronicle_soar)
+    forked.session = fork_session(chronicle_soar.session)
+    return forked
+
+
 def async_output_handler(func):
     """Wrap script execution coroutine to catch exceptions and provide proper output."""
 
@@ -64,6 +64,9 @@ SIEM_ID_ATTR_KEY = "siem_alert_id"
 IDS_DB_KEY = "ids"
 IDS_FILE_NAME = "ids.json"
 
+SEGMENTED_STREAM_MAX_DELTA_SEGMENTS = 16
+SEGMENTED_STREAM_SEGMENT_MAX_ENTRIES = 10_000
+
 NONE_VALS = [None, "", [], {}, ()]
 
 ENTITY_OG_ID_KEY = "OriginalIdentifier"
@@ -101,6 +104,8 @@ COMMENTS_MODIFICATION_TIME_FILTER: int = 1
 JOB_MIN_TAG_LEN: int = 2
 JOB_MAX_TAG_LEN: int = 100
 CASE_ALERTS_LIMIT: int = 30
+JOB_PREFETCH_WORKERS: int = 4
+JOB_WRITE_WORKERS: int = 4
 TAGS_KEY: str = "tags"
 MILLISECONDS_PER_DAY: float = 86400000.0
 CASE_STATUS_CHANGE_ACTIVITY: int = 1
@@ -35,6 +35,7 @@ from SiemplifyConnectorsDataModel import ConnectorContext
 
 if TYPE_CHECKING:
     import email
+    from collections.abc import Callable
 
     import SiemplifyVault
 
@@ -59,6 +60,36 @@ class TypedContainer(Generic[T]):
         return item in self._params
 
 
+class _LazySection:
+    """Attribute parsed from the instance's `raw_data` on first access.
+
+    The parsed value is cached in the `_<name>` slot of the owner class, so
+    sections that are never read are never parsed.
+    """
+
+    def __init__(self, parse: Callable[[SingleJson], Any]) -> None:
+        self._parse = parse
+        self._slot = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._slot = owner.__dict__[f"_{name}"]
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            return self._slot.__get__(instance, owner)
+
+        except AttributeError:
+            value = self._parse(instance.raw_data)
+            self._slot.__set__(instance, value)
+            return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self._slot.__set__(instance, value)
+
+
 class BaseDataModel:
     """Represents a base data model. It has the following properties:
 
@@ -517,20 +548,65 @@ class AlertEvent:
     @classmethod
     def from_json(cls, event_json):
         # type: (SingleJson) -> AlertEvent
-        return cls(
-            fields=[EventPropertyField.from_json(field) for field in event_json["fields"]],
-            identifier=event_json["identifier"],
-            case_id=event_json["caseId"],
-            alert_identifier=event_json["alertIdentifier"],
-            name=event_json["name"],
-            product=event_json["product"],
-            port=event_json["port"],
-            source_system_name=event_json["sourceSystemName"],
-            outcome=event_json["outcome"],
-            time=event_json["time"],
-            type_=event_json["type"],
-            artifact_entities=event_json["artifactEntities"],
-        )
+        return cls(fields=_parse_event_fields(event_json), **_alert_event_scalars(event_json))
+
+
+def _alert_event_scalars(event_json):
+    # type: (SingleJson) -> SingleJson
+    return {
+        "identifier": event_json["identifier"],
+        "case_id": event_json["caseId"],
+        "alert_identifier": event_json["alertIdentifier"],
+        "name": event_json["name"],
+        "product": event_json["product"],
+        "port": event_json["port"],
+        "source_system_name": event_json["sourceSystemName"],
+        "outcome": event_json["outcome"],
+        "time": event_json["time"],
+        "type_": event_json["type"],
+        "artifact_entities": event_json["artifactEntities"],
+    }
+
+
+def _parse_event_fields(event_json):
+    # type: (SingleJson) -> list[EventPropertyField]
+    return [EventPropertyField.from_json(field) for field in event_json["fields"]]
+
+
+class LazyAlertEvent(AlertEvent):
+    """AlertEvent that parses its event property fields on first access.
+
+    The raw event JSON is kept in `raw_data`.
+    """
+
+    __slots__ = (
+        "_fields",
+        "alert_identifier",
+        "artifact_entities",
+        "case_id",
+        "identifier",
+        "name",
+        "outcome",
+        "port",
+        "product",
+        "raw_data",
+        "source_system_name",
+        "time",
+        "type_",
+    )
+
+    fields = _LazySection(_parse_event_fields)
+
+    def __init__(self, raw_data):
+        # type: (SingleJson) -> None
+        self.raw_data = raw_data
+        for name, value in _alert_event_scalars(raw_data).items():
+            setattr(self, name, value)
+
+    @classmethod
+    def from_json(cls, event_json):
+        # type: (SingleJson) -> LazyAlertEvent
+        return cls(event_json)
 
 
 class FieldGroupItem:
@@ -623,6 +699,64 @@ class SLA:
         }
 
 
+def _alert_card_scalars(alert_card_json):
+    # type: (SingleJson) -> SingleJson
+    raw_priority = alert_card_json.get("priority")
+    priority = raw_priority
+    if isinstance(raw_priority, str) and raw_priority.isdigit():
+        priority = int(raw_priority)
+
+    add_props = alert_card_json.get("additionalProperties")
+    if isinstance(add_props, dict):
+        add_props = json.dumps(add_props)
+
+    return {
+        "id_": alert_card_json.get("id", 0),
+        "creation_time_unix_time_ms": alert_card_json.get("creationTimeUnixTimeInMs", 0),
+        "modification_time_unix_time_ms": alert_card_json.get("modificationTimeUnixTimeInMs", 0),
+        "identifier": alert_card_json.get("identifier", ""),
+        "status": alert_card_json.get("status", 0),
+        "name": alert_card_json.get("displayName", alert_card_json.get("name", "")),
+        "priority": priority,
+        "workflow_status": alert_card_json.get("workflowsStatus", alert_card_json.get("playbookStatus")),
+        "sla_expiration_unix_time": alert_card_json.get("slaExpirationUnixTime"),
+        "sla_critical_expiration_unix_time": alert_card_json.get("slaCriticalExpirationUnixTime"),
+        "start_time": alert_card_json.get("startTime", alert_card_json.get("startTimeUnixTimeInMs", 0)),
+        "end_time": alert_card_json.get("endTime", 0),
+        "alert_group_identifier": alert_card_json.get("alertGroupIdentifier", ""),
+        "events_count": alert_card_json.get("eventsCount", alert_card_json.get("eventCount", 0)),
+        "title": (alert_card_json.get("title") or alert_card_json.get("displayName", "")),
+        "rule_generator": alert_card_json.get("ruleGenerator", ""),
+        "device_product": alert_card_json.get("product", alert_card_json.get("deviceProduct")),
+        "device_vendor": alert_card_json.get("vendor", alert_card_json.get("deviceVendor")),
+        "playbook_attached": alert_card_json.get("playbookAttached"),
+        "playbook_run_count": (alert_card_json.get("playbookRunCount") or alert_card_json.get("playbook_run_count")),
+        "is_manual_alert": alert_card_json.get("isManualAlert", alert_card_json.get("manual")),
+        "source_url": alert_card_json.get("sourceUrl"),
+        "source_rule_url": alert_card_json.get("sourceRuleUrl"),
+        "siem_alert_id": alert_card_json.get("siemAlertId"),
+        "additional_properties": add_props,
+        "case_id": alert_card_json.get("caseId"),
+        "ticket_id": alert_card_json.get("ticketId"),
+        "closure_details": alert_card_json.get("closureDetails"),
+        "event_count": alert_card_json.get("eventCount"),
+        "product_families": alert_card_json.get("productFamilies", []),
+        "entity_cards": alert_card_json.get("entityCards", []),
+        "security_event_cards": alert_card_json.get("securityEventCards", []),
+        "involved_relations": alert_card_json.get("involvedRelations", []),
+    }
+
+
+def _parse_alert_card_sla(alert_card_json):
+    # type: (SingleJson) -> SLA | None
+    return SLA.from_json(alert_card_json.get("sla")) if alert_card_json.get("sla") else None
+
+
+def _parse_fields_groups(alert_card_json):
+    # type: (SingleJson) -> list[FieldsGroup]
+    return [FieldsGroup.from_json(x) for x in alert_card_json.get("fieldsGroups", alert_card_json.get("fields", []))]
+
+
 class AlertCard:
     def __init__(
         self,
@@ -700,54 +834,10 @@ class AlertCard:
 
     @classmethod
     def from_json(cls, alert_card_json):
-
-        raw_priority = alert_card_json.get("priority")
-        priority = raw_priority
-        if isinstance(raw_priority, str) and raw_priority.isdigit():
-            priority = int(raw_priority)
-
-        add_props = alert_card_json.get("additionalProperties")
-        if isinstance(add_props, dict):
-            add_props = json.dumps(add_props)
-
         return cls(
-            id_=alert_card_json.get("id", 0),
-            creation_time_unix_time_ms=alert_card_json.get("creationTimeUnixTimeInMs", 0),
-            modification_time_unix_time_ms=alert_card_json.get("modificationTimeUnixTimeInMs", 0),
-            identifier=alert_card_json.get("identifier", ""),
-            status=alert_card_json.get("status", 0),
-            name=alert_card_json.get("displayName", alert_card_json.get("name", "")),
-            priority=priority,
-            workflow_status=alert_card_json.get("workflowsStatus", alert_card_json.get("playbookStatus")),
-            sla_expiration_unix_time=alert_card_json.get("slaExpirationUnixTime"),
-            sla_critical_expiration_unix_time=alert_card_json.get("slaCriticalExpirationUnixTime"),
-            start_time=alert_card_json.get("startTime", alert_card_json.get("startTimeUnixTimeInMs", 0)),
-            end_time=alert_card_json.get("endTime", 0),
-            alert_group_identifier=alert_card_json.get("alertGroupIdentifier", ""),
-            events_count=alert_card_json.get("eventsCount", alert_card_json.get("eventCount", 0)),
-            title=(alert_card_json.get("title") or alert_card_json.get("displayName", "")),
-            rule_generator=alert_card_json.get("ruleGenerator", ""),
-            device_product=alert_card_json.get("product", alert_card_json.get("deviceProduct")),
-            device_vendor=alert_card_json.get("vendor", alert_card_json.get("deviceVendor")),
-            playbook_attached=alert_card_json.get("playbookAttached"),
-            playbook_run_count=(alert_card_json.get("playbookRunCount") or alert_card_json.get("playbook_run_count")),
-            is_manual_alert=alert_card_json.get("isManualAlert", alert_card_json.get("manual")),
-            sla=SLA.from_json(alert_card_json.get("sla")) if alert_card_json.get("sla") else None,
-            fields_groups=[
-                FieldsGroup.from_json(x) for x in alert_card_json.get("fieldsGroups", alert_card_json.get("fields", []))
-            ],
-            source_url=alert_card_json.get("sourceUrl"),
-            source_rule_url=alert_card_json.get("sourceRuleUrl"),
-            siem_alert_id=alert_card_json.get("siemAlertId"),
-            additional_properties=add_props,
-            case_id=alert_card_json.get("caseId"),
-            ticket_id=alert_card_json.get("ticketId"),
-            closure_details=alert_card_json.get("closureDetails"),
-            event_count=alert_card_json.get("eventCount"),
-            product_families=alert_card_json.get("productFamilies", []),
-            entity_cards=alert_card_json.get("entityCards", []),
-            security_event_cards=alert_card_json.get("securityEventCards", []),
-            involved_relations=alert_card_json.get("involvedRelations", []),
+            **_alert_card_scalars(alert_card_json),
+            sla=_parse_alert_card_sla(alert_card_json),
+            fields_groups=_parse_fields_groups(alert_card_json),
         )
 
     def to_json(self) -> SingleJson:
@@ -791,6 +881,176 @@ class AlertCard:
         }
 
 
+class LazyAlertCard(AlertCard):
+    """AlertCard that parses its SLA and fields groups on first access.
+
+    The raw alert card JSON is kept in `raw_data`.
+    """
+
+    __slots__ = (
+        "_fields_groups",
+        "_sla",
+        "additional_properties",
+        "alert_group_identifier",
+        "case_id",
+        "closure_details",
+        "creation_time_unix_time_ms",
+        "device_product",
+        "device_vendor",
+        "end_time",
+        "entity_cards",
+        "event_count",
+        "events_count",
+        "id_",
+        "identifier",
+        "involved_relations",
+        "is_manual_alert",
+        "modification_time_unix_time_ms",
+        "name",
+        "playbook_attached",
+        "playbook_run_count",
+        "priority",
+        "product_families",
+        "raw_data",
+        "rule_generator",
+        "security_event_cards",
+        "siem_alert_id",
+        "sla_critical_expiration_unix_time",
+        "sla_expiration_unix_time",
+        "source_rule_url",
+        "source_url",
+        "start_time",
+        "status",
+        "ticket_id",
+        "title",
+        "workflow_status",
+    )
+
+    sla = _LazySection(_parse_alert_card_sla)
+    fields_groups = _LazySection(_parse_fields_groups)
+
+    def __init__(self, raw_data):
+        # type: (SingleJson) -> None
+        self.raw_data = raw_data
+        for name, value in _alert_card_scalars(raw_data).items():
+            setattr(self, name, value)
+
+        self.product_families = self.product_families or []
+        self.entity_cards = self.entity_cards or []
+        self.security_event_cards = self.security_event_cards or []
+        self.involved_relations = self.involved_relations or []
+
+    @classmethod
+    def from_json(cls, alert_card_json):
+        # type: (SingleJson) -> LazyAlertCard
+        return cls(alert_card_json)
+
+
+def _case_details_scalars(case_details_json):
+    # type: (SingleJson) -> SingleJson
+    return {
+        "id_": case_details_json.get("id"),
+        "creation_time_unix_time_ms": (
+            case_details_json.get("creationTimeUnixTimeInMs") or case_details_json.get("createTime")
+        ),
+        "modification_time_unix_time_ms": (
+            case_details_json.get("modificationTimeUnixTimeInMs") or case_details_json.get("updateTime")
+        ),
+        "name": case_details_json.get("displayName", case_details_json.get("name")),
+        "priority": CasePriority(case_details_json.get("priority", 0)),
+        "is_important": case_details_json.get(
+            "important",
+            case_details_json.get("isImportant", False),
+        ),
+        "is_incident": case_details_json.get(
+            "incident",
+            case_details_json.get("isIncident", False),
+        ),
+        "start_time_unix_time_ms": (
+            case_details_json.get("startTimeUnixTimeInMs") or case_details_json.get("createTime")
+        ),
+        "end_time_unix_time_ms": (case_details_json.get("endTimeUnixTimeInMs") or case_details_json.get("endTime")),
+        "assigned_user": (case_details_json.get("assignedUser") or case_details_json.get("assignee")),
+        "description": case_details_json.get("description", ""),
+        "is_test_case": case_details_json.get("type", case_details_json.get("isTestCase", False)) in {True, "Test"},
+        "type_": case_details_json.get("type"),
+        "stage": case_details_json.get("stage"),
+        "tags": case_details_json.get("tags", []),
+        "environment": case_details_json.get("environment"),
+        "status": CaseDataStatus(case_details_json.get("status", 0)),
+        "score": case_details_json.get("score", 0),
+        "involved_suspicious_entity": case_details_json.get("involvedSuspiciousEntity", False),
+        "workflow_status": case_details_json.get("workflowStatus"),
+        "source": case_details_json.get("source"),
+        "products": case_details_json.get("products", []),
+        "tasks": case_details_json.get("tasks", []),
+        "incident_id": case_details_json.get("incidentId", ""),
+        "last_modifying_user_id": case_details_json.get("lastModifyingUserId"),
+        "related_alerts": case_details_json.get("relatedAlerts", []),
+        "alert_count": case_details_json.get("alertCount", 0),
+        "is_overflow_case": case_details_json.get(
+            "overflowCase",
+            case_details_json.get("isOverflowCase", False),
+        ),
+        "is_manual_case": case_details_json.get("isManualCase", False),
+        "sla_expiration_unix_time": case_details_json.get("slaExpirationUnixTime"),
+        "sla_critical_expiration_unix_time": (case_details_json.get("slaCriticalExpirationUnixTime")),
+        "stage_sla_expiration_unix_time_ms": (case_details_json.get("stageSlaExpirationUnixTimeInMs")),
+        "stage_sla__critical_expiration_unix_time_in_ms": (
+            case_details_json.get("stageSlaCriticalExpirationUnixTimeInMs")
+        ),
+        "can_open_incident": case_details_json.get("canOpenIncident", False),
+    }
+
+
+def _alert_cards_json(case_details_json):
+    # type: (SingleJson) -> list[SingleJson]
+    return case_details_json.get("alertCards", case_details_json.get("alerts", []))
+
+
+def _parse_alert_cards(case_details_json):
+    # type: (SingleJson) -> list[AlertCard]
+    return [AlertCard.from_json(alert_card_json) for alert_card_json in _alert_cards_json(case_details_json)]
+
+
+def _parse_lazy_alert_cards(case_details_json):
+    # type: (SingleJson) -> list[LazyAlertCard]
+    return [LazyAlertCard(alert_card_json) for alert_card_json in _alert_cards_json(case_details_json)]
+
+
+def _parse_wall_data(case_details_json):
+    # type: (SingleJson) -> list[WallData]
+    return [WallData.from_json(wall_data_json) for wall_data_json in case_details_json.get("wallData", {})]
+
+
+def _parse_entity_cards(case_details_json):
+    # type: (SingleJson) -> list[EntityCard]
+    return [EntityCard.from_json(entity_card_json) for entity_card_json in case_details_json.get("entityCards", {})]
+
+
+def _parse_entities(case_details_json):
+    # type: (SingleJson) -> list[Entity]
+    return [
+        Entity.from_json(entity_json)
+        for entity_json in case_details_json.get("involvedEntities", case_details_json.get("entities", []))
+    ]
+
+
+def _parse_case_sla(case_details_json):
+    # type: (SingleJson) -> SLA
+    return SLA.from_json(case_details_json.get("sla", {}))
+
+
+def _parse_stage_sla(case_details_json):
+    # type: (SingleJson) -> SLA
+    return SLA.from_json(case_details_json.get("stageSla", case_details_json.get("sla", {})))
+
+
+def _parse_alerts_sla(case_details_json):
+    # type: (SingleJson) -> SLA
+    return SLA.from_json(case_details_json.get("alertsSla", {}))
+
+
 class CaseDetails:
     def __init__(
         self,
@@ -893,76 +1153,14 @@ class CaseDetails:
     def from_json(cls, case_details_json):
         # type: (SingleJson) -> CaseDetails
         return cls(
-            id_=case_details_json.get("id"),
-            creation_time_unix_time_ms=(
-                case_details_json.get("creationTimeUnixTimeInMs") or case_details_json.get("createTime")
-            ),
-            modification_time_unix_time_ms=(
-                case_details_json.get("modificationTimeUnixTimeInMs") or case_details_json.get("updateTime")
-            ),
-            name=case_details_json.get("displayName", case_details_json.get("name")),
-            priority=CasePriority(case_details_json.get("priority", 0)),
-            is_important=case_details_json.get(
-                "important",
-                case_details_json.get("isImportant", False),
-            ),
-            is_incident=case_details_json.get(
-                "incident",
-                case_details_json.get("isIncident", False),
-            ),
-            start_time_unix_time_ms=(
-                case_details_json.get("startTimeUnixTimeInMs") or case_details_json.get("createTime")
-            ),
-            end_time_unix_time_ms=(case_details_json.get("endTimeUnixTimeInMs") or case_details_json.get("endTime")),
-            assigned_user=(case_details_json.get("assignedUser") or case_details_json.get("assignee")),
-            description=case_details_json.get("description", ""),
-            is_test_case=case_details_json.get("type", case_details_json.get("isTestCase", False)) in {True, "Test"},
-            type_=case_details_json.get("type"),
-            stage=case_details_json.get("stage"),
-            tags=case_details_json.get("tags", []),
-            environment=case_details_json.get("environment"),
-            status=CaseDataStatus(case_details_json.get("status", 0)),
-            score=case_details_json.get("score", 0),
-            involved_suspicious_entity=case_details_json.get("involvedSuspiciousEntity", False),
-            workflow_status=case_details_json.get("workflowStatus"),
-            source=case_details_json.get("source"),
-            products=case_details_json.get("products", []),
-            tasks=case_details_json.get("tasks", []),
-            incident_id=case_details_json.get("incidentId", ""),
-            last_modifying_user_id=case_details_json.get("lastModifyingUserId"),
-            related_alerts=case_details_json.get("relatedAlerts", []),
-            alert_count=case_details_json.get("alertCount", 0),
-            alerts=[
-                AlertCard.from_json(alert_card_json)
-                for alert_card_json in (case_details_json.get("alertCards", case_details_json.get("alerts", [])))
-            ],
-            wall_data=[
-                WallData.from_json(alert_card_json) for alert_card_json in case_details_json.get("wallData", {})
-            ],
-            entity_cards=[
-                EntityCard.from_json(alert_card_json) for alert_card_json in case_details_json.get("entityCards", {})
-            ],
-            entities=[
-                Entity.from_json(alert_card_json)
-                for alert_card_json in (
-                    case_details_json.get("involvedEntities", case_details_json.get("entities", []))
-                )
-            ],
-            is_overflow_case=case_details_json.get(
-                "overflowCase",
-                case_details_json.get("isOverflowCase", False),
-            ),
-            is_manual_case=case_details_json.get("isManualCase", False),
-            sla_expiration_unix_time=case_details_json.get("slaExpirationUnixTime"),
-            sla_critical_expiration_unix_time=(case_details_json.get("slaCriticalExpirationUnixTime")),
-            stage_sla_expiration_unix_time_ms=(case_details_json.get("stageSlaExpirationUnixTimeInMs")),
-            stage_sla__critical_expiration_unix_time_in_ms=(
-                case_details_json.get("stageSlaCriticalExpirationUnixTimeInMs")
-            ),
-            can_open_incident=case_details_json.get("canOpenIncident", False),
-            sla=SLA.from_json(case_details_json.get("sla", {})),
-            stage_sla=(SLA.from_json(case_details_json.get("stageSla", case_details_json.get("sla", {})))),
-            alerts_sla=SLA.from_json(case_details_json.get("alertsSla", {})),
+            **_case_details_scalars(case_details_json),
+            alerts=_parse_alert_cards(case_details_json),
+            wall_data=_parse_wall_data(case_details_json),
+            entity_cards=_parse_entity_cards(case_details_json),
+            entities=_parse_entities(case_details_json),
+            sla=_parse_case_sla(case_details_json),
+            stage_sla=_parse_stage_sla(case_details_json),
+            alerts_sla=_parse_alerts_sla(case_details_json),
         )
 
     def to_json(self, include_activities: bool = False) -> SingleJson:
@@ -1039,6 +1237,86 @@ class CaseDetails:
         return case_data
 
 
+class LazyCaseDetails(CaseDetails):
+    """CaseDetails that parses its nested sections on first access.
+
+    Alerts, wall data, entity cards, entities and SLAs are parsed from the raw
+    case JSON, kept in `raw_data`, only when read. Alerts are `LazyAlertCard`
+    objects, so their SLA and fields groups are parsed lazily as well. This
+    keeps loading cases with hundreds of alerts cheap when only a few fields
+    are used.
+
+    Example:
+        >>> case = LazyCaseDetails.from_json(case_json)
+        >>> case.status  # no nested section was parsed
+        >>> case.alerts[0].identifier  # parses the alerts, but not their SLAs
+    """
+
+    __slots__ = (
+        "_alerts",
+        "_alerts_sla",
+        "_entities",
+        "_entity_cards",
+        "_sla",
+        "_stage_sla",
+        "_wall_data",
+        "alert_count",
+        "assigned_user",
+        "can_open_incident",
+        "creation_time_unix_time_ms",
+        "description",
+        "end_time_unix_time_ms",
+        "environment",
+        "id_",
+        "incident_id",
+        "involved_suspicious_entity",
+        "is_important",
+        "is_incident",
+        "is_manual_case",
+        "is_overflow_case",
+        "is_test_case",
+        "last_modifying_user_id",
+        "modification_time_unix_time_ms",
+        "name",
+        "priority",
+        "products",
+        "raw_data",
+        "related_alerts",
+        "score",
+        "sla_critical_expiration_unix_time",
+        "sla_expiration_unix_time",
+        "source",
+        "stage",
+        "stage_sla__critical_expiration_unix_time_in_ms",
+        "stage_sla_expiration_unix_time_ms",
+        "start_time_unix_time_ms",
+        "status",
+        "tags",
+        "tasks",
+        "type_",
+        "workflow_status",
+    )
+
+    alerts = _LazySection(_parse_lazy_alert_cards)
+    wall_data = _LazySection(_parse_wall_data)
+    entity_cards = _LazySection(_parse_entity_cards)
+    entities = _LazySection(_parse_entities)
+    sla = _LazySection(_parse_case_sla)
+    stage_sla = _LazySection(_parse_stage_sla)
+    alerts_sla = _LazySection(_parse_alerts_sla)
+
+    def __init__(self, raw_data):
+        # type: (SingleJson) -> None
+        self.raw_data = raw_data
+        for name, value in _case_details_scalars(raw_data).items():
+            setattr(self, name, value)
+
+    @classmethod
+    def from_json(cls, case_details_json):
+        # type: (SingleJson) -> LazyCaseDetails
+        return cls(case_details_json)
+
+
 @dataclasses.dataclass(slots=True)
 class Insight:
     raw_data: SingleJson
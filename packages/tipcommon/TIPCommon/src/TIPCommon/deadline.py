@@ -0,0 +1,310 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""deadline.
+===========
+
+Module that tracks the time budget of a connector, action or job run.
+
+A `RunDeadline` ends a reserved window before the script deadline, so the work
+of the run stops early enough to persist the context and send the results.
+While a deadline is in scope, sessions bound with `bind_session` cap the
+timeout of each request to the remaining budget, and refuse to start new
+requests once it runs out.
+
+Example usage:
+.. code-block:: python
+
+    from TIPCommon.deadline import RunDeadline, bind_session, deadline_scope
+
+    deadline = RunDeadline.from_timeout(start_time_ms, python_process_timeout)
+    session = bind_session(requests.Session())
+
+    with deadline_scope(deadline):
+        session.get(url)  # timeout=min(remaining budget, the given timeout)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+from typing import TYPE_CHECKING, TypeVar
+
+import httpx
+from SiemplifyUtils import unix_now
+
+from .consts import ACTION_TIMEOUT_THRESHOLD_IN_SEC, NUM_OF_MILLI_IN_SEC, TIMEOUT_THRESHOLD
+from .exceptions import RunDeadlineExceededError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Generator, Iterable
+
+    RequestTimeout = float | tuple[float | None, float | None] | None
+
+_T = TypeVar("_T")
+_S = TypeVar("_S")
+
+_CURRENT_DEADLINE: contextvars.ContextVar[RunDeadline | None] = contextvars.ContextVar(
+    "tipcommon_run_deadline", default=None
+)
+
+
+class RunDeadline:
+    """The time budget of a script run.
+
+    Attributes:
+        deadline_unix_ms (int): The unix time in ms at which the script is stopped.
+        reserved_ms (int): The time in ms kept after the budget ends for
+            persisting the context and sending the results.
+
+    """
+
+    __slots__ = ("deadline_unix_ms", "reserved_ms")
+
+    def __init__(self, deadline_unix_ms: int, reserved_ms: int = 0) -> None:
+        self.deadline_unix_ms: int = deadline_unix_ms
+        self.reserved_ms: int = reserved_ms
+
+    def __repr__(self) -> str:
+        return f"RunDeadline(deadline_unix_ms={self.deadline_unix_ms}, reserved_ms={self.reserved_ms})"
+
+    @classmethod
+    def from_timeout(
+        cls,
+        start_unix_ms: int,
+        timeout_seconds: float,
+        timeout_threshold: float = TIMEOUT_THRESHOLD,
+    ) -> RunDeadline:
+        """Create the deadline of a connector or job with a process timeout.
+
+        Args:
+            start_unix_ms (int): The unix time in ms at which the run started.
+            timeout_seconds (float): The process timeout of the run.
+            timeout_threshold (float): The part of the timeout available for
+                the work of the run. Defaults to `TIMEOUT_THRESHOLD`.
+
+        Returns:
+            RunDeadline: The deadline of the run.
+
+        """
+        timeout_ms = round(timeout_seconds * NUM_OF_MILLI_IN_SEC)
+        return cls(start_unix_ms + timeout_ms, reserved_ms=round(timeout_ms * (1 - timeout_threshold)))
+
+    @classmethod
+    def from_action_deadline(
+        cls,
+        execution_deadline_unix_ms: int,
+        reserved_seconds: float = ACTION_TIMEOUT_THRESHOLD_IN_SEC,
+    ) -> RunDeadline:
+        """Create the deadline of an action from its execution deadline.
+
+        Args:
+            execution_deadline_unix_ms (int): The action's script deadline.
+            reserved_seconds (float): The time kept for sending the results.
+                Defaults to `ACTION_TIMEOUT_THRESHOLD_IN_SEC`.
+
+        Returns:
+            RunDeadline: The deadline of the run.
+
+        """
+        return cls(execution_deadline_unix_ms, reserved_ms=round(reserved_seconds * NUM_OF_MILLI_IN_SEC))
+
+    @property
+    def budget_end_unix_ms(self) -> int:
+        """The unix time in ms at which the work of the run should stop."""
+        return self.deadline_unix_ms - self.reserved_ms
+
+    @property
+    def remaining_ms(self) -> int:
+        """The time in ms left in the budget, or 0 if it ran out."""
+        return max(0, self.budget_end_unix_ms - unix_now())
+
+    @property
+    def remaining_seconds(self) -> float:
+        """The time in seconds left in the budget, or 0 if it ran out."""
+        return self.remaining_ms / NUM_OF_MILLI_IN_SEC
+
+    @property
+    def expired(self) -> bool:
+        """Whether the budget ran out."""
+        return self.remaining_ms <= 0
+
+    def check(self) -> None:
+        """Raise if the budget ran out.
+
+        Raises:
+            RunDeadlineExceededError: If the budget ran out.
+
+        """
+        if self.expired:
+            msg = f"The run's time budget ended at {self.budget_end_unix_ms}"
+            raise RunDeadlineExceededError(msg)
+
+    def request_timeout(self, timeout: RequestTimeout = None) -> RequestTimeout:
+        """Cap a `requests` timeout to the remaining budget.
+
+        Args:
+            timeout (float | tuple | None): The timeout given to the request,
+                either a total or a (connect, read) pair.
+
+        Returns:
+            float | tuple: The timeout to use, in the same form as given.
+
+        Raises:
+            RunDeadlineExceededError: If the budget ran out.
+
+        """
+        self.check()
+        remaining = self.remaining_seconds
+        if isinstance(timeout, tuple):
+            return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+
+        return remaining if timeout is None else min(timeout, remaining)
+
+    async def wait_for(self, awaitable: Awaitable[_T]) -> _T:
+        """Await within the remaining budget, cancelling the awaitable if it runs out.
+
+        Raises:
+            RunDeadlineExceededError: If the budget ran out first.
+
+        """
+        try:
+            return await asyncio.wait_for(awaitable, timeout=self.remaining_seconds)
+
+        except TimeoutError as e:
+            msg = f"The run's time budget ended at {self.budget_end_unix_ms}"
+            raise RunDeadlineExceededError(msg) from e
+
+    async def as_completed(self, awaitables: Iterable[Awaitable[_T]]) -> AsyncIterator[asyncio.Task[_T]]:
+        """Yield tasks as they complete until the budget runs out.
+
+        Tasks still running when the budget runs out, or when the consumer
+        stops iterating, are cancelled.
+
+        Yields:
+            asyncio.Task: Each completed task. Calling `result()` re-raises its
+            error, if any.
+
+        """
+        pending = {asyncio.ensure_future(awaitable) for awaitable in awaitables}
+        try:
+            while pending and not self.expired:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self.remaining_seconds,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    yield task
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+
+def get_run_deadline() -> RunDeadline | None:
+    """Get the deadline of the current run, if one is in scope."""
+    return _CURRENT_DEADLINE.get()
+
+
+@contextlib.contextmanager
+def deadline_scope(deadline: RunDeadline | None) -> Generator[RunDeadline | None, None, None]:
+    """Make a deadline the current run's deadline in a scope.
+
+    Passing `None` clears the current deadline in the scope.
+
+    Yields:
+        RunDeadline | None: The deadline of the scope.
+
+    """
+    token = _CURRENT_DEADLINE.set(deadline)
+    try:
+        yield deadline
+
+    finally:
+        _CURRENT_DEADLINE.reset(token)
+
+
+def bind_session(session: _S, deadline: RunDeadline | None = None) -> _S:
+    """Cap the timeout of a session's requests to a run's remaining budget.
+
+    Works with `requests` sessions, `httpx` clients and any session exposing a
+    `request(method, url, ..., timeout=...)` method. Binding the same session
+    again has no effect.
+
+    Args:
+        session: The session to bind.
+        deadline (RunDeadline | None): The deadline to follow. If not provided,
+            the deadline in scope at the time of each request is followed, and
+            requests made outside a deadline scope are left unchanged.
+
+    Returns:
+        The same session.
+
+    """
+    if getattr(session, "_tipcommon_deadline_bound", False):
+        return session
+
+    get_deadline = (lambda: deadline) if deadline is not None else get_run_deadline
+    if isinstance(session, httpx.Client | httpx.AsyncClient):
+        _bind_httpx_client(session, get_deadline)
+
+    else:
+        _bind_requests_session(session, get_deadline)
+
+    session._tipcommon_deadline_bound = True
+    return session
+
+
+def _bind_requests_session(session: _S, get_deadline: Callable[[], RunDeadline | None]) -> None:
+    request = session.request
+
+    @functools.wraps(request)
+    def request_within_deadline(method, url, *args, timeout=None, **kwargs):
+        deadline = get_deadline()
+        if deadline is not None:
+            timeout = deadline.request_timeout(timeout)
+
+        return request(method, url, *args, timeout=timeout, **kwargs)
+
+    session.request = request_within_deadline
+
+
+def _bind_httpx_client(
+    client: httpx.Client | httpx.AsyncClient, get_deadline: Callable[[], RunDeadline | None]
+) -> None:
+    def cap_timeout(request: httpx.Request) -> None:
+        deadline = get_deadline()
+        if deadline is None:
+            return
+
+        deadline.check()
+        remaining = deadline.remaining_seconds
+        timeouts = request.extensions.get("timeout", {})
+        request.extensions["timeout"] = {
+            name: remaining if timeouts.get(name) is None else min(timeouts[name], remaining)
+            for name in ("connect", "read", "write", "pool")
+        }
+
+    async def cap_timeout_async(request: httpx.Request) -> None:
+        cap_timeout(request)
+
+    hooks = client.event_hooks
+    hooks["request"] = [*hooks["request"], cap_timeout_async if isinstance(client, httpx.AsyncClient) else cap_timeout]
+    client.event_hooks = hooks
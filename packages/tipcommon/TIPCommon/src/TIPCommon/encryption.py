@@ -16,7 +16,9 @@ from __future__ import annotations
 
 import base64
 import email
+import hashlib
 import subprocess as sp
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -32,11 +34,19 @@ if TYPE_CHECKING:
     from .base.interfaces import ScriptLogger
 
 BLOCK_SIZE: int = 16
+PRIVATE_KEY_CACHE_SIZE: int = 32
+
+_PRIVATE_KEY_CACHE: dict[bytes, bytes] = {}
+_PRIVATE_KEY_CACHE_LOCK = threading.Lock()
 
 
 def get_private_key(password: str) -> bytes:
     """Derive a key from a password.
 
+    The derivation is deterministic and slow by design, so derived keys are
+    kept in memory for the lifetime of the process. They are cached by a hash
+    of the password, so the cache never holds the password itself.
+
     Args:
         password: The password to generate the key from
 
@@ -44,12 +54,38 @@ def get_private_key(password: str) -> bytes:
         A byte string
 
     """
+    cache_key: bytes = password_digest(password)
+    with _PRIVATE_KEY_CACHE_LOCK:
+        key: bytes | None = _PRIVATE_KEY_CACHE.get(cache_key)
+
+    if key is not None:
+        return key
+
     salt: bytes = b"this is a salt"
     kdf: bytes = PBKDF2(password, salt, dkLen=BLOCK_SIZE * 4)
-    key: bytes = kdf[:32]
+    key = kdf[:32]
+    with _PRIVATE_KEY_CACHE_LOCK:
+        if len(_PRIVATE_KEY_CACHE) >= PRIVATE_KEY_CACHE_SIZE:
+            del _PRIVATE_KEY_CACHE[next(iter(_PRIVATE_KEY_CACHE))]
+
+        _PRIVATE_KEY_CACHE[cache_key] = key
+
     return key
 
 
+def password_digest(password: str) -> bytes:
+    """Get the SHA-256 digest of a password, to key in-memory caches by.
+
+    Args:
+        password: The password to hash
+
+    Returns:
+        The digest of the password
+
+    """
+    return hashlib.sha256(password.encode()).digest()
+
+
 def encrypt(data: str, key: str) -> bytes:
     """Encrypt data with the key
     Args:
@@ -86,6 +86,10 @@ class BaseSyncJobException(GeneralJobException):
 
 
 # General Exceptions ####
+class RunDeadlineExceededError(TimeoutError):
+    """The time budget of the connector, action or job run ran out."""
+
+
 class EmptyMandatoryValues(Exception):
     """Exception for empty mandatory values."""
 
@@ -15,14 +15,16 @@
 from __future__ import annotations
 
 import abc
+import copy
 import dataclasses
 import json
+import threading
 from typing import TYPE_CHECKING
 
 from httpx import Client, Response
 
 from .consts import GLOBAL_CONTEXT_SCOPE
-from .encryption import decrypt, encrypt
+from .encryption import decrypt, encrypt, password_digest
 from .smp_time import unix_now
 
 if TYPE_CHECKING:
@@ -30,6 +32,9 @@ if TYPE_CHECKING:
 
 DB_TOKEN_KEY = "OAUTH_TOKEN"
 
+_TOKEN_CACHE: dict[tuple[str, bytes], OauthToken] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
 
 class AuthorizedOauthClient(Client):
     """This class represents an authorized client for API calls."""
@@ -50,9 +55,10 @@ class AuthorizedOauthClient(Client):
         if that's the case, it will execute the request again with refreshed token.
         """
         self.oauth_manager.refresh_if_expired(self)
+        token = self.oauth_manager.token
         response = super().request(*args, **kwargs)
 
-        if self.oauth_manager.refresh_if_bad_credentials(self, response):
+        if self.oauth_manager.refresh_if_bad_credentials(self, response, token):
             response = super().request(*args, **kwargs)
 
         return response
@@ -68,11 +74,24 @@ class AuthorizedOauthClient(Client):
 
 
 class OauthManager:
+    """Keeps an OAuth token valid for the clients sharing it.
+
+    Refreshes are single-flight: when several threads find the same token
+    expired or rejected, only the first one refreshes it and the others reuse
+    the new token.
+    """
+
     def __init__(self, oauth_adapter: OAuthAdapter, cred_storage: CredStorage) -> None:
         self._oauth_adapter = oauth_adapter
         self._cred_storage = cred_storage
+        self._refresh_lock = threading.Lock()
         self._token = self._fetch_token()
 
+    @property
+    def token(self) -> OauthToken | None:
+        """The current token, or None if there is none yet."""
+        return self._token
+
     def _fetch_token(self) -> OauthToken | None:
         try:
             return self._cred_storage.get_token()
@@ -80,16 +99,17 @@ class OauthManager:
             # The token cannot be decrypted, invalidate it
             return None
 
-    def _refresh_token(self) -> None:
-        token = self._oauth_adapter.refresh_token()
-        self._token = token
+    def _refresh_token(self, stale_token: OauthToken | None) -> None:
+        """Refresh the token, unless another thread already replaced `stale_token`."""
+        with self._refresh_lock:
+            if self._token is not stale_token:
+                return
+
+            self._token = self._oauth_adapter.refresh_token()
 
     def _token_is_expired(self) -> bool:
-        return (
-            self._token is None
-            or not self._oauth_adapter.check_signer(self._token)
-            or self._token.expiration_time > unix_now()
-        )
+        token = self._token
+        return token is None or not self._oauth_adapter.check_signer(token) or token.expiration_time <= unix_now()
 
     def save_token(self) -> None:
         if self._token is None:
@@ -107,12 +127,17 @@ class OauthManager:
         self,
         auth_client: AuthorizedOauthClient,
         response: Response,
+        used_token: OauthToken | None = None,
     ) -> bool:
-        """If the response indicates bad credentials, token will be refreshed."""
+        """If the response indicates bad credentials, token will be refreshed.
+
+        `used_token` is the token the request was sent with. It is not refreshed
+        again if another request already replaced it. Defaults to the current token.
+        """
         try:
             self._oauth_adapter.validate_bad_credentials(response)
         except AuthenticationError:
-            self._refresh_token()
+            self._refresh_token(self._token if used_token is None else used_token)
             self.prepare_authorized_client(auth_client)
             return True
 
@@ -120,10 +145,11 @@ class OauthManager:
 
     def refresh_if_expired(self, auth_client: AuthorizedOauthClient) -> bool:
         """Refreshes the token if it's expired."""
+        token = self._token
         if not self._token_is_expired():
             return False
 
-        self._refresh_token()
+        self._refresh_token(token)
         self.prepare_authorized_client(auth_client=auth_client)
         return True
 
@@ -179,6 +205,14 @@ class OauthToken:
 
 
 class CredStorage:
+    """Stores encrypted tokens in the SOAR context database.
+
+    Tokens are also kept decrypted in a process-local cache, keyed by instance
+    identifier and a hash of the encryption password, so they are read and
+    decrypted from the platform only once per process. The cache is updated
+    whenever a token is saved.
+    """
+
     def __init__(
         self,
         encryption_password: str,
@@ -200,26 +234,45 @@ class CredStorage:
 
     def get_token(self) -> OauthToken | None:
         """Extract ad decrypt a token from context database."""
+        identifier = self.get_instance_identifier()
+        cache_key = (identifier, password_digest(self.encryption_password))
+        with _TOKEN_CACHE_LOCK:
+            cached = _TOKEN_CACHE.get(cache_key)
+
+        if cached is not None:
+            return copy.deepcopy(cached)
+
         encrypted_data = self.chronicle_soar.get_context_property(
             context_type=GLOBAL_CONTEXT_SCOPE,
-            identifier=self.get_instance_identifier(),
+            identifier=identifier,
             property_key=DB_TOKEN_KEY,
         )
         if encrypted_data is None:
             return None
 
         token_data = self._decrypt(encrypted_data.encode())
-        return OauthToken.from_cache(token_data)
+        token = OauthToken.from_cache(token_data)
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE[cache_key] = copy.deepcopy(token)
+
+        return token
 
     def set_token(self, token: OauthToken) -> None:
         """Encrypt ad save a token into context database."""
+        identifier = self.get_instance_identifier()
+        cache_key = (identifier, password_digest(self.encryption_password))
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE.pop(cache_key, None)
+
         encrypted_data = self._encrypt(token.to_cache())
         self.chronicle_soar.set_context_property(
             context_type=GLOBAL_CONTEXT_SCOPE,
-            identifier=self.get_instance_identifier(),
+            identifier=identifier,
             property_key=DB_TOKEN_KEY,
             property_value=encrypted_data.decode(),
         )
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE[cache_key] = copy.deepcopy(token)
 
     def _decrypt(self, encrypted_data: bytes) -> str:
         try:
@@ -232,6 +285,12 @@ class CredStorage:
         return encrypt(raw_data, key=self.encryption_password)
 
 
+def clear_token_cache() -> None:
+    """Remove all the tokens cached by `CredStorage` in this process."""
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE.clear()
+
+
 class EncryptionError(Exception):
     """Generic exception for Encryption errors."""
 
@@ -12,8 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+
 import requests
 
+from TIPCommon.deadline import bind_session
+
 from .auth import generate_jwt_from_credentials, generate_jwt_from_sa
 
 
@@ -54,3 +58,37 @@ def get_auth_session(credentials=None, service_account=None, audience=None, veri
     session.headers.update(headers)
     session.verify = verify_ssl
     return session
+
+
+def fork_session(session):
+    """Creates a new HTTP session with the settings of another one.
+
+    `requests.Session` is not thread-safe, so each thread sending requests
+    concurrently with others needs its own session. The new session starts
+    with the headers, credentials, cookies, TLS and proxy settings of the
+    given one, and shares its connection adapters. If the given session was
+    bound with `bind_session`, the new one follows the deadline in scope.
+
+    Args:
+        session (requests.Session): The session to copy the settings of
+
+    Returns:
+        requests.Session: The new session
+
+    """
+    forked = requests.Session()
+    forked.headers = session.headers.copy()
+    forked.auth = session.auth
+    forked.cookies.update(session.cookies)
+    forked.proxies = dict(session.proxies)
+    forked.params = copy.copy(session.params)
+    forked.hooks = {event: list(hooks) for event, hooks in session.hooks.items()}
+    forked.verify = session.verify
+    forked.cert = session.cert
+    forked.trust_env = session.trust_env
+    forked.max_redirects = session.max_redirects
+    forked.adapters = session.adapters.copy()
+    if getattr(session, "_tipcommon_deadline_bound", False):
+        bind_session(forked)
+
+    return forked
@@ -36,6 +36,8 @@ from TIPCommon.data_models import (
     EventCard,
     Insight,
     InstalledIntegrationInstance,
+    LazyAlertEvent,
+    LazyCaseDetails,
     UserDetails,
 )
 from TIPCommon.exceptions import InternalJSONDecoderError
@@ -108,6 +110,7 @@ def get_case_overview_details(
     *,
     case_expand: list[str] | None = None,
     alert_expand: list[str] | None = None,
+    lazy: bool = False,
 ) -> CaseDetails:
     """Get case overview details with explicit expand separation.
 
@@ -116,6 +119,8 @@ def get_case_overview_details(
         case_id (int | str): The ID of the case.
         case_expand (list[str] | None): Fields to expand on the case object.
         alert_expand (list[str] | None): Fields to expand on the alerts within the case.
+        lazy (bool): Return a LazyCaseDetails, which parses the alerts and other
+            nested sections only when they are accessed.
 
     Returns:
         CaseDetails: An object containing the case overview details.
@@ -129,7 +134,8 @@ def get_case_overview_details(
     p.case_expand = case_expand
     p.alert_expand = alert_expand
 
-    return CaseDetails.from_json(api.get_case_overview_details())
+    case_details_class = LazyCaseDetails if lazy else CaseDetails
+    return case_details_class.from_json(api.get_case_overview_details())
 
 
 def get_installed_jobs(
@@ -453,6 +459,8 @@ def get_alert_events(
     chronicle_soar: ChronicleSOAR,
     case_id: str | int,
     alert_identifier: str,
+    *,
+    lazy: bool = False,
 ) -> list[AlertEvent]:
     """Get specific alert's events.
 
@@ -464,6 +472,8 @@ def get_alert_events(
             alert.name=SERVICE_ACCOUNT_USED
             alert.id=c3b80f09-38d3-4328-bddb-b938ccee0256
             identifier=SERVICE_ACCOUNT_USED_c3b80f09-38d3-4328-bddb-b938ccee0256
+        lazy (bool): Return LazyAlertEvent objects, which parse their event
+            property fields only when they are accessed.
 
     Returns:
         list[SingleJson]: The request's response JSON. A list of events' JSONs
@@ -484,7 +494,8 @@ def get_alert_events(
     response = chronicle_soar.session.post(url, json=payload)
     validate_response(response)
 
-    return [AlertEvent.from_json(event) for event in response.json()]
+    alert_event_class = LazyAlertEvent if lazy else AlertEvent
+    return [alert_event_class.from_json(event) for event in response.json()]
 
 
 def get_env_action_def_files(
@@ -1706,8 +1717,13 @@ def get_all_case_overview_details(
     alert_expand: list[str] | None = None,
     wall_expand: list[str] | None = None,
     entity_expand: list[str] | None = None,
+    lazy: bool = False,
 ) -> CaseDetails:
-    """Get complete case overview using explicit expand parameters."""
+    """Get complete case overview using explicit expand parameters.
+
+    With `lazy=True` a LazyCaseDetails is returned, which parses the alerts,
+    wall data, entities and SLAs only when they are accessed.
+    """
     _validate_expand_parameters(
         case_expand=case_expand,
         alert_expand=alert_expand,
@@ -1723,7 +1739,8 @@ def get_all_case_overview_details(
     api_client.params.entity_expand = entity_expand
 
     response = api_client.get_all_case_overview_details()
-    return CaseDetails.from_json(response)
+    case_details_class = LazyCaseDetails if lazy else CaseDetails
+    return case_details_class.from_json(response)
 
 
 def get_case_wall_records(
@@ -20,6 +20,7 @@ from typing import TYPE_CHECKING, Protocol
 
 from TIPCommon.utils import platform_supports_1p_api
 
+from .client_registry import get_client_context
 from .legacy_soar_api import LegacySoarApi
 from .one_platform_soar_api import OnePlatformSoarApi
 
@@ -228,11 +229,16 @@ def get_soar_client(chronicle_soar: ChronicleSOAR) -> SoarApiClient:
     Args:
         chronicle_soar: The ChronicleSOAR SDK object.
 
+    The platform is only checked once per ChronicleSOAR object. Every call
+    returns a new client, as clients hold the parameters of a single call, but
+    all of them share the object's session, base URI and response cache.
+
     Returns:
         An instance of a SOAR API client (either OnePlatformSoarApi or LegacySoarApi).
 
     """
-    if platform_supports_1p_api():
-        return OnePlatformSoarApi(chronicle_soar)
+    context = get_client_context(chronicle_soar)
+    if context.client_class is None:
+        context.client_class = OnePlatformSoarApi if platform_supports_1p_api() else LegacySoarApi
 
-    return LegacySoarApi(chronicle_soar)
+    return context.client_class(chronicle_soar)
@@ -19,12 +19,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from TIPCommon.data_models import Container
+from TIPCommon.rest.custom_types import HttpMethod
 from TIPCommon.utils import get_sdk_api_uri
 
+from .client_registry import SoarResponseCache, get_client_context
+
 if TYPE_CHECKING:
     import requests
 
-    from TIPCommon.rest.custom_types import HttpMethod
     from TIPCommon.types import ChronicleSOAR, SingleJson
 
 
@@ -40,6 +42,15 @@ class BaseSoarApi:
         """
         self.chronicle_soar = chronicle_soar
         self.params = Container()
+        self._context = get_client_context(chronicle_soar)
+
+    @property
+    def base_uri(self) -> str:
+        """The SOAR API URI, resolved once per ChronicleSOAR object."""
+        if self._context.base_uri is None:
+            self._context.base_uri = get_sdk_api_uri(self.chronicle_soar)
+
+        return self._context.base_uri
 
     def _make_request(
         self,
@@ -48,8 +59,39 @@ class BaseSoarApi:
         params: SingleJson | None = None,
         json_payload: SingleJson | None = None,
         headers: dict[str, str] | None = None,
+        read_only: bool = False,
     ) -> requests.Response:
-        url = f"{get_sdk_api_uri(self.chronicle_soar)}{endpoint}"
+        """Send a request to the SOAR API.
+
+        Inside a `cached_soar_responses` scope, GET requests and requests
+        marked as read-only are served from the response cache, and any other
+        request drops the cache.
+
+        Args:
+            method: The HTTP method.
+            endpoint: The endpoint path, appended to the SOAR API URI.
+            params: The query parameters.
+            json_payload: The JSON body.
+            headers: Extra request headers.
+            read_only: Whether a non-GET request only reads data and can be cached.
+
+        Returns:
+            The response of the request.
+
+        """
+        url = f"{self.base_uri}{endpoint}"
+        cache: SoarResponseCache | None = self._context.response_cache
+        cache_key = None
+        if cache is not None:
+            if method is HttpMethod.GET or read_only:
+                cache_key = cache.make_key(method.value, url, params, json_payload, headers)
+                cached_response = cache.get(cache_key)
+                if cached_response is not None:
+                    return cached_response
+
+            else:
+                cache.invalidate()
+
         self.chronicle_soar.LOGGER.info(f"Calling API endpoint: {method.value} {url}")
         request_kwargs = {
             "params": params,
@@ -59,8 +101,12 @@ class BaseSoarApi:
         if headers:
             request_kwargs["headers"] = headers
 
-        return self.chronicle_soar.session.request(
+        response = self.chronicle_soar.session.request(
             method.value,
             url,
             **request_kwargs,
         )
+        if cache_key is not None:
+            cache.set(cache_key, response)
+
+        return response
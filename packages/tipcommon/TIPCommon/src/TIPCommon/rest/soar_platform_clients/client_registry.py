@@ -0,0 +1,211 @@
+"""Per-ChronicleSOAR state shared by the SOAR API clients."""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import contextlib
+import copy
+import dataclasses
+import json
+import threading
+import weakref
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    import requests
+
+    from TIPCommon.types import ChronicleSOAR, SingleJson
+
+    from .base_soar_api import BaseSoarApi
+
+ResponseCacheKey = tuple[str, str, str, str, str]
+
+
+class SoarResponseCache:
+    """Request-scoped cache of successful read-only SOAR API responses.
+
+    Responses are keyed by method, URL, query parameters, JSON payload and
+    headers, so the same lookup with different arguments is fetched again.
+    Every caller gets its own copy of the cached response, so changing a
+    response's headers, encoding or other attributes doesn't affect other callers.
+    """
+
+    def __init__(self) -> None:
+        self._responses: dict[ResponseCacheKey, requests.Response] = {}
+        self._lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: SingleJson | None,
+        json_payload: SingleJson | None,
+        headers: dict[str, str] | None,
+    ) -> ResponseCacheKey:
+        """Build the cache key of a request."""
+        return (
+            method,
+            url,
+            json.dumps(params, sort_keys=True, default=str),
+            json.dumps(json_payload, sort_keys=True, default=str),
+            json.dumps(headers, sort_keys=True, default=str),
+        )
+
+    def get(self, key: ResponseCacheKey) -> requests.Response | None:
+        """Return the cached response of a request, if any."""
+        with self._lock:
+            response = self._responses.get(key)
+            if response is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        return _copy_response(response)
+
+    def set(self, key: ResponseCacheKey, response: requests.Response) -> None:
+        """Cache a response if it was successful.
+
+        The body is read before caching so the response can be served again.
+        A copy is cached, so the caller can change the given response.
+        """
+        if not response.ok:
+            return
+
+        _ = response.content
+        cached = _copy_response(response)
+        with self._lock:
+            self._responses[key] = cached
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """Drop cached responses.
+
+        Args:
+            endpoint: Only drop responses whose URL contains this endpoint.
+                All responses are dropped if not provided.
+
+        """
+        with self._lock:
+            if endpoint is None:
+                self._responses.clear()
+                return
+
+            for key in [k for k in self._responses if endpoint in k[1]]:
+                del self._responses[key]
+
+
+def _copy_response(response: requests.Response) -> requests.Response:
+    """Copy a response whose body was read, with its own headers, cookies and history."""
+    copied = copy.copy(response)
+    copied.headers = response.headers.copy()
+    copied.cookies = response.cookies.copy()
+    copied.history = list(response.history)
+    return copied
+
+
+@dataclasses.dataclass(slots=True)
+class SoarClientContext:
+    """What the SOAR API clients of one ChronicleSOAR object share."""
+
+    client_class: type[BaseSoarApi] | None = None
+    base_uri: str | None = None
+    response_cache: SoarResponseCache | None = None
+
+
+_CONTEXTS: weakref.WeakKeyDictionary[ChronicleSOAR, SoarClientContext] = weakref.WeakKeyDictionary()
+_CONTEXTS_LOCK = threading.Lock()
+
+
+def get_client_context(chronicle_soar: ChronicleSOAR) -> SoarClientContext:
+    """Get the shared client state of a ChronicleSOAR object.
+
+    The state lives as long as the ChronicleSOAR object does. Objects that
+    can't be weakly referenced get a fresh, unshared state on every call.
+
+    Args:
+        chronicle_soar: The ChronicleSOAR SDK object.
+
+    Returns:
+        The client state of the SDK object.
+
+    """
+    with _CONTEXTS_LOCK:
+        try:
+            context = _CONTEXTS.get(chronicle_soar)
+            if context is None:
+                context = _CONTEXTS[chronicle_soar] = SoarClientContext()
+
+        except TypeError:
+            context = SoarClientContext()
+
+    return context
+
+
+@contextlib.contextmanager
+def cached_soar_responses(chronicle_soar: ChronicleSOAR) -> Generator[SoarResponseCache, None, None]:
+    """Cache read-only SOAR API responses of a ChronicleSOAR object in a scope.
+
+    Inside the scope, GET requests and read-only lookups made through the SOAR
+    API clients are served from the cache after their first successful call.
+    Any other request drops the whole cache, as it may have changed the data.
+    Nested scopes share the outermost cache.
+
+    Example:
+        >>> with cached_soar_responses(siemplify):
+        ...     template = get_email_template(siemplify)
+        ...     template = get_email_template(siemplify)  # served from cache
+
+    Args:
+        chronicle_soar: The ChronicleSOAR SDK object.
+
+    Yields:
+        The response cache of the scope.
+
+    """
+    context = get_client_context(chronicle_soar)
+    if context.response_cache is not None:
+        yield context.response_cache
+        return
+
+    context.response_cache = SoarResponseCache()
+    try:
+        yield context.response_cache
+
+    finally:
+        context.response_cache = None
+
+
+def invalidate_soar_responses(chronicle_soar: ChronicleSOAR, endpoint: str | None = None) -> None:
+    """Drop cached SOAR API responses of a ChronicleSOAR object.
+
+    Does nothing outside a `cached_soar_responses` scope.
+
+    Args:
+        chronicle_soar: The ChronicleSOAR SDK object.
+        endpoint: Only drop responses whose URL contains this endpoint.
+            All responses are dropped if not provided.
+
+    """
+    cache = get_client_context(chronicle_soar).response_cache
+    if cache is not None:
+        cache.invalidate(endpoint)
@@ -188,7 +188,7 @@ class LegacySoarApi(BaseSoarApi):
         payload = {
             "integrationIdentifier": self.params.integration_identifier,
         }
-        return self._make_request(HttpMethod.POST, endpoint, json_payload=payload)
+        return self._make_request(HttpMethod.POST, endpoint, json_payload=payload, read_only=True)
 
     def _get_all_integration_instances(self) -> list[SingleJson]:
         """Private helper method to fetch all integration instances from the API.
@@ -283,7 +283,7 @@ class LegacySoarApi(BaseSoarApi):
             "fetchOnlySupportUsers": self.params.fetch_only_support_users,
             "filterPermissionTypes": self.params.filter_permission_types,
         }
-        return self._make_request(HttpMethod.POST, endpoint, json_payload=payload)
+        return self._make_request(HttpMethod.POST, endpoint, json_payload=payload, read_only=True)
 
     def get_security_events(self) -> requests.Response:
         """Get security events."""
@@ -351,7 +351,7 @@ class LegacySoarApi(BaseSoarApi):
         """Get domain alias."""
         endpoint = "/settings/GetDomainAliases?format=camel"
         payload = {"searchTerm": "", "requestedPage": self.params.page_count, "pageSize": 100}
-        return self._make_request(HttpMethod.POST, endpoint, json_payload=payload)
+        return self._make_request(HttpMethod.POST, endpoint, json_payload=payload, read_only=True)
 
     def add_tags_to_case_in_bulk(self) -> requests.Response:
         """Add tags to case in bulk."""
@@ -19,7 +19,7 @@ from .filters import filter_old_ids_by_timestamp
 from .utils import cast_keys_to_int, none_to_default_value
 
 
-def read_content(siemplify, file_name, db_key, default_value_to_return=None, identifier=None):
+def read_content(siemplify, file_name, db_key, default_value_to_return=None, identifier=None, segmented=False):
     """Read the content of a `ConnectorStream` object.
     If the object contains no data, does not exist, return a default value.
 
@@ -31,12 +31,13 @@ def read_content(siemplify, file_name, db_key, default_value_to_return=None, ide
                                     If no value is supplied, an internal default value of {} (dict) will be set as
                                     the new default value.
         identifier: (str) The connector's identifier attribute.
+        segmented: (bool) Whether the content is stored as compressed segments (see `SegmentedDataStream`).
 
     Returns:
         (dict) The content inside the `DataStream` object, the content passes through `json.loads` before returning.
 
     """
-    data = DataStreamFactory.get_stream_object(file_name, db_key, siemplify, identifier)
+    data = DataStreamFactory.get_stream_object(file_name, db_key, siemplify, identifier, segmented=segmented)
 
     default_value_to_return = none_to_default_value(default_value_to_return, {})
 
@@ -49,6 +50,7 @@ def read_ids(
     identifier=None,
     ids_file_name=IDS_FILE_NAME,
     db_key=IDS_DB_KEY,
+    segmented=False,
 ):
     """Read IDs from a `ConnectorStream` object.
     If the object contains no data, does not exist, return a default value.
@@ -61,6 +63,7 @@ def read_ids(
         identifier: (str) The connector's identifier attribute.
         ids_file_name: (str) The file name where IDs should be saved when `FileStream` object had been created.
         db_key: (str) The key name where IDs should be saved when `FileStream` object had been created.
+        segmented: (bool) Whether the IDs are stored as compressed segments (see `SegmentedDataStream`).
 
     Returns:
         (list) List of IDs inside the `DataStream` object, the content passes through `json.loads` before returning.
@@ -68,7 +71,7 @@ def read_ids(
     """
     default_value_to_return = none_to_default_value(default_value_to_return, [])
 
-    return read_content(siemplify, ids_file_name, db_key, default_value_to_return, identifier)
+    return read_content(siemplify, ids_file_name, db_key, default_value_to_return, identifier, segmented)
 
 
 def read_ids_by_timestamp(
@@ -169,7 +172,15 @@ def read_and_repair_existing_ids(
 ########################################################################################
 
 
-def write_content(siemplify, content_to_write, file_name, db_key, default_value_to_set=None, identifier=None) -> None:
+def write_content(
+    siemplify,
+    content_to_write,
+    file_name,
+    db_key,
+    default_value_to_set=None,
+    identifier=None,
+    segmented=False,
+) -> None:
     """Writes content into a `ConnectorStream` object.
 
     Args:
@@ -179,12 +190,14 @@ def write_content(siemplify, content_to_write, file_name, db_key, default_value_
         db_key: (str) The name of the key to be written to.
         default_value_to_set: (dict/list/str) The default value to be set in case a new file/key is created.
         identifier: (str) The connector's identifier attribute.
+        segmented: (bool) Whether to store the content as compressed segments, writing only what changed
+                          since the previous write (see `SegmentedDataStream`).
 
     Returns:
         None
 
     """
-    data = DataStreamFactory.get_stream_object(file_name, db_key, siemplify, identifier)
+    data = DataStreamFactory.get_stream_object(file_name, db_key, siemplify, identifier, segmented=segmented)
 
     default_value_to_set = none_to_default_value(default_value_to_set, {})
 
@@ -199,6 +212,7 @@ def write_ids(
     identifier=None,
     ids_file_name=IDS_FILE_NAME,
     db_key=IDS_DB_KEY,
+    segmented=False,
 ) -> None:
     """Writes the last 1,000 IDs into a `ConnectorStream` object.
 
@@ -210,6 +224,8 @@ def write_ids(
         identifier: (str) The connector's identifier attribute.
         ids_file_name: (str) The file name where IDs should be saved when `FileStream` object had been created.
         db_key: (str) The key name where IDs should be saved when `FileStream` object had been created.
+        segmented: (bool) Whether to store the IDs as compressed segments, writing only the trimmed and
+                          appended IDs (see `SegmentedDataStream`).
 
     Returns:
         None
@@ -218,7 +234,7 @@ def write_ids(
     default_value_to_set = none_to_default_value(default_value_to_set, [])
 
     ids = ids[-stored_ids_limit:]
-    write_content(siemplify, ids, ids_file_name, db_key, default_value_to_set, identifier)
+    write_content(siemplify, ids, ids_file_name, db_key, default_value_to_set, identifier, segmented)
 
 
 def write_ids_with_timestamp(
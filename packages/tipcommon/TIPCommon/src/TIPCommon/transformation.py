@@ -14,14 +14,14 @@
 
 from __future__ import annotations
 
-import copy
+import itertools
 import json
 from typing import TYPE_CHECKING
 
 from .exceptions import InternalJSONDecoderError
 
 if TYPE_CHECKING:
-    from collections.abc import Hashable, Sequence
+    from collections.abc import Hashable, Iterator, Sequence
     from typing import Any
 
     from .types import SingleJson
@@ -96,36 +96,43 @@ def construct_csv(list_of_dicts: Sequence[SingleJson]) -> list[str]:
         A list of strings, where each string is a row in the CSV file.
 
     """
-    if not list_of_dicts:
-        return []
+    return list(iter_csv(list_of_dicts))
 
-    headers: list[str] = []
-    seen_headers: set[str] = set()
-    for dict_item in list_of_dicts:
-        for key in dict_item:
-            if key not in seen_headers:
-                seen_headers.add(key)
-                headers.append(key)
 
-    csv_output: list[str] = []
-    unicode_headers: list[str] = [to_string(h) for h in headers]
-    csv_output.append(",".join(unicode_headers))
+def iter_csv(list_of_dicts: Sequence[SingleJson]) -> Iterator[str]:
+    """Lazily yields the rows of the CSV built by `construct_csv`.
 
-    for result in list_of_dicts:
-        csv_row: list[str] = []
-        for header in headers:
-            cell_value: Any = result.get(header)
-            cell_value = to_string(cell_value)
-            cell_value = cell_value.replace(",", " ")
-            csv_row.append(cell_value)
-        csv_output.append(",".join(csv_row))
+    Rows are produced one at a time, so large tables can be written out
+    without holding all their rows in memory.
+
+    Args:
+        list_of_dicts: A list of dictionaries to be converted to CSV format.
+
+    Yields:
+        The header row, then one row per dictionary.
+
+    """
+    if not list_of_dicts:
+        return
 
-    return csv_output
+    headers: list[str] = list(dict.fromkeys(itertools.chain.from_iterable(list_of_dicts)))
+    yield ",".join([to_string(h) for h in headers])
+
+    # to_string is inlined, as this runs once per cell of the table
+    for result in list_of_dicts:
+        yield ",".join([
+            "" if (cell_value := result.get(header)) is None else str(cell_value).replace(",", " ")
+            for header in headers
+        ])
 
 
 def dict_to_flat(target_dict: SingleJson) -> SingleJson:
     """Receives a nested dictionary and returns it as a flat dictionary.
 
+    Nested keys are joined with an underscore, and list items are numbered
+    starting from 1. The dictionary is traversed iteratively without being
+    copied, so deeply nested documents do not hit the recursion limit.
+
     Args:
         target_dict: The dictionary to flatten.
 
@@ -133,40 +140,26 @@ def dict_to_flat(target_dict: SingleJson) -> SingleJson:
         The flattened dictionary.
 
     """
-    target_dict = copy.deepcopy(target_dict)
-
-    def _expand(raw_key: str, raw_value: Any) -> list[tuple[str, str]]:
-        """Private recursive function to expand a nested dictionary."""
-        key: str = to_string(raw_key)
-        value: Any = raw_value
-
-        if value is None:
-            return [(key, "")]
-
-        if isinstance(value, dict):
-            return [
-                (f"{key}_{to_string(sub_key)}", to_string(sub_value))
-                for sub_key, sub_value in dict_to_flat(value).items()
-            ]
+    flat: SingleJson = {}
+    stack: list[tuple[str | None, Iterator[tuple[Any, Any]]]] = [(None, iter(target_dict.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for raw_key, value in items:
+            key: str = to_string(raw_key) if prefix is None else f"{prefix}_{to_string(raw_key)}"
+            if isinstance(value, dict):
+                stack.append((key, iter(value.items())))
+                break
 
-        if isinstance(value, list):
-            items: list[tuple[str, str]] = []
-            for count, item in enumerate(value, start=1):
-                new_key: str = f"{key}_{count}"
-                if isinstance(item, (dict, list)):
-                    items.extend(_expand(new_key, item))
-                else:
-                    items.append((new_key, to_string(item)))
+            if isinstance(value, list):
+                stack.append((key, enumerate(value, start=1)))
+                break
 
-            return items
+            flat[key] = to_string(value)
 
-        return [(key, to_string(value))]
+        else:
+            stack.pop()
 
-    items: list[tuple[str, str]] = [
-        item for sub_key, sub_value in target_dict.items() for item in _expand(sub_key, sub_value)
-    ]
-
-    return dict(items)
+    return flat
 
 
 def flat_dict_to_csv(
@@ -185,13 +178,28 @@ def flat_dict_to_csv(
         The list of strings in CSV format.
 
     """
-    csv_format: list[str] = [f"{property_header},{value_header}"]
-    for key, value in flat_dict.items():
-        safe_key: str = to_string(key)
-        safe_value: str = to_string(value)
-        csv_format.append(f"{safe_key},{safe_value}")
+    return list(iter_flat_dict_csv(flat_dict, property_header, value_header))
+
+
+def iter_flat_dict_csv(
+    flat_dict: SingleJson,
+    property_header: str = "Property",
+    value_header: str = "Value",
+) -> Iterator[str]:
+    """Lazily yields the rows of the CSV built by `flat_dict_to_csv`.
 
-    return csv_format
+    Args:
+        flat_dict: The dictionary to convert to CSV format.
+        property_header: The header for the property column.
+        value_header: The header for the value column.
+
+    Yields:
+        The header row, then one row per key of the dictionary.
+
+    """
+    yield f"{property_header},{value_header}"
+    for key, value in flat_dict.items():
+        yield f"{to_string(key)},{to_string(value)}"
 
 
 def add_prefix_to_dict(given_dict: SingleJson, prefix: str) -> SingleJson:
@@ -0,0 +1,119 @@
+"""Benchmark the lazy case models against the eager ones.
+
+Usage:
+    python tests/benchmarks/bench_data_models.py
+
+A sync job loads cases with hundreds of alerts and reads only the case status,
+its tags and the alerts' identifiers and closure details. The table shows the
+time to load and read a case, and the peak memory allocated while doing it.
+"""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from TIPCommon.data_models import CaseDetails, LazyCaseDetails
+
+if TYPE_CHECKING:
+    from TIPCommon.types import SingleJson
+
+ALERTS_PER_CASE: tuple[int, ...] = (100, 500, 1_000)
+FIELD_GROUPS_PER_ALERT: int = 5
+ITEMS_PER_FIELD_GROUP: int = 10
+RUNS: int = 20
+
+SLA_JSON: SingleJson = {
+    "slaExpirationTime": 1_700_000_000,
+    "criticalExpirationTime": 1_700_000_500,
+    "expirationStatus": 1,
+    "remainingTimeSinceLastPause": None,
+}
+
+
+def _alert_json(index: int) -> SingleJson:
+    return {
+        "id": index,
+        "identifier": f"ALERT_{index}",
+        "displayName": f"Alert {index}",
+        "priority": "60",
+        "status": 0,
+        "closureDetails": None,
+        "additionalProperties": {"source": "benchmark"},
+        "sla": SLA_JSON,
+        "fieldsGroups": [
+            {
+                "order": group,
+                "groupName": f"Group {group}",
+                "isIntegration": False,
+                "isHighlight": False,
+                "hideOptions": False,
+                "items": [
+                    {"originalName": f"field_{item}", "name": f"Field {item}", "value": f"value-{index}-{item}"}
+                    for item in range(ITEMS_PER_FIELD_GROUP)
+                ],
+            }
+            for group in range(FIELD_GROUPS_PER_ALERT)
+        ],
+    }
+
+
+def _case_json(alerts: int) -> SingleJson:
+    return {
+        "id": 1,
+        "displayName": "Benchmark case",
+        "priority": 80,
+        "status": 1,
+        "tags": [{"displayName": "sync"}],
+        "alertCards": [_alert_json(i) for i in range(alerts)],
+        "sla": SLA_JSON,
+        "alertsSla": SLA_JSON,
+    }
+
+
+def _read(case_details_class: type[CaseDetails], case_json: SingleJson) -> None:
+    case = case_details_class.from_json(case_json)
+    _ = case.is_open, case.tags
+    _ = [(alert.identifier, alert.closure_details) for alert in case.alerts]
+
+
+def _measure(case_details_class: type[CaseDetails], case_json: SingleJson) -> tuple[float, float]:
+    start: float = time.perf_counter()
+    for _ in range(RUNS):
+        _read(case_details_class, case_json)
+
+    elapsed: float = (time.perf_counter() - start) / RUNS
+
+    tracemalloc.start()
+    _read(case_details_class, case_json)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    print(f"{'alerts':>8}{'model':>8}{'ms/case':>10}{'peak MiB':>10}")  # ruff:ignore[print]
+    for alerts in ALERTS_PER_CASE:
+        case_json = _case_json(alerts)
+        for name, case_details_class in (("eager", CaseDetails), ("lazy", LazyCaseDetails)):
+            elapsed, peak = _measure(case_details_class, case_json)
+            print(f"{alerts:>8}{name:>8}{elapsed * 1000:>10.2f}{peak:>10.2f}")  # ruff:ignore[print]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Benchmark the segmented data stream against the plain JSON DB stream.
+
+Usage:
+    python tests/benchmarks/bench_data_stream.py
+
+A connector keeps a map of 1M alert IDs to timestamps in its context. Each run
+reads the map, adds a thousand new IDs and writes it back. The table shows the
+time of a run, the size of the context property written by it, and the total
+size of the stored context.
+"""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+from TIPCommon.DataStream import ConnectorDBStream, SegmentedDataStream
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+ENTRIES: int = 1_000_000
+NEW_IDS_PER_RUN: int = 1_000
+RUNS: int = 5
+
+
+class _FakeConnector:
+    def __init__(self) -> None:
+        self.LOGGER = MagicMock()
+        self.context = MagicMock()
+        self.properties: dict[str, str] = {}
+        self.written_bytes: int = 0
+
+    def get_connector_context_property(self, identifier: str, key: str) -> str | None:
+        return self.properties.get(f"{identifier}/{key}")
+
+    def set_connector_context_property(self, identifier: str, key: str, value: str) -> None:
+        self.written_bytes += len(value)
+        self.properties[f"{identifier}/{key}"] = value
+
+
+def _plain_stream(connector: _FakeConnector) -> ConnectorDBStream:
+    return ConnectorDBStream("ids", connector, "connector")
+
+
+def _segmented_stream(connector: _FakeConnector) -> SegmentedDataStream:
+    return SegmentedDataStream.from_stream(_plain_stream(connector))
+
+
+def _run(stream: ConnectorDBStream | SegmentedDataStream, first_id: int) -> None:
+    ids = stream.read_content({})
+    ids.update({f"alert-{i:012d}": 1_700_000_000 + i for i in range(first_id, first_id + NEW_IDS_PER_RUN)})
+    stream.write_content(ids, {})
+
+
+def _key_level_run(stream: SegmentedDataStream, first_id: int) -> None:
+    stream.update({f"alert-{i:012d}": 1_700_000_000 + i for i in range(first_id, first_id + NEW_IDS_PER_RUN)})
+
+
+def _measure(
+    make_stream: Callable[[_FakeConnector], ConnectorDBStream | SegmentedDataStream],
+    run: Callable[[ConnectorDBStream | SegmentedDataStream, int], None],
+) -> tuple[float, float, float]:
+    connector = _FakeConnector()
+    make_stream(connector).write_content({f"alert-{i:012d}": 1_700_000_000 + i for i in range(ENTRIES)}, {})
+    elapsed: float = 0.0
+    connector.written_bytes = 0
+    for index in range(RUNS):
+        start: float = time.perf_counter()
+        run(make_stream(connector), ENTRIES + index * NEW_IDS_PER_RUN)
+        elapsed += time.perf_counter() - start
+
+    stored: int = sum(len(value) for value in connector.properties.values())
+    return elapsed / RUNS, connector.written_bytes / RUNS / 2**20, stored / 2**20
+
+
+def main() -> None:
+    print(f"{ENTRIES} stored IDs, {NEW_IDS_PER_RUN} new IDs per run")  # ruff:ignore[print]
+    print(f"{'stream':<22}{'s/run':>10}{'MiB written':>14}{'MiB stored':>13}")  # ruff:ignore[print]
+    for name, make_stream, run in (
+        ("plain JSON", _plain_stream, _run),
+        ("segmented", _segmented_stream, _run),
+        ("segmented, by key", _segmented_stream, _key_level_run),
+    ):
+        elapsed, written, stored = _measure(make_stream, run)
+        print(f"{name:<22}{elapsed:>10.3f}{written:>14.3f}{stored:>13.2f}")  # ruff:ignore[print]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Benchmark the JobCase synchronization lookups against the previous linear scans.
+
+Usage:
+    python tests/benchmarks/bench_job_case.py [ALERTS] [COMMENTS]
+
+A synthetic case is built with ALERTS alerts (500 by default), each linked to a
+product incident, and COMMENTS comments (5000 by default) split between the case
+and the incidents. Half of the comments were already synced in each direction.
+"""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import sys
+import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from TIPCommon.base.job.job_case import JobCase
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_ALERTS: int = 500
+DEFAULT_COMMENTS: int = 5_000
+PRODUCT_PREFIX: str = "Product: "
+CASE_PREFIX: str = "SecOps: "
+
+
+def _build_case(alerts_count: int, comments_count: int) -> JobCase:
+    alerts: list[SimpleNamespace] = []
+    for i in range(alerts_count):
+        incident = SimpleNamespace(id=f"inc-{i}", name=f"incidents/{i}", comments=[], tags=[f"tag-{i}"])
+        alerts.append(
+            SimpleNamespace(
+                identifier=f"alert-{i}",
+                alert_group_identifier=f"group-{i}",
+                status="open",
+                incident=incident,
+            )
+        )
+
+    case_comments: list[dict[str, str]] = []
+    per_side: int = comments_count // 2
+    for i in range(per_side):
+        incident = alerts[i % alerts_count].incident
+        product_text: str = f"product comment {i}"
+        incident.comments.append(SimpleNamespace(message=product_text))
+        case_text: str = f"case comment {i}"
+        case_comments.append({"comment": case_text})
+        if i % 2:
+            case_comments.append({"comment": f"{PRODUCT_PREFIX}{incident.name}: {product_text}"})
+            incident.comments.append(SimpleNamespace(message=f"{CASE_PREFIX}1: {case_text}"))
+
+    case_detail = SimpleNamespace(id_=1, alerts=alerts, comments=case_comments, tags=[], status=None)
+    return JobCase(
+        case_detail=case_detail,
+        modification_time=0,
+        product_ids_from_secops_alerts={a.incident.name: a for a in alerts},
+    )
+
+
+def _legacy_comments_to_sync(job_case: JobCase) -> tuple[list[str], list[str]]:
+    case_hashes: list[str] = job_case.get_case_comments_hashes()
+    product_hashes: list[str] = job_case.get_product_comments_hashes()
+    to_case: list[str] = []
+    for alert in job_case.case_detail.alerts:
+        for comment in alert.incident.comments:
+            formatted: str = f"{PRODUCT_PREFIX}{alert.incident.name}: {comment.message}"
+            if comment.message.startswith(CASE_PREFIX) or job_case._generate_string_hash(formatted) in case_hashes:
+                continue
+            to_case.append(f"{alert.alert_group_identifier}:{formatted}")
+
+    to_product: list[str] = []
+    for comment in job_case.case_comments:
+        formatted = f"{CASE_PREFIX}{job_case.case_detail.id_}: {comment['comment']}"
+        if comment["comment"].startswith(PRODUCT_PREFIX) or job_case._generate_string_hash(formatted) in product_hashes:
+            continue
+        to_product.append(formatted)
+
+    return to_case, to_product
+
+
+def _legacy_lookups(job_case: JobCase) -> None:
+    for alert in job_case.case_detail.alerts:
+        name: str = alert.incident.name
+        next(a.incident for p, a in job_case.product_ids_from_secops_alerts.items() if p == name)
+
+
+def _indexed_comments_to_sync(job_case: JobCase) -> tuple[list[str], list[str]]:
+    result = job_case.get_comments_to_sync(PRODUCT_PREFIX, CASE_PREFIX)
+    return result.product_comments_sync_to_case, result.case_comments_sync_to_product
+
+
+def _indexed_lookups(job_case: JobCase) -> None:
+    for alert in job_case.case_detail.alerts:
+        job_case.get_product_incident(alert.incident.name)
+
+
+def _timed(func: Callable[[JobCase], object], job_case: JobCase) -> tuple[float, object]:
+    start: float = time.perf_counter()
+    result: object = func(job_case)
+    return time.perf_counter() - start, result
+
+
+def main(alerts_count: int = DEFAULT_ALERTS, comments_count: int = DEFAULT_COMMENTS) -> None:
+    job_case: JobCase = _build_case(alerts_count, comments_count)
+    legacy_comments, legacy_result = _timed(_legacy_comments_to_sync, job_case)
+    indexed_comments, indexed_result = _timed(_indexed_comments_to_sync, job_case)
+    if legacy_result != indexed_result:
+        msg: str = "Indexed comment diff does not match the legacy one"
+        raise RuntimeError(msg)
+
+    legacy_lookups, _ = _timed(_legacy_lookups, job_case)
+    indexed_lookups, _ = _timed(_indexed_lookups, job_case)
+
+    print(f"{alerts_count} alerts, {comments_count} comments")  # ruff:ignore[print]
+    print(f"{'operation':<16}{'legacy s':>12}{'indexed s':>12}{'speedup':>10}")  # ruff:ignore[print]
+    for name, legacy, indexed in (
+        ("comment diff", legacy_comments, indexed_comments),
+        ("product lookups", legacy_lookups, indexed_lookups),
+    ):
+        print(f"{name:<16}{legacy:>12.4f}{indexed:>12.4f}{legacy / indexed:>9.1f}x")  # ruff:ignore[print]
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,97 @@
+"""Benchmark the streaming Pub/Sub consumer and batch publisher against lockstep requests.
+
+Usage:
+    PYTHONPATH=src:tests/test_adapters python tests/benchmarks/bench_pubsub_streaming.py
+
+A local fake Pub/Sub server adds a fixed latency to every request. The lockstep
+consumer pulls, processes and acks each batch in turn, and the lockstep publisher
+sends one chunk after the other.
+"""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import time
+
+import requests
+from fake_pubsub import FakePubSub
+
+from TIPCommon.adapters import PubSubAdapter, PubSubBatchPublisher, PubSubStreamingConsumer
+from TIPCommon.adapters.pubsub import consts
+from TIPCommon.adapters.pubsub.streaming import chunk_messages
+
+LATENCY_SEC: float = 0.02
+MESSAGES: int = 5_000
+PULL_SIZE: int = 100
+PUBLISH_CHUNK_SIZE: int = 250
+
+
+def _lockstep_consume(adapter: PubSubAdapter) -> int:
+    consumed = 0
+    while received := adapter.pull("sub", PULL_SIZE):
+        consumed += len(received)
+        adapter.ack("sub", [m.ack_id for m in received])
+
+    return consumed
+
+
+def _streaming_consume(adapter: PubSubAdapter) -> int:
+    consumed = 0
+    with PubSubStreamingConsumer(adapter, "sub", max_messages_per_pull=PULL_SIZE, max_outstanding_pulls=4) as consumer:
+        for message in consumer.messages():
+            consumed += 1
+            consumer.ack(message)
+
+    return consumed
+
+
+def _lockstep_publish(adapter: PubSubAdapter, messages: list[dict[str, str]]) -> int:
+    return sum(len(adapter.publish("topic", chunk)) for chunk in chunk_messages(messages, PUBLISH_CHUNK_SIZE))
+
+
+def _concurrent_publish(adapter: PubSubAdapter, messages: list[dict[str, str]]) -> int:
+    return len(PubSubBatchPublisher(adapter, "topic", max_messages=PUBLISH_CHUNK_SIZE).publish(messages))
+
+
+def main() -> None:
+    messages: list[dict[str, str]] = [{"data": "eA=="} for _ in range(MESSAGES)]
+    print(f"{MESSAGES} messages, {LATENCY_SEC * 1000:.0f}ms per request")  # ruff:ignore[print]
+    print(f"{'operation':<10}{'mode':<12}{'seconds':>10}{'requests':>10}")  # ruff:ignore[print]
+    for operation, mode, run in (
+        ("publish", "lockstep", lambda a: _lockstep_publish(a, messages)),
+        ("publish", "concurrent", lambda a: _concurrent_publish(a, messages)),
+        ("consume", "lockstep", _lockstep_consume),
+        ("consume", "streaming", _streaming_consume),
+    ):
+        with FakePubSub(latency_sec=LATENCY_SEC) as fake:
+            consts.PUBSUB_API_ROOT = fake.url
+            adapter = PubSubAdapter(requests.Session(), project_id="project")
+            if operation == "consume":
+                fake.add_messages(MESSAGES)
+
+            start = time.perf_counter()
+            count = run(adapter)
+            elapsed = time.perf_counter() - start
+            if count != MESSAGES:
+                msg = f"{operation} ({mode}) handled {count} of {MESSAGES} messages"
+                raise RuntimeError(msg)
+
+            requests_count = len(fake.publish_requests) + fake.pull_requests + fake.ack_requests
+            print(f"{operation:<10}{mode:<12}{elapsed:>10.3f}{requests_count:>10}")  # ruff:ignore[print]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Benchmark the JSON flattener and CSV writers against their previous implementations.
+
+Usage:
+    python tests/benchmarks/bench_transformation.py
+
+Two synthetic vendor responses are used: a deep one, nesting a small object
+200 levels down, and a wide one with thousands of keys holding shallow objects
+and lists. Each document is flattened and written out as a CSV data table.
+"""
+
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import copy
+import io
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+from TIPCommon.transformation import (
+    construct_csv,
+    dict_to_flat,
+    flat_dict_to_csv,
+    iter_csv,
+    iter_flat_dict_csv,
+    to_string,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from TIPCommon.types import SingleJson
+
+DEEP_LEVELS: int = 200
+DEEP_FIELDS: int = 10
+WIDE_KEYS: int = 20_000
+ROUNDS: int = 5
+
+
+def _deep_document() -> SingleJson:
+    document: SingleJson = {}
+    for level in range(DEEP_LEVELS):
+        fields: SingleJson = {f"field_{i}": f"value {level},{i}" for i in range(DEEP_FIELDS)}
+        document = {**fields, "tags": ["a", "b", None], "child": document}
+
+    return document
+
+
+def _wide_document() -> SingleJson:
+    return {
+        f"key_{i}": {"id": i, "name": f"name {i}", "labels": [i, {"score": i / 2}], "empty": None}
+        for i in range(WIDE_KEYS)
+    }
+
+
+def _legacy_dict_to_flat(target_dict: SingleJson) -> SingleJson:
+    target_dict = copy.deepcopy(target_dict)
+
+    def _expand(raw_key: str, value: Any) -> list[tuple[str, str]]:
+        key: str = to_string(raw_key)
+        if value is None:
+            return [(key, "")]
+
+        if isinstance(value, dict):
+            return [(f"{key}_{k}", to_string(v)) for k, v in _legacy_dict_to_flat(value).items()]
+
+        if isinstance(value, list):
+            items: list[tuple[str, str]] = []
+            for count, item in enumerate(value, start=1):
+                new_key: str = f"{key}_{count}"
+                if isinstance(item, (dict, list)):
+                    items.extend(_expand(new_key, item))
+                else:
+                    items.append((new_key, to_string(item)))
+
+            return items
+
+        return [(key, to_string(value))]
+
+    return dict(item for k, v in target_dict.items() for item in _expand(k, v))
+
+
+def _legacy_construct_csv(list_of_dicts: list[SingleJson]) -> list[str]:
+    headers: list[str] = []
+    seen_headers: set[str] = set()
+    for dict_item in list_of_dicts:
+        for key in dict_item:
+            if key not in seen_headers:
+                seen_headers.add(key)
+                headers.append(key)
+
+    csv_output: list[str] = [",".join(to_string(h) for h in headers)]
+    for result in list_of_dicts:
+        csv_row: list[str] = []
+        for header in headers:
+            csv_row.append(to_string(result.get(header)).replace(",", " "))
+        csv_output.append(",".join(csv_row))
+
+    return csv_output
+
+
+def _write_rows(rows: list[str] | Any) -> int:
+    out = io.StringIO()
+    for row in rows:
+        out.write(row)
+        out.write("\n")
+
+    return out.tell()
+
+
+def _measure(func: Callable[[], object]) -> tuple[float, float]:
+    start: float = time.perf_counter()
+    for _ in range(ROUNDS):
+        func()
+
+    elapsed: float = (time.perf_counter() - start) / ROUNDS
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    print(  # ruff:ignore[print]
+        f"{'document':<10}{'operation':<18}{'legacy s':>10}{'new s':>10}{'legacy MiB':>12}{'new MiB':>10}"
+    )
+    for name, document in (("deep", _deep_document()), ("wide", _wide_document())):
+        flat: SingleJson = dict_to_flat(document)
+        if flat != _legacy_dict_to_flat(document):
+            msg: str = f"Flattened {name} document does not match the legacy one"
+            raise RuntimeError(msg)
+
+        rows: list[SingleJson] = [value for value in document.values() if isinstance(value, dict)] or [flat]
+        if construct_csv(rows) != _legacy_construct_csv(rows):
+            msg = f"CSV of the {name} document does not match the legacy one"
+            raise RuntimeError(msg)
+
+        results: list[tuple[str, tuple[float, float], tuple[float, float]]] = [
+            (
+                "dict_to_flat",
+                _measure(lambda d=document: _legacy_dict_to_flat(d)),
+                _measure(lambda d=document: dict_to_flat(d)),
+            ),
+            (
+                "construct_csv",
+                _measure(lambda r=rows: _write_rows(_legacy_construct_csv(r))),
+                _measure(lambda r=rows: _write_rows(iter_csv(r))),
+            ),
+            (
+                "flat_dict_to_csv",
+                _measure(lambda f=flat: _write_rows(flat_dict_to_csv(f))),
+                _measure(lambda f=flat: _write_rows(iter_flat_dict_csv(f))),
+            ),
+        ]
+        for operation, legacy, new in results:
+            print(  # ruff:ignore[print]
+                f"{name:<10}{operation:<18}{legacy[0]:>10.4f}{new[0]:>10.4f}{legacy[1]:>12.2f}{new[1]:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
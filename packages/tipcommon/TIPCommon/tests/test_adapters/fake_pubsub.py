@@ -0,0 +1,150 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A minimal in-process Pub/Sub REST server for tests and benchmarks.
+
+All topics feed a single queue, which every subscription pulls from.
+"""
+
+from __future__ import annotations
+
+import base64
+import collections
+import datetime
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+
+class FakePubSub:
+    def __init__(self, latency_sec: float = 0.0) -> None:
+        self.latency_sec = latency_sec
+        self.queue: collections.deque[dict[str, Any]] = collections.deque()
+        self.outstanding: dict[str, tuple[float, dict[str, Any]]] = {}
+        self.acked: list[str] = []
+        self.publish_requests: list[int] = []
+        self.pull_requests = 0
+        self.ack_requests = 0
+        self.modify_ack_deadline_requests: list[tuple[list[str], int]] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.01})
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> FakePubSub:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def add_messages(self, count: int, size: int = 16) -> None:
+        self._publish([{"data": base64.b64encode(b"x" * size).decode()} for _ in range(count)])
+
+    def _publish(self, messages: list[dict[str, Any]]) -> list[str]:
+        publish_time = datetime.datetime.now(datetime.UTC).isoformat()
+        ids = []
+        with self._lock:
+            for message in messages:
+                message_id = str(next(self._ids))
+                self.queue.append({**message, "messageId": message_id, "publishTime": publish_time})
+                ids.append(message_id)
+
+        return ids
+
+    def _pull(self, max_messages: int) -> list[dict[str, Any]]:
+        now = time.monotonic()
+        received = []
+        with self._lock:
+            self.pull_requests += 1
+            for ack_id, (deadline, message) in list(self.outstanding.items()):
+                if deadline <= now:
+                    del self.outstanding[ack_id]
+                    self.queue.appendleft(message)
+
+            while self.queue and len(received) < max_messages:
+                message = self.queue.popleft()
+                ack_id = f"ack-{message['messageId']}-{next(self._ids)}"
+                self.outstanding[ack_id] = (now + 10, message)
+                received.append({"ackId": ack_id, "message": message, "deliveryAttempt": 1})
+
+        return received
+
+    def _acknowledge(self, ack_ids: list[str]) -> None:
+        with self._lock:
+            self.ack_requests += 1
+            for ack_id in ack_ids:
+                if self.outstanding.pop(ack_id, None) is not None:
+                    self.acked.append(ack_id)
+
+    def _modify_ack_deadline(self, ack_ids: list[str], seconds: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self.modify_ack_deadline_requests.append((ack_ids, seconds))
+            for ack_id in ack_ids:
+                entry = self.outstanding.pop(ack_id, None)
+                if entry is None:
+                    continue
+
+                if seconds:
+                    self.outstanding[ack_id] = (now + seconds, entry[1])
+                else:
+                    self.queue.appendleft(entry[1])
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                if fake.latency_sec:
+                    time.sleep(fake.latency_sec)
+
+                action = self.path.rsplit(":", 1)[-1]
+                response: dict[str, Any] = {}
+                if action == "publish":
+                    fake.publish_requests.append(len(body["messages"]))
+                    response = {"messageIds": fake._publish(body["messages"])}
+                elif action == "pull":
+                    response = {"receivedMessages": fake._pull(body["maxMessages"])}
+                elif action == "acknowledge":
+                    fake._acknowledge(body["ackIds"])
+                elif action == "modifyAckDeadline":
+                    fake._modify_ack_deadline(body["ackIds"], body["ackDeadlineSeconds"])
+                else:
+                    self.send_error(404)
+                    return
+
+                payload = json.dumps(response).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        return Handler
@@ -0,0 +1,162 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+import requests
+from fake_pubsub import FakePubSub
+
+from TIPCommon.adapters import PubSubAdapter, PubSubBatchPublisher, PubSubStreamingConsumer
+from TIPCommon.adapters.pubsub import consts
+from TIPCommon.adapters.pubsub.streaming import chunk_messages
+
+
+@pytest.fixture
+def fake_pubsub(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakePubSub]:
+    with FakePubSub() as fake:
+        monkeypatch.setattr(consts, "PUBSUB_API_ROOT", fake.url)
+        yield fake
+
+
+@pytest.fixture
+def adapter(fake_pubsub: FakePubSub) -> PubSubAdapter:
+    return PubSubAdapter(requests.Session(), project_id="project")
+
+
+def test_chunk_messages_respects_count_and_byte_limits() -> None:
+    messages = [{"data": "x" * 100} for _ in range(25)]
+
+    by_count = list(chunk_messages(messages, max_messages=10, max_bytes=10**6))
+    by_bytes = list(chunk_messages(messages, max_messages=1000, max_bytes=500))
+
+    assert [len(c) for c in by_count] == [10, 10, 5]
+    assert all(len(c) == 4 for c in by_bytes[:-1])
+    assert sum(len(c) for c in by_bytes) == 25
+
+
+def test_batch_publisher_returns_message_ids_in_order(adapter: PubSubAdapter, fake_pubsub: FakePubSub) -> None:
+    publisher = PubSubBatchPublisher(adapter, "topic", max_messages=10, max_workers=4)
+
+    ids = publisher.publish([{"data": f"{i:04d}"} for i in range(95)])
+
+    published_ids = {m["data"]: m["messageId"] for m in fake_pubsub.queue}
+    assert len(fake_pubsub.publish_requests) == 10
+    assert ids == [published_ids[f"{i:04d}"] for i in range(95)]
+
+
+def test_batch_publisher_publishes_with_a_session_per_thread(
+    adapter: PubSubAdapter, fake_pubsub: FakePubSub, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sessions_by_thread: dict[int, set[int]] = {}
+    lock = threading.Lock()
+    publish = PubSubAdapter.publish
+
+    def record_publish(self: PubSubAdapter, *args: object, **kwargs: object) -> list:
+        with lock:
+            sessions_by_thread.setdefault(threading.get_ident(), set()).add(id(self.session))
+
+        return publish(self, *args, **kwargs)
+
+    monkeypatch.setattr(PubSubAdapter, "publish", record_publish)
+    publisher = PubSubBatchPublisher(adapter, "topic", max_messages=10, max_workers=4)
+
+    ids = publisher.publish([{"data": f"{i:04d}"} for i in range(95)])
+
+    sessions = [session for thread_sessions in sessions_by_thread.values() for session in thread_sessions]
+    assert len(ids) == 95
+    assert all(len(thread_sessions) == 1 for thread_sessions in sessions_by_thread.values())
+    assert len(sessions) == len(set(sessions))
+    assert id(adapter.session) not in sessions
+
+
+def test_consumer_drains_subscription_and_coalesces_acks(adapter: PubSubAdapter, fake_pubsub: FakePubSub) -> None:
+    fake_pubsub.add_messages(250)
+
+    with PubSubStreamingConsumer(adapter, "sub", max_messages_per_pull=20, max_outstanding_pulls=3) as consumer:
+        for message in consumer.messages():
+            consumer.ack(message)
+
+    assert len(fake_pubsub.acked) == 250
+    assert not fake_pubsub.outstanding
+    assert fake_pubsub.ack_requests < fake_pubsub.pull_requests
+
+
+def test_consumer_limit_releases_extra_messages(adapter: PubSubAdapter, fake_pubsub: FakePubSub) -> None:
+    fake_pubsub.add_messages(100)
+
+    with PubSubStreamingConsumer(adapter, "sub", max_messages_per_pull=20, max_outstanding_pulls=2) as consumer:
+        received = list(consumer.messages(limit=30))
+        consumer.ack(*received)
+
+    assert len(received) == 30
+    assert len(fake_pubsub.acked) == 30
+    assert len(fake_pubsub.queue) == 70
+    assert not fake_pubsub.outstanding
+
+
+def test_consumer_releases_messages_left_when_iteration_stops(adapter: PubSubAdapter, fake_pubsub: FakePubSub) -> None:
+    fake_pubsub.add_messages(100)
+
+    with PubSubStreamingConsumer(adapter, "sub", max_messages_per_pull=20, max_outstanding_pulls=2) as consumer:
+        messages = consumer.messages()
+        received = [next(messages) for _ in range(5)]
+        messages.close()
+        consumer.ack(*received)
+
+    assert len(fake_pubsub.acked) == 5
+    assert len(fake_pubsub.queue) == 95
+    assert not fake_pubsub.outstanding
+
+
+def test_consumer_pulls_with_a_session_per_thread(
+    adapter: PubSubAdapter, fake_pubsub: FakePubSub, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake_pubsub.add_messages(100)
+    sessions_by_thread: dict[int, set[int]] = {}
+    lock = threading.Lock()
+    pull = PubSubAdapter.pull
+
+    def record_pull(self: PubSubAdapter, *args: object, **kwargs: object) -> list:
+        with lock:
+            sessions_by_thread.setdefault(threading.get_ident(), set()).add(id(self.session))
+
+        return pull(self, *args, **kwargs)
+
+    monkeypatch.setattr(PubSubAdapter, "pull", record_pull)
+    with PubSubStreamingConsumer(adapter, "sub", max_messages_per_pull=10, max_outstanding_pulls=3) as consumer:
+        for message in consumer.messages():
+            consumer.ack(message)
+
+    sessions = [session for thread_sessions in sessions_by_thread.values() for session in thread_sessions]
+    assert all(len(thread_sessions) == 1 for thread_sessions in sessions_by_thread.values())
+    assert len(sessions) == len(set(sessions))
+    assert id(adapter.session) not in sessions
+    assert len(fake_pubsub.acked) == 100
+
+
+def test_consumer_extends_deadlines_until_max_lease(adapter: PubSubAdapter, fake_pubsub: FakePubSub) -> None:
+    fake_pubsub.add_messages(5)
+    consumer = PubSubStreamingConsumer(adapter, "sub", max_lease_seconds=30)
+
+    received = list(consumer.messages())
+    now = time.monotonic()
+
+    assert consumer._renew_expiring_leases(now) == []
+    assert sorted(consumer._renew_expiring_leases(now + 9)) == sorted(m.ack_id for m in received)
+    assert consumer._renew_expiring_leases(now + 31) == []
+    assert not consumer._leases
+    consumer.close()
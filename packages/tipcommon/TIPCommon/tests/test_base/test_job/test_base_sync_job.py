@@ -0,0 +1,135 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+from requests.exceptions import HTTPError
+
+from TIPCommon.base.job.base_sync_job import BaseSyncJob
+from TIPCommon.base.job.job_case import JobCase
+from TIPCommon.deadline import RunDeadline
+
+
+class SyncJob(BaseSyncJob):
+    def _init_api_clients(self) -> None:
+        return None
+
+    def _extract_product_ids_from_case(self, case_details: JobCase) -> list[str]:
+        return [f"INC-{case_details.case_detail.id_}"]
+
+    def is_alert_and_product_closed(self, job_case: JobCase, product: object) -> bool:
+        return False
+
+    def map_product_data_to_case(self, job_case: JobCase) -> None:
+        return None
+
+
+@pytest.fixture
+def soar_job() -> SimpleNamespace:
+    return SimpleNamespace(session=requests.Session(), script_name="Sync", unique_identifier="1")
+
+
+@pytest.fixture
+def sync_job(mocker: MockerFixture, soar_job: SimpleNamespace) -> SyncJob:
+    mocker.patch("TIPCommon.base.job.base_job.create_soar_job", return_value=soar_job)
+    mocker.patch("TIPCommon.base.job.base_job.create_params_container")
+    mocker.patch("TIPCommon.base.job.base_job.create_logger")
+    job = SyncJob("Sync", "ids", [])
+    job.sync_limit = 20
+    job.product_alerts_limit = 0
+    job.prefetch_workers = 4
+    mocker.patch.object(job, "_get_case_ids_by_timestamp", return_value=[(str(i), i) for i in range(20)])
+    return job
+
+
+@pytest.fixture
+def mock_get_case_overview_details(mocker: MockerFixture) -> MagicMock:
+    return mocker.patch("TIPCommon.base.job.base_sync_job.get_case_overview_details")
+
+
+def test_cases_to_sync_are_kept_in_order_and_failures_are_skipped(
+    sync_job: SyncJob, mock_get_case_overview_details: MagicMock
+) -> None:
+    """Test a case whose details fail to load is skipped without stopping the others."""
+
+    def get_case_overview_details(_: object, case_id: str, **__: object) -> SimpleNamespace:
+        if case_id == "3":
+            raise HTTPError(case_id)
+
+        return SimpleNamespace(id_=case_id, alerts=[])
+
+    mock_get_case_overview_details.side_effect = get_case_overview_details
+
+    job_cases = sync_job._get_cases_to_sync()  # ruff:ignore[private-member-access]
+
+    expected = [str(i) for i in range(20) if i != 3]
+    assert [job_case.case_detail.id_ for job_case in job_cases] == expected
+    assert sync_job.sorted_modified_ids == [(case_id, int(case_id)) for case_id in expected]
+    assert "3" not in sync_job.processed_items
+
+
+def test_case_details_are_fetched_with_a_session_per_thread(
+    sync_job: SyncJob, soar_job: SimpleNamespace, mock_get_case_overview_details: MagicMock
+) -> None:
+    """Test the prefetch threads never share the job's SDK session or each other's."""
+    sessions_by_thread: dict[int, set[int]] = {}
+    lock = threading.Lock()
+
+    def get_case_overview_details(chronicle_soar: SimpleNamespace, case_id: str, **_: object) -> SimpleNamespace:
+        with lock:
+            sessions_by_thread.setdefault(threading.get_ident(), set()).add(id(chronicle_soar.session))
+
+        return SimpleNamespace(id_=case_id, alerts=[])
+
+    mock_get_case_overview_details.side_effect = get_case_overview_details
+
+    sync_job._get_cases_to_sync()  # ruff:ignore[private-member-access]
+
+    sessions = [session for thread_sessions in sessions_by_thread.values() for session in thread_sessions]
+    assert all(len(thread_sessions) == 1 for thread_sessions in sessions_by_thread.values())
+    assert len(sessions) == len(set(sessions))
+    assert id(soar_job.session) not in sessions
+
+
+def test_case_writes_are_not_flushed_once_the_budget_ran_out(
+    sync_job: SyncJob, soar_job: SimpleNamespace, mocker: MockerFixture
+) -> None:
+    """Test writes left when the budget ran out are dropped and their cases retried in the next run."""
+    soar_job.add_comment = MagicMock()
+    sync_job.batch_case_writes = True
+    sync_job.deadline = RunDeadline(1_700_000_000_000)
+    mocker.patch("TIPCommon.deadline.unix_now", return_value=1_700_000_000_000)
+    mocker.patch("TIPCommon.base.job.base_sync_job.unix_now", return_value=1_700_000_000_000)
+
+    def get_cases_to_sync() -> list[JobCase]:
+        sync_job.case_writes.add_comment(7, "Closed in product")
+        sync_job.sorted_modified_ids = [("5", 5), ("7", 7)]
+        return []
+
+    mocker.patch.object(sync_job, "get_last_run_time", return_value=0)
+    mocker.patch.object(sync_job, "_read_ids", return_value={})
+    mocker.patch.object(sync_job, "_get_cases_to_sync", side_effect=get_cases_to_sync)
+    mocker.patch.object(sync_job, "_finalize_job")
+
+    sync_job._perform_job()  # ruff:ignore[private-member-access]
+
+    soar_job.add_comment.assert_not_called()
+    assert len(sync_job.case_writes) == 0
+    assert sync_job.failed_case_ids == {"7"}
+    assert sync_job._get_latest_synced_timestamp() == 5  # ruff:ignore[private-member-access]
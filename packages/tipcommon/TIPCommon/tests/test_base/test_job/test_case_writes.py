@@ -0,0 +1,148 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from unittest.mock import MagicMock, call
+
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+from TIPCommon.base.job.case_writes import CaseWriteBatch, CaseWriteType
+
+
+@pytest.fixture
+def mock_add_tags_in_bulk(mocker: MockerFixture) -> MagicMock:
+    return mocker.patch("TIPCommon.base.job.case_writes.add_tags_to_case_in_bulk")
+
+
+@pytest.fixture
+def mock_remove_case_tag(mocker: MockerFixture) -> MagicMock:
+    return mocker.patch("TIPCommon.base.job.case_writes.remove_case_tag")
+
+
+def test_tags_of_many_cases_are_added_in_bulk(
+    mock_chronicle_soar: MagicMock, mock_add_tags_in_bulk: MagicMock, mock_remove_case_tag: MagicMock
+) -> None:
+    """Test cases with the same tags to add share one bulk call."""
+    batch = CaseWriteBatch(mock_chronicle_soar)
+    for case_id in range(1, 101):
+        batch.add_tags(case_id, ["Synced", "Product"])
+
+    batch.add_tags(101, ["Other"])
+    batch.remove_tags(1, ["Stale"])
+
+    results = batch.flush()
+
+    assert all(result.succeeded for result in results)
+    assert len(results) == 202
+    assert len(batch) == 0
+    mock_add_tags_in_bulk.assert_has_calls([
+        call(mock_chronicle_soar, list(range(1, 101)), ["Synced", "Product"]),
+        call(mock_chronicle_soar, [101], ["Other"]),
+    ])
+    mock_remove_case_tag.assert_called_once_with(chronicle_soar=mock_chronicle_soar, case_id=1, tag="Stale")
+
+
+def test_failures_are_reported_per_write_and_case_order_is_kept(
+    mock_chronicle_soar: MagicMock, mock_add_tags_in_bulk: MagicMock
+) -> None:
+    """Test a failed write doesn't stop the flush and comments keep their order."""
+
+    def add_comment(comment: str, **_: str) -> None:
+        if comment == "bad":
+            raise RuntimeError(comment)
+
+    mock_add_tags_in_bulk.side_effect = RuntimeError("bulk failed")
+    mock_chronicle_soar.add_comment.side_effect = add_comment
+    batch = CaseWriteBatch(mock_chronicle_soar, max_workers=4)
+    batch.add_tags(1, ["Synced"])
+    for case_id in (1, 2):
+        for comment in ("first", "bad", "last"):
+            batch.add_comment(case_id, comment, "ALERT")
+
+    batch.assign(2, "ALERT", "Analyst")
+
+    results = batch.flush()
+    failed = [
+        (result.write.type_, result.write.case_id, result.write.value) for result in results if not result.succeeded
+    ]
+
+    assert failed == [
+        (CaseWriteType.ADD_TAG, 1, "Synced"),
+        (CaseWriteType.ADD_COMMENT, 1, "bad"),
+        (CaseWriteType.ADD_COMMENT, 2, "bad"),
+    ]
+    for case_id in (1, 2):
+        case_comments = [
+            c.kwargs["comment"]
+            for c in mock_chronicle_soar.add_comment.call_args_list
+            if c.kwargs["case_id"] == case_id
+        ]
+        assert case_comments == ["first", "bad", "last"]
+
+    mock_chronicle_soar.assign_case.assert_called_once_with("Analyst", 2, "ALERT")
+
+
+def test_tags_added_and_removed_in_a_case_keep_their_queue_order(
+    mock_chronicle_soar: MagicMock, mock_add_tags_in_bulk: MagicMock, mock_remove_case_tag: MagicMock
+) -> None:
+    """Test a tag removed then added again ends up on the case, while other tags are still added in bulk."""
+    calls: list[tuple[str, object, object]] = []
+    mock_add_tags_in_bulk.side_effect = lambda _, case_ids, tags: calls.append(("add", case_ids, tags))
+    mock_remove_case_tag.side_effect = lambda **kwargs: calls.append(("remove", kwargs["case_id"], kwargs["tag"]))
+    batch = CaseWriteBatch(mock_chronicle_soar, max_workers=4)
+    batch.remove_tags(1, ["Open"])
+    batch.add_tags(1, ["Open", "Synced"])
+    batch.add_tags(2, ["Open"])
+    batch.add_tags(3, ["Closed"])
+    batch.remove_tags(3, ["Closed"])
+
+    results = batch.flush()
+
+    assert all(result.succeeded for result in results)
+    assert calls[:2] == [("add", [1], ["Synced"]), ("add", [2], ["Open"])]
+    case_1_calls = [c for c in calls[2:] if c[1] in (1, [1])]
+    case_3_calls = [c for c in calls[2:] if c[1] in (3, [3])]
+    assert case_1_calls == [("remove", 1, "Open"), ("add", [1], ["Open"])]
+    assert case_3_calls == [("add", [3], ["Closed"]), ("remove", 3, "Closed")]
+
+
+class RecordingSoar:
+    def __init__(self) -> None:
+        self.session = requests.Session()
+        self.comment_sessions: list[tuple[int, int]] = []
+
+    def add_comment(self, **_: object) -> None:
+        self.comment_sessions.append((threading.get_ident(), id(self.session)))
+
+
+def test_each_write_worker_uses_its_own_session() -> None:
+    """Test the write workers never share the job's SDK session or each other's."""
+    soar_job = RecordingSoar()
+    batch = CaseWriteBatch(soar_job, max_workers=4)
+    for case_id in range(20):
+        batch.add_comment(case_id, "comment")
+
+    batch.flush()
+
+    sessions_by_thread: dict[int, set[int]] = {}
+    for thread_id, session_id in soar_job.comment_sessions:
+        sessions_by_thread.setdefault(thread_id, set()).add(session_id)
+
+    sessions = [session for thread_sessions in sessions_by_thread.values() for session in thread_sessions]
+    assert len(soar_job.comment_sessions) == 20
+    assert all(len(thread_sessions) == 1 for thread_sessions in sessions_by_thread.values())
+    assert len(sessions) == len(set(sessions))
+    assert id(soar_job.session) not in sessions
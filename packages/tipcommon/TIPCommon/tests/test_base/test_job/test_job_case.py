@@ -0,0 +1,69 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from types import SimpleNamespace
+
+import pytest
+
+from TIPCommon.base.job.job_case import JobCase
+
+
+def _alert(index: int, incident_id: object = None) -> SimpleNamespace:
+    incident = SimpleNamespace(id=incident_id or f"inc-{index}", name=f"incidents/{index}", comments=[])
+    return SimpleNamespace(identifier=f"alert-{index}", alert_group_identifier=f"group-{index}", incident=incident)
+
+
+@pytest.fixture
+def job_case() -> JobCase:
+    alerts = [_alert(i) for i in range(3)]
+    return JobCase(
+        case_detail=SimpleNamespace(id_=1, alerts=alerts, comments=[]),
+        modification_time=0,
+        product_ids_from_secops_alerts={alert.incident.name: alert for alert in alerts},
+    )
+
+
+def test_product_comment_follows_alerts_replaced_in_place(job_case: JobCase) -> None:
+    """Test an alert replaced in the case's list receives the comments of its incident."""
+    job_case.add_product_comment("inc-0", "first")
+    replacement = _alert(9)
+    job_case.case_detail.alerts[0] = replacement
+
+    job_case.add_product_comment("inc-9", "second")
+    job_case.add_product_comment("inc-0", "dropped")
+
+    assert [c for a in job_case.case_detail.alerts for c in a.incident.comments] == ["second"]
+
+
+def test_product_comment_follows_incidents_attached_to_alerts(job_case: JobCase) -> None:
+    """Test incidents attached directly or with add_product_incident receive comments."""
+    job_case.add_product_comment("inc-1", "first")
+    job_case.case_detail.alerts[1].incident = SimpleNamespace(id="new-1", comments=[])
+    job_case.add_product_comment("new-1", "second")
+    job_case.add_product_incident(SimpleNamespace(id="new-2", name="incidents/2", comments=[]))
+    job_case.add_product_comment("new-2", "third")
+
+    assert job_case.case_detail.alerts[1].incident.comments == ["second"]
+    assert job_case.case_detail.alerts[2].incident.comments == ["third"]
+    assert job_case.get_product_incident("incidents/2").id == "new-2"
+
+
+def test_product_comment_matches_unhashable_incident_keys(job_case: JobCase) -> None:
+    """Test incidents keyed by unhashable values, or alerts without incidents, don't break the lookup."""
+    job_case.case_detail.alerts[0].incident = None
+    job_case.case_detail.alerts[1] = _alert(1, incident_id=["inc", 1])
+
+    job_case.add_product_comment(["inc", 1], "comment")
+
+    assert job_case.case_detail.alerts[1].incident.comments == ["comment"]
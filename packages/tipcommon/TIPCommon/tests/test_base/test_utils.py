@@ -0,0 +1,121 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from TIPCommon.base.utils import fork_chronicle_soar, prefetch_in_order
+from TIPCommon.deadline import bind_session
+
+
+def test_prefetch_in_order_yields_items_in_order() -> None:
+    """Test results are yielded in the items' order, whatever order the fetches finish in."""
+
+    def fetch(item: int) -> int:
+        time.sleep((10 - item) / 1000)
+        return item * 2
+
+    results = [(item, future.result()) for item, future in prefetch_in_order(range(10), fetch, 4)]
+
+    assert results == [(item, item * 2) for item in range(10)]
+
+
+def test_prefetch_in_order_cancels_pending_fetches_on_early_close() -> None:
+    """Test closing the generator early cancels the fetches that did not start."""
+    release = threading.Event()
+    fetched: list[int] = []
+
+    def fetch(item: int) -> int:
+        release.wait(timeout=5)
+        fetched.append(item)
+        return item
+
+    prefetched = prefetch_in_order(range(100), fetch, 1)
+    item, future = next(prefetched)
+    timer = threading.Timer(0.05, release.set)
+    timer.start()
+    prefetched.close()
+    timer.join()
+
+    assert item == 0
+    assert future.result() == 0
+    assert fetched == [0]
+
+
+def test_prefetch_in_order_isolates_failures_per_item() -> None:
+    """Test a failed fetch is only raised by its own future."""
+
+    def fetch(item: int) -> int:
+        if item == 2:
+            raise ValueError(item)
+
+        return item
+
+    results: list[int | str] = []
+    for _, future in prefetch_in_order(range(5), fetch, 2):
+        try:
+            results.append(future.result())
+
+        except ValueError:
+            results.append("failed")
+
+    assert results == [0, 1, "failed", 3, 4]
+
+
+def test_prefetch_in_order_fetches_ahead_of_the_consumer() -> None:
+    """Test no more than twice the workers are fetched ahead of the consumer."""
+    submitted: list[int] = []
+
+    def fetch(item: int) -> int:
+        submitted.append(item)
+        return item
+
+    prefetched = prefetch_in_order(range(100), fetch, 2)
+    next(prefetched)
+    prefetched.close()
+
+    assert len(submitted) <= 4
+
+
+def test_fork_chronicle_soar_gives_the_copy_its_own_session() -> None:
+    """Test the fork has a new session with the same settings and adapters."""
+    session = bind_session(requests.Session())
+    session.headers["Authorization"] = "Bearer token"
+    session.verify = False
+    session.proxies = {"https": "http://proxy:3128"}
+    chronicle_soar = SimpleNamespace(session=session, API_ROOT="https://soar")
+
+    forked = fork_chronicle_soar(chronicle_soar)
+    forked.session.headers.pop("Authorization")
+
+    assert forked is not chronicle_soar
+    assert forked.API_ROOT == "https://soar"
+    assert forked.session is not session
+    assert forked.session.verify is False
+    assert forked.session.proxies == {"https": "http://proxy:3128"}
+    assert forked.session.adapters["https://"] is session.adapters["https://"]
+    assert forked.session._tipcommon_deadline_bound  # ruff:ignore[private-member-access]
+    assert session.headers["Authorization"] == "Bearer token"
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_prefetch_in_order_runs_with_at_least_one_worker(max_workers: int) -> None:
+    """Test a non-positive worker count still fetches every item."""
+    results = [future.result() for _, future in prefetch_in_order(range(3), str, max_workers)]
+
+    assert results == ["0", "1", "2"]
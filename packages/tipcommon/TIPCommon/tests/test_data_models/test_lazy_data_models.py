@@ -0,0 +1,135 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from TIPCommon.data_models import (
+    AlertCard,
+    AlertEvent,
+    CaseDetails,
+    LazyAlertCard,
+    LazyAlertEvent,
+    LazyCaseDetails,
+)
+from TIPCommon.types import SingleJson
+
+SLA_JSON: SingleJson = {
+    "slaExpirationTime": 1_700_000_000,
+    "criticalExpirationTime": 1_700_000_500,
+    "expirationStatus": 1,
+    "remainingTimeSinceLastPause": None,
+}
+
+
+def _alert_json(index: int) -> SingleJson:
+    return {
+        "id": index,
+        "identifier": f"ALERT_{index}",
+        "displayName": f"Alert {index}",
+        "priority": "60",
+        "status": 0,
+        "additionalProperties": {"source": "test"},
+        "sla": SLA_JSON,
+        "fieldsGroups": [
+            {
+                "order": 1,
+                "groupName": "Default",
+                "isIntegration": False,
+                "isHighlight": True,
+                "hideOptions": False,
+                "items": [{"originalName": "host", "name": "Host", "value": f"host-{index}"}],
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def case_json() -> SingleJson:
+    return {
+        "id": 7,
+        "displayName": "Case",
+        "priority": 80,
+        "status": 1,
+        "tags": [{"displayName": "sync"}],
+        "alertCards": [_alert_json(i) for i in range(3)],
+        "sla": SLA_JSON,
+        "alertsSla": SLA_JSON,
+    }
+
+
+def test_lazy_case_details_match_eager_models(case_json: SingleJson) -> None:
+    eager = CaseDetails.from_json(case_json)
+    lazy = LazyCaseDetails.from_json(case_json)
+
+    assert isinstance(lazy, CaseDetails)
+    assert all(isinstance(alert, AlertCard) for alert in lazy.alerts)
+    assert lazy.is_open == eager.is_open
+    assert lazy.alerts[1].priority == 60
+    assert lazy.to_json() == eager.to_json()
+
+
+def test_nested_sections_are_parsed_on_first_access(case_json: SingleJson) -> None:
+    case = LazyCaseDetails.from_json(case_json)
+    unparsed = ("_alerts", "_wall_data", "_entities", "_sla", "_stage_sla", "_alerts_sla")
+
+    assert not any(hasattr(case, slot) for slot in unparsed)
+    assert case.alerts is case.alerts
+    assert not hasattr(case.alerts[0], "_fields_groups")
+    assert case.alerts[0].fields_groups[0].items[0].value == "host-0"
+    assert not hasattr(case, "_wall_data")
+    assert not hasattr(case, "__dict__") or not case.__dict__
+
+
+def test_lazy_sections_can_be_assigned_and_pickled(case_json: SingleJson) -> None:
+    case = LazyCaseDetails.from_json(case_json)
+    alert = LazyAlertCard.from_json(_alert_json(1))
+    case.alerts = [alert]
+
+    restored = pickle.loads(pickle.dumps(case))
+
+    assert [a.identifier for a in restored.alerts] == ["ALERT_1"]
+    assert restored.sla.to_json() == case.sla.to_json()
+
+
+def test_lazy_alert_event_parses_fields_on_access() -> None:
+    event_json = {
+        "fields": [
+            {
+                "order": 1,
+                "groupName": "Default",
+                "isIntegration": False,
+                "isHighlight": False,
+                "items": [{"originalName": "src", "name": "Source", "value": "10.0.0.1"}],
+            }
+        ],
+        "identifier": "event",
+        "caseId": 7,
+        "alertIdentifier": "ALERT_1",
+        "name": "Event",
+        "product": "Product",
+        "port": None,
+        "sourceSystemName": "System",
+        "outcome": None,
+        "time": 1_700_000_000,
+        "type": "Login",
+        "artifactEntities": [],
+    }
+    event = LazyAlertEvent.from_json(event_json)
+
+    assert not hasattr(event, "_fields")
+    assert event.fields[0].items[0].value == AlertEvent.from_json(event_json).fields[0].items[0].value
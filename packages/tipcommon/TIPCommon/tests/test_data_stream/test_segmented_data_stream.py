@@ -0,0 +1,133 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import pathlib
+from unittest.mock import MagicMock
+
+import pytest
+
+from TIPCommon.DataStream import ContextSegmentStorage, FileSegmentStorage, SegmentedDataStream
+
+
+@pytest.fixture
+def properties() -> dict[str, str]:
+    return {}
+
+
+@pytest.fixture
+def context_storage(properties: dict[str, str]) -> ContextSegmentStorage:
+    return ContextSegmentStorage(properties.get, properties.__setitem__, "ids")
+
+
+def _stream(storage: ContextSegmentStorage | FileSegmentStorage, **kwargs: int) -> SegmentedDataStream:
+    return SegmentedDataStream(storage, MagicMock(), **kwargs)
+
+
+def test_dict_writes_store_only_changed_keys(
+    context_storage: ContextSegmentStorage, properties: dict[str, str]
+) -> None:
+    content = {f"id-{i}": i for i in range(100)}
+    _stream(context_storage).write_content(content, {})
+    snapshot_keys = set(properties)
+
+    content.update({"id-1": -1, "id-new": {"nested": [1]}})
+    del content["id-2"]
+    _stream(context_storage).write_content(content, {})
+
+    assert len(set(properties) - snapshot_keys) == 1
+    assert _stream(context_storage).read_content({}) == content
+
+
+def test_list_writes_store_trimmed_and_appended_ids(
+    context_storage: ContextSegmentStorage, properties: dict[str, str]
+) -> None:
+    _stream(context_storage).write_content(list(range(10)), [])
+    _stream(context_storage).write_content(list(range(5, 15)), [])
+
+    assert json.loads(properties["ids"])["count"] == 2
+    assert _stream(context_storage).read_content([]) == list(range(5, 15))
+
+
+def test_key_level_updates_and_compaction(context_storage: ContextSegmentStorage, properties: dict[str, str]) -> None:
+    stream = _stream(context_storage, max_delta_segments=3, segment_max_entries=2)
+    stream.write_content({"a": 1, "b": 2, "c": 3}, {})
+    for i in range(3):
+        stream.update({f"key-{i}": i})
+
+    stream.delete("a", "missing")
+    reread = _stream(context_storage)
+
+    assert "a" not in reread
+    assert reread.get("key-2") == 2
+    assert reread.key_count() == 5
+    assert json.loads(properties["ids"])["count"] == 3
+    assert not any(value for key, value in properties.items() if key.startswith("ids__0_"))
+
+
+def test_values_equal_to_the_stored_ones_but_of_another_type_are_written(
+    context_storage: ContextSegmentStorage,
+) -> None:
+    _stream(context_storage).write_content({"flag": 1, "ratio": 1, "count": 0, "same": 1}, {})
+    _stream(context_storage).write_content({"flag": True, "ratio": 1.0, "count": False, "same": 1}, {})
+
+    content = _stream(context_storage).read_content({})
+
+    assert content == {"flag": True, "ratio": 1.0, "count": False, "same": 1}
+    assert [type(value) for value in content.values()] == [bool, float, bool, int]
+
+
+def test_returned_content_does_not_share_stored_state(context_storage: ContextSegmentStorage) -> None:
+    stream = _stream(context_storage)
+    stream.write_content({"alert": {"tags": ["a"]}}, {})
+
+    content = stream.read_content({})
+    content["alert"]["tags"].append("b")
+    stream.write_content(content, {})
+
+    assert _stream(context_storage).get("alert") == {"tags": ["a", "b"]}
+
+
+@pytest.mark.parametrize("legacy_content", [{"id": 1, "other": [1, 2]}, ["a", "b"]])
+def test_plain_json_is_migrated_on_first_write(
+    context_storage: ContextSegmentStorage, properties: dict[str, str], legacy_content: dict | list
+) -> None:
+    properties["ids"] = json.dumps(legacy_content)
+    stream = _stream(context_storage)
+
+    assert stream.read_content(None) == legacy_content
+
+    stream.write_content(legacy_content, None)
+
+    assert json.loads(properties["ids"])["count"] == 1
+    assert _stream(context_storage).read_content(None) == legacy_content
+
+
+def test_file_storage_appends_segments_and_migrates(tmp_path: pathlib.Path) -> None:
+    file_path = tmp_path / "ids.json"
+    file_path.write_text(json.dumps({"a": 1}))
+    storage = FileSegmentStorage(str(file_path))
+
+    _stream(storage).write_content({"a": 1, "b": 2}, {})
+    _stream(storage).write_content({"a": 1, "b": 2, "c": 3}, {})
+
+    assert len(file_path.read_text().splitlines()) == 3
+    assert _stream(storage).read_content({}) == {"a": 1, "b": 2, "c": 3}
+
+
+def test_corrupted_segments_return_default(context_storage: ContextSegmentStorage, properties: dict[str, str]) -> None:
+    _stream(context_storage).write_content({"a": 1}, {})
+    properties["ids__0_0"] = "not a segment"
+
+    assert _stream(context_storage).read_content({"default": True}) == {"default": True}
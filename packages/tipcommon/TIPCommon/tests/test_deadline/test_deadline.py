@@ -0,0 +1,131 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+import requests
+from pytest_mock import MockerFixture
+
+from TIPCommon.base.job.case_writes import CaseWriteBatch
+from TIPCommon.base.utils import prefetch_in_order
+from TIPCommon.deadline import RunDeadline, bind_session, deadline_scope, get_run_deadline
+from TIPCommon.exceptions import RunDeadlineExceededError
+
+NOW_MS: int = 1_700_000_000_000
+
+
+@pytest.fixture
+def mock_unix_now(mocker: MockerFixture) -> MagicMock:
+    return mocker.patch("TIPCommon.deadline.unix_now", return_value=NOW_MS)
+
+
+def test_request_timeout_is_capped_to_the_remaining_budget(mock_unix_now: MagicMock) -> None:
+    """Test request timeouts never outlast the budget, which ends before the reserved window."""
+    deadline = RunDeadline.from_timeout(NOW_MS, timeout_seconds=100, timeout_threshold=0.9)
+
+    assert deadline.budget_end_unix_ms == NOW_MS + 90_000
+    assert deadline.request_timeout() == 90
+    assert deadline.request_timeout(30) == 30
+    assert deadline.request_timeout((5, 120)) == (5, 90)
+    assert deadline.request_timeout((None, 10)) == (90, 10)
+
+    mock_unix_now.return_value = NOW_MS + 90_000
+    assert deadline.expired
+    with pytest.raises(RunDeadlineExceededError):
+        deadline.request_timeout(30)
+
+
+def test_bound_session_follows_the_deadline_in_scope(mock_unix_now: MagicMock, mocker: MockerFixture) -> None:
+    """Test a bound session caps timeouts only within a deadline scope."""
+    session = requests.Session()
+    mock_request = mocker.patch.object(session, "request")
+    bind_session(session)
+    bind_session(session)
+
+    session.get("https://example.com", timeout=60)
+    assert mock_request.call_args.kwargs["timeout"] == 60
+
+    with deadline_scope(RunDeadline(NOW_MS + 20_000, reserved_ms=10_000)) as deadline:
+        assert get_run_deadline() is deadline
+        session.get("https://example.com", timeout=60)
+        assert mock_request.call_args.kwargs["timeout"] == 10
+
+        mock_unix_now.return_value = NOW_MS + 10_000
+        with pytest.raises(RunDeadlineExceededError):
+            session.post("https://example.com")
+
+    assert get_run_deadline() is None
+    assert mock_request.call_count == 2
+
+
+def test_bound_httpx_client_caps_every_timeout(mock_unix_now: MagicMock) -> None:
+    """Test an httpx client sends requests with timeouts capped to the budget."""
+    timeouts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200)
+
+    client = bind_session(
+        httpx.Client(transport=httpx.MockTransport(handler), timeout=httpx.Timeout(60, connect=5)),
+        RunDeadline(NOW_MS + 30_000),
+    )
+    client.get("https://example.com")
+
+    assert timeouts == [{"connect": 5, "read": 30, "write": 30, "pool": 30}]
+
+
+def test_as_completed_cancels_tasks_left_when_the_budget_runs_out(mocker: MockerFixture) -> None:
+    """Test slow tasks are cancelled once the budget runs out."""
+    start = time.monotonic()
+    mocker.patch("TIPCommon.deadline.unix_now", side_effect=lambda: NOW_MS + int((time.monotonic() - start) * 1000))
+    cancelled = []
+
+    async def work(seconds: float) -> float:
+        try:
+            await asyncio.sleep(seconds)
+
+        except asyncio.CancelledError:
+            cancelled.append(seconds)
+            raise
+
+        return seconds
+
+    async def run() -> list[float]:
+        deadline = RunDeadline(NOW_MS + 200)
+        return [task.result() async for task in deadline.as_completed([work(0), work(0.01), work(60)])]
+
+    assert sorted(asyncio.run(run())) == [0, 0.01]
+    assert cancelled == [60]
+
+
+def test_pool_work_follows_the_deadline_in_scope(mock_unix_now: MagicMock) -> None:
+    """Test prefetches and flushed case writes run in the deadline scope of their caller."""
+    chronicle_soar = MagicMock()
+    deadlines = []
+    chronicle_soar.add_comment.side_effect = lambda **_: deadlines.append(get_run_deadline())
+    batch = CaseWriteBatch(chronicle_soar, max_workers=2)
+    batch.add_comment(1, "first")
+    batch.add_comment(2, "second")
+
+    with deadline_scope(RunDeadline(NOW_MS + 30_000)) as deadline:
+        prefetched = [future.result() for _, future in prefetch_in_order(range(3), lambda _: get_run_deadline(), 2)]
+        batch.flush()
+
+    assert prefetched == [deadline] * 3
+    assert deadlines == [deadline] * 2
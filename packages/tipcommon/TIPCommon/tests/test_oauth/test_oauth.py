@@ -0,0 +1,126 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+from httpx import Response
+from pytest_mock import MockerFixture
+
+from TIPCommon import encryption, oauth
+from TIPCommon.oauth import CredStorage, OAuthAdapter, OauthManager, OauthToken, clear_token_cache
+
+PASSWORD: str = "s3cret-password"
+
+
+class SlowOAuthAdapter(OAuthAdapter):
+    def __init__(self) -> None:
+        self.refresh_calls: int = 0
+
+    def check_signer(self, token: OauthToken) -> bool:
+        return True
+
+    def refresh_token(self) -> OauthToken:
+        self.refresh_calls += 1
+        time.sleep(0.05)
+        return OauthToken(access_token=f"token-{self.refresh_calls}", expiration_time=2**62)
+
+    @staticmethod
+    def validate_bad_credentials(response: Response) -> bool:
+        return False
+
+    def prepare_authorized_client(self, token: OauthToken, auth_client: MagicMock) -> MagicMock:
+        auth_client.token = token
+        return auth_client
+
+
+class ContextStore:
+    def __init__(self) -> None:
+        self.properties: dict[str, str] = {}
+        self.get_calls: int = 0
+        self.integration_identifier = "Integration"
+        self.integration_instance = "instance-1"
+
+    def get_context_property(self, context_type: int, identifier: str, property_key: str) -> str | None:
+        self.get_calls += 1
+        return self.properties.get(f"{identifier}:{property_key}")
+
+    def set_context_property(self, context_type: int, identifier: str, property_key: str, property_value: str) -> None:
+        self.properties[f"{identifier}:{property_key}"] = property_value
+
+
+@pytest.fixture(autouse=True)
+def empty_token_cache() -> Iterator[None]:
+    clear_token_cache()
+    yield
+    clear_token_cache()
+
+
+def test_concurrent_callers_of_an_expired_token_refresh_it_once(mocker: MockerFixture) -> None:
+    """Test threads finding the same token expired share a single refresh."""
+    mocker.patch("TIPCommon.oauth.unix_now", return_value=1_700_000_000_000)
+    cred_storage = MagicMock()
+    cred_storage.get_token.return_value = OauthToken(access_token="expired", expiration_time=0)
+    adapter = SlowOAuthAdapter()
+    manager = OauthManager(adapter, cred_storage)
+    barrier = threading.Barrier(8)
+    clients = [MagicMock() for _ in range(8)]
+
+    def call(client: MagicMock) -> None:
+        barrier.wait()
+        manager.refresh_if_expired(client)
+
+    threads = [threading.Thread(target=call, args=(client,)) for client in clients]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert adapter.refresh_calls == 1
+    assert manager.token.access_token == "token-1"
+    assert all(client.token is manager.token for client in clients)
+
+
+def test_set_token_replaces_the_cached_token() -> None:
+    """Test a saved token replaces the cached one without reading the platform again."""
+    store = ContextStore()
+    CredStorage(PASSWORD, store).set_token(OauthToken(access_token="first", expiration_time=1))
+    assert CredStorage(PASSWORD, store).get_token().access_token == "first"
+
+    CredStorage(PASSWORD, store).set_token(OauthToken(access_token="second", expiration_time=2))
+    token = CredStorage(PASSWORD, store).get_token()
+
+    assert token.access_token == "second"
+    assert store.get_calls == 0
+
+    clear_token_cache()
+    assert CredStorage(PASSWORD, store).get_token().access_token == "second"
+    assert store.get_calls == 1
+
+
+def test_caches_never_hold_the_password() -> None:
+    """Test the token and private key caches are keyed by a hash of the password."""
+    store = ContextStore()
+    CredStorage(PASSWORD, store).set_token(OauthToken(access_token="token", expiration_time=1))
+
+    cache_keys = [*oauth._TOKEN_CACHE, *encryption._PRIVATE_KEY_CACHE]  # ruff:ignore[private-member-access]
+
+    assert cache_keys
+    assert PASSWORD not in repr(cache_keys)
+    assert PASSWORD.encode() not in repr(cache_keys).encode()
+    assert encryption.get_private_key(PASSWORD) is encryption.get_private_key(PASSWORD)
@@ -0,0 +1,61 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import MagicMock
+
+from pytest_mock import MockerFixture
+
+from TIPCommon.rest.custom_types import HttpMethod
+from TIPCommon.rest.soar_platform_clients.api_client_factory import get_soar_client
+from TIPCommon.rest.soar_platform_clients.client_registry import cached_soar_responses
+from TIPCommon.rest.soar_platform_clients.legacy_soar_api import LegacySoarApi
+from TIPCommon.rest.soar_platform_clients.one_platform_soar_api import OnePlatformSoarApi
+
+
+def test_get_soar_client_resolves_platform_and_uri_once(
+    mock_chronicle_soar: MagicMock, mock_get_sdk_api_uri: MagicMock, mock_platform_supports_1p: MagicMock
+) -> None:
+    """Test clients of the same SDK object share the platform check and base URI."""
+    clients = [get_soar_client(mock_chronicle_soar) for _ in range(3)]
+    for client in clients:
+        client._make_request(HttpMethod.GET, "/cases")
+
+    assert all(isinstance(client, OnePlatformSoarApi) for client in clients)
+    assert len({id(client.params) for client in clients}) == 3
+    mock_platform_supports_1p.assert_called_once()
+    mock_get_sdk_api_uri.assert_called_once_with(mock_chronicle_soar)
+
+
+def test_cached_soar_responses_serves_reads_and_drops_on_writes(
+    mocker: MockerFixture, mock_chronicle_soar: MagicMock, mock_get_sdk_api_uri: MagicMock
+) -> None:
+    """Test GET responses are cached in scope and dropped by any other request."""
+    mock_response = mocker.MagicMock(ok=True)
+    mock_chronicle_soar.session.request.return_value = mock_response
+    client = LegacySoarApi(mock_chronicle_soar)
+
+    with cached_soar_responses(mock_chronicle_soar) as cache:
+        first = client._make_request(HttpMethod.GET, "/cases", params={"id": 1})
+        second = client._make_request(HttpMethod.GET, "/cases", params={"id": 1})
+        client._make_request(HttpMethod.GET, "/cases", params={"id": 2})
+        client._make_request(HttpMethod.POST, "/cases/Update", json_payload={})
+        client._make_request(HttpMethod.GET, "/cases", params={"id": 1})
+
+    client._make_request(HttpMethod.GET, "/cases", params={"id": 1})
+
+    assert first is mock_response
+    assert second is not first
+    assert second.ok
+    assert cache.hits == 1
+    assert mock_chronicle_soar.session.request.call_count == 5
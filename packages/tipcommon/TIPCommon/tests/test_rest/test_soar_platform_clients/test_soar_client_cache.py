@@ -0,0 +1,118 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from collections.abc import Callable
+from unittest.mock import MagicMock
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+
+from TIPCommon.rest import soar_api
+from TIPCommon.rest.soar_platform_clients.client_registry import cached_soar_responses, invalidate_soar_responses
+
+EMAIL_TEMPLATES_PATH: str = "/settings/GetEmailTemplateRecords"
+DOMAIN_ALIASES_PATH: str = "/settings/GetDomainAliases"
+ADD_TAGS_PATH: str = "/cases/ExecuteBulkAddCaseTag"
+API_ROOT: str = "https://soar.example.com/api/external/v1"
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.paths: list[str] = []
+        self.routes: dict[str, Callable[[dict], object]] = {
+            EMAIL_TEMPLATES_PATH: lambda _: [{"id": 1, "name": "Template", "type": 0, "content": "Hello"}],
+            DOMAIN_ALIASES_PATH: lambda payload: {"objectsList": [], "page": payload["requestedPage"]},
+            ADD_TAGS_PATH: lambda _: {},
+        }
+
+    def request(self, method: str, url: str, json: dict | None = None, **_: object) -> requests.Response:
+        path = urlsplit(url).path.removeprefix(urlsplit(API_ROOT).path)
+        self.paths.append(path)
+        return _response(self.routes[path](json))
+
+
+class MockChronicleSOAR:
+    def __init__(self) -> None:
+        self.session: FakeSession = FakeSession()
+        self.LOGGER: MagicMock = MagicMock()
+
+
+def _response(data: object) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(data).encode()  # ruff:ignore[private-member-access]
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+@pytest.fixture
+def chronicle_soar(mock_get_sdk_api_uri: MagicMock, mock_platform_supports_1p: MagicMock) -> MockChronicleSOAR:
+    mock_get_sdk_api_uri.return_value = API_ROOT
+    mock_platform_supports_1p.return_value = False
+    return MockChronicleSOAR()
+
+
+def test_repeated_lookups_without_cache_call_the_api_every_time(chronicle_soar: MockChronicleSOAR) -> None:
+    """Test lookups outside a cache scope always reach the API."""
+    for _ in range(3):
+        soar_api.get_email_template(chronicle_soar)
+
+    assert chronicle_soar.session.paths == [EMAIL_TEMPLATES_PATH] * 3
+
+
+def test_repeated_lookups_in_cache_scope_call_the_api_once(chronicle_soar: MockChronicleSOAR) -> None:
+    """Test the same lookup in a cache scope reaches the API once per arguments."""
+    with cached_soar_responses(chronicle_soar) as cache:
+        templates = [soar_api.get_email_template(chronicle_soar) for _ in range(3)]
+        aliases = [soar_api.get_domain_alias(chronicle_soar, page_count=page) for page in (0, 0, 1)]
+
+    assert chronicle_soar.session.paths == [EMAIL_TEMPLATES_PATH, DOMAIN_ALIASES_PATH, DOMAIN_ALIASES_PATH]
+    assert all(t[0].name == "Template" for t in templates)
+    assert [a["page"] for a in aliases] == [0, 0, 1]
+    assert cache.hits == 3
+
+
+def test_write_requests_and_explicit_invalidation_drop_cached_responses(chronicle_soar: MockChronicleSOAR) -> None:
+    """Test writes and explicit invalidation make the next lookup reach the API."""
+    with cached_soar_responses(chronicle_soar):
+        soar_api.get_email_template(chronicle_soar)
+        soar_api.add_tags_to_case_in_bulk(chronicle_soar, case_ids=[1], tags=["tag"])
+        soar_api.get_email_template(chronicle_soar)
+        invalidate_soar_responses(chronicle_soar, "GetEmailTemplateRecords")
+        soar_api.get_email_template(chronicle_soar)
+        soar_api.get_email_template(chronicle_soar)
+
+    assert chronicle_soar.session.paths == [
+        EMAIL_TEMPLATES_PATH,
+        ADD_TAGS_PATH,
+        EMAIL_TEMPLATES_PATH,
+        EMAIL_TEMPLATES_PATH,
+    ]
+
+
+def test_cached_responses_are_copied_for_every_caller(chronicle_soar: MockChronicleSOAR) -> None:
+    """Test changing a served response doesn't change what the next caller gets."""
+    client = soar_api.get_soar_client(chronicle_soar)
+    with cached_soar_responses(chronicle_soar):
+        first = client.get_email_template()
+        first.headers["Content-Type"] = "text/plain"
+        first.encoding = "latin-1"
+        second = client.get_email_template()
+
+    assert second is not first
+    assert second.headers["Content-Type"] == "application/json"
+    assert second.encoding is None
+    assert second.json()[0]["name"] == "Template"
@@ -0,0 +1,78 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+from collections.abc import Iterator
+
+from TIPCommon.transformation import construct_csv, dict_to_flat, flat_dict_to_csv, iter_csv, iter_flat_dict_csv
+
+
+def test_dict_to_flat_names_keys_by_path_in_document_order() -> None:
+    """Test nested keys are joined with underscores and list items are numbered from 1."""
+    document = {
+        "id": 7,
+        "owner": {"name": "Alice", "groups": ["admins", None, {"role": "lead"}]},
+        "empty": None,
+        "nothing": {},
+        "matrix": [[1, 2], []],
+        3: True,
+    }
+
+    flat = dict_to_flat(document)
+
+    assert list(flat.items()) == [
+        ("id", "7"),
+        ("owner_name", "Alice"),
+        ("owner_groups_1", "admins"),
+        ("owner_groups_2", ""),
+        ("owner_groups_3_role", "lead"),
+        ("empty", ""),
+        ("matrix_1_1", "1"),
+        ("matrix_1_2", "2"),
+        ("3", "True"),
+    ]
+
+
+def test_dict_to_flat_handles_nesting_deeper_than_the_recursion_limit() -> None:
+    """Test documents nested beyond the recursion limit are flattened without copying them."""
+    depth = sys.getrecursionlimit() + 100
+    document: dict = {"leaf": "value"}
+    for _ in range(depth):
+        document = {"a": [document]}
+
+    flat = dict_to_flat(document)
+
+    assert flat == {"a_1_" * depth + "leaf": "value"}
+
+
+def test_iter_csv_yields_the_rows_of_construct_csv() -> None:
+    """Test headers are the union of all keys, missing and None cells are empty and commas are dropped."""
+    rows = [{"name": "a,b", "count": 1}, {"count": None, "extra": [1, 2]}]
+
+    lines = iter_csv(rows)
+
+    assert isinstance(lines, Iterator)
+    assert list(lines) == construct_csv(rows) == ["name,count,extra", "a b,1,", ",,[1  2]"]
+    assert list(iter_csv([])) == construct_csv([]) == []
+
+
+def test_iter_flat_dict_csv_yields_the_rows_of_flat_dict_to_csv() -> None:
+    """Test one row is yielded per key, after the header row."""
+    flat = {"owner_name": "Alice", "empty": None}
+
+    lines = iter_flat_dict_csv(flat, "Key", "Data")
+
+    assert isinstance(lines, Iterator)
+    assert list(lines) == flat_dict_to_csv(flat, "Key", "Data") == ["Key,Data", "owner_name,Alice", "empty,"]
+    assert list(iter_flat_dict_csv({})) == ["Property,Value"]